@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Synthetic League Generator for META Simulator Scale Tests
+Builds leagues of arbitrary size on top of checkMeta's generate_random_character, the
+SimEngine v3 division file and the v2 trait catalog export, and writes them in the CSV
+formats the v5 DataLoader and MatchScheduler read
+
+Attribute and trait distributions are deliberately skewed: a few powerhouse teams and
+star players, a long tail of average rosters, and a handful of traits held by most players.
+
+Usage:
+    python benchmarks/league_generator.py --teams 1000 --days 5 --output-dir /tmp/league1000
+"""
+
+import os
+import sys
+import csv
+import json
+import math
+import random
+import argparse
+from typing import Dict, List, Any, Optional, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+V5_DATA_DIR = os.path.join(REPO_ROOT, "meta_simulator_v5", "data")
+CHECKMETA_DIR = os.path.join(REPO_ROOT, "checkMeta")
+
+TRAIT_CATALOG = os.path.join(V5_DATA_DIR, "SimEngine v2 full_trait_catalog_export.csv")
+DIVISIONS_FILE = os.path.join(V5_DATA_DIR, "SimEngine v3  Divisions.csv")
+TEAM_NAMES_FILE = os.path.join(V5_DATA_DIR, "SimEngine v3 teamIDs 1.csv")
+
+# Team -> division file in the SimEngine v3 layout (MatchScheduler / checkMeta load_divisions_data)
+TEAM_DIVISIONS_NAME = "SimEngine v3  Divisions.csv"
+
+ATTRIBUTES = ["aSTR", "aSPD", "aFS", "aLDR", "aDUR", "aRES", "aWIL"]
+DIVISION_BONUSES = {
+    "undercurrent": ("stamina_regen", 1.1),
+    "overlay": ("critical_chance", 1.15)
+}
+
+LINEUP_SIZE = 8
+DEFAULT_ROSTER_SIZE = 10
+BASE_HP = 100
+HOME_COURT_ADVANTAGE = 1.05
+
+# Skew parameters: team strength is log-normal, star players follow a Pareto tail,
+# and trait popularity follows a Zipf law over the catalog order
+TEAM_STRENGTH_SIGMA = 0.35
+STAR_PARETO_ALPHA = 3.0
+TRAIT_ZIPF_EXPONENT = 1.1
+MEAN_TRAITS_PER_PLAYER = 2.5
+
+
+###############################
+# SOURCE DATA
+###############################
+
+def _leading_int(value: str) -> int:
+    """Parse the leading integer of a catalog value ("1 match" -> 1, "none" -> 0)"""
+    digits = ""
+    for char in (value or "").strip():
+        if not char.isdigit():
+            break
+        digits += char
+    return int(digits) if digits else 0
+
+
+def load_catalog_traits(path: str = TRAIT_CATALOG) -> List[Dict[str, Any]]:
+    """Read the trait catalog export as traits.csv rows (numeric stamina cost and cooldown)"""
+    traits = []
+    with open(path, "r", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            if not row.get("trait_id"):
+                continue
+            row = {key: (value or "") for key, value in row.items() if key}
+            row["stamina_cost"] = _leading_int(row["stamina_cost"])
+            row["cooldown"] = _leading_int(row["cooldown"])
+            traits.append(row)
+    return traits
+
+
+def load_division_names(path: str = DIVISIONS_FILE) -> List[str]:
+    """Distinct division names from the SimEngine v3 division file, in file order"""
+    names = []
+    with open(path, "r", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            division = row["division"].strip().lower()
+            if division and division not in names:
+                names.append(division)
+    return names
+
+
+def load_team_names(path: str = TEAM_NAMES_FILE) -> List[str]:
+    """Team names from the SimEngine v3 team ID file"""
+    with open(path, "r", encoding="utf-8") as f:
+        return [row["teamName"].strip() for row in csv.DictReader(f) if row.get("teamName")]
+
+
+def load_team_divisions(data_dir: str) -> Dict[str, List[str]]:
+    """Team IDs by lower-case division from a generated league (MatchScheduler.division_teams)"""
+    division_teams = {}
+    with open(os.path.join(data_dir, TEAM_DIVISIONS_NAME), "r", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            division_teams.setdefault(row["division"].lower(), []).append(row["team_id"])
+    return division_teams
+
+
+###############################
+# GENERATION
+###############################
+
+class LeagueGenerator:
+    """
+    Seeded synthetic league generator
+    The same seed and sizes always produce byte-identical files
+    """
+
+    def __init__(self, num_teams: int, seed: int = 0, roster_size: int = DEFAULT_ROSTER_SIZE,
+                 lineup_days: int = 5, matches_per_day: Optional[int] = None):
+        """Configure a league
+
+        Args:
+            num_teams: Number of teams (split evenly across the divisions)
+            seed: Random seed
+            roster_size: Players per team roster (at least 8; lineups pick 8 per day)
+            lineup_days: Number of lineups_day<N>.csv files to write
+            matches_per_day: Matchups per day in matchups.csv (default: every team plays)
+        """
+        if roster_size < LINEUP_SIZE:
+            raise ValueError(f"Roster size must be at least {LINEUP_SIZE}, got {roster_size}")
+
+        self.num_teams = num_teams
+        self.seed = seed
+        self.roster_size = roster_size
+        self.lineup_days = lineup_days
+        self.matches_per_day = matches_per_day
+
+        self.divisions = load_division_names()
+        if len(self.divisions) < 2:
+            raise ValueError("At least two divisions are required for cross-division scheduling")
+        if num_teams < 2 * len(self.divisions):
+            raise ValueError(f"At least {2 * len(self.divisions)} teams are required, got {num_teams}")
+
+        self.catalog = load_catalog_traits()
+        self.team_names = load_team_names()
+
+        self.rng = random.Random(seed)
+        self.team_width = max(3, len(str(num_teams)))
+
+        # Zipf weights over the catalog: the first traits are the popular ones
+        order = list(range(len(self.catalog)))
+        self.rng.shuffle(order)
+        self.trait_order = [self.catalog[i]["trait_id"] for i in order]
+        self.trait_weights = [1.0 / (rank + 1) ** TRAIT_ZIPF_EXPONENT for rank in range(len(order))]
+
+    def team_id(self, number: int) -> str:
+        """Team ID for a 1-based team number (t001 ... t1000)"""
+        return f"t{number:0{self.team_width}d}"
+
+    def player_id(self, team_number: int, index: int) -> str:
+        """Player ID in the p<team><index> layout of players.csv"""
+        return f"p{team_number:0{self.team_width}d}{index + 1:02d}"
+
+    def _skewed_attribute(self, base: int, team_strength: float, star: float) -> int:
+        """Scale a checkMeta 4-10 attribute to the v5 range with team and star skew"""
+        value = (25 + base * 5) * team_strength * star + self.rng.gauss(0, 3)
+        return int(min(99, max(30, round(value))))
+
+    def _trait_count(self) -> int:
+        """Traits per player: Poisson around the mean, at least one"""
+        # Knuth's method keeps this on the seeded generator
+        limit = math.exp(-MEAN_TRAITS_PER_PLAYER)
+        count, product = 0, self.rng.random()
+        while product > limit:
+            count += 1
+            product *= self.rng.random()
+        return max(1, count)
+
+    def _pick_traits(self, count: int) -> List[str]:
+        """Distinct traits drawn by Zipf popularity"""
+        count = min(count, len(self.trait_order))
+        picked = []
+        while len(picked) < count:
+            trait_id = self.rng.choices(self.trait_order, weights=self.trait_weights)[0]
+            if trait_id not in picked:
+                picked.append(trait_id)
+        return picked
+
+    def _roster(self, team_number: int, team_id: str, division: str) -> Tuple[List[Dict[str, Any]], Dict[str, List[str]]]:
+        """Generate one team's roster and trait assignments"""
+        from utils.loaders import generate_random_character
+
+        team_strength = self.rng.lognormvariate(0, TEAM_STRENGTH_SIGMA) ** 0.5
+        players = []
+        player_traits = {}
+
+        for index in range(self.roster_size):
+            # generate_random_character draws from the module-level generator
+            random.seed(self.rng.getrandbits(64))
+            character = generate_random_character(team_id, index, "FL" if index == 0 else None)
+
+            star = min(1.5, self.rng.paretovariate(STAR_PARETO_ALPHA) ** 0.25)
+            player_id = self.player_id(team_number, index)
+            player = {
+                "player_id": player_id,
+                "name": character["name"],
+                "team_id": team_id,
+                "role": character["role"],
+                "division": division,
+                "base_HP": BASE_HP
+            }
+            for attribute in ATTRIBUTES:
+                player[attribute] = self._skewed_attribute(character[attribute], team_strength, star)
+
+            players.append(player)
+            player_traits[player_id] = self._pick_traits(self._trait_count())
+
+        return players, player_traits
+
+    def _lineups(self, rosters: Dict[str, List[str]]) -> Dict[int, Dict[str, List[str]]]:
+        """Daily lineups: the field leader plus seven of the remaining roster"""
+        lineups = {}
+        for day in range(1, self.lineup_days + 1):
+            lineups[day] = {}
+            for team_id, player_ids in rosters.items():
+                bench = self.rng.sample(player_ids[1:], LINEUP_SIZE - 1)
+                lineups[day][team_id] = [player_ids[0]] + sorted(bench)
+        return lineups
+
+    def _matchups(self, division_teams: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+        """Cross-division rotation pairings with home/away alternating by day"""
+        home, away = division_teams[self.divisions[0]], division_teams[self.divisions[1]]
+        pairs_per_day = min(len(home), len(away))
+        if self.matches_per_day:
+            pairs_per_day = min(pairs_per_day, self.matches_per_day)
+
+        rows = []
+        for day in range(1, self.lineup_days + 1):
+            shift = (day - 1) % len(away)
+            rotated = away[shift:] + away[:shift]
+            for i in range(pairs_per_day):
+                team_a, team_b = (home[i], rotated[i]) if day % 2 else (rotated[i], home[i])
+                rows.append({"day": day, "match_number": i + 1, "team_a_id": team_a, "team_b_id": team_b})
+        return rows
+
+    def generate(self) -> Dict[str, Any]:
+        """Generate every table of the league
+
+        Returns:
+            dict: Table name -> rows (lineups keyed by day)
+        """
+        teams = []
+        players = []
+        player_traits = {}
+        rosters = {}
+        division_teams = {division: [] for division in self.divisions}
+
+        for number in range(1, self.num_teams + 1):
+            team_id = self.team_id(number)
+            division = self.divisions[(number - 1) * len(self.divisions) // self.num_teams]
+            base_name = self.team_names[(number - 1) % len(self.team_names)] if self.team_names else "Team"
+            cycle = (number - 1) // max(1, len(self.team_names))
+
+            teams.append({
+                "team_id": team_id,
+                "team_name": f"{base_name} {cycle + 1}" if cycle else base_name,
+                "division": division.capitalize(),
+                "coach_name": f"Coach {team_id.upper()}",
+                "home_court_advantage": HOME_COURT_ADVANTAGE
+            })
+            division_teams[division].append(team_id)
+
+            roster, roster_traits = self._roster(number, team_id, division.capitalize())
+            players.extend(roster)
+            player_traits.update(roster_traits)
+            rosters[team_id] = [player["player_id"] for player in roster]
+
+        divisions = []
+        for index, division in enumerate(self.divisions, 1):
+            bonus_type, bonus_value = DIVISION_BONUSES.get(division, ("none", 1.0))
+            divisions.append({"division_id": f"div{index:03d}", "division_name": division.capitalize(),
+                              "bonus_type": bonus_type, "bonus_value": bonus_value})
+
+        return {
+            "teams": teams,
+            "players": players,
+            "traits": self.catalog,
+            "divisions": divisions,
+            "team_divisions": [{"team_id": team["team_id"], "division": team["division"].lower()} for team in teams],
+            "player_traits": player_traits,
+            "lineups": self._lineups(rosters),
+            "matchups": self._matchups(division_teams)
+        }
+
+
+###############################
+# OUTPUT
+###############################
+
+def _write_rows(path: str, fieldnames: List[str], rows: List[Dict[str, Any]]) -> None:
+    """Write dict rows as CSV"""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _write_id_lists(path: str, key_field: str, list_field: str, lists: Dict[str, List[str]]) -> None:
+    """Write ID lists as a quoted comma-separated column (DataLoader._split_ids format)"""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([key_field, list_field])
+        for key, ids in lists.items():
+            writer.writerow([key, ",".join(ids)])
+
+
+def write_league(league: Dict[str, Any], output_dir: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Write a generated league as a v5 data directory
+
+    Args:
+        league: Output of LeagueGenerator.generate()
+        output_dir: Data directory to write (paths.data_dir)
+        metadata: Extra fields for league.json
+
+    Returns:
+        dict: Manifest with row counts and file sizes
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    _write_rows(os.path.join(output_dir, "teams.csv"),
+                ["team_id", "team_name", "division", "coach_name", "home_court_advantage"], league["teams"])
+    _write_rows(os.path.join(output_dir, "players.csv"),
+                ["player_id", "name", "team_id", "role", "division", "base_HP"] + ATTRIBUTES, league["players"])
+    _write_rows(os.path.join(output_dir, "traits.csv"),
+                ["trait_id", "name", "type", "triggers", "formula_key", "formula_expr", "bound_nbid",
+                 "stamina_cost", "cooldown", "description"], league["traits"])
+    _write_rows(os.path.join(output_dir, "divisions.csv"),
+                ["division_id", "division_name", "bonus_type", "bonus_value"], league["divisions"])
+    _write_rows(os.path.join(output_dir, TEAM_DIVISIONS_NAME), ["team_id", "division"], league["team_divisions"])
+    if league["matchups"]:
+        _write_rows(os.path.join(output_dir, "matchups.csv"),
+                    ["day", "match_number", "team_a_id", "team_b_id"], league["matchups"])
+    _write_id_lists(os.path.join(output_dir, "player_traits.csv"), "player_id", "trait_ids", league["player_traits"])
+    for day, lineup in league["lineups"].items():
+        _write_id_lists(os.path.join(output_dir, f"lineups_day{day}.csv"), "team_id", "player_ids", lineup)
+
+    files = sorted(name for name in os.listdir(output_dir) if name.endswith(".csv"))
+    manifest = dict(metadata or {})
+    manifest.update({
+        "teams": len(league["teams"]),
+        "players": len(league["players"]),
+        "traits": len(league["traits"]),
+        "trait_assignments": sum(len(ids) for ids in league["player_traits"].values()),
+        "lineup_days": len(league["lineups"]),
+        "matchups": len(league["matchups"]),
+        "bytes": sum(os.path.getsize(os.path.join(output_dir, name)) for name in files),
+        "files": files
+    })
+    with open(os.path.join(output_dir, "league.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def generate_league(num_teams: int, output_dir: str, seed: int = 0, roster_size: int = DEFAULT_ROSTER_SIZE,
+                    lineup_days: int = 5, matches_per_day: Optional[int] = None,
+                    matchups: bool = True) -> Dict[str, Any]:
+    """Generate and write a league in one call (see LeagueGenerator)
+
+    Args:
+        matchups: Write matchups.csv; without it the MatchScheduler plans the season itself
+    """
+    if CHECKMETA_DIR not in sys.path:
+        sys.path.insert(0, CHECKMETA_DIR)
+    generator = LeagueGenerator(num_teams, seed, roster_size, lineup_days, matches_per_day)
+    league = generator.generate()
+    if not matchups:
+        league["matchups"] = []
+    metadata = {"seed": seed, "roster_size": roster_size, "matches_per_day": matches_per_day}
+    return write_league(league, output_dir, metadata)
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Generate a synthetic META league")
+    parser.add_argument("--teams", type=int, default=1000, help="Number of teams")
+    parser.add_argument("--days", type=int, default=5, help="Number of daily lineup files")
+    parser.add_argument("--roster-size", type=int, default=DEFAULT_ROSTER_SIZE, help="Players per team roster")
+    parser.add_argument("--matches-per-day", type=int, help="Matchups per day (default: every team plays)")
+    parser.add_argument("--no-matchups", action="store_true",
+                        help="Leave matchups.csv out so the scheduler plans the season")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output-dir", required=True, help="Data directory to write")
+    args = parser.parse_args()
+
+    manifest = generate_league(args.teams, args.output_dir, args.seed, args.roster_size,
+                               args.days, args.matches_per_day, not args.no_matchups)
+    print(f"Generated {manifest['teams']} teams, {manifest['players']} players, "
+          f"{manifest['trait_assignments']} trait assignments, {manifest['matchups']} matchups "
+          f"({manifest['bytes'] / 1024:.0f} KiB) in {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
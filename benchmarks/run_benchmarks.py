@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+"""
+META Simulator Benchmark Suite
+Seeded micro- and macro-benchmarks over synthetic 8v8 leagues, with JSON results,
+baseline comparison and regression thresholds
+
+Micro: convergence detection, trait dispatch, event emit, rStats update, PGN write, lineup load
+Macro: one match, one day, one week (engine-less or against the stand-in UCI engine)
+
+Usage:
+    python benchmarks/run_benchmarks.py --output bench.json
+    python benchmarks/run_benchmarks.py --baseline bench.json --threshold 0.15
+"""
+
+import os
+import sys
+import copy
+import json
+import time
+import random
+import logging
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+import importlib
+import datetime
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+V4_DIR = os.path.join(REPO_ROOT, "v4")
+V5_DIR = os.path.join(REPO_ROOT, "meta_simulator_v5")
+CHECKMETA_DIR = os.path.join(REPO_ROOT, "checkMeta")
+STANDIN_ENGINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "standin_engine.py")
+
+SUITE_VERSION = 1
+DEFAULT_SEED = 20250407
+DEFAULT_THRESHOLD = 0.15
+ENGINE_MODES = ["engineless", "standin"]
+
+PLAYERS_PER_TEAM = 8
+MATCHES_PER_DAY = 5
+DAYS_PER_WEEK = 5
+BOARD_PLIES = 40
+
+
+###############################
+# SYNTHETIC LEAGUE
+###############################
+
+def make_league(num_teams: int, seed: int) -> Dict[str, List[Dict[str, Any]]]:
+    """Seeded synthetic league of 8-player teams from the checkMeta random generators
+
+    Teams alternate between the operations ('o') and intelligence ('i') divisions.
+    """
+    from utils.loaders import generate_random_team
+
+    random.seed(seed)
+    league = {}
+    for index in range(1, num_teams + 1):
+        team_id = f"t{index:03d}"
+        division = "o" if index % 2 else "i"
+        team = generate_random_team(team_id, PLAYERS_PER_TEAM)
+        for char in team:
+            char["division"] = division
+        league[team_id] = team
+    return league
+
+
+def day_pairings(team_ids: List[str], day: int) -> List[Tuple[str, str]]:
+    """Cross-division pairings for a day (operations team vs intelligence team, rotated daily)"""
+    ops = team_ids[0::2]
+    intel = team_ids[1::2]
+    shift = (day - 1) % len(intel)
+    intel = intel[shift:] + intel[:shift]
+    return list(zip(ops, intel))[:MATCHES_PER_DAY]
+
+
+def played_boards(count: int, plies: int, seed: int):
+    """Boards advanced by seeded random moves, so board-dependent code has work to do"""
+    import chess
+
+    rng = random.Random(seed)
+    boards = []
+    for _ in range(count):
+        board = chess.Board()
+        for _ in range(plies):
+            moves = list(board.legal_moves)
+            if not moves:
+                break
+            board.push(rng.choice(moves))
+        boards.append(board)
+    return boards
+
+
+###############################
+# ENVIRONMENT
+###############################
+
+def import_v5(module_name: str):
+    """Import a v5 module (v4 and v5 both ship a system_base; the v5 one must win here)"""
+    sys.path.insert(0, V5_DIR)
+    try:
+        sys.modules.pop("system_base", None)
+        return importlib.import_module(module_name)
+    finally:
+        sys.path.remove(V5_DIR)
+
+
+def build_v4_simulator(engine_mode: str, think_ms: float = 0.0):
+    """Construct the v4 simulator without its data-file validation
+
+    Args:
+        engine_mode: "engineless" (random legal moves) or "standin" (stand-in UCI engine)
+        think_ms: Stand-in engine think time per search
+    """
+    import meta_simulator_v4 as v4
+
+    simulator = v4.MetaLeagueSimulator.__new__(v4.MetaLeagueSimulator)
+    simulator.trait_system = v4.TraitSystem()
+    simulator.chess_system = v4.ChessSystem(None)
+    simulator.combat_system = v4.CombatSystem(simulator.trait_system)
+    simulator.convergence_system = v4.ConvergenceSystem(simulator.trait_system)
+    simulator.pgn_tracker = v4.PGNTracker()
+    simulator.stat_tracker = v4.StatTracker()
+
+    if engine_mode == "standin":
+        engine_path = STANDIN_ENGINE
+        if think_ms:
+            # popen_uci takes a path; a wrapper script carries the think time
+            engine_path = os.path.join(os.getcwd(), "standin_engine.sh")
+            with open(engine_path, "w") as f:
+                f.write(f'#!/bin/sh\nexec "{sys.executable}" "{STANDIN_ENGINE}" --think-ms {think_ms} "$@"\n')
+            os.chmod(engine_path, 0o755)
+        simulator.chess_system.stockfish_path = engine_path
+        simulator.chess_system.stockfish_available = True
+
+    return simulator
+
+
+def git_commit() -> Optional[str]:
+    """Current commit of the repository, if available"""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+###############################
+# HARNESS
+###############################
+
+class Benchmark:
+    """One named workload: setup() builds state (untimed), run(state) is timed"""
+
+    def __init__(self, name: str, group: str, setup: Callable[[], Any], run: Callable[[Any], Any],
+                 number: int = 1, mode: str = "n/a"):
+        self.name = name
+        self.group = group
+        self.setup = setup
+        self.run = run
+        self.number = number
+        self.mode = mode
+
+    @property
+    def key(self) -> str:
+        """Result key, e.g. macro.match[standin]"""
+        return f"{self.group}.{self.name}" + (f"[{self.mode}]" if self.mode != "n/a" else "")
+
+    def measure(self, seed: int, repeat: int, warmup: int) -> Dict[str, Any]:
+        """Time `number` calls of run() per repetition, reseeding before each repetition"""
+        timings = []
+        for iteration in range(warmup + repeat):
+            random.seed(seed)
+            state = self.setup()
+            random.seed(seed)
+            start = time.perf_counter()
+            for _ in range(self.number):
+                self.run(state)
+            elapsed = time.perf_counter() - start
+            if iteration >= warmup:
+                timings.append(elapsed)
+
+        median = statistics.median(timings)
+        return {
+            "group": self.group,
+            "mode": self.mode,
+            "repeat": repeat,
+            "number": self.number,
+            "min_s": min(timings),
+            "median_s": median,
+            "mean_s": statistics.fmean(timings),
+            "stdev_s": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+            "per_op_us": median / self.number * 1e6
+        }
+
+
+###############################
+# MICRO-BENCHMARKS
+###############################
+
+def micro_benchmarks(seed: int, workdir: str) -> List[Benchmark]:
+    """Component-level benchmarks on one synthetic 8v8 match"""
+    import meta_simulator_v4 as v4
+    from lineup_cache import LineupCache
+
+    league = make_league(2, seed)
+    team_a, team_b = league["t001"], league["t002"]
+
+    def fresh_teams():
+        a, b = copy.deepcopy(team_a), copy.deepcopy(team_b)
+        for team_label, team in (("A", a), ("B", b)):
+            for char in team:
+                char.update({"HP": 100, "stamina": 100, "is_ko": False, "is_active": True,
+                             "team": team_label, "rStats": {}})
+        return a, b
+
+    context = {"team_a_id": "t001", "team_b_id": "t002", "team_a_name": "Team 001",
+               "team_b_name": "Team 002", "day": 1, "round": 5, "convergence_logs": [],
+               "trait_logs": [], "damage_contributors": {}}
+
+    # Convergence detection: one round of convergence processing on mid-game boards
+    def convergence_setup():
+        a, b = fresh_teams()
+        ctx = dict(context, team_a=a, team_b=b, convergence_logs=[], trait_logs=[], damage_contributors={})
+        return (v4.ConvergenceSystem(v4.TraitSystem()), a, played_boards(8, BOARD_PLIES, seed),
+                b, played_boards(8, BOARD_PLIES, seed + 1), ctx)
+
+    def convergence_run(state):
+        system, a, a_boards, b, b_boards, ctx = state
+        system.process_convergences(a, a_boards, b, b_boards, ctx, 3, False)
+
+    # Trait dispatch: every character checks every trigger
+    triggers = ["convergence", "damage_taken", "end_of_turn", "combat", "critical_hit"]
+
+    def traits_setup():
+        a, b = fresh_teams()
+        return v4.TraitSystem(), a + b
+
+    def traits_run(state):
+        system, characters = state
+        for char in characters:
+            for trigger in triggers:
+                system.check_trait_activation(char, trigger, context)
+
+    # Event emit: v5 event system, four handlers on a hot event type
+    event_system_module = import_v5("event_system")
+
+    def events_setup():
+        events = event_system_module.EventSystem()
+        sink = []
+        for _ in range(4):
+            events.subscribe("damage_dealt", lambda **kwargs: sink.append(kwargs.get("amount")))
+        return events
+
+    def events_run(events):
+        for amount in range(1000):
+            events.dispatch("damage_dealt", attacker="c1", target="c2", amount=amount)
+
+    # rStats update: canonical stat updates through the stat tracker
+    stat_names = ["DAMAGE_DEALT", "DAMAGE_TAKEN", "CONVERGENCES", "TRAIT_ACTIVATIONS", "HEALING"]
+
+    def rstats_setup():
+        tracker = v4.StatTracker()
+        a, b = fresh_teams()
+        for char in a + b:
+            tracker.register_character(char)
+        return tracker, a + b
+
+    def rstats_run(state):
+        tracker, characters = state
+        for char in characters:
+            for stat in stat_names:
+                tracker.update_stat(char, stat, 3)
+
+    # PGN write: export and save all 16 games of a match
+    pgn_dir = os.path.join(workdir, "pgn")
+
+    def pgn_setup():
+        a, b = fresh_teams()
+        return (v4.PGNTracker(output_dir=pgn_dir), a, played_boards(8, BOARD_PLIES, seed),
+                b, played_boards(8, BOARD_PLIES, seed + 1))
+
+    def pgn_run(state):
+        tracker, a, a_boards, b, b_boards = state
+        tracker.record_match_games(a, a_boards, b, b_boards, context)
+
+    # Lineup load: cold compile of the workbook and warm load from the compiled cache
+    workbook = write_lineup_workbook(make_league(10, seed), os.path.join(workdir, "lineups.xlsx"))
+    cache_path = os.path.join(workdir, ".lineup_cache", "lineups.xlsx.pkl")
+
+    def lineup_cold_setup():
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+        return None
+
+    def lineup_run(_):
+        LineupCache(workbook, cache_path).load_day(
+            "4/7/25", v4.DataLoader.map_position_to_role, v4.DataLoader.get_division_from_role,
+            normalize_team_id=v4.DataLoader.normalize_team_id, active_source="active", required=("team_id",))
+
+    def lineup_warm_setup():
+        if not os.path.exists(cache_path):
+            lineup_run(None)
+        return None
+
+    return [
+        Benchmark("convergence_detection", "micro", convergence_setup, convergence_run, number=20),
+        Benchmark("trait_dispatch", "micro", traits_setup, traits_run, number=20),
+        Benchmark("event_emit", "micro", events_setup, events_run, number=10),
+        Benchmark("rstats_update", "micro", rstats_setup, rstats_run, number=50),
+        Benchmark("pgn_write", "micro", pgn_setup, pgn_run, number=5),
+        Benchmark("lineup_load_cold", "micro", lineup_cold_setup, lineup_run),
+        Benchmark("lineup_load_warm", "micro", lineup_warm_setup, lineup_run, number=10)
+    ]
+
+
+def write_lineup_workbook(league: Dict[str, List[Dict[str, Any]]], path: str) -> str:
+    """Write a lineup workbook in the shape the lineup loaders read (one sheet per day)"""
+    import pandas as pd
+
+    rows = []
+    for team_id, team in league.items():
+        for char in team:
+            rows.append({"Team": team_id, "Nexus Being": char["name"], "Position": char["role"],
+                         "Active": True, "Primary Type": "tech",
+                         **{stat: char[f"a{stat}"] for stat in ["STR", "SPD", "FS", "LDR", "DUR", "RES", "WIL"]}})
+    frame = pd.DataFrame(rows)
+    with pd.ExcelWriter(path) as writer:
+        for day in range(7, 12):
+            frame.to_excel(writer, sheet_name=f"4-{day}-25", index=False)
+    return path
+
+
+###############################
+# MACRO-BENCHMARKS
+###############################
+
+def macro_benchmarks(seed: int, engine_mode: str, include_slow: bool, think_ms: float) -> List[Benchmark]:
+    """End-to-end match, day and week benchmarks on the v4 simulator"""
+    league = make_league(10, seed)
+    team_ids = sorted(league)
+
+    def simulator_setup():
+        return build_v4_simulator(engine_mode, think_ms)
+
+    def play(simulator, team_a_id: str, team_b_id: str, day: int) -> None:
+        simulator.simulate_match(copy.deepcopy(league[team_a_id]), copy.deepcopy(league[team_b_id]), day, False)
+
+    def match_run(simulator):
+        play(simulator, "t001", "t002", 1)
+
+    def day_run(simulator, day: int = 1):
+        for team_a_id, team_b_id in day_pairings(team_ids, day):
+            play(simulator, team_a_id, team_b_id, day)
+
+    def week_run(simulator):
+        for day in range(1, DAYS_PER_WEEK + 1):
+            day_run(simulator, day)
+
+    benchmarks = [Benchmark("match", "macro", simulator_setup, match_run, mode=engine_mode)]
+    # Engine-bound days and weeks spawn an engine per move; opt in explicitly
+    if engine_mode == "engineless" or include_slow:
+        benchmarks.append(Benchmark("day", "macro", simulator_setup, day_run, mode=engine_mode))
+        benchmarks.append(Benchmark("week", "macro", simulator_setup, week_run, mode=engine_mode))
+    return benchmarks
+
+
+###############################
+# BASELINE COMPARISON
+###############################
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float,
+            overrides: Dict[str, float]) -> List[Dict[str, Any]]:
+    """Compare medians against a baseline run
+
+    Returns:
+        list: One entry per shared benchmark with the ratio and regression flag
+    """
+    comparisons = []
+    for key, current in results["results"].items():
+        previous = baseline.get("results", {}).get(key)
+        if not previous or not previous.get("median_s"):
+            continue
+        limit = overrides.get(key, overrides.get(current["group"], threshold))
+        ratio = current["median_s"] / previous["median_s"]
+        comparisons.append({
+            "benchmark": key,
+            "baseline_s": previous["median_s"],
+            "current_s": current["median_s"],
+            "ratio": ratio,
+            "threshold": limit,
+            "regression": ratio > 1.0 + limit
+        })
+    return comparisons
+
+
+def parse_overrides(values: List[str]) -> Dict[str, float]:
+    """Parse NAME=FRACTION threshold overrides (NAME is a benchmark key or group)"""
+    overrides = {}
+    for value in values:
+        name, _, fraction = value.partition("=")
+        overrides[name] = float(fraction)
+    return overrides
+
+
+###############################
+# MAIN
+###############################
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="META Simulator benchmark suite")
+    parser.add_argument("--suite", choices=["micro", "macro", "all"], default="all")
+    parser.add_argument("--mode", choices=ENGINE_MODES + ["both"], default="engineless",
+                        help="Engine mode for macro-benchmarks")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions per benchmark")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed repetitions per benchmark")
+    parser.add_argument("--filter", help="Only run benchmarks whose key contains this text")
+    parser.add_argument("--include-slow", action="store_true",
+                        help="Also run day and week macro-benchmarks against the stand-in engine")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="Stand-in engine think time per search")
+    parser.add_argument("--output", help="Write results JSON here")
+    parser.add_argument("--baseline", help="Baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown of the median as a fraction (0.15 = 15%%)")
+    parser.add_argument("--threshold-for", action="append", default=[], metavar="NAME=FRACTION",
+                        help="Per-benchmark or per-group threshold override")
+    args = parser.parse_args()
+
+    sys.path[:0] = [V4_DIR, CHECKMETA_DIR]
+    # Component logging would dominate the timings
+    logging.disable(logging.WARNING)
+
+    output = os.path.abspath(args.output) if args.output else None
+    baseline_path = os.path.abspath(args.baseline) if args.baseline else None
+
+    # The simulators write reports and PGNs relative to the working directory
+    workdir = tempfile.mkdtemp(prefix="meta_bench_")
+    os.chdir(workdir)
+
+    benchmarks = []
+    if args.suite in ("micro", "all"):
+        benchmarks.extend(micro_benchmarks(args.seed, workdir))
+    if args.suite in ("macro", "all"):
+        modes = ENGINE_MODES if args.mode == "both" else [args.mode]
+        for mode in modes:
+            benchmarks.extend(macro_benchmarks(args.seed, mode, args.include_slow, args.think_ms))
+    if args.filter:
+        benchmarks = [b for b in benchmarks if args.filter in b.key]
+
+    results = {
+        "suite_version": SUITE_VERSION,
+        "created": datetime.datetime.now().isoformat(),
+        "seed": args.seed,
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {}
+    }
+
+    for benchmark in benchmarks:
+        # Keep the simulators' console output out of the report
+        with open(os.devnull, "w") as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                result = benchmark.measure(args.seed, args.repeat, args.warmup)
+            finally:
+                sys.stdout = stdout
+        results["results"][benchmark.key] = result
+        print(f"{benchmark.key:<40} median {result['median_s'] * 1000:10.2f} ms"
+              f"  ({result['per_op_us']:.1f} us/op, stdev {result['stdev_s'] * 1000:.2f} ms)")
+
+    if output:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {output}")
+
+    if baseline_path:
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+        comparisons = compare(results, baseline, args.threshold, parse_overrides(args.threshold_for))
+        print(f"\nComparison against {baseline_path}:")
+        for entry in comparisons:
+            flag = "REGRESSION" if entry["regression"] else "ok"
+            print(f"  {entry['benchmark']:<40} x{entry['ratio']:.2f} (limit x{1 + entry['threshold']:.2f})  {flag}")
+        if any(entry["regression"] for entry in comparisons):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+League Scaling Report for META Simulator
+Generates synthetic leagues growing by orders of magnitude and measures how loading,
+scheduling, standings, persistence and stats tracking scale with league size
+
+Match outcomes are synthetic (seeded board scores and rStats), so the report isolates the
+league-level bookkeeping from chess and combat cost.
+
+Usage:
+    python benchmarks/scaling_report.py --sizes 10,100,1000 --output scaling.json
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import random
+import shutil
+import importlib
+import logging
+import argparse
+import platform
+import tempfile
+import datetime
+from typing import Dict, List, Any, Optional, Callable
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+V5_DIR = os.path.join(REPO_ROOT, "meta_simulator_v5")
+CHECKMETA_DIR = os.path.join(REPO_ROOT, "checkMeta")
+
+DEFAULT_SIZES = [10, 100, 1000]
+DEFAULT_DAYS = 5
+DEFAULT_SEED = 20250407
+
+# rStats written per character per match (canonical codes)
+MATCH_STATS = ["rDD", "rDS", "rOTD", "rAST", "rKNB", "rHLG"]
+
+
+class PhaseClock:
+    """Records wall time and item counts for the phases of one league size"""
+
+    def __init__(self):
+        self.phases: Dict[str, Dict[str, Any]] = {}
+
+    def measure(self, name: str, items: int, func: Callable[[], Any]) -> Any:
+        """Run func once, timing it as phase `name` covering `items` units of work"""
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        self.phases[name] = {"seconds": elapsed, "items": items,
+                             "per_item_us": elapsed / max(items, 1) * 1e6}
+        return result
+
+
+def synthetic_result(rng: random.Random, match_id: str, team_a_id: str, team_b_id: str,
+                     lineups: Dict[str, List[Dict[str, Any]]], teams: Dict[str, Dict[str, Any]],
+                     day: int) -> Dict[str, Any]:
+    """Match result in the simulate_match shape with seeded board scores and rStats"""
+    team_a_wins = rng.randint(0, 8)
+    team_b_wins = rng.randint(0, 8 - team_a_wins)
+    result = "win" if team_a_wins > team_b_wins else "loss" if team_b_wins > team_a_wins else "draw"
+
+    character_results = []
+    for team_id in (team_a_id, team_b_id):
+        for char in lineups[team_id]:
+            character_results.append({
+                "character_id": char["id"],
+                "character_name": char["name"],
+                "team_id": team_id,
+                "role": char["role"],
+                "division": char["division"],
+                "rStats": {code: rng.randint(0, 40) for code in MATCH_STATS}
+            })
+
+    return {
+        "match_id": match_id,
+        "day": day,
+        "team_a_id": team_a_id,
+        "team_b_id": team_b_id,
+        "team_a_name": teams[team_a_id]["team_name"],
+        "team_b_name": teams[team_b_id]["team_name"],
+        "team_a_division": teams[team_a_id]["division"],
+        "team_b_division": teams[team_b_id]["division"],
+        "team_a_wins": team_a_wins,
+        "team_b_wins": team_b_wins,
+        "result": result,
+        "character_results": character_results
+    }
+
+
+def directory_bytes(path: str) -> int:
+    """Total size of the files under a directory"""
+    total = 0
+    for root, _, files in os.walk(path):
+        total += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+    return total
+
+
+def measure_league(num_teams: int, days: int, seed: int, workdir: str) -> Dict[str, Any]:
+    """Generate one league and measure every league-level subsystem on it
+
+    Returns:
+        dict: League manifest, per-phase timings and on-disk sizes
+    """
+    from league_generator import generate_league
+    from config_manager import ConfigManager
+    from data_loader import DataLoader
+    from match_scheduler import MatchScheduler
+    from standings_engine import StandingsEngine
+    from report_store import ReportStore
+    from rstats_accumulator import RStatsAccumulator
+
+    data_dir = os.path.join(workdir, f"league_{num_teams}")
+    clock = PhaseClock()
+
+    manifest = clock.measure("generate", num_teams,
+                             lambda: generate_league(num_teams, data_dir, seed, lineup_days=days, matchups=False))
+    players = manifest["players"]
+
+    config = ConfigManager()
+    config.set("paths.data_dir", data_dir)
+    config.set("paths.reports_dir", os.path.join(workdir, f"reports_{num_teams}"))
+    config.set("simulation.matches_per_day", num_teams // 2)
+
+    # Loading: CSV parse, snapshot compile (includes integrity checks) and warm snapshot load
+    config.set("data.use_roster_snapshot", False)
+    csv_loader = DataLoader(config)
+    clock.measure("load.csv", players, lambda: csv_loader.load_lineups(1))
+
+    config.set("data.use_roster_snapshot", True)
+    clock.measure("load.snapshot_compile", players, lambda: DataLoader(config).get_snapshot())
+    snapshot_loader = DataLoader(config)
+    clock.measure("load.snapshot_warm", players, lambda: snapshot_loader.load_lineups(1))
+
+    teams = snapshot_loader.load_teams()
+    lineups = {day: snapshot_loader.load_lineups(day) for day in range(1, days + 1)}
+
+    # Scheduling: plan the season once (every team plays every match day), then look days up
+    config.set("simulation.weeks_per_season", math.ceil(days / 5))
+    config.set("scheduling.seed", seed)
+    config.set("scheduling.table_path", os.path.join(workdir, f"schedule_{num_teams}.json"))
+    scheduler = MatchScheduler(config, snapshot_loader)
+    season = clock.measure("schedule.season", num_teams // 2 * days, lambda: scheduler.build_season(force=True))
+    match_days = [day for day in range(1, days + 1) if season.get(day)]
+    schedule = clock.measure("schedule.lookup", len(match_days), lambda: {
+        day: scheduler.schedule_matches(day, lineups[day]) for day in match_days
+    })
+
+    rng = random.Random(seed)
+    results = [synthetic_result(rng, f"d{day}_m{number}_{team_a}_{team_b}", team_a, team_b, lineups[day], teams, day)
+               for day, matchups in schedule.items()
+               for number, (team_a, team_b) in enumerate(matchups, 1)]
+    character_entries = sum(len(result["character_results"]) for result in results)
+
+    # Standings: incremental updates, then the queries day and season summaries make
+    standings = StandingsEngine(config)
+
+    def update_standings():
+        for result in results:
+            standings.record_match(result)
+            standings.record_character_results(result["character_results"])
+
+    def query_standings():
+        standings.get_standings(10)
+        standings.get_division_standings(10)
+        for code in MATCH_STATS:
+            standings.get_top_performers(code, 10)
+        for team_id in teams:
+            standings.get_team_rank(team_id)
+
+    clock.measure("standings.update", len(results), update_standings)
+    clock.measure("standings.query", len(teams), query_standings)
+
+    # Stats tracking: one accumulator row per rostered player seen in a lineup
+    # (the v5 copy of the accumulator, laid out on the stats a match records)
+    accumulator = RStatsAccumulator(MATCH_STATS)
+
+    def track_stats():
+        for day_lineups in lineups.values():
+            for team in day_lineups.values():
+                for char in team:
+                    accumulator.register(char)
+        for result in results:
+            for entry in result["character_results"]:
+                for code, value in entry["rStats"].items():
+                    accumulator.update(entry["character_id"], code, value)
+
+    clock.measure("stats.update", character_entries * len(MATCH_STATS), track_stats)
+    stats_path = os.path.join(workdir, f"rstats_{num_teams}.csv")
+    clock.measure("stats.export", len(accumulator), lambda: accumulator.export_csv(stats_path))
+
+    # Persistence: compact result store on disk
+    store = ReportStore(config)
+    store.activate()
+
+    def persist_results():
+        for result in results:
+            store.store_match(result)
+
+    clock.measure("persist.store", len(results), persist_results)
+    clock.measure("persist.load", len(results),
+                  lambda: [store.load(f"match:{result['match_id']}") for result in results])
+
+    return {
+        "teams": num_teams,
+        "league": manifest,
+        "matches": len(results),
+        "phases": clock.phases,
+        "bytes": {
+            "csv": manifest["bytes"],
+            "snapshot": os.path.getsize(snapshot_loader.snapshot_path),
+            "result_store": directory_bytes(store.store_dir),
+            "rstats_csv": os.path.getsize(stats_path)
+        }
+    }
+
+
+def scaling_exponents(runs: List[Dict[str, Any]]) -> Dict[str, List[Optional[float]]]:
+    """Growth exponent k of time ~ teams**k between consecutive sizes, per phase"""
+    exponents = {}
+    for previous, current in zip(runs, runs[1:]):
+        size_ratio = math.log(current["teams"] / previous["teams"])
+        for phase, timing in current["phases"].items():
+            before = previous["phases"].get(phase, {}).get("seconds")
+            value = None
+            if before and timing["seconds"] > 0:
+                value = math.log(timing["seconds"] / before) / size_ratio
+            exponents.setdefault(phase, []).append(value)
+    return exponents
+
+
+def print_report(runs: List[Dict[str, Any]], exponents: Dict[str, List[Optional[float]]]) -> None:
+    """Print the per-phase timings and growth exponents as a table"""
+    sizes = [run["teams"] for run in runs]
+    print("\nPhase timings (ms) by league size (teams)")
+    print(f"{'phase':<24}" + "".join(f"{size:>12}" for size in sizes) + "   growth k (time ~ teams^k)")
+    for phase in runs[0]["phases"]:
+        cells = "".join(f"{run['phases'][phase]['seconds'] * 1000:>12.1f}" for run in runs)
+        growth = ", ".join("-" if k is None else f"{k:.2f}" for k in exponents.get(phase, []))
+        print(f"{phase:<24}{cells}   {growth}")
+
+    print("\nOn-disk size (KiB)")
+    for kind in runs[0]["bytes"]:
+        print(f"{kind:<24}" + "".join(f"{run['bytes'][kind] / 1024:>12.0f}" for run in runs))
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="META league scaling report")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+                        help="Comma-separated league sizes in teams")
+    parser.add_argument("--days", type=int, default=DEFAULT_DAYS, help="Days scheduled per league")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--output", help="Write the report JSON here")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated leagues and stores")
+    args = parser.parse_args()
+
+    sys.path[:0] = [os.path.dirname(os.path.abspath(__file__)), V5_DIR, REPO_ROOT, CHECKMETA_DIR]
+    logging.disable(logging.WARNING)
+
+    output = os.path.abspath(args.output) if args.output else None
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+
+    # Pay the generator's import cost (pandas via checkMeta utils) before the first size is timed
+    importlib.import_module("utils.loaders")
+
+    # ConfigManager creates its default directories relative to the working directory
+    workdir = tempfile.mkdtemp(prefix="meta_scaling_")
+    cwd = os.getcwd()
+    os.chdir(workdir)
+
+    runs = []
+    try:
+        for size in sizes:
+            print(f"Measuring league of {size} teams...")
+            runs.append(measure_league(size, args.days, args.seed, workdir))
+    finally:
+        os.chdir(cwd)
+        if not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    exponents = scaling_exponents(runs)
+    print_report(runs, exponents)
+    if args.keep:
+        print(f"\nLeagues kept in {workdir}")
+
+    if output:
+        with open(output, "w") as f:
+            json.dump({
+                "created": datetime.datetime.now().isoformat(),
+                "seed": args.seed,
+                "days": args.days,
+                "python": platform.python_version(),
+                "runs": runs,
+                "growth_exponents": exponents
+            }, f, indent=2)
+        print(f"\nReport written to {output}")
+
+
+if __name__ == "__main__":
+    main()
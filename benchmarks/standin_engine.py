@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Stand-in UCI Engine for META Simulator Benchmarks
+Minimal deterministic UCI engine: one-ply material evaluation with optional think time.
+Lets engine-bound code paths (process spawn, UCI I/O, multipv analysis) be benchmarked
+without Stockfish installed.
+
+Usage: standin_engine.py [--think-ms N]
+"""
+
+import sys
+import time
+import argparse
+
+import chess
+
+PIECE_VALUES = {
+    chess.PAWN: 100,
+    chess.KNIGHT: 300,
+    chess.BISHOP: 310,
+    chess.ROOK: 500,
+    chess.QUEEN: 900,
+    chess.KING: 0
+}
+
+
+def evaluate(board: chess.Board) -> int:
+    """Material balance in centipawns from the side to move's perspective"""
+    score = 0
+    for square, piece in board.piece_map().items():
+        value = PIECE_VALUES[piece.piece_type]
+        score += value if piece.color == board.turn else -value
+    return score
+
+
+def rank_moves(board: chess.Board):
+    """Legal moves with scores, best first (ties broken by UCI string for determinism)"""
+    ranked = []
+    for move in board.legal_moves:
+        board.push(move)
+        if board.is_checkmate():
+            score = 100000
+        else:
+            score = -evaluate(board)
+        board.pop()
+        ranked.append((score, move.uci(), move))
+    ranked.sort(key=lambda entry: (-entry[0], entry[1]))
+    return ranked
+
+
+def parse_position(tokens, board: chess.Board) -> chess.Board:
+    """Apply a UCI 'position' command"""
+    if not tokens:
+        return board
+    if tokens[0] == "startpos":
+        board = chess.Board()
+        rest = tokens[1:]
+    elif tokens[0] == "fen":
+        fen_end = tokens.index("moves") if "moves" in tokens else len(tokens)
+        board = chess.Board(" ".join(tokens[1:fen_end]))
+        rest = tokens[fen_end:]
+    else:
+        return board
+    if rest and rest[0] == "moves":
+        for uci in rest[1:]:
+            board.push_uci(uci)
+    return board
+
+
+def main():
+    """UCI loop"""
+    parser = argparse.ArgumentParser(description="Stand-in UCI engine")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="Simulated search time per 'go'")
+    args = parser.parse_args()
+
+    board = chess.Board()
+    multipv = 1
+
+    def send(line):
+        sys.stdout.write(line + "\n")
+        sys.stdout.flush()
+
+    for raw in sys.stdin:
+        tokens = raw.split()
+        if not tokens:
+            continue
+        command = tokens[0]
+
+        if command == "uci":
+            send("id name META stand-in")
+            send("id author META")
+            send("option name MultiPV type spin default 1 min 1 max 500")
+            send("uciok")
+        elif command == "isready":
+            send("readyok")
+        elif command == "setoption":
+            if "name" in tokens and "value" in tokens:
+                name = " ".join(tokens[tokens.index("name") + 1:tokens.index("value")])
+                if name.lower() == "multipv":
+                    multipv = max(1, int(tokens[tokens.index("value") + 1]))
+        elif command == "ucinewgame":
+            board = chess.Board()
+        elif command == "position":
+            board = parse_position(tokens[1:], board)
+        elif command == "go":
+            if args.think_ms:
+                time.sleep(args.think_ms / 1000.0)
+            ranked = rank_moves(board)
+            if not ranked:
+                send("info depth 0 score mate 0")
+                send("bestmove (none)")
+                continue
+            for index, (score, uci, _) in enumerate(ranked[:multipv], 1):
+                send(f"info depth 1 seldepth 1 multipv {index} score cp {score} nodes {len(ranked)} pv {uci}")
+            send(f"bestmove {ranked[0][1]}")
+        elif command == "quit":
+            break
+
+
+if __name__ == "__main__":
+    main()
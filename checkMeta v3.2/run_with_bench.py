@@ -8,7 +8,8 @@ import sys
 import time
 import json
 import datetime
-import pandas as pd
+
+from utils.lineup_cache import get_lineup_cache, build_teams
 
 # Try to import meta_simulator
 try:
@@ -92,204 +93,18 @@ def load_teams_with_bench(lineup_file, match_date):
             print(f"Error: File '{lineup_file}' does not exist")
             return {}
         
-        # Get all sheet names
-        xls = pd.ExcelFile(lineup_file)
-        available_sheets = xls.sheet_names
-        print(f"Available sheets in Excel file: {available_sheets}")
-        
-        # Try to find a matching sheet
-        day_sheet_clean = day_sheet.replace('/', '')
-        matching_sheets = [s for s in available_sheets if day_sheet_clean in s.replace('/', '').replace('-', '')]
-        selected_sheet = None
-        
-        if day_sheet in available_sheets:
-            selected_sheet = day_sheet
-            print(f"Found exact match for sheet: {day_sheet}")
-        elif matching_sheets:
-            selected_sheet = matching_sheets[0]
-            print(f"Found partial match for sheet: {selected_sheet}")
-        else:
-            # Fall back to first sheet
-            selected_sheet = available_sheets[0]
-            print(f"No matching sheet found. Using first sheet: {selected_sheet}")
-        
-        # Load the selected sheet
+        # The workbook is compiled once; the deploy/bench columns decide is_active
+        selected_sheet, sheet = get_lineup_cache(lineup_file).get_sheet(day_sheet)
         print(f"Loading data from sheet: {selected_sheet}")
-        df = pd.read_excel(lineup_file, sheet_name=selected_sheet)
-        
-        # Print column names for debugging
-        print(f"Columns in sheet: {df.columns.tolist()}")
-        
-        # Check for deployment/bench column
-        deploy_column = None
-        bench_column = None
-        
-        possible_deploy_columns = ['Deploy', 'Deployment', 'deployRoster', 'Active', 'isActive']
-        possible_bench_columns = ['Bench', 'isBench', 'Reserve', 'isReserve']
-        
-        for col in possible_deploy_columns:
-            if col in df.columns:
-                deploy_column = col
-                print(f"Found deployment column: {col}")
-                break
-                
-        for col in possible_bench_columns:
-            if col in df.columns:
-                bench_column = col
-                print(f"Found bench column: {col}")
-                break
         
-        if not deploy_column and not bench_column:
+        if sheet["deploy"] is None and sheet["bench"] is None:
             print("Warning: No deploy or bench column found, will use role-based selection")
         
-        # Map column names for other data
-        column_mapping = {
-            'team_id': ['Team', 'team_id', 'team', 'team id', 'teamid', 'tid'],
-            'name': ['Nexus Being', 'name', 'character', 'character name', 'char_name', 'character_name'],
-            'role': ['Position', 'PositionFull', 'role', 'position', 'char_role', 'character_role']
-        }
-        
-        # Create new columns with required names based on available columns
-        for required_col, possible_cols in column_mapping.items():
-            found = False
-            for col in possible_cols:
-                if col in df.columns:
-                    print(f"Mapping '{col}' to '{required_col}'")
-                    df[required_col] = df[col]
-                    found = True
-                    break
-            
-            if not found:
-                print(f"Warning: Could not find any column to map to '{required_col}'")
-        
-        # Organize by teams
-        teams = {}
-        
-        for _, row in df.iterrows():
-            # Skip completely empty rows
-            if pd.isna(row.get('team_id', None)) and pd.isna(row.get('name', None)):
-                continue
-                
-            team_id = str(row.get('team_id', '')).strip()
-            
-            # Skip rows with empty team_id
-            if not team_id or pd.isna(team_id):
-                continue
-                
-            # Clean team_id format if needed (some Excel exports add '.0')
-            if team_id.endswith('.0'):
-                team_id = team_id[:-2]
-            
-            # Ensure team_id starts with 't' 
-            if not team_id.startswith('t'):
-                team_id = 't' + team_id
-            
-            if team_id not in teams:
-                teams[team_id] = []
-            
-            # Get character name
-            char_name = str(row.get('name', f"Character {len(teams[team_id])}")).strip()
-            if not char_name or pd.isna(char_name):
-                char_name = f"Character {len(teams[team_id])}"
-            
-            # Get role
-            role = str(row.get('role', 'FL')).strip()
-            if not role or pd.isna(role):
-                role = 'FL'
-            
-            # Normalize role
-            role = map_position_to_role(role)
-            
-            # Get division
-            division = get_division_from_role(role)
-            
-            # Determine if character is active or bench
-            is_active = True  # Default to active
-            
-            # Check bench/deploy columns
-            if deploy_column is not None:
-                deploy_value = row.get(deploy_column)
-                if not pd.isna(deploy_value):
-                    # Treat as active if any non-empty value
-                    is_active = bool(deploy_value)
-                    
-            if bench_column is not None:
-                bench_value = row.get(bench_column)
-                if not pd.isna(bench_value):
-                    # If bench column has any non-empty value, mark as bench
-                    if bench_value:
-                        is_active = False
-            
-            # Get team name
-            team_name = f"Team {team_id[1:]}"
-            if 'Team' in df.columns and not pd.isna(row.get('Team')):
-                team_name = f"Team {row.get('Team')}"
-            
-            # Create character dictionary
-            character = {
-                'id': f"{team_id}_{len(teams[team_id])}",
-                'name': char_name,
-                'team_id': team_id,
-                'team_name': team_name,
-                'role': role,
-                'division': division,
-                'HP': 100,
-                'stamina': 100,
-                'life': 100,
-                'morale': 50,
-                'traits': [],
-                'rStats': {},
-                'xp_total': 0,
-                'is_active': is_active,
-                'is_ko': False
-            }
-            
-            # Add stats - use default values
-            for stat in ['STR', 'SPD', 'FS', 'LDR', 'DUR', 'RES', 'WIL', 'OP', 'AM', 'SBY']:
-                character[f"a{stat}"] = 5
-            
-            # Try to get Rank as a value for stats
-            if 'Rank' in df.columns and not pd.isna(row.get('Rank')):
-                try:
-                    rank = int(row.get('Rank'))
-                    # Scale rank to stats (assuming rank is 1-10)
-                    stat_value = min(10, max(1, rank))
-                    # Apply to key stats
-                    character["aSTR"] = stat_value
-                    character["aSPD"] = stat_value
-                    character["aOP"] = stat_value
-                except:
-                    pass
-            
-            # Add traits based on Primary Type
-            if 'Primary Type' in df.columns and not pd.isna(row.get('Primary Type')):
-                primary_type = str(row.get('Primary Type')).lower()
-                
-                # Map primary types to traits
-                type_to_trait = {
-                    'tech': ['genius', 'armor'],
-                    'energy': ['genius', 'tactical'],
-                    'cosmic': ['shield', 'healing'],
-                    'mutant': ['agile', 'stretchy'],
-                    'bio': ['agile', 'spider-sense'],
-                    'mystic': ['tactical', 'healing'],
-                    'skill': ['tactical', 'spider-sense']
-                }
-                
-                # Assign traits based on primary type
-                for type_key, traits in type_to_trait.items():
-                    if type_key in primary_type:
-                        character['traits'] = traits
-                        break
-                
-                # Default traits if no match
-                if not character['traits']:
-                    character['traits'] = ['genius', 'tactical']
-            else:
-                # Default traits if no primary type
-                character['traits'] = ['genius', 'tactical']
-            
-            teams[team_id].append(character)
+        teams = build_teams(sheet, map_position_to_role, get_division_from_role,
+                            active_source="bench", required=())
+        for team_chars in teams.values():
+            for character in team_chars:
+                character['is_ko'] = False
         
         # Ensure exactly 8 active characters per team
         for team_id, team_chars in teams.items():
@@ -0,0 +1,438 @@
+"""
+META Fantasy League - Compiled Lineup Cache
+Reads the lineup workbook once, normalizes every day sheet with column operations
+and keeps a compact per-sheet cache on disk keyed by workbook mtime and hash
+"""
+
+import os
+import pickle
+import hashlib
+import numpy as np
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+CACHE_VERSION = 1
+
+# Source columns accepted for each normalized field, in priority order
+COLUMN_MAPPING = {
+    'team_id': ['Team', 'team_id', 'team', 'team id', 'teamid', 'tid'],
+    'name': ['Nexus Being', 'name', 'character', 'character name', 'char_name', 'character_name'],
+    'role': ['Position', 'PositionFull', 'role', 'position', 'char_role', 'character_role'],
+    'active': ['Active', 'is_active', 'active', 'playing', 'is_playing']
+}
+DEPLOY_COLUMNS = ['Deploy', 'Deployment', 'deployRoster', 'Active', 'isActive']
+BENCH_COLUMNS = ['Bench', 'isBench', 'Reserve', 'isReserve']
+
+# Primary type substring -> trait set; the first match wins
+TYPE_TO_TRAITS = [
+    ('tech', ('genius', 'armor')),
+    ('energy', ('genius', 'tactical')),
+    ('cosmic', ('shield', 'healing')),
+    ('mutant', ('agile', 'stretchy')),
+    ('bio', ('agile', 'spider-sense')),
+    ('mystic', ('tactical', 'healing')),
+    ('skill', ('tactical', 'spider-sense'))
+]
+TRAIT_SETS = [traits for _, traits in TYPE_TO_TRAITS] + [('genius', 'tactical')]
+DEFAULT_TRAIT_SET = len(TRAIT_SETS) - 1
+
+BASE_STATS = ['STR', 'SPD', 'FS', 'LDR', 'DUR', 'RES', 'WIL', 'OP', 'AM', 'SBY']
+ACTIVE_STRINGS = ('true', 'yes', 'y', '1', 'active', 'playing')
+
+# Tri-state flag encoding for optional boolean columns
+FLAG_MISSING, FLAG_FALSE, FLAG_TRUE = -1, 0, 1
+
+###############################
+# SHEET COMPILATION
+###############################
+
+def _first_column(df, candidates):
+    """Get the first available column from a candidate list, or None"""
+    for col in candidates:
+        if col in df.columns:
+            return df[col]
+    return None
+
+
+def _intern(values, strings: List[str], index: Dict[str, int]) -> np.ndarray:
+    """Encode a sequence of strings (None for missing) as indices into a string table"""
+    codes = np.empty(len(values), dtype=np.int32)
+    for i, value in enumerate(values):
+        if value is None:
+            codes[i] = -1
+            continue
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(strings)
+            strings.append(value)
+        codes[i] = code
+    return codes
+
+
+def _flag_column(series, convert: Callable[[Any], bool]) -> np.ndarray:
+    """Encode an optional boolean column as tri-state flags, converting each distinct value once"""
+    if series is None:
+        return None
+    present = series.notna()
+    converted = {value: convert(value) for value in series[present].unique()}
+    flags = np.full(len(series), FLAG_MISSING, dtype=np.int8)
+    flags[present.to_numpy()] = [FLAG_TRUE if converted[v] else FLAG_FALSE for v in series[present]]
+    return flags
+
+
+def _active_value(value) -> bool:
+    """Interpret an Active column value"""
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return value > 0
+    if isinstance(value, str):
+        return value.lower() in ACTIVE_STRINGS
+    return True
+
+
+def compile_sheet(df) -> Dict[str, Any]:
+    """Normalize one lineup sheet into compact column arrays
+
+    Args:
+        df: Raw sheet DataFrame
+
+    Returns:
+        dict: String table plus per-row index/flag arrays and any missing columns
+    """
+    import pandas as pd
+
+    team = _first_column(df, COLUMN_MAPPING['team_id'])
+    name = _first_column(df, COLUMN_MAPPING['name'])
+    role = _first_column(df, COLUMN_MAPPING['role'])
+    missing = [field for field, column in (('team_id', team), ('name', name), ('role', role)) if column is None]
+
+    n = len(df)
+    if team is None:
+        team = pd.Series([None] * n, index=df.index, dtype=object)
+    if name is None:
+        name = pd.Series([None] * n, index=df.index, dtype=object)
+
+    # Drop rows without a team ID (this also drops completely empty rows)
+    keep = team.notna()
+    team_str = team[keep].astype(str).str.strip().str.replace(r'\.0$', '', regex=True)
+    keep_idx = team_str.index[team_str != '']
+    team_str = team_str.loc[keep_idx]
+    rows = df.loc[keep_idx]
+
+    # Names: None marks a missing name, filled with the slot default when built
+    name_vals = name.loc[keep_idx]
+    name_str = name_vals.astype(str).str.strip().where(name_vals.notna(), '')
+    names = [value or None for value in name_str.tolist()]
+
+    # Raw position strings; role mapping happens per distinct value at build time
+    if role is None:
+        roles = ['FL'] * len(keep_idx)
+    else:
+        role_vals = role.loc[keep_idx]
+        role_str = role_vals.astype(str).str.strip().where(role_vals.notna(), '')
+        roles = [value or 'FL' for value in role_str.tolist()]
+
+    # Team display name from the Team column when present
+    if 'Team' in rows.columns:
+        team_col = rows['Team']
+        team_names = [f"Team {value}" if present else None
+                      for value, present in zip(team_col.astype(str).tolist(), team_col.notna().tolist())]
+    else:
+        team_names = [None] * len(keep_idx)
+
+    # Rank scales aSTR/aSPD/aOP; 0 means no usable rank
+    if 'Rank' in rows.columns:
+        rank = pd.to_numeric(rows['Rank'], errors='coerce').to_numpy(dtype=float)
+        valid = np.isfinite(rank)
+        ranks = np.zeros(len(rank), dtype=np.int8)
+        ranks[valid] = np.clip(np.trunc(rank[valid]), 1, 10)
+    else:
+        ranks = np.zeros(len(keep_idx), dtype=np.int8)
+
+    # Trait set index from Primary Type
+    if 'Primary Type' in rows.columns:
+        primary = rows['Primary Type']
+        lowered = primary.astype(str).str.lower()
+        conditions = [primary.notna().to_numpy() & lowered.str.contains(key, regex=False).to_numpy()
+                      for key, _ in TYPE_TO_TRAITS]
+        traits = np.select(conditions, range(len(TYPE_TO_TRAITS)), DEFAULT_TRAIT_SET).astype(np.int8)
+    else:
+        traits = np.full(len(keep_idx), DEFAULT_TRAIT_SET, dtype=np.int8)
+
+    strings = []
+    index = {}
+    return {
+        'missing': missing,
+        'rows': len(keep_idx),
+        'strings': strings,
+        'team_id': _intern(team_str.tolist(), strings, index),
+        'name': _intern(names, strings, index),
+        'role': _intern(roles, strings, index),
+        'team_name': _intern(team_names, strings, index),
+        'rank': ranks,
+        'traits': traits,
+        'active': _flag_column(_first_column(rows, COLUMN_MAPPING['active']), _active_value),
+        'deploy': _flag_column(_first_column(rows, DEPLOY_COLUMNS), bool),
+        'bench': _flag_column(_first_column(rows, BENCH_COLUMNS), bool)
+    }
+
+
+def _default_normalize_team_id(team_id: str) -> str:
+    """Ensure a team ID starts with 't'"""
+    return team_id if team_id.lower().startswith('t') else 't' + team_id
+
+
+def build_teams(sheet: Dict[str, Any],
+                map_role: Callable[[str], str],
+                get_division: Callable[[str], str],
+                normalize_team_id: Optional[Callable[[str], str]] = None,
+                active_source: Optional[str] = None,
+                required: Tuple[str, ...] = ('team_id', 'name', 'role')) -> Dict[str, List[Dict[str, Any]]]:
+    """Build fresh character dictionaries from a compiled sheet
+
+    Role, division and team ID normalization run once per distinct string.
+
+    Args:
+        sheet: Compiled sheet from compile_sheet
+        map_role: Position -> role code
+        get_division: Role code -> division
+        normalize_team_id: Team ID normalizer (defaults to prefixing 't')
+        active_source: None (no is_active key), 'active' (Active column) or 'bench' (deploy/bench columns)
+        required: Normalized columns that must exist in the sheet
+
+    Returns:
+        dict: Dictionary of teams by team_id
+    """
+    missing = [field for field in required if field in sheet['missing']]
+    if missing:
+        raise ValueError(f"Could not find any column to map to {missing}")
+
+    normalize_team_id = normalize_team_id or _default_normalize_team_id
+
+    strings = sheet['strings']
+    team_ids = {}
+    roles = {}
+
+    active = [True] * sheet['rows']
+    if active_source == 'active' and sheet['active'] is not None:
+        active = (sheet['active'] != FLAG_FALSE).tolist()
+    elif active_source == 'bench':
+        flags = np.ones(sheet['rows'], dtype=bool)
+        if sheet['deploy'] is not None:
+            flags &= sheet['deploy'] != FLAG_FALSE
+        if sheet['bench'] is not None:
+            flags &= sheet['bench'] != FLAG_TRUE
+        active = flags.tolist()
+
+    teams = {}
+    columns = zip(sheet['team_id'].tolist(), sheet['name'].tolist(), sheet['role'].tolist(),
+                  sheet['team_name'].tolist(), sheet['rank'].tolist(), sheet['traits'].tolist(), active)
+    for team_code, name_code, role_code, team_name_code, rank, trait_set, is_active in columns:
+        team_id = team_ids.get(team_code)
+        if team_id is None:
+            team_id = team_ids[team_code] = normalize_team_id(strings[team_code])
+        if not team_id:
+            continue
+
+        role_info = roles.get(role_code)
+        if role_info is None:
+            role = map_role(strings[role_code])
+            role_info = roles[role_code] = (role, get_division(role))
+
+        team = teams.setdefault(team_id, [])
+        slot = len(team)
+
+        character = {
+            'id': f"{team_id}_{slot}",
+            'name': strings[name_code] if name_code >= 0 else f"Character {slot}",
+            'team_id': team_id,
+            'team_name': strings[team_name_code] if team_name_code >= 0 else f"Team {team_id[1:]}",
+            'role': role_info[0],
+            'division': role_info[1],
+            'HP': 100,
+            'stamina': 100,
+            'life': 100,
+            'morale': 50,
+            'traits': list(TRAIT_SETS[trait_set]),
+            'rStats': {},
+            'xp_total': 0
+        }
+        if active_source is not None:
+            character['is_active'] = is_active
+
+        for stat in BASE_STATS:
+            character[f"a{stat}"] = 5
+        if rank:
+            character["aSTR"] = rank
+            character["aSPD"] = rank
+            character["aOP"] = rank
+
+        team.append(character)
+
+    return teams
+
+###############################
+# WORKBOOK CACHE
+###############################
+
+def _file_hash(path: str) -> str:
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _frame_hash(df) -> str:
+    """Content hash of a raw sheet, used to skip recompiling unchanged sheets"""
+    return hashlib.sha256(df.to_csv(index=False).encode('utf-8')).hexdigest()
+
+
+def resolve_sheet_name(day_sheet: str, available_sheets: List[str]) -> str:
+    """Pick the sheet for a day: exact name, then partial match ignoring separators, then the first sheet"""
+    if day_sheet in available_sheets:
+        return day_sheet
+
+    day_sheet_clean = day_sheet.replace('/', '')
+    for sheet in available_sheets:
+        if day_sheet_clean in sheet.replace('/', '').replace('-', ''):
+            return sheet
+
+    return available_sheets[0]
+
+
+class LineupCache:
+    """Compiled lineups for one workbook, kept in memory and persisted next to the workbook"""
+
+    def __init__(self, workbook_path: str, cache_path: Optional[str] = None):
+        """Initialize the cache
+
+        Args:
+            workbook_path: Path to the lineup Excel workbook
+            cache_path: Compiled cache file (defaults to .lineup_cache/<workbook>.pkl beside the workbook)
+        """
+        self.workbook_path = os.path.abspath(workbook_path)
+        if cache_path is None:
+            cache_dir = os.path.join(os.path.dirname(self.workbook_path), '.lineup_cache')
+            cache_path = os.path.join(cache_dir, os.path.basename(self.workbook_path) + '.pkl')
+        self.cache_path = cache_path
+
+        self._state = None
+        self.sheets_compiled = 0
+
+    def _load_state(self) -> Optional[Dict[str, Any]]:
+        """Read the persisted cache, ignoring unreadable or outdated files"""
+        if not os.path.exists(self.cache_path):
+            return None
+        try:
+            with open(self.cache_path, 'rb') as f:
+                state = pickle.load(f)
+        except Exception as e:
+            print(f"Ignoring unreadable lineup cache {self.cache_path}: {e}")
+            return None
+        if state.get('version') != CACHE_VERSION:
+            return None
+        return state
+
+    def _save_state(self) -> None:
+        """Write the cache atomically"""
+        os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+        tmp_path = self.cache_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(self._state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.cache_path)
+
+    def refresh(self) -> bool:
+        """Bring the cache up to date with the workbook
+
+        Returns:
+            bool: True if any sheet was recompiled
+        """
+        if not os.path.exists(self.workbook_path):
+            raise FileNotFoundError(f"File '{self.workbook_path}' does not exist")
+
+        if self._state is None:
+            self._state = self._load_state()
+
+        stat = os.stat(self.workbook_path)
+        state = self._state
+        if state and state['mtime_ns'] == stat.st_mtime_ns and state['size'] == stat.st_size:
+            return False
+
+        file_hash = _file_hash(self.workbook_path)
+        if state and state['hash'] == file_hash:
+            # Touched but unchanged
+            state['mtime_ns'] = stat.st_mtime_ns
+            self._save_state()
+            return False
+
+        self._compile(stat, file_hash)
+        return True
+
+    def _compile(self, stat, file_hash: str) -> None:
+        """Read every sheet in one pass and recompile those whose content changed"""
+        import pandas as pd
+
+        old_sheets = self._state['sheets'] if self._state else {}
+        frames = pd.read_excel(self.workbook_path, sheet_name=None)
+
+        sheets = {}
+        compiled = 0
+        for sheet_name, df in frames.items():
+            sheet_hash = _frame_hash(df)
+            previous = old_sheets.get(sheet_name)
+            if previous is not None and previous['hash'] == sheet_hash:
+                sheets[sheet_name] = previous
+                continue
+            sheets[sheet_name] = {'hash': sheet_hash, 'data': compile_sheet(df)}
+            compiled += 1
+
+        self._state = {
+            'version': CACHE_VERSION,
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'hash': file_hash,
+            'sheet_order': list(frames),
+            'sheets': sheets
+        }
+        self.sheets_compiled += compiled
+        self._save_state()
+        print(f"Compiled {compiled} of {len(sheets)} lineup sheets from {self.workbook_path}")
+
+    def sheet_names(self) -> List[str]:
+        """Get the workbook's sheet names in workbook order"""
+        self.refresh()
+        return list(self._state['sheet_order'])
+
+    def get_sheet(self, day_sheet: str) -> Tuple[str, Dict[str, Any]]:
+        """Get the compiled sheet for a day
+
+        Args:
+            day_sheet: Sheet name or date string such as '4/7/25'
+
+        Returns:
+            tuple: (selected sheet name, compiled sheet)
+        """
+        self.refresh()
+        selected = resolve_sheet_name(day_sheet, self._state['sheet_order'])
+        return selected, self._state['sheets'][selected]['data']
+
+    def load_day(self, day_sheet: str, map_role: Callable[[str], str], get_division: Callable[[str], str],
+                 **build_options) -> Dict[str, List[Dict[str, Any]]]:
+        """Build the teams for a day sheet; extra keyword options are passed to build_teams"""
+        _, sheet = self.get_sheet(day_sheet)
+        return build_teams(sheet, map_role, get_division, **build_options)
+
+
+# One cache per workbook per process
+_CACHES = {}
+
+
+def get_lineup_cache(workbook_path: str) -> LineupCache:
+    """Get the shared cache for a workbook"""
+    key = os.path.abspath(workbook_path)
+    cache = _CACHES.get(key)
+    if cache is None:
+        cache = _CACHES[key] = LineupCache(key)
+    return cache
@@ -8,9 +8,10 @@ import json
 import time
 import random
 import datetime
-import matplotlib.pyplot as plt
 from typing import List, Dict, Any, Tuple
 
+from utils.character_overlay import overlay_team
+
 class ParityTester:
     """Utility for testing and validating simulation fairness"""
     
@@ -52,9 +53,9 @@ class ParityTester:
         for i in range(iterations):
             print(f"Normal configuration - iteration {i+1}/{iterations}")
             
-            # Create deep copies to avoid modifying originals
-            team_a_copy = [char.copy() for char in team_a]
-            team_b_copy = [char.copy() for char in team_b]
+            # Overlay the rosters so the match never modifies the originals
+            team_a_copy = overlay_team(team_a)
+            team_b_copy = overlay_team(team_b)
             
             # Run match
             match_result = self.simulator.simulate_match(team_a_copy, team_b_copy, show_details=False)
@@ -76,9 +77,9 @@ class ParityTester:
         for i in range(iterations):
             print(f"Mirrored configuration - iteration {i+1}/{iterations}")
             
-            # Create deep copies to avoid modifying originals
-            team_a_copy = [char.copy() for char in team_a]
-            team_b_copy = [char.copy() for char in team_b]
+            # Overlay the rosters so the match never modifies the originals
+            team_a_copy = overlay_team(team_a)
+            team_b_copy = overlay_team(team_b)
             
             # Swap team names and IDs to ensure proper tracking
             for char in team_a_copy:
@@ -163,9 +164,9 @@ class ParityTester:
         for i in range(iterations):
             print(f"Iteration {i+1}/{iterations}")
             
-            # Create deep copies to avoid modifying originals
-            team_a_copy = [char.copy() for char in team_a]
-            team_b_copy = [char.copy() for char in team_b]
+            # Overlay the rosters so the match never modifies the originals
+            team_a_copy = overlay_team(team_a)
+            team_b_copy = overlay_team(team_b)
             
             # Run match
             match_result = self.simulator.simulate_match(team_a_copy, team_b_copy, show_details=False)
@@ -378,6 +379,7 @@ class ParityTester:
             # Save if path provided
             if save_path:
                 plt.savefig(save_path)
+                plt.close()
                 print(f"Visualization saved to {save_path}")
                 return save_path
             else:
@@ -452,6 +454,7 @@ class ParityTester:
             # Save if path provided
             if save_path:
                 plt.savefig(save_path)
+                plt.close()
                 print(f"Visualization saved to {save_path}")
                 return save_path
             else:
@@ -534,6 +537,7 @@ class ParityTester:
             # Save if path provided
             if save_path:
                 plt.savefig(save_path)
+                plt.close()
                 print(f"Visualization saved to {save_path}")
                 return save_path
             else:
@@ -11,16 +11,15 @@ import json
 import random
 import datetime
 import chess
-import chess.pgn
 import io
-import pandas as pd
 from typing import Dict, List, Any, Optional, Tuple
-from systems.initiative_randomizer import randomize_team_order, randomize_convergence_processing
+from systems.initiative_randomizer import randomize_team_order
 from systems.buffered_damage import BufferedDamageSystem
 from systems.enhanced_field_leader import FieldLeaderEnhancer
 from systems.loss_conditions import LossConditionSystem
 from systems.convergence_balancer import ConvergenceBalancer
 from systems.momentum_system import MomentumSystem
+from utils.rstats_accumulator import RStatsAccumulator
 
 # Create necessary directories
 os.makedirs("results", exist_ok=True)
@@ -43,11 +42,6 @@ class MetaLeagueSimulator:
         self.MAX_BATCH_SIZE = 5
         self.MAX_CONVERGENCES_PER_CHAR = 3
         self.stockfish_path = stockfish_path
-        self.buffered_damage = BufferedDamageSystem(
-            base_damage_reduction=self.BASE_DAMAGE_REDUCTION,
-            max_damage_reduction=self.MAX_DAMAGE_REDUCTION,
-            max_damage_per_hit=self.MAX_DAMAGE_PER_HIT
-        )
         
         # Integrated tracking systems
         self.pgn_tracker = PGNTracker()
@@ -66,6 +60,13 @@ class MetaLeagueSimulator:
         self.STAMINA_REGEN_RATE = 5     # Stamina regeneration per turn
         self.CRITICAL_THRESHOLD = 25    # Threshold for critical hits
         
+        # Round-level damage resolution
+        self.buffered_damage = BufferedDamageSystem(
+            base_damage_reduction=self.BASE_DAMAGE_REDUCTION,
+            max_damage_reduction=self.MAX_DAMAGE_REDUCTION,
+            max_damage_per_hit=self.MAX_DAMAGE_PER_HIT
+        )
+        
         # Trait definitions
         self.traits = self._create_trait_definitions()
         
@@ -612,8 +613,16 @@ class MetaLeagueSimulator:
         character["stamina"] = max(0, character.get("stamina", 100) - stamina_cost)
     
     def _process_convergences(self, team_a, team_a_boards, team_b, team_b_boards, match_context, show_details=False):
-        """Process convergences between boards"""
+        """Process convergences between boards
+        
+        Damage is buffered for the whole round and committed once at the end. Knockouts
+        are projected as damage is buffered, so a character knocked out earlier in the
+        round sits out the rest of it, as when damage was applied immediately.
+        """
         convergences = []
+        damage_events = []
+        projection = {}
+        knocked_out = set()
         
         # Track convergence counts per character
         char_convergence_counts = {char.get("id", f"A{i}"): 0 for i, char in enumerate(team_a)}
@@ -622,7 +631,7 @@ class MetaLeagueSimulator:
         # Check for piece overlaps across boards
         for a_idx, (a_char, a_board) in enumerate(zip(team_a, team_a_boards)):
             # Skip KO'd characters
-            if a_char.get("is_ko", False):
+            if a_char.get("is_ko", False) or id(a_char) in knocked_out:
                 continue
                 
             # Skip if reached max convergences
@@ -632,7 +641,7 @@ class MetaLeagueSimulator:
                 
             for b_idx, (b_char, b_board) in enumerate(zip(team_b, team_b_boards)):
                 # Skip KO'd characters
-                if b_char.get("is_ko", False):
+                if b_char.get("is_ko", False) or id(b_char) in knocked_out:
                     continue
                 
                 # Skip if reached max convergences
@@ -696,8 +705,11 @@ class MetaLeagueSimulator:
                         # Cap damage at maximum
                         reduced_damage = min(reduced_damage, self.MAX_DAMAGE_PER_HIT)
                         
-                        # Apply damage to loser
-                        self._apply_damage(loser, reduced_damage, source_character=winner, show_details=False)
+                        # Buffer damage to loser
+                        damage_event = {"target": loser, "source": winner, "damage": reduced_damage}
+                        damage_events.append(damage_event)
+                        if self.buffered_damage.project_damage(projection, damage_event):
+                            knocked_out.add(id(loser))
                         
                         # Record convergence data
                         convergence_data = {
@@ -741,6 +753,13 @@ class MetaLeagueSimulator:
                             if outcome == "critical_success":
                                 print(f"  CRITICAL SUCCESS! {winner.get('name', 'Winner')} executed an Ultimate Move!")
         
+        # Commit the round's HP, stamina and KO changes in one pass
+        results = self.buffered_damage.apply_round(damage_events)
+        if show_details:
+            for event, result in zip(damage_events, results):
+                if result["is_ko"]:
+                    print(f"  {event['target'].get('name', 'Character')} is KNOCKED OUT!")
+        
         return convergences
     
     def _calculate_combat_roll(self, attacker, defender):
@@ -1056,152 +1075,19 @@ CHARACTER OUTCOMES:
     ###############################
     
     def load_lineups_from_excel(self, file_path, day_sheet="4/7/25"):
-        """Load character lineups from an Excel file"""
+        """Load character lineups from an Excel file (compiled once, then served from the lineup cache)"""
+        from utils.lineup_cache import get_lineup_cache, build_teams
+        
         try:
             print(f"Attempting to load from: {file_path}")
             
-            # First check if file exists
             if not os.path.exists(file_path):
-                print(f"Error: File '{file_path}' does not exist")
                 raise FileNotFoundError(f"File '{file_path}' does not exist")
             
-            # Get sheet names
-            xls = pd.ExcelFile(file_path)
-            available_sheets = xls.sheet_names
-            print(f"Available sheets: {available_sheets}")
-            
-            # Find a matching sheet
-            day_sheet_clean = day_sheet.replace('/', '')
-            matching_sheets = [s for s in available_sheets if day_sheet_clean in s.replace('/', '').replace('-', '')]
-            
-            if day_sheet in available_sheets:
-                selected_sheet = day_sheet
-            elif matching_sheets:
-                selected_sheet = matching_sheets[0]
-            else:
-                # Fall back to first sheet
-                selected_sheet = available_sheets[0]
-            
+            selected_sheet, sheet = get_lineup_cache(file_path).get_sheet(day_sheet)
             print(f"Using sheet: {selected_sheet}")
             
-            # Load data
-            df = pd.read_excel(file_path, sheet_name=selected_sheet)
-            print(f"Columns: {df.columns.tolist()}")
-            
-            # Map columns
-            column_mapping = {
-                'team_id': ['Team', 'team_id', 'team', 'team id', 'teamid', 'tid'],
-                'name': ['Nexus Being', 'name', 'character', 'character name', 'char_name', 'character_name'],
-                'role': ['Position', 'PositionFull', 'role', 'position', 'char_role', 'character_role']
-            }
-            
-            # Find required columns
-            for required_col, possible_cols in column_mapping.items():
-                found = False
-                for col in possible_cols:
-                    if col in df.columns:
-                        print(f"Mapping '{col}' to '{required_col}'")
-                        df[required_col] = df[col]
-                        found = True
-                        break
-                
-                if not found:
-                    raise ValueError(f"Could not find column for '{required_col}'")
-            
-            # Organize by teams
-            teams = {}
-            
-            for _, row in df.iterrows():
-                # Skip empty rows
-                if pd.isna(row.get('team_id', None)) or pd.isna(row.get('name', None)):
-                    continue
-                
-                team_id = str(row.get('team_id', '')).strip()
-                
-                # Clean team_id
-                if team_id.endswith('.0'):
-                    team_id = team_id[:-2]
-                
-                # Ensure team_id starts with 't'
-                if not team_id.lower().startswith('t'):
-                    team_id = 't' + team_id
-                
-                # Initialize team if needed
-                if team_id not in teams:
-                    teams[team_id] = []
-                
-                # Get character attributes
-                char_name = str(row.get('name', f"Character {len(teams[team_id])}")).strip()
-                role = str(row.get('role', 'FL')).strip()
-                
-                # Get team name
-                if 'Team' in df.columns and not pd.isna(row.get('Team')):
-                    team_name = f"Team {row.get('Team')}"
-                else:
-                    team_name = f"Team {team_id[1:]}"
-                
-                # Map role to standardized code
-                role = self._map_position_to_role(role)
-                division = self._get_division_from_role(role)
-                
-                # Create character
-                character = {
-                    'id': f"{team_id}_{len(teams[team_id])}",
-                    'name': char_name,
-                    'team_id': team_id,
-                    'team_name': team_name,
-                    'role': role,
-                    'division': division,
-                    'HP': 100,
-                    'stamina': 100,
-                    'life': 100,
-                    'morale': 50,
-                    'traits': [],
-                    'rStats': {},
-                    'xp_total': 0
-                }
-                
-                # Add stats
-                for stat in ['STR', 'SPD', 'FS', 'LDR', 'DUR', 'RES', 'WIL', 'OP', 'AM', 'SBY']:
-                    character[f"a{stat}"] = 5
-                
-                # Try to get Rank for stats
-                if 'Rank' in df.columns and not pd.isna(row.get('Rank')):
-                    try:
-                        rank = int(row.get('Rank'))
-                        stat_value = min(10, max(1, rank))
-                        character["aSTR"] = stat_value
-                        character["aSPD"] = stat_value
-                        character["aOP"] = stat_value
-                    except:
-                        pass
-                
-                # Assign traits
-                if 'Primary Type' in df.columns and not pd.isna(row.get('Primary Type')):
-                    primary_type = str(row.get('Primary Type')).lower()
-                    
-                    # Map types to traits
-                    type_to_trait = {
-                        'tech': ['genius', 'armor'],
-                        'energy': ['genius', 'tactical'],
-                        'cosmic': ['shield', 'healing'],
-                        'mutant': ['agile', 'stretchy'],
-                        'bio': ['agile', 'spider-sense'],
-                        'mystic': ['tactical', 'healing'],
-                        'skill': ['tactical', 'spider-sense']
-                    }
-                    
-                    for type_key, traits in type_to_trait.items():
-                        if type_key in primary_type:
-                            character['traits'] = traits
-                            break
-                    
-                    if not character['traits']:
-                        character['traits'] = ['genius', 'tactical']
-                else:
-                    character['traits'] = ['genius', 'tactical']
-                
-                teams[team_id].append(character)
+            teams = build_teams(sheet, self._map_position_to_role, self._get_division_from_role)
             
             print(f"Loaded {sum(len(team) for team in teams.values())} characters across {len(teams)} teams")
             
@@ -1370,6 +1256,8 @@ class PGNTracker:
             print("ERROR: No active match. Call start_match() first")
             return ""
         
+        import chess.pgn  # loads chess.engine, kept off the simulator's import path
+        
         # Create a new game
         game = chess.pgn.Game()
         
@@ -1482,6 +1370,10 @@ class StatTracker:
         """Initialize the stat tracker"""
         self.character_stats = {}
         self.team_stats = {}
+        
+        # rStats live in one matrix, a column per stat name as it is first written
+        self.rstats = RStatsAccumulator([], open_columns=True, default_division="o")
+        self._stat_columns = {}
     
     def register_character(self, character):
         """Register a character for stat tracking"""
@@ -1500,6 +1392,7 @@ class StatTracker:
                 "losses": 0,
                 "draws": 0
             }
+            self.rstats.register(character)
             
             # Register team if needed
             team_id = character.get("team_id", "unknown")
@@ -1553,25 +1446,17 @@ class StatTracker:
     
     def update_character_stat(self, char_id, stat_name, value, operation="add"):
         """Update a specific stat for a character"""
+        row = self.rstats.row_of(char_id)
+        if row is None:
+            return
+        
         # Ensure rStat names start with 'r'
-        if not stat_name.startswith('r'):
-            stat_name = 'r' + stat_name
+        col = self._stat_columns.get(stat_name)
+        if col is None:
+            full_name = stat_name if stat_name.startswith('r') else 'r' + stat_name
+            col = self._stat_columns[stat_name] = self.rstats.column(full_name)
         
-        if char_id in self.character_stats:
-            if operation == "add":
-                if stat_name not in self.character_stats[char_id]:
-                    self.character_stats[char_id][stat_name] = 0
-                self.character_stats[char_id][stat_name] += value
-            elif operation == "set":
-                self.character_stats[char_id][stat_name] = value
-            elif operation == "max":
-                if stat_name not in self.character_stats[char_id]:
-                    self.character_stats[char_id][stat_name] = value
-                else:
-                    self.character_stats[char_id][stat_name] = max(
-                        self.character_stats[char_id][stat_name],
-                        value
-                    )
+        self.rstats.apply_at(row, col, value, operation)
     
     def update_team_stat(self, team_id, stat_name, value, operation="add"):
         """Update a specific stat for a team"""
@@ -1610,22 +1495,17 @@ class StatTracker:
         
         with open(char_path, "w", newline="") as f:
             # Get all stat fields
-            all_fields = set()
-            for stats in self.character_stats.values():
-                all_fields.update(stats.keys())
-            
-            # Remove basic fields that should come first
             base_fields = ["id", "name", "team_id", "role", "division", "matches", "wins", "losses", "draws"]
-            stat_fields = sorted([f for f in all_fields if f not in base_fields])
+            stat_fields = sorted(self.rstats.columns)
             
             # Create writer with all fields
             import csv
             writer = csv.DictWriter(f, fieldnames=base_fields + stat_fields)
             writer.writeheader()
             
-            # Write character stats
+            # Write character stats with their rStats from the matrix
             for char_id, stats in self.character_stats.items():
-                writer.writerow(stats)
+                writer.writerow({**stats, **self.rstats.as_dict(char_id)})
         
         # Export team stats
         team_path = f"{output_path}_teams.csv"
@@ -3,14 +3,24 @@ META Fantasy League - Buffered Damage System
 Handles damage calculations with buffering to prevent first-mover advantage
 """
 
-from typing import List, Dict, Any
-
 class BufferedDamageSystem:
     """System for buffering damage calculations to ensure fairness"""
     
-    def __init__(self):
-        """Initialize the buffered damage system"""
+    def __init__(self, base_damage_reduction=35, max_damage_reduction=75, max_damage_per_hit=None,
+                 damage_multiplier=1.0):
+        """Initialize the buffered damage system
+        
+        Args:
+            base_damage_reduction: Default base damage reduction percentage for round resolution
+            max_damage_reduction: Default maximum damage reduction percentage
+            max_damage_per_hit: Default cap on damage per hit (None for no cap)
+            damage_multiplier: Default multiplier on base damage (combat calibration)
+        """
         self.damage_buffer = []
+        self.base_damage_reduction = base_damage_reduction
+        self.max_damage_reduction = max_damage_reduction
+        self.max_damage_per_hit = max_damage_per_hit
+        self.damage_multiplier = damage_multiplier
     
     def buffer_calculations(self, convergences, base_reduction, max_reduction, damage_cap=None):
         """Buffer damage calculations for later application
@@ -165,6 +175,101 @@ class BufferedDamageSystem:
             "is_ko": is_ko
         }
     
+    # ---- ROUND RESOLUTION ----
+    # buffer_round() matches buffer_calculations() and apply_round() matches
+    # apply_buffered_damage() called once per event, in order. Rounds hold a handful
+    # of events, so plain loops beat array passes here.
+    
+    def resolve_round(self, intents, base_reduction=None, max_reduction=None, damage_cap=None,
+                      damage_multiplier=None, min_damage=1):
+        """Buffer and apply a round of damage intents
+        
+        Args:
+            intents: Convergence-style dicts with winner/loser (or source/target) and base_damage
+            base_reduction, max_reduction, damage_cap, damage_multiplier: Overrides of the defaults
+            min_damage: Floor on damage per hit after reduction
+            
+        Returns:
+            List: Result of each applied damage event, in buffer order
+        """
+        events = self.buffer_round(intents, base_reduction, max_reduction, damage_cap, damage_multiplier, min_damage)
+        return self.apply_round(events)
+    
+    def buffer_round(self, intents, base_reduction=None, max_reduction=None, damage_cap=None,
+                     damage_multiplier=None, min_damage=1):
+        """buffer_calculations for a whole round, computing each target's reduction once
+        
+        Intents may carry a precomputed "reduction" (percent) that is used as is.
+        
+        Returns:
+            List: Buffered damage events ready for apply_round()
+        """
+        base_reduction = self.base_damage_reduction if base_reduction is None else base_reduction
+        max_reduction = self.max_damage_reduction if max_reduction is None else max_reduction
+        damage_cap = self.max_damage_per_hit if damage_cap is None else damage_cap
+        damage_multiplier = self.damage_multiplier if damage_multiplier is None else damage_multiplier
+        
+        self.damage_buffer = []
+        reductions = {}
+        for intent in intents:
+            source = intent.get("winner", intent.get("source"))
+            target = intent.get("loser", intent.get("target"))
+            base_damage = intent.get("base_damage", 0)
+            if not source or not target or base_damage <= 0:
+                continue
+            
+            reduction = intent.get("reduction")
+            if reduction is None:
+                if id(target) not in reductions:
+                    reductions[id(target)] = self._calculate_damage_reduction(target, base_reduction, max_reduction)
+                reduction = reductions[id(target)]
+            
+            damage = max(min_damage, base_damage * damage_multiplier * (1 - reduction / 100.0))
+            if damage_cap:
+                damage = min(damage, damage_cap)
+            
+            self.damage_buffer.append({
+                "target": target,
+                "source": source,
+                "base_damage": base_damage,
+                "damage": damage,
+                "reduction": reduction
+            })
+        
+        return self.damage_buffer
+    
+    def apply_round(self, damage_events):
+        """Commit a round's buffered damage events in order
+        
+        Returns:
+            List: Result of each damage event, in order
+        """
+        return [self.apply_buffered_damage(event["target"], event) for event in damage_events]
+    
+    def project_damage(self, projection, damage_event):
+        """Fold a damage event into a round's projected HP and stamina, leaving the target untouched
+        
+        Lets a caller buffering a round see the knockouts apply_buffered_damage would
+        already have caused, so characters knocked out earlier in the round can be skipped.
+        
+        Args:
+            projection: Dict of id(target) to [HP, stamina], shared across the round
+            damage_event: Damage event data
+            
+        Returns:
+            bool: Whether the event knocks the target out
+        """
+        target = damage_event["target"]
+        state = projection.setdefault(id(target), [target.get("HP", 100), target.get("stamina", 100)])
+        damage = damage_event.get("damage", 0)
+        
+        current_hp = state[0]
+        state[0] = max(0, current_hp - damage)
+        if state[0] == 0:
+            state[1] = max(0, state[1] - (damage - current_hp) * 0.3)
+            return state[1] == 0
+        return False
+    
     def _calculate_damage_reduction(self, character, base_reduction, max_reduction):
         """Calculate damage reduction percentage for a character
         
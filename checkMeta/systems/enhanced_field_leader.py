@@ -5,6 +5,11 @@ Handles Field Leader enhancements and specialized abilities
 
 from typing import List, Dict, Any, Tuple
 
+from utils.stat_modifiers import add_modifier, ADD, PRIORITY_TEAM
+
+# Field Leader attribute bonuses never raise an attribute above this
+FL_ATTRIBUTE_CAP = 10
+
 class FieldLeaderEnhancer:
     """System for enhancing Field Leaders with better durability and special traits"""
     
@@ -120,6 +125,18 @@ class FieldLeaderEnhancer:
             # Balanced team - balanced leader
             self._add_balanced_leader_bonus(field_leader)
     
+    def _add_attribute_bonus(self, character, stat, bonus):
+        """Add a Field Leader attribute bonus as a modifier, capped at FL_ATTRIBUTE_CAP
+        
+        Args:
+            character: Character to enhance
+            stat: Attribute name
+            bonus: Bonus before the cap
+        """
+        current = character.get(stat, 5)
+        add_modifier(character, "field_leader", stat, max(0, min(FL_ATTRIBUTE_CAP, current + bonus) - current),
+                     ADD, PRIORITY_TEAM, stack=True, default=5)
+    
     def _add_tactical_leader_bonus(self, field_leader):
         """Add tactical leader bonuses for operations-focused teams
         
@@ -127,8 +144,8 @@ class FieldLeaderEnhancer:
             field_leader: Field Leader character
         """
         # Enhance STR and DUR attributes
-        field_leader["aSTR"] = min(10, field_leader.get("aSTR", 5) + 1)
-        field_leader["aDUR"] = min(10, field_leader.get("aDUR", 5) + 1)
+        self._add_attribute_bonus(field_leader, "aSTR", 1)
+        self._add_attribute_bonus(field_leader, "aDUR", 1)
         
         # Add tactical traits if needed
         tactical_traits = ["tactical", "shield"]
@@ -143,8 +160,8 @@ class FieldLeaderEnhancer:
             field_leader: Field Leader character
         """
         # Enhance FS and WIL attributes
-        field_leader["aFS"] = min(10, field_leader.get("aFS", 5) + 1)
-        field_leader["aWIL"] = min(10, field_leader.get("aWIL", 5) + 1)
+        self._add_attribute_bonus(field_leader, "aFS", 1)
+        self._add_attribute_bonus(field_leader, "aWIL", 1)
         
         # Add strategic traits if needed
         strategic_traits = ["genius", "tactical"]
@@ -159,8 +176,8 @@ class FieldLeaderEnhancer:
             field_leader: Field Leader character
         """
         # Enhance LDR and DUR attributes
-        field_leader["aLDR"] = min(10, field_leader.get("aLDR", 5) + 1)
-        field_leader["aRES"] = min(10, field_leader.get("aRES", 5) + 1)
+        self._add_attribute_bonus(field_leader, "aLDR", 1)
+        self._add_attribute_bonus(field_leader, "aRES", 1)
         
         # Add balanced traits if needed
         balanced_traits = ["tactical", "healing"]
@@ -245,4 +262,4 @@ class FieldLeaderEnhancer:
             substitute["traits"].append("emergency_leadership")
             
         # Apply emergency leadership bonuses
-        substitute["aLDR"] = min(10, substitute.get("aLDR", 5) + 1)
\ No newline at end of file
+        self._add_attribute_bonus(substitute, "aLDR", 1)
\ No newline at end of file
@@ -5,6 +5,17 @@ Handles team momentum tracking and comeback mechanics
 
 from typing import List, Dict, Any, Tuple
 
+from utils.stat_modifiers import add_modifier, remove_modifiers, ADD, PRIORITY_TEAM
+
+# Momentum effect -> character stat it modifies
+MOMENTUM_STATS = {
+    "damage_reduction": "momentum_reduction",
+    "damage_bonus": "momentum_damage",
+    "trait_bonus": "momentum_trait",
+    "stamina_discount": "momentum_stamina",
+    "recovery": "momentum_recovery"
+}
+
 class MomentumSystem:
     """System for tracking team momentum and applying comeback mechanics"""
     
@@ -257,25 +268,15 @@ class MomentumSystem:
             char["momentum_state"] = state
             char["momentum_value"] = momentum["value"]
             
-            # Apply damage reduction (for crash state)
-            if "damage_reduction" in effects:
-                char["momentum_reduction"] = effects["damage_reduction"]
-            
-            # Apply damage bonus (for building state)
-            if "damage_bonus" in effects:
-                char["momentum_damage"] = effects["damage_bonus"]
-            
-            # Apply trait activation bonus
-            if "trait_bonus" in effects:
-                char["momentum_trait"] = effects["trait_bonus"]
-            
-            # Apply stamina discount
-            if "stamina_discount" in effects:
-                char["momentum_stamina"] = effects["stamina_discount"]
+            # Replace the previous update's momentum and comeback modifiers
+            remove_modifiers(char, "momentum")
+            remove_modifiers(char, "comeback")
             
-            # Apply recovery bonus
-            if "recovery" in effects:
-                char["momentum_recovery"] = effects["recovery"]
+            # Apply damage reduction (crash), damage bonus (building), trait activation
+            # bonus, stamina discount and recovery bonus
+            for effect, stat in MOMENTUM_STATS.items():
+                if effect in effects:
+                    add_modifier(char, "momentum", stat, effects[effect], ADD, PRIORITY_TEAM)
     
     def _apply_comeback_effects(self, team):
         """Apply special comeback effects to a team
@@ -289,12 +290,10 @@ class MomentumSystem:
                 continue
             
             # Enhanced damage reduction (stacks with crash reduction)
-            reduction_bonus = char.get("momentum_reduction", 0) + 10
-            char["momentum_reduction"] = reduction_bonus
+            add_modifier(char, "comeback", "momentum_reduction", 10, ADD, PRIORITY_TEAM)
             
             # Enhanced trait activation
-            trait_bonus = char.get("momentum_trait", 0) + 15
-            char["momentum_trait"] = trait_bonus
+            add_modifier(char, "comeback", "momentum_trait", 15, ADD, PRIORITY_TEAM)
             
             # Apply "comeback" flag for other systems
             char["comeback_active"] = True
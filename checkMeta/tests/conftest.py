@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+CHECKMETA_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The simulator imports its systems/ package relative to the checkMeta root
+sys.path.insert(0, CHECKMETA_ROOT)
+
+
+@pytest.fixture(scope="session")
+def meta_simulator(tmp_path_factory):
+    """The simulator module, imported from a scratch directory (it creates results/ on import)"""
+    previous = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("checkmeta"))
+    try:
+        import meta_simulator
+        yield meta_simulator
+    finally:
+        os.chdir(previous)
@@ -0,0 +1,79 @@
+import copy
+import random
+
+import chess
+import pytest
+
+
+class ImmediateDamage:
+    """Stands in for BufferedDamageSystem, applying each hit as it is found (the sequential path)"""
+
+    def __init__(self, simulator):
+        self.simulator = simulator
+
+    def project_damage(self, projection, damage_event):
+        self.simulator._apply_damage(damage_event["target"], damage_event["damage"],
+                                     source_character=damage_event["source"])
+        return False
+
+    def apply_round(self, damage_events):
+        return [{"is_ko": False}] * len(damage_events)
+
+
+def make_team(prefix):
+    return [{"id": "{}{}".format(prefix, i), "name": "{}{}".format(prefix, i), "division": "o",
+             "HP": 3 + 3 * i, "stamina": i, "aSTR": 5 + i, "aOP": 5, "traits": []}
+            for i in range(3)]
+
+
+def make_board():
+    # One shared non-pawn square, so every pairing converges exactly once
+    board = chess.Board(None)
+    board.set_piece_at(chess.D4, chess.Piece(chess.KNIGHT, chess.WHITE))
+    return board
+
+
+def run_round(simulator, seed):
+    team_a, team_b = make_team("a"), make_team("b")
+    boards = [make_board() for _ in range(6)]
+    context = {"convergences": []}
+    random.seed(seed)
+    convergences = simulator._process_convergences(team_a, boards[:3], team_b, boards[3:], context)
+    return convergences, team_a + team_b
+
+
+@pytest.fixture
+def simulator(meta_simulator):
+    return meta_simulator.MetaLeagueSimulator()
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_buffered_round_matches_sequential_application(simulator, seed):
+    buffered = run_round(simulator, seed)
+
+    sequential_simulator = copy.copy(simulator)
+    sequential_simulator.buffered_damage = ImmediateDamage(sequential_simulator)
+    sequential = run_round(sequential_simulator, seed)
+
+    assert buffered == sequential
+    assert any(character.get("is_ko") for character in buffered[1])
+
+
+
+def test_resolve_round_matches_per_event_buffering():
+    from systems.buffered_damage import BufferedDamageSystem
+
+    def intents(characters):
+        rng = random.Random(5)
+        return [{"winner": rng.choice(characters), "loser": rng.choice(characters), "base_damage": rng.randint(1, 40)}
+                for _ in range(12)]
+
+    round_characters, event_characters = make_team("a"), make_team("a")
+    system = BufferedDamageSystem(max_damage_per_hit=30)
+
+    round_results = system.resolve_round(intents(round_characters), min_damage=1)
+    events = system.buffer_calculations(intents(event_characters), 35, 75, 30)
+    event_results = [system.apply_buffered_damage(event["target"], event) for event in events]
+
+    assert round_results == event_results
+    assert round_characters == event_characters
@@ -0,0 +1,18 @@
+import csv
+
+
+def test_character_rstats_go_through_the_accumulator(meta_simulator, tmp_path):
+    tracker = meta_simulator.StatTracker()
+    tracker.register_character({"id": "c1", "name": "Ana", "team_id": "t1", "division": "o"})
+    tracker.update_character_stat("c1", "DD", 4)
+    tracker.update_character_stat("c1", "rDD", 2)
+    tracker.update_character_stat("c1", "OTD", 3, "max")
+    tracker.update_character_stat("ghost", "DD", 9)
+
+    assert tracker.rstats.as_dict("c1") == {"rDD": 6.0, "rOTD": 3.0}
+    assert "ghost" not in tracker.rstats
+
+    char_path = tracker.export_stats(str(tmp_path / "stats"))
+    with open(char_path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]["id"] == "c1" and float(rows[0]["rDD"]) == 6.0 and rows[0]["wins"] == "0"
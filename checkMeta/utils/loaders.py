@@ -6,11 +6,13 @@ Handles loading lineups from Excel files and other data sources
 import os
 import pandas as pd
 import random
-from typing import Dict, List, Any
 
 def load_lineups_from_excel(file_path, day_sheet="4/7/25"):
     """Load character lineups from an Excel file
     
+    The workbook is compiled once into a cached per-sheet form (see utils.lineup_cache);
+    later calls only rebuild character dictionaries from memory.
+    
     Args:
         file_path: Path to Excel file
         day_sheet: Sheet name for day-specific lineups
@@ -18,177 +20,20 @@ def load_lineups_from_excel(file_path, day_sheet="4/7/25"):
     Returns:
         dict: Dictionary of teams by team_id
     """
+    from utils.lineup_cache import get_lineup_cache, build_teams
+    
     try:
-        print(f"Attempting to load from: {file_path}")
-        
         # First check if file exists
         if not os.path.exists(file_path):
             print(f"Error: File '{file_path}' does not exist")
             raise FileNotFoundError(f"File '{file_path}' does not exist")
         
-        # Get all sheet names to debug
-        xls = pd.ExcelFile(file_path)
-        available_sheets = xls.sheet_names
-        print(f"Available sheets in Excel file: {available_sheets}")
-        
-        # Try to find a matching sheet
-        day_sheet_clean = day_sheet.replace('/', '')
-        matching_sheets = [s for s in available_sheets if day_sheet_clean in s.replace('/', '').replace('-', '')]
-        selected_sheet = None
-        
-        if day_sheet in available_sheets:
-            selected_sheet = day_sheet
-            print(f"Found exact match for sheet: {day_sheet}")
-        elif matching_sheets:
-            selected_sheet = matching_sheets[0]
-            print(f"Found partial match for sheet: {selected_sheet}")
-        else:
-            # Fall back to first sheet
-            selected_sheet = available_sheets[0]
-            print(f"No matching sheet found. Using first sheet: {selected_sheet}")
-        
-        # Load the selected sheet
+        selected_sheet, sheet = get_lineup_cache(file_path).get_sheet(day_sheet)
         print(f"Loading data from sheet: {selected_sheet}")
-        df = pd.read_excel(file_path, sheet_name=selected_sheet)
-        
-        # Print column names for debugging
-        print(f"Columns in sheet: {df.columns.tolist()}")
-        
-        # Map column names based on what's available
-        column_mapping = {
-            'team_id': ['Team', 'team_id', 'team', 'team id', 'teamid', 'tid'],
-            'name': ['Nexus Being', 'name', 'character', 'character name', 'char_name', 'character_name'],
-            'role': ['Position', 'PositionFull', 'role', 'position', 'char_role', 'character_role']
-        }
         
-        # Create new columns with required names based on available columns
-        required_columns = ['team_id', 'name', 'role']
-        
-        for required_col, possible_cols in column_mapping.items():
-            found = False
-            for col in possible_cols:
-                if col in df.columns:
-                    print(f"Mapping '{col}' to '{required_col}'")
-                    df[required_col] = df[col]
-                    found = True
-                    break
-            
-            if not found:
-                print(f"Error: Could not find any column to map to '{required_col}'")
-                raise ValueError(f"Could not find any column to map to '{required_col}'")
-        
-        # Organize by teams
-        teams = {}
-        valid_rows = 0
-        
-        for _, row in df.iterrows():
-            # Skip completely empty rows
-            if pd.isna(row.get('team_id', None)) and pd.isna(row.get('name', None)):
-                continue
-                
-            team_id = str(row.get('team_id', '')).strip()
-            
-            # Skip rows with empty team_id
-            if not team_id or pd.isna(team_id):
-                continue
-                
-            # Clean team_id format if needed (some Excel exports add '.0')
-            if team_id.endswith('.0'):
-                team_id = team_id[:-2]
-            
-            # Ensure team_id starts with 't' 
-            if not team_id.lower().startswith('t'):
-                team_id = 't' + team_id
-            
-            if team_id not in teams:
-                teams[team_id] = []
-            
-            # Get character name
-            char_name = str(row.get('name', f"Character {len(teams[team_id])}")).strip()
-            if not char_name or pd.isna(char_name):
-                char_name = f"Character {len(teams[team_id])}"
-            
-            # Get role
-            role = str(row.get('role', 'FL')).strip()
-            if not role or pd.isna(role):
-                role = 'FL'
-            
-            # Get team name (from Team column or construct from team_id)
-            team_name = None
-            if 'Team' in df.columns and not pd.isna(row.get('Team')):
-                team_name = f"Team {row.get('Team')}"
-            else:
-                team_name = f"Team {team_id[1:]}"  # Remove 't' prefix for name
-            
-            # Create character
-            role = map_position_to_role(role)
-            division = get_division_from_role(role)
-            
-            character = {
-                'id': f"{team_id}_{len(teams[team_id])}",
-                'name': char_name,
-                'team_id': team_id,
-                'team_name': team_name,
-                'role': role,
-                'division': division,
-                'HP': 100,
-                'stamina': 100,
-                'life': 100,
-                'morale': 50,
-                'traits': [],
-                'rStats': {},
-                'xp_total': 0
-            }
-            
-            # Add stats - use default values since these usually aren't in the Excel
-            for stat in ['STR', 'SPD', 'FS', 'LDR', 'DUR', 'RES', 'WIL', 'OP', 'AM', 'SBY']:
-                character[f"a{stat}"] = 5
-            
-            # Try to get Rank as a value for stats
-            if 'Rank' in df.columns and not pd.isna(row.get('Rank')):
-                try:
-                    rank = int(row.get('Rank'))
-                    # Scale rank to stats (assuming rank is 1-10)
-                    stat_value = min(10, max(1, rank))
-                    # Apply to key stats
-                    character["aSTR"] = stat_value
-                    character["aSPD"] = stat_value
-                    character["aOP"] = stat_value
-                except:
-                    pass
-            
-            # Add traits based on Primary Type
-            if 'Primary Type' in df.columns and not pd.isna(row.get('Primary Type')):
-                primary_type = str(row.get('Primary Type')).lower()
-                
-                # Map primary types to traits
-                type_to_trait = {
-                    'tech': ['genius', 'armor'],
-                    'energy': ['genius', 'tactical'],
-                    'cosmic': ['shield', 'healing'],
-                    'mutant': ['agile', 'stretchy'],
-                    'bio': ['agile', 'spider-sense'],
-                    'mystic': ['tactical', 'healing'],
-                    'skill': ['tactical', 'spider-sense']
-                }
-                
-                # Assign traits based on primary type
-                for type_key, traits in type_to_trait.items():
-                    if type_key in primary_type:
-                        character['traits'] = traits
-                        break
-                
-                # Default traits if no match
-                if not character['traits']:
-                    character['traits'] = ['genius', 'tactical']
-            else:
-                # Default traits if no primary type
-                character['traits'] = ['genius', 'tactical']
-            
-            teams[team_id].append(character)
-            valid_rows += 1
+        teams = build_teams(sheet, map_position_to_role, get_division_from_role)
         
-        print(f"Successfully loaded {valid_rows} characters across {len(teams)} teams")
+        print(f"Successfully loaded {sum(len(team) for team in teams.values())} characters across {len(teams)} teams")
         
         # If no valid teams loaded, return error
         if not teams:
@@ -247,23 +92,35 @@ def load_trait_catalog(csv_path='data/traits/SimEngine v2  full_trait_catalog_ex
             df = pd.read_csv(csv_path)
             
             for _, row in df.iterrows():
-                team_id = str(row.get('team_id', '')).strip()
-                division = str(row.get('division', '')).strip()
+                # Extract key info
+                trait_id = row.get('trait_id', '').strip()
+                if not trait_id:
+                    continue
+                    
+                # Parse triggers
+                triggers_raw = row.get('triggers', '').strip()
+                triggers = [t.strip() for t in triggers_raw.split(',') if t.strip()]
                 
-                if team_id and division:
-                    # Normalize team ID
-                    if not team_id.lower().startswith('t'):
-                        team_id = 't' + team_id
-                        
-                    team_divisions[team_id] = division
+                # Create trait definition
+                traits[trait_id] = {
+                    'name': row.get('name', trait_id),
+                    'type': row.get('type', '').lower(),
+                    'triggers': triggers,
+                    'formula_key': row.get('formula_key', ''),
+                    'formula_expr': row.get('formula_expr', ''),
+                    'value': int(row.get('value', 0)) if row.get('value', '').isdigit() else 10,
+                    'stamina_cost': int(row.get('stamina_cost', 0)) if row.get('stamina_cost', '').isdigit() else 0,
+                    'cooldown': int(row.get('cooldown', 0)) if row.get('cooldown', '').isdigit() else 0,
+                    'description': row.get('description', '')
+                }
             
-            print(f"Loaded {len(team_divisions)} team divisions from {csv_path}")
-            return team_divisions
+            print(f"Loaded {len(traits)} traits from {csv_path}")
+            return traits
     except Exception as e:
-        print(f"Error loading division data: {e}")
+        print(f"Error loading trait catalog: {e}")
     
     # Return empty if loading fails
-    return team_divisions
+    return traits
 
 def generate_random_character(team_id, index, role=None):
     """Generate a random character for testing
@@ -435,36 +292,6 @@ def get_division_from_role(role):
         return "i"
     else:
         return "o"  # Default to operations
-                # Extract key info
-                trait_id = row.get('trait_id', '').strip()
-                if not trait_id:
-                    continue
-                    
-                # Parse triggers
-                triggers_raw = row.get('triggers', '').strip()
-                triggers = [t.strip() for t in triggers_raw.split(',') if t.strip()]
-                
-                # Create trait definition
-                traits[trait_id] = {
-                    'name': row.get('name', trait_id),
-                    'type': row.get('type', '').lower(),
-                    'triggers': triggers,
-                    'formula_key': row.get('formula_key', ''),
-                    'formula_expr': row.get('formula_expr', ''),
-                    'value': int(row.get('value', 0)) if row.get('value', '').isdigit() else 10,
-                    'stamina_cost': int(row.get('stamina_cost', 0)) if row.get('stamina_cost', '').isdigit() else 0,
-                    'cooldown': int(row.get('cooldown', 0)) if row.get('cooldown', '').isdigit() else 0,
-                    'description': row.get('description', '')
-                }
-            
-            print(f"Loaded {len(traits)} traits from {csv_path}")
-            return traits
-    except Exception as e:
-        print(f"Error loading trait catalog: {e}")
-    
-    # Return empty if loading fails
-    return traits
-
 def load_divisions_data(csv_path='data/teams/SimEngine v3  Divisions.csv'):
     """Load division assignments data
     
@@ -480,4 +307,22 @@ def load_divisions_data(csv_path='data/teams/SimEngine v3  Divisions.csv'):
         if os.path.exists(csv_path):
             df = pd.read_csv(csv_path)
             
-            for _, row in df.iterrows():
\ No newline at end of file
+            for _, row in df.iterrows():
+                team_id = str(row.get('team_id', '')).strip()
+                division = str(row.get('division', '')).strip()
+                
+                if team_id and division:
+                    # Normalize team ID
+                    if not team_id.lower().startswith('t'):
+                        team_id = 't' + team_id
+                        
+                    team_divisions[team_id] = division
+            
+            print(f"Loaded {len(team_divisions)} team divisions from {csv_path}")
+            return team_divisions
+    except Exception as e:
+        print(f"Error loading division data: {e}")
+    
+    # Return empty if loading fails
+    return team_divisions
+
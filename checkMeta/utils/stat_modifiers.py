@@ -0,0 +1,327 @@
+"""
+META Fantasy League - Stat Modifiers
+Per-character stack of attribute modifiers with cached effective values
+
+Every temporary change to a stat (field-leader bonuses, momentum, comeback effects, ...)
+is a modifier on the character's stack instead of an ad hoc rewrite of the attribute.
+A modifier has a source, a stat, a value, a stacking mode, a priority and an optional
+duration in rounds.
+
+Effective values are resolved by priority layer, lowest first:
+    value = (value + sum of additive modifiers) * product of multiplicative modifiers
+and cached until the stack changes. sync_modifiers() writes them through to the
+character's attribute keys, so code reading character["aSTR"] sees the effective
+value with a plain dict lookup; the base values live on the stack.
+"""
+
+from typing import Dict, List, Any, Optional, Tuple, Iterator
+
+ADD = "add"
+MUL = "mul"
+
+# Default priorities: lower layers resolve first
+PRIORITY_HOME = 0
+PRIORITY_TEAM = 10        # synergies, field-leader bonuses
+PRIORITY_TRAIT = 20
+PRIORITY_CONVERGENCE = 30
+PRIORITY_COMBAT = 40
+
+STACK_KEY = "modifier_stack"
+
+
+class StatModifier:
+    """One source's modifier to one stat"""
+
+    __slots__ = ("source", "stat", "value", "mode", "priority", "remaining")
+
+    def __init__(self, source: str, stat: str, value: float, mode: str = ADD,
+                 priority: int = 0, duration: Optional[int] = None):
+        if mode not in (ADD, MUL):
+            raise ValueError(f"Unknown modifier mode: {mode}")
+        self.source = source
+        self.stat = stat
+        self.value = value
+        self.mode = mode
+        self.priority = priority
+        self.remaining = duration
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"source": self.source, "stat": self.stat, "value": self.value, "mode": self.mode,
+                "priority": self.priority, "remaining": self.remaining}
+
+    def __repr__(self) -> str:
+        sign = "x" if self.mode == MUL else "+"
+        return f"StatModifier({self.source}: {self.stat} {sign}{self.value}, p{self.priority}, {self.remaining})"
+
+
+class ModifierStack:
+    """
+    A character's modifiers keyed by (source, stat)
+
+    The effective values are recomputed only when the stack is dirty, and then only
+    for the stats whose modifiers changed. Expiry is ticked by round number, so several
+    systems may tick the same round and the round still counts once.
+    """
+
+    __slots__ = ("bases", "modifiers", "effective", "_dirty", "_last_round")
+
+    def __init__(self, bases: Optional[Dict[str, float]] = None):
+        """Create a stack
+
+        Args:
+            bases: Unmodified stat values (more are captured as stats are first modified)
+        """
+        self.bases: Dict[str, float] = dict(bases or {})
+        self.modifiers: Dict[Tuple[str, str], StatModifier] = {}
+        self.effective: Dict[str, float] = {}
+        self._dirty = set()
+        self._last_round = None
+
+    @property
+    def dirty(self) -> bool:
+        """Whether some effective values are out of date"""
+        return bool(self._dirty)
+
+    def add(self, source: str, stat: str, value: float, mode: str = ADD, priority: int = 0,
+            duration: Optional[int] = None, stack: bool = False) -> StatModifier:
+        """Add or replace the modifier of `source` on `stat`
+
+        Args:
+            source: Who applies the modifier ("home_advantage", "synergy:<name>", "trait:<id>", ...)
+            stat: Stat name
+            value: Amount to add (ADD) or factor to multiply by (MUL)
+            mode: ADD or MUL
+            priority: Resolution layer, lowest first
+            duration: Rounds until expiry (None = until removed)
+            stack: Accumulate onto an existing modifier of the same source instead of replacing it
+        """
+        key = (source, stat)
+        existing = self.modifiers.get(key)
+        if stack and existing is not None and existing.mode == mode:
+            existing.value = existing.value + value if mode == ADD else existing.value * value
+            existing.remaining = duration
+            existing.priority = priority
+            modifier = existing
+        else:
+            modifier = self.modifiers[key] = StatModifier(source, stat, value, mode, priority, duration)
+        self._dirty.add(stat)
+        return modifier
+
+    def remove(self, source: str, stat: Optional[str] = None) -> List[StatModifier]:
+        """Remove a source's modifier on one stat, or on every stat"""
+        if stat is not None:
+            removed = self.modifiers.pop((source, stat), None)
+            removed = [removed] if removed is not None else []
+        else:
+            removed = [modifier for modifier in self.modifiers.values() if modifier.source == source]
+            for modifier in removed:
+                del self.modifiers[(modifier.source, modifier.stat)]
+        for modifier in removed:
+            self._dirty.add(modifier.stat)
+        return removed
+
+    def tick(self, round_number: Optional[int] = None) -> List[StatModifier]:
+        """Count down timed modifiers by one round and drop the expired ones
+
+        Args:
+            round_number: Round being closed; a round already ticked is ignored
+
+        Returns:
+            list: Expired modifiers
+        """
+        if round_number is not None:
+            if round_number == self._last_round:
+                return []
+            self._last_round = round_number
+
+        expired = []
+        for modifier in self.modifiers.values():
+            if modifier.remaining is not None:
+                modifier.remaining -= 1
+                if modifier.remaining <= 0:
+                    expired.append(modifier)
+        for modifier in expired:
+            del self.modifiers[(modifier.source, modifier.stat)]
+            self._dirty.add(modifier.stat)
+        return expired
+
+    def set_base(self, stat: str, value: float) -> None:
+        """Change a stat's unmodified value (injuries, progression)"""
+        self.bases[stat] = value
+        self._dirty.add(stat)
+
+    def resolve(self) -> Dict[str, float]:
+        """Effective values of every stat the stack has touched, recomputing the dirty ones"""
+        if self._dirty:
+            for stat in self._dirty:
+                self.effective[stat] = self._compute(stat)
+            self._dirty = set()
+        return self.effective
+
+    def get(self, stat: str, default: Any = None) -> Any:
+        """Effective value of a stat (its base if unmodified)"""
+        if stat in self._dirty:
+            self.resolve()
+        return self.effective.get(stat, self.bases.get(stat, default))
+
+    def _compute(self, stat: str) -> float:
+        modifiers = sorted((modifier for modifier in self.modifiers.values() if modifier.stat == stat),
+                           key=lambda modifier: modifier.priority)
+        value = self.bases.get(stat, 0)
+        i = 0
+        while i < len(modifiers):
+            priority = modifiers[i].priority
+            added, factor = 0, 1
+            while i < len(modifiers) and modifiers[i].priority == priority:
+                if modifiers[i].mode == ADD:
+                    added += modifiers[i].value
+                else:
+                    factor *= modifiers[i].value
+                i += 1
+            value = (value + added) * factor
+        return value
+
+    def sources(self, stat: Optional[str] = None) -> Dict[str, List[StatModifier]]:
+        """Modifiers grouped by source (optionally only those on one stat)"""
+        grouped: Dict[str, List[StatModifier]] = {}
+        for modifier in self.modifiers.values():
+            if stat is None or modifier.stat == stat:
+                grouped.setdefault(modifier.source, []).append(modifier)
+        return grouped
+
+    def __iter__(self) -> Iterator[StatModifier]:
+        return iter(list(self.modifiers.values()))
+
+    def __len__(self) -> int:
+        return len(self.modifiers)
+
+    def __copy__(self) -> "ModifierStack":
+        fork = ModifierStack(self.bases)
+        for key, modifier in self.modifiers.items():
+            fork.modifiers[key] = StatModifier(modifier.source, modifier.stat, modifier.value, modifier.mode,
+                                               modifier.priority, modifier.remaining)
+        fork.effective = dict(self.effective)
+        fork._dirty = set(self._dirty)
+        fork._last_round = self._last_round
+        return fork
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable view (for state exports and reports)"""
+        return {"bases": dict(self.bases), "effective": dict(self.resolve()),
+                "modifiers": [modifier.to_dict() for modifier in self.modifiers.values()]}
+
+
+# ---- CHARACTER HELPERS ----
+
+def get_modifier_stack(character: Dict[str, Any], create: bool = True) -> Optional[ModifierStack]:
+    """The character's stack, created on first use"""
+    stack = character.get(STACK_KEY)
+    if stack is None and create:
+        stack = character[STACK_KEY] = ModifierStack()
+    return stack
+
+
+def _base_of(character: Dict[str, Any], stat: str, default: float) -> float:
+    """Unmodified value of a stat, as it was before any modifier was written through"""
+    base_value = getattr(character, "base_value", None)
+    if base_value is not None:
+        # Copy-on-write overlays keep the roster value in their base layer
+        return base_value(stat, character.get(stat, default))
+    # Characters modified by the older original_<stat> convention
+    return character.get(f"original_{stat}", character.get(stat, default))
+
+
+def sync_modifiers(character: Dict[str, Any]) -> None:
+    """Write the stack's recomputed effective values through to the character's attributes"""
+    stack = character.get(STACK_KEY)
+    if stack is None or not stack.dirty:
+        return
+    dirty = stack._dirty
+    effective = stack.resolve()
+    for stat in dirty:
+        character[stat] = effective[stat]
+
+
+def add_modifier(character: Dict[str, Any], source: str, stat: str, value: float, mode: str = ADD,
+                 priority: int = 0, duration: Optional[int] = None, stack: bool = False,
+                 default: float = 0) -> float:
+    """Add a modifier to a character and update the attribute
+
+    Args:
+        character: Character dictionary
+        source: Modifier source
+        stat: Stat name
+        value: Amount (ADD) or factor (MUL)
+        mode: ADD or MUL
+        priority: Resolution layer
+        duration: Rounds until expiry (None = until removed)
+        stack: Accumulate onto the source's existing modifier
+        default: Base value when the character lacks the stat
+
+    Returns:
+        float: New effective value
+    """
+    modifiers = get_modifier_stack(character)
+    if stat not in modifiers.bases:
+        modifiers.bases[stat] = _base_of(character, stat, default)
+    modifiers.add(source, stat, value, mode, priority, duration, stack)
+    sync_modifiers(character)
+    return character[stat]
+
+
+def remove_modifiers(character: Dict[str, Any], source: str, stat: Optional[str] = None) -> List[StatModifier]:
+    """Remove a source's modifiers from a character and restore the affected attributes"""
+    modifiers = character.get(STACK_KEY)
+    if modifiers is None:
+        return []
+    removed = modifiers.remove(source, stat)
+    sync_modifiers(character)
+    return removed
+
+
+def tick_modifiers(character: Dict[str, Any], round_number: Optional[int] = None) -> List[StatModifier]:
+    """Count down a character's timed modifiers for a round (idempotent per round number)
+
+    Returns:
+        list: Expired modifiers
+    """
+    modifiers = character.get(STACK_KEY)
+    if modifiers is None:
+        return []
+    expired = modifiers.tick(round_number)
+    sync_modifiers(character)
+    return expired
+
+
+def effective_stat(character: Dict[str, Any], stat: str, default: Any = None) -> Any:
+    """Effective value of a stat, from the stack's cache when the character has one"""
+    modifiers = character.get(STACK_KEY)
+    if modifiers is None:
+        return character.get(stat, default)
+    return modifiers.get(stat, character.get(stat, default))
+
+
+def base_stat(character: Dict[str, Any], stat: str, default: Any = None) -> Any:
+    """Unmodified value of a stat, from the stack when it has captured one"""
+    modifiers = character.get(STACK_KEY)
+    if modifiers is not None and stat in modifiers.bases:
+        return modifiers.bases[stat]
+    return character.get(stat, default)
+
+
+def set_base_stat(character: Dict[str, Any], stat: str, value: float) -> float:
+    """Change a stat's unmodified value (injuries, progression) and update the attribute
+
+    Writing the attribute directly would be overwritten by the stack's stale base the
+    next time the stat's modifiers change.
+
+    Returns:
+        float: New effective value
+    """
+    modifiers = character.get(STACK_KEY)
+    if modifiers is None or stat not in modifiers.bases:
+        character[stat] = value
+        return value
+    modifiers.set_base(stat, value)
+    sync_modifiers(character)
+    return character[stat]
@@ -2,6 +2,11 @@
 # Evaluates convergence conditions and applies trait-driven effects via d20 rolls
 
 import random
+from typing import List, Optional
+
+import numpy as np
+
+from dice_engine import roll_dice_batch
 
 D20_BASE = 20
 
@@ -22,7 +27,6 @@ def evaluate_convergence(unit: dict, material_loss: int) -> dict:
     Returns convergence summary.
     """
     traits = unit.get("traits", [])
-    aStats = unit.get("aStats", {})
 
     # Basic convergence trigger condition (tunable)
     triggered = material_loss >= 5
@@ -37,8 +41,40 @@ def evaluate_convergence(unit: dict, material_loss: int) -> dict:
         return result
 
     # Apply aStats-based modifier (e.g., intelligence, focus, luck)
-    skew = int((aStats.get("aINT", 0) + aStats.get("aLCK", 0)) * 4)
+    skew = _convergence_skew(unit)
     roll = roll_d20(skew)
+    return _resolve(result, roll, skew)
+
+
+def evaluate_convergences(units: List[dict], material_losses: List[int],
+                          rng: Optional[np.random.Generator] = None) -> List[dict]:
+    """
+    Batched evaluate_convergence: every triggered unit of a round rolls in one d20 draw.
+    Returns one convergence summary per unit, in order.
+    """
+    results = [{"triggered": loss >= 5, "roll": None, "outcome": "none", "modifiers": []}
+               for loss in material_losses]
+    triggered = [k for k, result in enumerate(results) if result["triggered"]]
+    if not triggered:
+        return results
+
+    # One draw for the round; a match has too few units for array clamping to pay off
+    naturals = roll_dice_batch(D20_BASE, len(triggered), rng).tolist()
+    for k, natural in zip(triggered, naturals):
+        skew = _convergence_skew(units[k])
+        _resolve(results[k], min(max(natural + skew, 1), D20_BASE), skew)
+    return results
+
+
+def _convergence_skew(unit: dict) -> int:
+    aStats = unit.get("aStats", {})
+    return int((aStats.get("aINT", 0) + aStats.get("aLCK", 0)) * 4)
+
+
+def _resolve(result: dict, roll: int, skew: int) -> dict:
+    """
+    Fills a triggered convergence summary from its roll.
+    """
     result["roll"] = roll
     result["modifiers"] = [
         {"source": "aINT+aLCK", "value": skew, "reason": "convergence modifier"}
@@ -2,10 +2,39 @@
 # Centralized probability engine for trait-based d20 rolls, contested rolls, and chance-based triggers
 
 import random
-from typing import Dict
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
 
 D20 = 20
 
+ArrayLike = Union[Sequence[float], np.ndarray]
+
+# Generator shared by all batched rolls: created once, on first use, from Python's
+# random, or reseeded by seed_dice() (e.g. with a match seed)
+_rng: Optional[np.random.Generator] = None
+
+
+def seed_dice(seed: Optional[int] = None) -> np.random.Generator:
+    """
+    Reseeds the shared batch generator with `seed` and returns it.
+    seed_dice(None) draws the seed from Python's random, so random.seed() governs it.
+    """
+    global _rng
+    _rng = np.random.default_rng(seed if seed is not None else random.getrandbits(64))
+    return _rng
+
+
+def _generator(rng: Optional[np.random.Generator]) -> np.random.Generator:
+    """
+    The generator for one batch: the caller's, else the shared one (never a new one per batch).
+    """
+    if rng is not None:
+        return rng
+    if _rng is None:
+        return seed_dice()
+    return _rng
+
 
 def roll_d20(modifier: int = 0, floor: int = 1, ceiling: int = D20) -> int:
     """
@@ -39,8 +68,71 @@ def probability_trigger(chance_percent: float) -> bool:
     return random.uniform(0, 100) <= chance_percent
 
 
+# --- Batched rolls ---
+# One generator call per batch instead of one random number per roll. Every function
+# takes arrays of modifiers (one entry per roll) and an optional numpy Generator.
+
+def roll_dice_batch(sides: int, count: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Rolls `count` unmodified dice with `sides` faces (1..sides) in one draw.
+    Scaling uniform doubles is several times cheaper than Generator.integers on small batches.
+    """
+    return (_generator(rng).random(count) * sides).astype(np.int64) + 1
+
+
+def roll_d20_batch(modifiers: ArrayLike, floor: int = 1, ceiling: int = D20,
+                   rng: Optional[np.random.Generator] = None) -> Dict[str, np.ndarray]:
+    """
+    Rolls one d20 per modifier.
+    Returns the natural rolls, the clamped totals and the crit (natural 20) / fumble (natural 1) flags.
+    """
+    modifiers = np.asarray(modifiers)
+    natural = roll_dice_batch(D20, modifiers.size, rng).reshape(modifiers.shape)
+    return {
+        "natural": natural,
+        "total": np.minimum(np.maximum(natural + modifiers, floor), ceiling),
+        "crit": natural == D20,
+        "fumble": natural == 1
+    }
+
+
+def contested_roll_batch(attacker_mods: ArrayLike, defender_mods: ArrayLike,
+                         rng: Optional[np.random.Generator] = None) -> Dict[str, np.ndarray]:
+    """
+    Performs one contested d20 roll per (attacker_mod, defender_mod) pair in a single draw.
+    "winner" is 1 for the attacker, -1 for the defender and 0 for a draw.
+    """
+    attacker_mods = np.asarray(attacker_mods)
+    defender_mods = np.asarray(defender_mods)
+    if attacker_mods.shape != defender_mods.shape:
+        raise ValueError(f"Modifier shapes differ: {attacker_mods.shape} vs {defender_mods.shape}")
+
+    natural = roll_dice_batch(D20, 2 * attacker_mods.size, rng).reshape((2,) + attacker_mods.shape)
+    attacker = np.minimum(np.maximum(natural[0] + attacker_mods, 1), D20)
+    defender = np.minimum(np.maximum(natural[1] + defender_mods, 1), D20)
+    return {
+        "attacker": attacker,
+        "defender": defender,
+        "winner": np.sign(attacker - defender),
+        "attacker_crit": natural[0] == D20,
+        "defender_crit": natural[1] == D20
+    }
+
+
+def probability_trigger_batch(chance_percents: ArrayLike,
+                              rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Percent-based triggers, one per chance, in a single draw.
+    """
+    chance_percents = np.asarray(chance_percents, dtype=float)
+    return _generator(rng).uniform(0, 100, size=chance_percents.shape) <= chance_percents
+
+
 # Example roll outputs
 if __name__ == "__main__":
     print("d20 Roll (mod +2):", roll_d20(modifier=2))
     print("Contested Roll:", contested_roll(3, 1))
-    print("Trigger 30% Chance:", probability_trigger(30.0))
\ No newline at end of file
+    print("Trigger 30% Chance:", probability_trigger(30.0))
+    print("Batched d20s (mods 0..4):", roll_d20_batch(np.arange(5))["total"])
+    print("Batched Contests:", contested_roll_batch([3, 0, -2], [1, 1, 1])["winner"])
+    print("Batched Triggers:", probability_trigger_batch([10.0, 50.0, 90.0]))
\ No newline at end of file
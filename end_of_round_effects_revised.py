@@ -59,6 +59,9 @@ class EndOfRoundEffectsSystem(SystemBase):
         self.active = False
         self.round_statistics = defaultdict(int)
         
+        # Events raised during a round are buffered and emitted together at its end
+        self._pending_events = None
+        
         self.logger.info("End-of-round effects system initialized with stamina_decay_multiplier={:.2f}".format(
             self._stamina_decay_multiplier))
     
@@ -190,6 +193,7 @@ class EndOfRoundEffectsSystem(SystemBase):
             self.logger.warning("End-of-round effects system not active, effects will not be applied")
             return
             
+        self._pending_events = []
         try:
             round_num = match_context.get("round", 0)
             character_count = len(characters)
@@ -304,6 +308,24 @@ class EndOfRoundEffectsSystem(SystemBase):
             self._emit_error_event("apply_end_of_round_effects", str(e), {
                 "round": match_context.get("round", 0)
             })
+        finally:
+            self._flush_events()
+    
+    def _flush_events(self) -> None:
+        """Emit the round's buffered events in one batch"""
+        events, self._pending_events = self._pending_events, None
+        if not events:
+            return
+        event_system = self._get_event_system()
+        if event_system:
+            try:
+                if hasattr(event_system, "emit_batch"):
+                    event_system.emit_batch(events)
+                else:
+                    for event_name, data in events:
+                        event_system.emit(event_name, data)
+            except Exception as e:
+                self.logger.error("Error emitting round events: {}".format(e))
     
     def _apply_stamina_effects(self, character: Dict[str, Any], match_context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -931,7 +953,10 @@ class EndOfRoundEffectsSystem(SystemBase):
         return dict(self.round_statistics)
     
     def _emit_event(self, event_name: str, data: Dict[str, Any]) -> None:
-        """Emit an event with the given name and data"""
+        """Emit an event with the given name and data (buffered while a round is applied)"""
+        if self._pending_events is not None:
+            self._pending_events.append((event_name, data))
+            return
         event_system = self._get_event_system()
         if event_system:
             try:
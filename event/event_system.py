@@ -156,6 +156,25 @@ class EventSystem(SystemBase):
         
         return handler_count
     
+    def emit_batch(self, events: List[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Emit several events in order, e.g. everything raised during one round
+        
+        Args:
+            events: (event_name, data) pairs
+            
+        Returns:
+            int: Total number of handler calls
+        """
+        if not self.active:
+            self.logger.warning(f"Event system is not active, ignoring {len(events)} events")
+            return 0
+        
+        handler_count = 0
+        for event_name, data in events:
+            handler_count += self.emit(event_name, data)
+        return handler_count
+    
     def _log_event(self, event_name: str, event_data: Dict[str, Any]) -> None:
         """Log an event for analytics"""
         # Only store essentials to save space
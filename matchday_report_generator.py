@@ -13,8 +13,11 @@ CANONICAL_RSTATS = [
 def fill_missing_rstats(rstats: Dict[str, int]) -> Dict[str, int]:
     """
     Ensures all canonical rStats are present in the dict.
-    Fills missing ones with 0.
+    Fills missing ones with 0. Accepts an RStatsView, whose row already holds every canonical code.
     """
+    canonical = getattr(rstats, "canonical", None)
+    if canonical is not None:
+        return canonical()
     return {k: rstats.get(k, 0) for k in CANONICAL_RSTATS}
 
 
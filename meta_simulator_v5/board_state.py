@@ -0,0 +1,158 @@
+"""
+Board State for META League Simulator v5.0
+chess.Board with position queries cached until the position changes
+"""
+
+import chess
+from typing import Dict, List, Any, Optional
+
+# Material weights shared by the PGN tracker and the motif detector (king excluded)
+PIECE_VALUES = {
+    chess.PAWN: 1,
+    chess.KNIGHT: 3,
+    chess.BISHOP: 3,
+    chess.ROOK: 5,
+    chess.QUEEN: 9
+}
+
+
+class BoardState(chess.Board):
+    """
+    A chess.Board that caches its expensive queries
+
+    Legal moves, game-over status and outcome, checkmate/stalemate, insufficient
+    material, material counts and the piece map are computed at most once per
+    position. The cache is dropped by every mutating call (push, pop, set_fen, ...),
+    so a BoardState can be handed to anything that takes a chess.Board, including
+    engines and chess.pgn. Mutating the position through private chess.Board
+    helpers bypasses the cache; call invalidate() afterwards.
+    """
+
+    def __init__(self, fen: Optional[str] = chess.STARTING_FEN, *, chess960: bool = False):
+        self._cache: Dict[Any, Any] = {}
+        super().__init__(fen, chess960=chess960)
+
+    @classmethod
+    def from_board(cls, board: chess.Board) -> "BoardState":
+        """BoardState with the same starting position and move stack as `board`"""
+        if isinstance(board, cls):
+            return board
+        state = cls(board.root().fen(), chess960=board.chess960)
+        for move in board.move_stack:
+            state.push(move)
+        return state
+
+    def invalidate(self) -> None:
+        """Drop all cached queries"""
+        self._cache = {}
+
+    # Mutators: every change to the position invalidates the cache
+
+    def push(self, move: chess.Move) -> None:
+        super().push(move)
+        self._cache = {}
+
+    def pop(self) -> chess.Move:
+        result = super().pop()
+        self._cache = {}
+        return result
+
+    def reset(self) -> None:
+        super().reset()
+        self._cache = {}
+
+    def clear(self) -> None:
+        super().clear()
+        self._cache = {}
+
+    def set_fen(self, fen: str) -> None:
+        super().set_fen(fen)
+        self._cache = {}
+
+    def set_board_fen(self, fen: str) -> None:
+        super().set_board_fen(fen)
+        self._cache = {}
+
+    def set_piece_at(self, square: chess.Square, piece: Optional[chess.Piece], promoted: bool = False) -> None:
+        super().set_piece_at(square, piece, promoted)
+        self._cache = {}
+
+    def remove_piece_at(self, square: chess.Square) -> Optional[chess.Piece]:
+        result = super().remove_piece_at(square)
+        self._cache = {}
+        return result
+
+    def set_castling_fen(self, castling_fen: str) -> None:
+        super().set_castling_fen(castling_fen)
+        self._cache = {}
+
+    # Cached queries
+
+    def legal_move_list(self) -> List[chess.Move]:
+        """Legal moves of the position as a list (shared; do not modify)"""
+        moves = self._cache.get("legal")
+        if moves is None:
+            moves = self._cache["legal"] = list(self.generate_legal_moves())
+        return moves
+
+    def outcome(self, *, claim_draw: bool = False) -> Optional[chess.Outcome]:
+        key = ("outcome", claim_draw)
+        if key in self._cache:
+            return self._cache[key]
+        outcome = self._cache[key] = super().outcome(claim_draw=claim_draw)
+        return outcome
+
+    def is_game_over(self, *, claim_draw: bool = False) -> bool:
+        return self.outcome(claim_draw=claim_draw) is not None
+
+    def is_checkmate(self) -> bool:
+        return self.is_check() and not self.legal_move_list()
+
+    def is_stalemate(self) -> bool:
+        return not self.is_check() and not self.is_variant_end() and not self.legal_move_list()
+
+    def is_check(self) -> bool:
+        check = self._cache.get("check")
+        if check is None:
+            check = self._cache["check"] = super().is_check()
+        return check
+
+    def is_insufficient_material(self) -> bool:
+        insufficient = self._cache.get("insufficient")
+        if insufficient is None:
+            insufficient = self._cache["insufficient"] = super().is_insufficient_material()
+        return insufficient
+
+    def piece_map(self, *, mask: chess.Bitboard = chess.BB_ALL) -> Dict[chess.Square, chess.Piece]:
+        """Occupied squares to pieces (shared when unmasked; do not modify)"""
+        if mask != chess.BB_ALL:
+            return super().piece_map(mask=mask)
+        pieces = self._cache.get("pieces")
+        if pieces is None:
+            pieces = self._cache["pieces"] = super().piece_map()
+        return pieces
+
+    def material(self, color: chess.Color) -> int:
+        """Material of one side in pawns (PIECE_VALUES)"""
+        key = ("material", color)
+        value = self._cache.get(key)
+        if value is None:
+            value = self._cache[key] = material_value(self, color)
+        return value
+
+    def material_difference(self) -> int:
+        """White material minus Black material"""
+        return self.material(chess.WHITE) - self.material(chess.BLACK)
+
+
+def material_value(board: chess.Board, color: chess.Color) -> int:
+    """Material of one side in pawns, from the piece bitboards"""
+    return sum(value * chess.popcount(board.pieces_mask(piece_type, color))
+               for piece_type, value in PIECE_VALUES.items())
+
+
+def material_difference(board: chess.Board) -> int:
+    """White material minus Black material for any chess.Board"""
+    if isinstance(board, BoardState):
+        return board.material_difference()
+    return material_value(board, chess.WHITE) - material_value(board, chess.BLACK)
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Calibration Sweep for META League Simulator v5.0
+Evaluates combat calibration settings over a design of points on a fixed match corpus
+
+Each point of a grid or Latin-hypercube design over combat_calibration settings is
+written as its own configuration and run in a worker process. The worker replays a
+recorded corpus (see match_replay) with those settings, so the chess is shared by
+every point and no engine is needed unless the recordings run out. Every point is
+scored on balance metrics (match length, KO rate, win-rate spread and the ParityTester
+position advantage) and the non-dominated points are reported as the Pareto front.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Union
+
+import numpy as np
+
+from match_replay import scratch_config
+
+# A dimension is a (low, high) range or an explicit list of values
+Dimension = Union[Tuple[float, float], List[Any]]
+
+DEFAULT_SPACE: Dict[str, Dimension] = {
+    "combat_calibration.damage_settings.base_damage_multiplier": (0.75, 2.0),
+    "combat_calibration.stamina_settings.stamina_decay_per_round_multiplier": (0.8, 1.5),
+    "combat_calibration.morale_settings.morale_loss_per_ko_multiplier": (0.8, 1.5),
+    "combat_calibration.convergence_settings.convergence_damage_multiplier": (1.0, 3.0)
+}
+
+# Balance targets; each objective is a distance to be minimized
+DEFAULT_TARGETS = {
+    "mean_rounds": 20.0,
+    "ko_rate": 0.25
+}
+
+OBJECTIVES = ["rounds_error", "ko_rate_error", "win_rate_spread", "position_advantage_pct"]
+
+# Outputs a sweep point does not need
+QUIET_SETTINGS = {
+    "reporting.generate_match_reports": False,
+    "reporting.generate_day_reports": False,
+    "reporting.generate_charts": False,
+    "advanced.auto_backup_frequency": 0,
+    "development.phase_timing": False
+}
+
+
+# ---- DESIGNS ----
+
+def grid_design(space: Dict[str, Dimension], levels: int = 3) -> List[Dict[str, Any]]:
+    """Full factorial design: `levels` evenly spaced values per range, every listed value"""
+    axes = []
+    for dimension in space.values():
+        if isinstance(dimension, tuple):
+            axes.append(np.linspace(dimension[0], dimension[1], levels).round(6).tolist())
+        else:
+            axes.append(list(dimension))
+    keys = list(space)
+    return [dict(zip(keys, values)) for values in itertools.product(*axes)]
+
+
+def latin_hypercube(space: Dict[str, Dimension], samples: int, seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Latin-hypercube design: every dimension is split into `samples` strata, each used once"""
+    rng = np.random.default_rng(seed)
+    columns = []
+    for dimension in space.values():
+        strata = rng.permutation(samples)
+        if isinstance(dimension, tuple):
+            unit = (strata + rng.random(samples)) / samples
+            columns.append((dimension[0] + unit * (dimension[1] - dimension[0])).round(6).tolist())
+        else:
+            columns.append([dimension[k * len(dimension) // samples] for k in strata])
+    keys = list(space)
+    return [dict(zip(keys, values)) for values in zip(*columns)]
+
+
+# ---- METRICS ----
+
+def balance_metrics(match_results: List[Dict[str, Any]], targets: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """Balance metrics of a set of match results
+
+    Win rates count draws as half a win. Position advantage is ParityTester's: how far
+    the team listed first (position A) is from winning half its matches.
+    """
+    targets = {**DEFAULT_TARGETS, **(targets or {})}
+    if not match_results:
+        return {"matches": 0}
+
+    rounds = np.array([result.get("rounds_played", 0) for result in match_results], dtype=float)
+    metrics = [result.get("metrics", {}) for result in match_results]
+    kos = np.array([m.get("team_a_ko_count", 0) + m.get("team_b_ko_count", 0) for m in metrics], dtype=float)
+    outcome = np.array([{"win": 1.0, "loss": 0.0}.get(result.get("result"), 0.5) for result in match_results])
+
+    team_points: Dict[str, List[float]] = {}
+    for result, score in zip(match_results, outcome.tolist()):
+        team_points.setdefault(result.get("team_a_id"), []).append(score)
+        team_points.setdefault(result.get("team_b_id"), []).append(1.0 - score)
+    team_win_rates = np.array([np.mean(points) for points in team_points.values()])
+
+    mean_rounds = float(rounds.mean())
+    ko_rate = float(kos.mean() / 16)  # 8v8 lineups
+    position_a_win_rate = float(outcome.mean() * 100)
+    return {
+        "matches": len(match_results),
+        "mean_rounds": mean_rounds,
+        "rounds_std": float(rounds.std()),
+        "ko_rate": ko_rate,
+        "draw_rate": float(np.mean(outcome == 0.5)),
+        "win_rate_spread": float(team_win_rates.std() * 100),
+        "position_a_win_rate": position_a_win_rate,
+        "position_advantage_pct": abs(50 - position_a_win_rate),
+        "rounds_error": abs(mean_rounds - targets["mean_rounds"]),
+        "ko_rate_error": abs(ko_rate - targets["ko_rate"])
+    }
+
+
+def pareto_front(rows: List[Dict[str, Any]], objectives: List[str] = OBJECTIVES) -> List[int]:
+    """Indices of the rows no other row beats on every objective (all minimized)"""
+    scored = [k for k, row in enumerate(rows) if all(name in row.get("metrics", {}) for name in objectives)]
+    if not scored:
+        return []
+    values = np.array([[rows[k]["metrics"][name] for name in objectives] for k in scored])
+    front = []
+    for i in range(len(scored)):
+        dominated = np.any(np.all(values <= values[i], axis=1) & np.any(values < values[i], axis=1))
+        if not dominated:
+            front.append(scored[i])
+    return front
+
+
+# ---- EVALUATION ----
+
+def point_config(base_config: Dict[str, Any], overrides: Dict[str, Any], point_dir: str) -> Dict[str, Any]:
+    """Configuration for one sweep point: the overrides, private output paths and no reporting"""
+    config = scratch_config(base_config, point_dir)
+    settings = dict(QUIET_SETTINGS)
+    settings.update(overrides)
+    for key_path, value in settings.items():
+        current = config
+        parts = key_path.split(".")
+        for part in parts[:-1]:
+            current = current.setdefault(part, {})
+        current[parts[-1]] = value
+    return config
+
+
+def evaluate_point(config_path: str, start_day: int, end_day: int, recordings_path: Optional[str],
+                   engine_fallback: bool = False, targets: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """Worker: replay the corpus under one point's configuration and score it"""
+    from meta_simulator_5 import MetaLeagueSimulatorV5
+    from match_replay import load_recordings
+
+    start = time.perf_counter()
+    simulator = MetaLeagueSimulatorV5(config_path)
+    # The point's configuration already keeps every output in its own directory
+    simulator.scratch_dir = os.path.dirname(config_path)
+    recordings = load_recordings(recordings_path) if recordings_path else {}
+    fallback = None
+    if engine_fallback:
+        chess_system = simulator.registry.get("chess_system")
+        fallback = chess_system.select_move if chess_system else None
+
+    days = simulator.replay_days(start_day, end_day, recordings, False, fallback)
+    match_results = [result for day in days.values() for result in day.get("matches", [])]
+    replay = {"replayed": 0, "exhausted": 0, "diverged": 0}
+    for result in match_results:
+        for key, count in result.get("replay", {}).items():
+            replay[key] = replay.get(key, 0) + count
+
+    return {
+        "metrics": balance_metrics(match_results, targets),
+        "replay": replay,
+        "seconds": time.perf_counter() - start
+    }
+
+
+def run_sweep(design: List[Dict[str, Any]], base_config_path: str, start_day: int, end_day: int,
+              recordings_path: Optional[str] = None, output_dir: str = os.path.join("results", "calibration"),
+              workers: Optional[int] = None, engine_fallback: bool = False,
+              targets: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """Evaluate every point of a design in parallel
+
+    Args:
+        design: Points as {config key path: value}
+        base_config_path: Configuration every point starts from
+        start_day, end_day: Match days of the corpus
+        recordings_path: Recorded corpus (JSON written by match_replay.save_recordings)
+        output_dir: Where point configurations and the sweep summary are written
+        workers: Worker processes (default: CPU count)
+        engine_fallback: Ask the chess system for moves the recordings do not cover
+        targets: Overrides of DEFAULT_TARGETS
+
+    Returns:
+        dict: Points with their metrics, the Pareto front and the summary path
+    """
+    sweep_dir = os.path.join(output_dir, time.strftime("sweep_%Y%m%d_%H%M%S"))
+    os.makedirs(sweep_dir, exist_ok=True)
+    with open(base_config_path, "r") as f:
+        base_config = json.load(f)
+
+    config_paths = []
+    for index, overrides in enumerate(design):
+        point_dir = os.path.join(sweep_dir, f"point_{index:04d}")
+        os.makedirs(point_dir, exist_ok=True)
+        path = os.path.join(point_dir, "config.json")
+        with open(path, "w") as f:
+            json.dump(point_config(base_config, overrides, point_dir), f, indent=2)
+        config_paths.append(path)
+
+    rows = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(evaluate_point, path, start_day, end_day, recordings_path, engine_fallback, targets)
+                   for path in config_paths]
+        for index, (overrides, future) in enumerate(zip(design, futures)):
+            row = {"point": index, "settings": overrides}
+            try:
+                row.update(future.result())
+            except Exception as e:
+                row["error"] = str(e)
+            rows.append(row)
+
+    front = pareto_front(rows)
+    summary = {
+        "corpus": {"start_day": start_day, "end_day": end_day, "recordings": recordings_path},
+        "targets": {**DEFAULT_TARGETS, **(targets or {})},
+        "objectives": OBJECTIVES,
+        "points": rows,
+        "pareto_front": front
+    }
+    summary_path = os.path.join(sweep_dir, "sweep_summary.json")
+    with open(summary_path, "w") as f:
+        json.dump(summary, f, indent=2)
+    summary["summary_path"] = summary_path
+    return summary
+
+
+def print_summary(summary: Dict[str, Any]) -> None:
+    """Print the Pareto-front points and their metrics"""
+    points = summary["points"]
+    failed = [row for row in points if "error" in row]
+    print(f"\nEvaluated {len(points)} points ({len(failed)} failed)")
+    print(f"Pareto front ({len(summary['pareto_front'])} points, minimizing {', '.join(summary['objectives'])}):")
+    for index in summary["pareto_front"]:
+        row = points[index]
+        metrics = row["metrics"]
+        settings = ", ".join(f"{key.rsplit('.', 1)[-1]}={value}" for key, value in row["settings"].items())
+        print(f"  #{index:<4} rounds {metrics['mean_rounds']:5.1f}  KO {metrics['ko_rate']:.2f}  "
+              f"spread {metrics['win_rate_spread']:5.1f}  position {metrics['position_advantage_pct']:4.1f}%  | {settings}")
+    for row in failed:
+        print(f"  #{row['point']} failed: {row['error']}")
+    print(f"\nSummary: {summary['summary_path']}")
+
+
+def parse_dimension(text: str) -> Tuple[str, Dimension]:
+    """Parse key=low:high or key=v1,v2,... (keys may omit the combat_calibration. prefix)"""
+    key, _, values = text.partition("=")
+    if not key.startswith("combat_calibration."):
+        key = f"combat_calibration.{key}"
+    if ":" in values:
+        low, high = values.split(":", 1)
+        return key, (float(low), float(high))
+    return key, [json.loads(value) for value in values.split(",")]
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Sweep combat calibration settings over a recorded match corpus")
+    parser.add_argument("--config", default="config.json", help="Base configuration file")
+    parser.add_argument("--days", default="1-5", help="Match days of the corpus (format: start-end)")
+    parser.add_argument("--recordings", help="Recorded corpus (JSON from match_replay.save_recordings)")
+    parser.add_argument("--pgn-dir", help="Build the corpus from a PGN archive instead")
+    parser.add_argument("--design", choices=["grid", "lhs"], default="lhs", help="Design over the settings")
+    parser.add_argument("--levels", type=int, default=3, help="Values per range for a grid design")
+    parser.add_argument("--samples", type=int, default=32, help="Points of a Latin-hypercube design")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the Latin-hypercube design")
+    parser.add_argument("--param", action="append", default=[], metavar="KEY=LOW:HIGH|V1,V2",
+                        help="Sweep this setting instead of the defaults (repeatable)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--engine-fallback", action="store_true",
+                        help="Use the chess engine for moves the recordings do not cover")
+    parser.add_argument("--target-rounds", type=float, default=DEFAULT_TARGETS["mean_rounds"])
+    parser.add_argument("--target-ko-rate", type=float, default=DEFAULT_TARGETS["ko_rate"])
+    parser.add_argument("--output-dir", default=os.path.join("results", "calibration"))
+    args = parser.parse_args()
+
+    space = dict(parse_dimension(text) for text in args.param) if args.param else DEFAULT_SPACE
+    design = grid_design(space, args.levels) if args.design == "grid" else latin_hypercube(space, args.samples, args.seed)
+    start_day, end_day = map(int, args.days.split("-"))
+
+    recordings_path = args.recordings
+    if args.pgn_dir:
+        from match_replay import load_pgn_archive, save_recordings
+        os.makedirs(args.output_dir, exist_ok=True)
+        recordings_path = os.path.join(args.output_dir, "corpus_recordings.json")
+        save_recordings(load_pgn_archive(args.pgn_dir), recordings_path)
+    if not recordings_path and not args.engine_fallback:
+        parser.error("A corpus is needed: --recordings or --pgn-dir (or --engine-fallback to play the moves)")
+
+    print(f"Sweeping {len(design)} points ({args.design}) over days {start_day}-{end_day}...")
+    summary = run_sweep(design, args.config, start_day, end_day, recordings_path, args.output_dir,
+                        args.workers, args.engine_fallback,
+                        {"mean_rounds": args.target_rounds, "ko_rate": args.target_ko_rate})
+    print_summary(summary)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""
+Character Overlay for META League Simulator v5.0
+Copy-on-write view of a roster record for one match or simulation
+
+The roster record is the read-only base layer. Every write (HP, stamina, modifiers,
+rStats, ...) lands in a small per-overlay delta, so simulations that share a roster
+allocate only what they change. Container values (rStats, traits, ...) are detached
+into the delta the first time they are read, so in-place updates never reach the base.
+"""
+
+import copy
+from collections import ChainMap
+from collections.abc import Mapping, MutableMapping
+from typing import Dict, List, Any, Optional, Iterator, Hashable
+
+def _detach(value: Any) -> Any:
+    """Private copy of a container value; mappings inside lists get their own layer"""
+    if isinstance(value, ChainMap):
+        return value.new_child()
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, list):
+        return [_detach(item) if isinstance(item, Mapping) else item for item in value]
+    if isinstance(value, set):
+        return set(value)
+    if hasattr(value, "__copy__"):
+        # Per-character state objects (e.g. modifier stacks) fork with the overlay
+        return copy.copy(value)
+    return value
+
+
+def _is_container(value: Any) -> bool:
+    return isinstance(value, (Mapping, list, set)) or hasattr(value, "__copy__")
+
+
+class CharacterOverlay(MutableMapping):
+    """
+    A character dict backed by an immutable roster record plus a mutable delta
+
+    Reads fall through to the base; writes and deletions stay in the delta until
+    commit() folds them into a new record or discard() drops them. copy() forks an
+    independent overlay on the same base, so per-iteration copies cost one delta.
+    """
+
+    __slots__ = ("base", "delta", "_removed")
+
+    def __init__(self, base: Mapping, delta: Optional[Dict[str, Any]] = None):
+        """Create an overlay
+
+        Args:
+            base: Roster record (never modified)
+            delta: Initial per-match values (taken over, not copied)
+        """
+        if isinstance(base, CharacterOverlay):
+            base = base.commit()
+        self.base = base
+        self.delta = {} if delta is None else delta
+        self._removed = None
+
+    # ---- MAPPING ----
+
+    def __getitem__(self, key: Hashable) -> Any:
+        delta = self.delta
+        if key in delta:
+            return delta[key]
+        if self._removed and key in self._removed:
+            raise KeyError(key)
+        value = self.base[key]
+        if _is_container(value):
+            value = delta[key] = _detach(value)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.delta[key] = value
+        if self._removed:
+            self._removed.discard(key)
+
+    def __delitem__(self, key: Hashable) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self.delta.pop(key, None)
+        if key in self.base:
+            if self._removed is None:
+                self._removed = set()
+            self._removed.add(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        if key in self.delta:
+            return True
+        return key in self.base and not (self._removed and key in self._removed)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        delta = self.delta
+        removed = self._removed or ()
+        for key in self.base:
+            if key not in delta and key not in removed:
+                yield key
+        yield from delta
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"CharacterOverlay({self.get('id', '?')!r}, delta={sorted(self.delta)})"
+
+    # ---- COPY-ON-WRITE ----
+
+    def copy(self) -> "CharacterOverlay":
+        """Independent overlay on the same base with a private copy of the delta"""
+        fork = CharacterOverlay(self.base, {key: _detach(value) for key, value in self.delta.items()})
+        if self._removed:
+            fork._removed = set(self._removed)
+        return fork
+
+    def base_value(self, key: Hashable, default: Any = None) -> Any:
+        """Roster value of a key, ignoring this overlay's changes"""
+        return self.base.get(key, default)
+
+    def changes(self) -> Dict[str, Any]:
+        """Values written or detached since the overlay was created or last committed"""
+        return dict(self.delta)
+
+    def rstat_deltas(self) -> Dict[str, Any]:
+        """Numeric rStats accumulated on top of the roster's rStats"""
+        rstats = self.delta.get("rStats")
+        if not rstats:
+            return {}
+        base_rstats = self.base.get("rStats") or {}
+        deltas = {}
+        for stat, value in rstats.items():
+            if isinstance(value, (int, float)):
+                change = value - base_rstats.get(stat, 0)
+                if change:
+                    deltas[stat] = change
+        return deltas
+
+    def discard(self) -> None:
+        """Drop all changes, returning the overlay to the roster record"""
+        self.delta = {}
+        self._removed = None
+
+    def commit(self) -> Dict[str, Any]:
+        """Fold the changes into a new plain record (the base itself is left untouched)
+
+        Returns:
+            dict: The merged record, suitable as the base of the next overlay or for saving
+        """
+        removed = self._removed or ()
+        record = {key: value for key, value in self.base.items() if key not in removed}
+        record.update(self.delta)
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict of the current values (for JSON and reports)"""
+        return self.commit()
+
+
+def overlay_team(team: List[Mapping]) -> List[CharacterOverlay]:
+    """Overlay every character of a team (a cheap replacement for copying the roster)"""
+    return [character.copy() if isinstance(character, CharacterOverlay) else CharacterOverlay(character)
+            for character in team]
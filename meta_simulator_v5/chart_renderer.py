@@ -0,0 +1,289 @@
+"""
+Chart Renderer for META League Simulator v5.0
+Queues chart jobs during simulation and renders them in a worker process
+"""
+
+import os
+import logging
+import importlib
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Callable
+from system_base import SystemBase
+
+#############################################################################
+#                      WORKER-SIDE RENDERING                                #
+#############################################################################
+
+# Figures are created once per chart kind in each worker and cleared between jobs
+_FIGURES = {}
+
+
+def _worker_init() -> None:
+    """Select the non-interactive backend before pyplot is imported in the worker"""
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+def _get_figure(kind: str, figsize: Tuple[float, float]):
+    """Get the reusable figure for a chart kind"""
+    import matplotlib.pyplot as plt
+
+    fig = _FIGURES.get(kind)
+    if fig is None:
+        fig = plt.figure(figsize=figsize)
+        _FIGURES[kind] = fig
+    else:
+        fig.clf()
+    return fig
+
+
+def render_team_history(fig, payload: Dict[str, Any]) -> None:
+    """Line chart of a team stat over match days"""
+    days = payload["days"]
+    values = payload["values"]
+
+    ax = fig.add_subplot(1, 1, 1)
+    ax.plot(days, values, marker="o")
+    ax.set_xlabel("Day")
+    ax.set_ylabel(payload["stat_name"])
+    ax.set_title(f"{payload.get('team_name', payload['team_id'])} - {payload['stat_name']} by Day")
+    ax.grid(True, alpha=0.3)
+
+
+def render_bar(fig, payload: Dict[str, Any]) -> None:
+    """Generic labelled bar chart"""
+    ax = fig.add_subplot(1, 1, 1)
+    labels = payload["labels"]
+    values = payload["values"]
+    bars = ax.bar(range(len(labels)), values)
+    ax.set_xticks(range(len(labels)))
+    ax.set_xticklabels(labels, rotation=payload.get("rotation", 0))
+    ax.set_ylabel(payload.get("ylabel", ""))
+    ax.set_title(payload.get("title", ""))
+    for bar, value in zip(bars, values):
+        ax.text(bar.get_x() + bar.get_width() / 2., bar.get_height(), f"{value:g}", ha="center", va="bottom")
+
+
+BUILTIN_RENDERERS = {
+    "team_history": render_team_history,
+    "bar": render_bar
+}
+
+
+def _resolve_renderer(kind: str, renderer_path: Optional[str]) -> Callable:
+    """Resolve a renderer by kind, or by 'module:function' for externally registered kinds"""
+    if renderer_path:
+        module_name, func_name = renderer_path.split(":")
+        return getattr(importlib.import_module(module_name), func_name)
+    return BUILTIN_RENDERERS[kind]
+
+
+def render_batch(jobs: List[Dict[str, Any]]) -> List[str]:
+    """Render a batch of chart jobs; runs in the worker process
+
+    Args:
+        jobs: Job dicts with kind, payload, output_path, figsize and optional renderer path
+
+    Returns:
+        List of written chart paths (failed jobs are skipped)
+    """
+    written = []
+    for job in jobs:
+        try:
+            fig = _get_figure(job["kind"], job["figsize"])
+            renderer = _resolve_renderer(job["kind"], job.get("renderer"))
+            renderer(fig, job["payload"])
+            fig.tight_layout()
+            os.makedirs(os.path.dirname(job["output_path"]) or ".", exist_ok=True)
+            fig.savefig(job["output_path"])
+            written.append(job["output_path"])
+        except Exception as e:
+            logging.getLogger("system.chart_renderer").error(f"Error rendering {job['kind']} chart: {e}")
+    return written
+
+
+#############################################################################
+#                      SIMULATION-SIDE QUEUE                                #
+#############################################################################
+
+class ChartRenderer(SystemBase):
+    """
+    Collects chart jobs on the simulation hot path and hands them to a worker process
+    Jobs sharing a dedup key replace each other until the queue is flushed
+    """
+
+    def __init__(self, config):
+        """Initialize the chart renderer"""
+        super().__init__("chart_renderer", None)
+        self.config = config
+
+        reports_dir = config.get("paths.reports_dir", "results/reports")
+        self.output_dir = config.get("paths.charts_dir", os.path.join(reports_dir, "charts"))
+        self.out_of_process = config.get("reporting.render_charts_out_of_process", True)
+        self.max_workers = config.get("reporting.chart_workers", 1)
+        self.batch_size = config.get("reporting.chart_batch_size", 16)
+        self.default_figsize = (10, 6)
+
+        # Pending jobs keyed by dedup key, in submission order
+        self._pending = OrderedDict()
+
+        # Extra renderers registered as 'module:function' so workers can import them
+        self._renderers = {}
+
+        # Series accumulated for team history charts: (team_id, stat) -> {day: value}
+        self._team_history = defaultdict(dict)
+
+        self._executor = None
+        self._futures = []
+
+        self.jobs_submitted = 0
+        self.jobs_superseded = 0
+
+        self.logger.info(f"Chart renderer initialized (out_of_process={self.out_of_process}, workers={self.max_workers})")
+
+    def _activate_implementation(self) -> bool:
+        """Implementation-specific activation logic"""
+        self.logger.info("Activating Chart Renderer")
+        return True
+
+    def _deactivate_implementation(self) -> bool:
+        """Render anything still queued and stop the worker"""
+        self.close()
+        return True
+
+    def register_renderer(self, kind: str, renderer_path: str) -> None:
+        """Register a renderer for a new chart kind
+
+        Args:
+            kind: Chart kind name
+            renderer_path: 'module:function' taking (fig, payload); must be importable by workers
+        """
+        self._renderers[kind] = renderer_path
+
+    def submit(self, kind: str, dedup_key: Tuple, payload: Dict[str, Any], filename: str,
+               figsize: Optional[Tuple[float, float]] = None) -> str:
+        """Queue a chart job
+
+        Args:
+            kind: Chart kind (built-in or registered)
+            dedup_key: Jobs with the same key supersede earlier unrendered ones
+            payload: Picklable chart data
+            filename: Output file name relative to the charts directory
+            figsize: Optional figure size
+
+        Returns:
+            str: Path the chart will be written to
+        """
+        if kind not in BUILTIN_RENDERERS and kind not in self._renderers:
+            raise ValueError(f"Unknown chart kind: {kind}")
+
+        key = (kind,) + tuple(dedup_key)
+        if key in self._pending:
+            del self._pending[key]
+            self.jobs_superseded += 1
+
+        output_path = os.path.join(self.output_dir, filename)
+        self._pending[key] = {
+            "kind": kind,
+            "renderer": self._renderers.get(kind),
+            "payload": payload,
+            "output_path": output_path,
+            "figsize": figsize or self.default_figsize
+        }
+        self.jobs_submitted += 1
+        return output_path
+
+    def submit_team_history(self, team_id: str, stat_name: str, day_number: int, value: float,
+                            team_name: Optional[str] = None) -> str:
+        """Record a team stat value for a day and queue the team's history chart
+
+        Only the latest chart per team, stat and day is rendered.
+        """
+        series = self._team_history[(team_id, stat_name)]
+        series[day_number] = value
+        days = sorted(series)
+
+        payload = {
+            "team_id": team_id,
+            "team_name": team_name or team_id,
+            "stat_name": stat_name,
+            "days": days,
+            "values": [series[day] for day in days]
+        }
+        return self.submit(
+            "team_history", (team_id, stat_name, day_number), payload,
+            f"team_history_{team_id}_{stat_name}_day{day_number}.png"
+        )
+
+    def pending_count(self) -> int:
+        """Get the number of queued jobs"""
+        return len(self._pending)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start the worker pool on first use"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_worker_init)
+        return self._executor
+
+    def flush(self, wait: bool = False) -> List[str]:
+        """Hand all queued jobs to the renderer
+
+        Args:
+            wait: Block until every submitted job has been rendered
+
+        Returns:
+            List of written paths when waiting (or rendering in-process), else empty
+        """
+        jobs = list(self._pending.values())
+        self._pending.clear()
+
+        written = []
+        if jobs:
+            batches = [jobs[i:i + self.batch_size] for i in range(0, len(jobs), self.batch_size)]
+            if self.out_of_process:
+                executor = self._get_executor()
+                self._futures.extend(executor.submit(render_batch, batch) for batch in batches)
+            else:
+                _worker_init()
+                for batch in batches:
+                    written.extend(render_batch(batch))
+            self.logger.debug(f"Flushed {len(jobs)} chart jobs")
+
+        if wait:
+            written.extend(self._collect())
+        else:
+            # Drop references to finished futures so they don't pile up
+            self._futures = [future for future in self._futures if not future.done()]
+
+        return written
+
+    def _collect(self) -> List[str]:
+        """Wait for outstanding futures and gather their results"""
+        written = []
+        for future in self._futures:
+            try:
+                written.extend(future.result())
+            except Exception as e:
+                self.logger.error(f"Chart worker failed: {e}")
+        self._futures = []
+        return written
+
+    def close(self) -> List[str]:
+        """Render everything still queued, then shut the worker down"""
+        written = self.flush(wait=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        return written
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get status of the renderer"""
+        status = super().get_status()
+        status.update({
+            "pending": len(self._pending),
+            "in_flight": len(self._futures),
+            "submitted": self.jobs_submitted,
+            "superseded": self.jobs_superseded
+        })
+        return status
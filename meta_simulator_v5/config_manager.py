@@ -1,6 +1,7 @@
 import os
 import json
 import logging
+from settings import Settings, resolve_settings
 
 class ConfigManager:
     '''Configuration manager for META Simulator'''
@@ -16,6 +17,7 @@ class ConfigManager:
         self._stats_dir = "results/stats"
         self._backup_dir = "backups"
         self._use_stockfish = False
+        self._settings = None
         
         if config_file and os.path.exists(config_file):
             self.load_from_file(config_file)
@@ -130,6 +132,26 @@ class ConfigManager:
         # Set the value
         current[parts[-1]] = value
     
+    @property
+    def settings(self) -> Settings:
+        '''Get typed settings, resolved on first access
+        
+        Values changed with set() take effect only after reload_settings().
+        '''
+        if self._settings is None:
+            self._settings = resolve_settings(self)
+        return self._settings
+    
+    def reload_settings(self) -> Settings:
+        '''Re-resolve typed settings from the current configuration
+        
+        Raises:
+            SettingsError: If the configuration is invalid (the previous settings are kept)
+        '''
+        self._settings = resolve_settings(self)
+        self.logger.info("Typed settings reloaded")
+        return self._settings
+    
     @property
     def LOG_DIR(self):
         '''Get logs directory path (alias for LOGS_DIR)'''
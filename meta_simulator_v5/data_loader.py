@@ -7,8 +7,9 @@ import os
 import json
 import csv
 import logging
-import pandas as pd
 from typing import Dict, List, Any, Optional, Tuple
+from roster_snapshot import RosterSnapshot, hash_sources
+from character_overlay import CharacterOverlay
 
 class DataLoader:
     """Data loader for META League Simulator that handles all data file access"""
@@ -29,8 +30,56 @@ class DataLoader:
         self._matchups_cache = None
         self._player_traits_cache = None
         
+        # Compiled roster snapshot, built or loaded on first lineup access
+        self.use_snapshot = config.get("data.use_roster_snapshot", True)
+        self.snapshot_path = config.get("data.roster_snapshot_path",
+                                        os.path.join(self.data_dir, ".roster_snapshot.bin"))
+        self._snapshot = None
+        
         self.logger.info("Data loader initialized")
     
+    @staticmethod
+    def _split_ids(row: Dict[str, Any], field: str) -> List[str]:
+        """Split a comma-separated ID column
+        
+        Handles both a quoted "a,b,c" value and unquoted lists, which DictReader
+        spreads over the field and its overflow (None) key.
+        """
+        values = row[field].split(',') + row.get(None, [])
+        return [value.strip() for value in values if value.strip()]
+    
+    def get_snapshot(self) -> Optional[RosterSnapshot]:
+        """Get the roster snapshot, loading it or compiling it from the CSVs if stale
+        
+        Returns:
+            RosterSnapshot or None if snapshots are disabled
+        """
+        if self._snapshot is not None or not self.use_snapshot:
+            return self._snapshot
+        
+        source_hash = hash_sources(self.data_dir)
+        snapshot = RosterSnapshot.load(self.snapshot_path, source_hash)
+        
+        if snapshot is None:
+            self.logger.info("Compiling roster snapshot")
+            snapshot = RosterSnapshot.build(self, source_hash)
+            try:
+                snapshot.save(self.snapshot_path)
+            except OSError as e:
+                self.logger.warning(f"Could not save roster snapshot: {e}")
+        
+        self.attach_snapshot(snapshot)
+        return snapshot
+    
+    def attach_snapshot(self, snapshot: RosterSnapshot) -> None:
+        """Serve all tables from a snapshot (used directly by worker processes)"""
+        self._snapshot = snapshot
+        self._teams_cache = snapshot.teams
+        self._divisions_cache = snapshot.divisions
+        self._matchups_cache = snapshot.matchups
+        self.logger.info(f"Using roster snapshot {snapshot.source_hash[:12]} "
+                         f"({len(snapshot.teams)} teams, {len(snapshot.players)} players)")
+    
     def load_teams(self) -> Dict[str, Dict[str, Any]]:
         """Load team data from teams.csv"""
         if self._teams_cache is not None:
@@ -176,9 +225,7 @@ class DataLoader:
             with open(player_traits_file, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
                 for row in reader:
-                    player_id = row['player_id']
-                    trait_ids = [trait_id.strip() for trait_id in row['trait_ids'].split(',')]
-                    player_traits_data[player_id] = trait_ids
+                    player_traits_data[row['player_id']] = self._split_ids(row, 'trait_ids')
             
             self._player_traits_cache = player_traits_data
             self.logger.info(f"Loaded trait assignments for {len(player_traits_data)} players")
@@ -262,8 +309,21 @@ class DataLoader:
         
         return matchups
     
-    def load_lineups(self, day_number: int) -> Dict[str, List[Dict[str, Any]]]:
+    def read_lineup_file(self, lineup_file: str) -> Dict[str, List[str]]:
+        """Read a lineup CSV into player ID lists by team"""
+        lineup = {}
+        with open(lineup_file, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                lineup[row['team_id']] = self._split_ids(row, 'player_ids')
+        return lineup
+    
+    def load_lineups(self, day_number: int) -> Dict[str, List[CharacterOverlay]]:
         """Load lineup data for a specific day"""
+        snapshot = self.get_snapshot()
+        if snapshot is not None:
+            return self._load_lineups_from_snapshot(snapshot, day_number)
+        
         lineup_file = os.path.join(self.data_dir, f"lineups_day{day_number}.csv")
         
         # If day-specific lineup doesn't exist, fall back to previous day or default
@@ -293,44 +353,38 @@ class DataLoader:
         # Read lineups
         lineups = {}
         try:
-            with open(lineup_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    team_id = row['team_id']
-                    player_ids = [pid.strip() for pid in row['player_ids'].split(',')]
-                    
-                    # Create lineup for this team
-                    team_lineup = []
-                    
-                    for player_id in player_ids:
-                        if player_id in players:
-                            # Create a copy of player data with traits
-                            player_data = players[player_id].copy()
-                            
-                            # Set HP to base HP at start of day
-                            player_data['HP'] = player_data['base_HP']
-                            
-                            # Initialize other stats if needed
-                            player_data.setdefault('stamina', 100)
-                            player_data.setdefault('morale', 100)
-                            
-                            # Add traits
-                            player_data['traits'] = []
-                            if player_id in player_traits:
-                                for trait_id in player_traits[player_id]:
-                                    if trait_id in traits:
-                                        trait_data = traits[trait_id].copy()
-                                        trait_data['current_cooldown'] = 0  # Reset cooldown
-                                        player_data['traits'].append(trait_data)
-                            
-                            team_lineup.append(player_data)
-                    
-                    # Ensure exactly 8 players per team (non-negotiable rule)
-                    if len(team_lineup) < 8:
-                        self.logger.error(f"Team {team_id} has only {len(team_lineup)} players, 8 required")
-                        raise ValueError(f"Team {team_id} has only {len(team_lineup)} players, 8 required")
-                    
-                    lineups[team_id] = team_lineup
+            for team_id, player_ids in self.read_lineup_file(lineup_file).items():
+                # Create lineup for this team
+                team_lineup = []
+                
+                for player_id in player_ids:
+                    if player_id in players:
+                        # Overlay the player record; the day's changes stay in the overlay
+                        player_data = CharacterOverlay(players[player_id])
+                        
+                        # Set HP to base HP at start of day
+                        player_data['HP'] = player_data['base_HP']
+                        
+                        # Initialize other stats if needed
+                        player_data.setdefault('stamina', 100)
+                        player_data.setdefault('morale', 100)
+                        
+                        # Add traits (plain per-character copies; trait consumers expect dicts)
+                        player_data['traits'] = []
+                        if player_id in player_traits:
+                            for trait_id in player_traits[player_id]:
+                                if trait_id in traits:
+                                    trait_data = dict(traits[trait_id], current_cooldown=0)  # Reset cooldown
+                                    player_data['traits'].append(trait_data)
+                        
+                        team_lineup.append(player_data)
+                
+                # Ensure exactly 8 players per team (non-negotiable rule)
+                if len(team_lineup) < 8:
+                    self.logger.error(f"Team {team_id} has only {len(team_lineup)} players, 8 required")
+                    raise ValueError(f"Team {team_id} has only {len(team_lineup)} players, 8 required")
+                
+                lineups[team_id] = team_lineup
             
             self.logger.info(f"Loaded lineups for {len(lineups)} teams from {os.path.basename(lineup_file)}")
             return lineups
@@ -338,6 +392,26 @@ class DataLoader:
             self.logger.error(f"Error loading lineups: {e}")
             raise
     
+    def _load_lineups_from_snapshot(self, snapshot: RosterSnapshot, day_number: int) -> Dict[str, List[CharacterOverlay]]:
+        """Build a day's lineups from the snapshot; traits reference shared definitions"""
+        lineup_day = snapshot.resolve_lineup_day(day_number)
+        if lineup_day is None:
+            self.logger.error(f"No lineup data found for day {day_number}")
+            raise FileNotFoundError(f"No lineup data found for day {day_number}")
+        if lineup_day != day_number:
+            self.logger.info(f"Using lineup from day {lineup_day} for day {day_number}")
+        
+        lineups = snapshot.get_lineups(lineup_day)
+        
+        # Ensure exactly 8 players per team (non-negotiable rule)
+        for team_id, team_lineup in lineups.items():
+            if len(team_lineup) < 8:
+                self.logger.error(f"Team {team_id} has only {len(team_lineup)} players, 8 required")
+                raise ValueError(f"Team {team_id} has only {len(team_lineup)} players, 8 required")
+        
+        self.logger.info(f"Loaded lineups for {len(lineups)} teams from snapshot (day {lineup_day})")
+        return lineups
+    
     def get_team_name(self, team_id: str) -> Optional[str]:
         """Get team name by ID"""
         teams = self.load_teams()
@@ -354,6 +428,19 @@ class DataLoader:
     
     def validate_data_integrity(self) -> bool:
         """Validate the integrity of all data files"""
+        # Snapshots are checked once when compiled
+        if self.use_snapshot:
+            try:
+                snapshot = self.get_snapshot()
+            except Exception as e:
+                self.logger.error(f"Data integrity validation failed: {e}")
+                return False
+            for error in snapshot.errors:
+                self.logger.error(error)
+            if snapshot.valid:
+                self.logger.info("Data integrity validation passed (roster snapshot)")
+            return snapshot.valid
+        
         try:
             # Check all required files exist
             required_files = [
@@ -0,0 +1,158 @@
+"""
+Engine Pool for META League Simulator v5.0
+A bounded set of asyncio UCI engine processes shared by interleaved matches
+"""
+
+import time
+import asyncio
+import logging
+import chess
+import chess.engine
+from typing import Dict, List, Any, Optional
+
+from phase_timer import PhaseTimer
+
+# Queued in place of an engine once none are left, waking every waiter with an error
+_NO_ENGINES = object()
+
+
+def search_limit(character: Dict[str, Any]) -> chess.engine.Limit:
+    """Search limit for a character's move: Focus/Speed sets depth and think time, stamina cuts depth
+
+    Used when the chess system does not provide its own search_limit(character).
+    """
+    focus_speed = character.get("aFS", 5)
+    base_depth = min(max(2, focus_speed // 2), 10)
+    stamina_factor = max(0.5, character.get("stamina", 100) / 100)
+    return chess.engine.Limit(depth=max(1, int(base_depth * stamina_factor)),
+                              time=focus_speed * 50 / 1000.0)
+
+
+class EnginePool:
+    """
+    Multiplexes board searches over a fixed number of UCI engine processes
+
+    Searches wait for an idle engine, so any number of coroutines can share the pool;
+    an engine that dies mid-search is replaced before it is handed out again, or
+    dropped from the pool if the replacement fails to start. Once the last engine is
+    dropped or the pool is closed, waiting and later searches fail instead of hanging.
+    """
+
+    def __init__(self, engine_path: str, size: int = 4, options: Optional[Dict[str, Any]] = None,
+                 restart_timeout: float = 10.0):
+        """Create the pool (engines are started by start())
+
+        Args:
+            engine_path: Path of the UCI engine executable
+            size: Number of engine processes
+            options: UCI options applied to every engine (e.g. {"Threads": 1, "Hash": 16})
+            restart_timeout: Seconds to wait for a replacement engine to start
+        """
+        self.logger = logging.getLogger("META_SIMULATOR.EnginePool")
+        self.engine_path = engine_path
+        self.size = max(1, size)
+        self.options = options or {}
+        self.restart_timeout = restart_timeout
+        self._idle: Optional[asyncio.Queue] = None
+        self._engines: List[Any] = []
+        self.searches = 0
+        self.restarts = 0
+
+    async def _launch(self):
+        """Start one engine process and apply the pool's options"""
+        transport, protocol = await chess.engine.popen_uci(self.engine_path)
+        if self.options:
+            await protocol.configure(self.options)
+        return transport, protocol
+
+    async def start(self) -> "EnginePool":
+        """Start all engine processes"""
+        self._idle = asyncio.Queue()
+        engines = await asyncio.gather(*(self._launch() for _ in range(self.size)))
+        for engine in engines:
+            self._engines.append(engine)
+            self._idle.put_nowait(engine)
+        self.logger.info(f"Engine pool started: {self.size} x {self.engine_path}")
+        return self
+
+    async def play(self, board: chess.Board, limit: chess.engine.Limit,
+                   timer: Optional[PhaseTimer] = None) -> Optional[chess.Move]:
+        """Search a position on the next idle engine
+
+        Args:
+            board: Position to search (not modified)
+            limit: Search limit
+            timer: Match timer receiving "engine_pool.queue_wait" and "select_move.engine_wait"
+
+        Returns:
+            chess.Move or None: Best move, None if the engine found none
+        """
+        if self._idle is None:
+            raise RuntimeError("Engine pool has not been started")
+        if not self._engines:
+            raise RuntimeError("Engine pool has no live engines")
+
+        idle = self._idle
+        start = time.perf_counter_ns()
+        engine = await idle.get()
+        if engine is _NO_ENGINES:
+            idle.put_nowait(engine)  # Pass it on to the next waiter
+            raise RuntimeError("Engine pool has no live engines")
+        acquired = time.perf_counter_ns()
+        try:
+            result = await engine[1].play(board, limit)
+            self.searches += 1
+            return result.move
+        except chess.engine.EngineTerminatedError:
+            try:
+                engine = await self._replace(engine)
+            except BaseException:
+                engine = None  # Not replaced: never hand the dead engine out again
+                raise
+            raise
+        finally:
+            if engine is not None:
+                idle.put_nowait(engine)
+            if timer is not None and timer.enabled:
+                timer.add("engine_pool.queue_wait", acquired - start)
+                timer.add("select_move.engine_wait", time.perf_counter_ns() - acquired)
+
+    async def _replace(self, engine):
+        """Swap a dead engine for a fresh process"""
+        self.logger.warning("Engine terminated during search, restarting it")
+        engine[0].close()
+        try:
+            replacement = await asyncio.wait_for(self._launch(), self.restart_timeout)
+        except BaseException:
+            self._engines.remove(engine)
+            self.logger.error(f"Engine restart failed, pool is down to {len(self._engines)} engines")
+            if not self._engines:
+                self._idle.put_nowait(_NO_ENGINES)
+            raise
+        self._engines[self._engines.index(engine)] = replacement
+        self.restarts += 1
+        return replacement
+
+    async def close(self) -> None:
+        """Quit all engine processes and fail any searches still waiting for one"""
+        engines, self._engines = self._engines, []
+        if self._idle is not None:
+            self._idle.put_nowait(_NO_ENGINES)
+            self._idle = None
+        for transport, protocol in engines:
+            try:
+                await asyncio.wait_for(protocol.quit(), self.restart_timeout)
+            except (asyncio.TimeoutError, chess.engine.EngineError, chess.engine.EngineTerminatedError):
+                pass
+            finally:
+                transport.close()
+
+    async def __aenter__(self) -> "EnginePool":
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool size and search counters"""
+        return {"size": self.size, "searches": self.searches, "restarts": self.restarts}
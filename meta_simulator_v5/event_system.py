@@ -4,7 +4,7 @@ Centralized event dispatching system
 """
 
 import logging
-from typing import Dict, List, Any, Callable, Optional
+from typing import Dict, List, Any, Callable, Optional, Tuple
 from collections import defaultdict
 from system_base import SystemBase
 
@@ -61,6 +61,17 @@ class EventSystem(SystemBase):
             except Exception as e:
                 self.logger.error(f"Error in event handler for {event_type}: {e}")
     
+    def emit_batch(self, events: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """Dispatch several (event_type, data) events in order
+        
+        Args:
+            events: Events collected during one pass, e.g. an end-of-round pipeline run
+        """
+        handlers = self.handlers
+        for event_type, data in events:
+            if event_type in handlers:
+                self.dispatch(event_type, **data)
+    
     def get_handler_count(self, event_type: str) -> int:
         """Get number of handlers for an event type
         
@@ -2,7 +2,6 @@
 
 import os
 import glob
-import chess
 import datetime
 
 class Gatekeeper:
@@ -0,0 +1,152 @@
+"""
+Match Orchestrator for META League Simulator v5.0
+Interleaves a day's matches on one asyncio event loop over a shared engine pool
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Any, Optional
+
+from engine_pool import EnginePool, search_limit
+from phase_timer import PhaseTimer
+
+
+class MatchOrchestrator:
+    """
+    Runs matches as coroutines driving the simulator's match_steps() generators
+
+    Each match runs its Python-side phases (traits, combat, convergences, effects) until it
+    needs a move, then awaits a search on the engine pool while other matches proceed.
+    Days run one after another; the matches of a day run concurrently, up to max_concurrent.
+
+    Match phase histograms come from a per-match timer, so "chess_round" is wall time
+    including interleaving; registry system.* timings stay on the shared simulator timer.
+    """
+
+    def __init__(self, simulator, engine_pool: EnginePool, max_concurrent: Optional[int] = None):
+        """Create an orchestrator
+
+        Args:
+            simulator: MetaLeagueSimulatorV5 instance
+            engine_pool: Started engine pool shared by all matches
+            max_concurrent: Matches in flight at once (default: config concurrency.max_concurrent_matches)
+        """
+        self.logger = logging.getLogger("META_SIMULATOR.MatchOrchestrator")
+        self.simulator = simulator
+        self.engine_pool = engine_pool
+        if max_concurrent is None:
+            max_concurrent = simulator.config.get("concurrency.max_concurrent_matches", 256)
+        self.max_concurrent = max(1, max_concurrent)
+        self._slots = asyncio.Semaphore(self.max_concurrent)
+
+    async def select_move(self, board, character: Dict[str, Any], timer: PhaseTimer):
+        """Answer one move request from the pool
+
+        Chess systems providing select_move_async(board, character, engine_pool) choose
+        their own searches; otherwise the pool plays the best move at the character's limit,
+        taken from the chess system's search_limit(character) so pooled and synchronous
+        searches agree (engine_pool.search_limit if the system has none).
+        """
+        chess_system = self.simulator.registry.get("chess_system")
+        if hasattr(chess_system, "select_move_async"):
+            return await chess_system.select_move_async(board, character, self.engine_pool)
+        limit = getattr(chess_system, "search_limit", search_limit)
+        return await self.engine_pool.play(board, limit(character), timer)
+
+    async def simulate_match(self, team_a: List[Dict[str, Any]], team_b: List[Dict[str, Any]],
+                             day_number: int = 1, match_number: int = 1,
+                             show_details: bool = False, featured: bool = False) -> Dict[str, Any]:
+        """Simulate one match, awaiting the engine pool for every move"""
+        async with self._slots:
+            timer = PhaseTimer(self.simulator.phase_timer.enabled)
+            # Unseeded: interleaved matches share the global random stream
+            steps = self.simulator.match_steps(team_a, team_b, day_number, match_number,
+                                               show_details, featured, timer, seeded=False)
+            registry = self.simulator.registry
+            try:
+                request = next(steps)
+                while True:
+                    board, char = request
+                    try:
+                        move = await self.select_move(board, char, timer)
+                    except Exception as e:
+                        # Raised at the request so the round handles it like any move error
+                        registry.timer = timer
+                        request = steps.throw(e)
+                        continue
+                    # Other matches ran while this one awaited its move; time its system calls again
+                    registry.timer = timer
+                    request = steps.send(move)
+            except StopIteration as done:
+                return done.value
+
+    async def simulate_day(self, day_number: int, show_details: bool = False) -> Dict[str, Any]:
+        """Simulate all of a day's matches concurrently"""
+        simulator = self.simulator
+        lineups, matchups = simulator._prepare_day(day_number)
+
+        async def play(match_number: int, team_a_id: str, team_b_id: str) -> Dict[str, Any]:
+            try:
+                result = await self.simulate_match(lineups.get(team_a_id, []), lineups.get(team_b_id, []),
+                                                   day_number, match_number, show_details)
+            except Exception as e:
+                simulator._handle_match_error(day_number, match_number, team_a_id, team_b_id, e)
+                raise
+            self.logger.info(f"Match {match_number} completed: {result['winning_team']}")
+            return result
+
+        # gather() keeps match order, so results line up with the sequential day
+        match_results = await asyncio.gather(*(play(number, team_a_id, team_b_id)
+                                               for number, (team_a_id, team_b_id) in enumerate(matchups, 1)))
+        return simulator._finish_day(day_number, list(match_results), lineups)
+
+    async def run_range(self, start_day: int, end_day: int, show_details: bool = False) -> Dict[str, Any]:
+        """Simulate the match days in [start_day, end_day]
+
+        Returns:
+            dict: Day results by day number plus per-day match counts under "stats"
+        """
+        days = {}
+        for day_number in range(start_day, end_day + 1):
+            if not self.simulator._is_valid_match_day(day_number):
+                continue
+            days[day_number] = await self.simulate_day(day_number, show_details)
+
+        return {
+            "days": days,
+            "stats": {day: {"matches_played": len(results.get("matches", []))} for day, results in days.items()},
+            "engine_pool": self.engine_pool.get_stats()
+        }
+
+
+async def _run_range(simulator, start_day: int, end_day: int, show_details: bool,
+                     engine_path: str, pool_size: int, max_concurrent: Optional[int]) -> Dict[str, Any]:
+    """Start a pool, run the range and shut the pool down"""
+    options = simulator.config.get("concurrency.engine_options", {})
+    async with EnginePool(engine_path, pool_size, options) as pool:
+        orchestrator = MatchOrchestrator(simulator, pool, max_concurrent)
+        return await orchestrator.run_range(start_day, end_day, show_details)
+
+
+def run_range_concurrent(simulator, start_day: int, end_day: int, show_details: bool = False,
+                         engine_path: Optional[str] = None, pool_size: Optional[int] = None,
+                         max_concurrent: Optional[int] = None) -> Dict[str, Any]:
+    """Simulate a range of days with interleaved matches on a fresh event loop
+
+    Args:
+        simulator: MetaLeagueSimulatorV5 instance
+        start_day: First day to simulate
+        end_day: Last day to simulate
+        show_details: Whether to print match details (interleaved across matches)
+        engine_path: UCI engine executable (default: config concurrency.engine_path)
+        pool_size: Engine processes (default: config concurrency.engine_pool_size)
+        max_concurrent: Matches in flight at once (default: config concurrency.max_concurrent_matches)
+
+    Returns:
+        dict: MatchOrchestrator.run_range() results
+    """
+    config = simulator.config
+    engine_path = engine_path or config.get("concurrency.engine_path", "stockfish")
+    pool_size = pool_size or config.get("concurrency.engine_pool_size", 4)
+    return asyncio.run(_run_range(simulator, start_day, end_day, show_details,
+                                  engine_path, pool_size, max_concurrent))
@@ -0,0 +1,200 @@
+"""
+Match Replay for META League Simulator v5.0
+Re-drives recorded matches under the current rules without a chess engine
+
+A recording holds a match's seed and each character's moves in order. Replaying it
+runs match_steps() with the same seed and answers every move request from the
+recording, so traits, convergences, combat and end-of-round effects are recomputed
+by the current code while the chess stays as it was played.
+
+Replays never run on the live simulator: they get a separate one whose output and
+persistence paths point into a scratch directory (see scratch_config).
+"""
+
+import os
+import re
+import copy
+import glob
+import json
+import shutil
+import chess
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+# Output paths a replay redirects into its scratch directory (inputs such as data_dir are shared)
+SCRATCH_PATH_KEYS = ["results_dir", "pgn_dir", "reports_dir", "charts_dir", "stats_dir",
+                     "logs_dir", "backups_dir", "backup_dir", "persistence_dir"]
+
+MATCH_ID_PATTERN = re.compile(r"^day(\d+)_match(\d+)_(.+)_vs_(.+)$")
+
+
+class MatchRecording:
+    """A match's seed and per-character move lists (UCI)"""
+
+    __slots__ = ("match_id", "seed", "moves")
+
+    def __init__(self, match_id: str, seed: Optional[int] = None,
+                 moves: Optional[Dict[str, List[str]]] = None):
+        """Create a recording
+
+        Args:
+            match_id: Match identifier (day<d>_match<m>_<team_a>_vs_<team_b>)
+            seed: RNG seed the match was played with (None if unknown)
+            moves: UCI moves by character ID, in the order they were played
+        """
+        self.match_id = match_id
+        self.seed = seed
+        self.moves = moves if moves is not None else {}
+
+    @classmethod
+    def from_result(cls, result: Dict[str, Any]) -> "MatchRecording":
+        """Recording from a match result returned by simulate_match()"""
+        return cls(result["match_id"], result.get("seed"),
+                   {char_id: list(moves) for char_id, moves in result.get("move_log", {}).items()})
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MatchRecording":
+        return cls(data["match_id"], data.get("seed"), data.get("moves", {}))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"match_id": self.match_id, "seed": self.seed, "moves": self.moves}
+
+    def move_count(self) -> int:
+        return sum(len(moves) for moves in self.moves.values())
+
+    def __repr__(self) -> str:
+        return f"MatchRecording({self.match_id!r}, seed={self.seed}, boards={len(self.moves)}, moves={self.move_count()})"
+
+
+def read_pgn_game(game: "chess.pgn.Game", recordings: Dict[str, MatchRecording]) -> None:
+    """Add one archived per-board game to the recording of its match"""
+    headers = game.headers
+    match_id = headers.get("MatchID")
+    char_id = headers.get("CharacterID")
+    if not match_id or not char_id:
+        return
+
+    recording = recordings.get(match_id)
+    if recording is None:
+        recording = recordings[match_id] = MatchRecording(match_id)
+    seed = headers.get("Seed")
+    if seed and recording.seed is None:
+        recording.seed = int(seed)
+    recording.moves[char_id] = [move.uci() for move in game.mainline_moves()]
+
+
+def load_pgn_archive(pgn_dir: str, match_ids: Optional[List[str]] = None) -> Dict[str, MatchRecording]:
+    """Recordings for every match in a PGN archive
+
+    Reads the per-board PGNs written by the PGN tracker (combined match files are
+    skipped, their games duplicate the per-board ones).
+
+    Args:
+        pgn_dir: Directory of archived PGNs
+        match_ids: Only keep these matches (default: all)
+
+    Returns:
+        dict: Recordings by match ID
+    """
+    import chess.pgn  # loads chess.engine, kept off the simulator's import path
+
+    wanted = set(match_ids) if match_ids is not None else None
+    recordings: Dict[str, MatchRecording] = {}
+    for path in sorted(glob.glob(os.path.join(pgn_dir, "*.pgn"))):
+        if path.endswith("_combined.pgn"):
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            while True:
+                game = chess.pgn.read_game(f)
+                if game is None:
+                    break
+                if wanted is None or game.headers.get("MatchID") in wanted:
+                    read_pgn_game(game, recordings)
+    return recordings
+
+
+def save_recordings(recordings: Dict[str, MatchRecording], path: str) -> None:
+    """Write recordings as one JSON file (smaller and faster to load than the PGN archive)"""
+    with open(path, "w") as f:
+        json.dump({match_id: recording.to_dict() for match_id, recording in recordings.items()}, f)
+
+
+def load_recordings(path: str) -> Dict[str, MatchRecording]:
+    with open(path, "r") as f:
+        return {match_id: MatchRecording.from_dict(data) for match_id, data in json.load(f).items()}
+
+
+def recorded_matchups(recordings: Dict[str, MatchRecording], day_number: int) -> List[Tuple[str, str]]:
+    """A day's (team_a_id, team_b_id) matchups, in match order, from its recordings' match IDs"""
+    matches = []
+    for match_id in recordings:
+        parsed = MATCH_ID_PATTERN.match(match_id)
+        if parsed and int(parsed.group(1)) == day_number:
+            matches.append((int(parsed.group(2)), parsed.group(3), parsed.group(4)))
+    return [(team_a_id, team_b_id) for _, team_a_id, team_b_id in sorted(matches)]
+
+
+def scratch_config(config_data: Dict[str, Any], scratch_dir: str) -> Dict[str, Any]:
+    """Configuration for a replay simulator: every output path inside scratch_dir
+
+    PGNs, reports, charts, stats, the schedule table, backups, logs and persistent
+    system data are written there, so a replay cannot overwrite the live season.
+    """
+    config = copy.deepcopy(config_data)
+    paths = config.setdefault("paths", {})
+    for key in SCRATCH_PATH_KEYS:
+        paths[key] = os.path.join(scratch_dir, key[:-len("_dir")])
+    config.setdefault("scheduling", {})["table_path"] = os.path.join(paths["results_dir"], "schedule_table.json")
+    return config
+
+
+def load_snapshot(snapshot_dir: str, persistence_dir: str) -> None:
+    """Copy persistent system data saved before the replayed days into a scratch persistence dir"""
+    if not os.path.isdir(snapshot_dir):
+        raise ValueError(f"Snapshot not found: {snapshot_dir}")
+    shutil.copytree(snapshot_dir, persistence_dir, dirs_exist_ok=True)
+
+
+class ReplayMoveSource:
+    """
+    Answers match_steps() move requests from a recording
+
+    Each character's moves are consumed in order. When a character's recording runs
+    out (the match now lasts longer) or the next move is illegal (the position has
+    changed), the fallback selector is asked instead; without one the character
+    passes. Such requests are counted, so a replay can report how far it diverged.
+    """
+
+    def __init__(self, recording: MatchRecording,
+                 fallback: Optional[Callable[[chess.Board, Dict[str, Any]], Optional[chess.Move]]] = None):
+        """Create a move source
+
+        Args:
+            recording: Match recording
+            fallback: fn(board, character) for moves the recording cannot supply
+        """
+        self.recording = recording
+        self.fallback = fallback
+        self._positions: Dict[str, int] = {}
+        self.replayed = 0
+        self.exhausted = 0
+        self.diverged = 0
+
+    def __call__(self, board: chess.Board, character: Dict[str, Any]) -> Optional[chess.Move]:
+        char_id = character.get("id")
+        moves = self.recording.moves.get(char_id, ())
+        position = self._positions.get(char_id, 0)
+
+        if position < len(moves):
+            self._positions[char_id] = position + 1
+            move = chess.Move.from_uci(moves[position])
+            if board.is_legal(move):
+                self.replayed += 1
+                return move
+            self.diverged += 1
+        else:
+            self.exhausted += 1
+
+        return self.fallback(board, character) if self.fallback else None
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"replayed": self.replayed, "exhausted": self.exhausted, "diverged": self.diverged}
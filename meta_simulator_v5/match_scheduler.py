@@ -3,224 +3,657 @@ Match Scheduler for META League Simulator v4.2.1
 Handles scheduling matches with division separation rules
 """
 
+import os
+import json
 import random
+import hashlib
 import logging
 from typing import Dict, List, Any, Optional, Tuple, Set
 from system_base import SystemBase
 
+# scipy's Jonker-Volgenant solver is much faster on large leagues; fall back to a numpy Hungarian
+try:
+    from scipy.optimize import linear_sum_assignment
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+    def linear_sum_assignment(cost):
+        """Minimum-cost assignment of rows to columns (shortest augmenting path, O(n^3))
+
+        Args:
+            cost: n x n cost matrix (the column-reduction start assumes a square matrix)
+
+        Returns:
+            Tuple of (row indices, column indices) of the optimal assignment
+        """
+        import numpy as np
+
+        cost = np.asarray(cost, dtype=float)
+        n, m = cost.shape
+        if n != m:
+            raise ValueError(f"Assignment fallback needs a square cost matrix, got {n}x{m}")
+        u = np.zeros(n + 1)
+        v = np.zeros(m + 1)
+        owner = np.zeros(m + 1, dtype=int)  # owner[j]: 1-based row assigned to column j, 0 if free
+        way = np.zeros(m + 1, dtype=int)
+
+        # Column reduction: tight edges give a feasible start; only unmatched rows are augmented
+        v[1:] = cost.min(axis=0)
+        matched = np.zeros(n + 1, dtype=bool)
+        for j, i in enumerate(cost.argmin(axis=0), 1):
+            if not matched[i + 1]:
+                matched[i + 1] = True
+                owner[j] = i + 1
+
+        for row in range(1, n + 1):
+            if matched[row]:
+                continue
+            owner[0] = row
+            j0 = 0
+            minv = np.full(m + 1, np.inf)
+            used = np.zeros(m + 1, dtype=bool)
+            while True:
+                used[j0] = True
+                i0 = owner[j0]
+                free = ~used[1:]
+                reduced = cost[i0 - 1] - u[i0] - v[1:]
+                better = free & (reduced < minv[1:])
+                minv[1:][better] = reduced[better]
+                way[1:][better] = j0
+
+                candidates = np.where(free, minv[1:], np.inf)
+                j1 = int(np.argmin(candidates)) + 1
+                delta = candidates[j1 - 1]
+
+                used_columns = np.nonzero(used)[0]
+                u[owner[used_columns]] += delta
+                v[used_columns] -= delta
+                minv[1:][free] -= delta
+
+                j0 = j1
+                if owner[j0] == 0:
+                    break
+
+            # Augment along the alternating path
+            while j0:
+                j1 = way[j0]
+                owner[j0] = owner[j1]
+                j0 = j1
+
+        columns = [j - 1 for j in range(1, m + 1) if owner[j]]
+        rows = [owner[j + 1] - 1 for j in columns]
+        order = sorted(range(len(rows)), key=rows.__getitem__)
+        return [rows[i] for i in order], [columns[i] for i in order]
+
+
+SCHEDULE_TABLE_VERSION = 2
+
+# Cost that keeps a "sits out" row off a "sits out" column, so exactly the day's match count is played
+UNASSIGNABLE = 1e9
+
+# Attributes averaged into a team's strength for strength-of-schedule balancing
+STRENGTH_ATTRIBUTES = ["aSTR", "aSPD", "aFS", "aLDR", "aDUR", "aRES", "aWIL"]
+
+
+class ScheduleTable:
+    """
+    Precomputed season schedule: day number -> ordered (home, away) pairings
+    Tagged with a signature of the league and scheduler settings it was built from
+    """
+
+    def __init__(self, signature: str, days: Optional[Dict[int, List[Tuple[str, str]]]] = None):
+        self.signature = signature
+        self.days = days or {}
+
+    def get(self, day_number: int) -> Optional[List[Tuple[str, str]]]:
+        """Get a day's pairings, or None if the day is not scheduled"""
+        return self.days.get(day_number)
+
+    def set(self, day_number: int, pairings: List[Tuple[str, str]]) -> None:
+        """Replace a day's pairings"""
+        self.days[day_number] = list(pairings)
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly view"""
+        return {
+            "version": SCHEDULE_TABLE_VERSION,
+            "signature": self.signature,
+            "days": {str(day): [list(pair) for pair in pairs] for day, pairs in sorted(self.days.items())}
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ScheduleTable":
+        """Rebuild a table from to_dict() output"""
+        days = {int(day): [tuple(pair) for pair in pairs] for day, pairs in data.get("days", {}).items()}
+        return cls(data["signature"], days)
+
+    def save(self, path: str) -> str:
+        """Write the table as JSON"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=1)
+        return path
+
+    @classmethod
+    def load(cls, path: str, signature: str) -> Optional["ScheduleTable"]:
+        """Load a saved table if it exists and matches the signature"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != SCHEDULE_TABLE_VERSION or data.get("signature") != signature:
+            return None
+        return cls.from_dict(data)
+
+
 class MatchScheduler(SystemBase):
     """
     Match Scheduler system for META League simulations
     Enforces division separation rules, home/away alternation, and fairness
+
+    The whole season is planned in one pass into a ScheduleTable. Each day chooses and
+    pairs teams of both divisions in one min-cost matching over games balance, rest,
+    repeat pairings, strength-of-schedule balance and venue preference; teams left out
+    are matched to "sits out" slots. schedule_matches() then just looks the day up.
     """
-    
-    def __init__(self, config, data_loader=None):
-        """Initialize the match scheduler"""
+
+    def __init__(self, config, data_loader=None, settings=None):
+        """Initialize the match scheduler
+
+        Args:
+            config: Configuration manager (or any object with get(path, default))
+            data_loader: Optional data loader for team lists and strengths
+            settings: Typed settings; taken from the config manager when not given
+        """
         super().__init__("match_scheduler", None)
         self.config = config
         self.data_loader = data_loader
-        
+
+        if settings is None:
+            settings = getattr(config, "settings", None)
+
         # Configuration values
-        self.matches_per_day = config.get("simulation.matches_per_day", 5)
+        if settings is not None:
+            self.matches_per_day = settings.simulation.matches_per_day
+            self.season_days = settings.simulation.weeks_per_season * 7
+        else:
+            self.matches_per_day = config.get("simulation.matches_per_day", 5)
+            self.season_days = config.get("simulation.weeks_per_season", 10) * 7
         self.undercurrent_division = config.get("divisions.undercurrent", "undercurrent")
         self.overlay_division = config.get("divisions.overlay", "overlay")
-        
+
+        # Matching costs and constraints
+        self.min_days_between = config.get("scheduling.min_days_between_matches", 1)
+        self.repeat_weight = config.get("scheduling.repeat_weight", 10.0)
+        self.strength_weight = config.get("scheduling.strength_weight", 1.0)
+        self.venue_weight = config.get("scheduling.venue_weight", 2.0)
+        self.balance_weight = config.get("scheduling.balance_weight", 100.0)
+        self.rest_weight = config.get("scheduling.rest_weight", 1000.0)
+        self.max_matching_block = config.get("scheduling.max_matching_block", 128)
+        self.seed = config.get("scheduling.seed", 0)
+        self.table_path = config.get("scheduling.table_path",
+                                     os.path.join(config.get("paths.results_dir", "results"), "schedule_table.json"))
+
         # Cache for team information
         self.division_teams = None
         self.match_history = {}
-        
+
+        # Season indices maintained while planning
+        self.schedule_table = None
+        self.rest_violations = 0
+        self._reset_indices()
+
         self.logger.info(f"Match Scheduler initialized with {self.matches_per_day} matches per day")
-    
+
+    def _reset_indices(self) -> None:
+        """Clear the per-team indices the season plan is built from"""
+        self.match_history = {}
+        self.last_played = {}
+        self.games_played = {}
+        self.home_balance = {}
+        self.last_venue = {}
+        self.opponents = {}
+        self.opponent_strength = {}
+        self.rest_violations = 0
+
     def _activate_implementation(self) -> bool:
         """Implementation-specific activation logic"""
         self.logger.info("Activating Match Scheduler")
-        
+
         # Update data_loader reference if in registry
         if self.registry and not self.data_loader:
             self.data_loader = self.registry.get("data_loader")
             if not self.data_loader:
                 self.logger.error("DataLoader not found in registry")
                 return False
-        
+
         # Pre-load divisions to check team counts
         try:
             self._load_division_teams()
-            
+
             # Verify we have enough teams per division
             undercurrent_count = len(self.division_teams.get(self.undercurrent_division, []))
             overlay_count = len(self.division_teams.get(self.overlay_division, []))
-            
+
             if undercurrent_count < self.matches_per_day:
                 self.logger.error(f"Not enough teams in {self.undercurrent_division} division for scheduling")
                 return False
-            
+
             if overlay_count < self.matches_per_day:
                 self.logger.error(f"Not enough teams in {self.overlay_division} division for scheduling")
                 return False
-            
+
             self.logger.info(f"Division team counts verified: {self.undercurrent_division}={undercurrent_count}, {self.overlay_division}={overlay_count}")
-            
+
         except Exception as e:
             self.logger.error(f"Error loading division teams: {e}")
             return False
-        
+
         return True
-    
+
     def _load_division_teams(self) -> None:
         """Load teams by division"""
         if self.division_teams is not None:
             return
-            
+
         # Make sure we have a data loader
         if not self.data_loader:
             self.logger.error("DataLoader not available for loading division teams")
             raise ValueError("DataLoader not available")
-        
-        # Load divisions
-        divisions = self.data_loader.load_divisions()
-        
+
+        # Team records carry their division (load_divisions is keyed by division name)
+        teams = self.data_loader.load_teams()
+
         # Group teams by division
         self.division_teams = {}
-        
-        for team_id, division in divisions.items():
-            division = division.lower()
+
+        for team_id, team_data in teams.items():
+            division = team_data["division"].lower()
             if division not in self.division_teams:
                 self.division_teams[division] = []
-            
+
             self.division_teams[division].append(team_id)
-        
+
         # Log division counts
         for division, teams in self.division_teams.items():
             self.logger.info(f"Division '{division}' has {len(teams)} teams")
-    
+
+    # ---- SEASON PLANNING ----
+
+    def _team_strengths(self) -> Dict[str, float]:
+        """Average attribute value of each team's roster"""
+        try:
+            players = self.data_loader.load_players()
+        except Exception as e:
+            self.logger.warning(f"Team strengths unavailable, scheduling without strength balance: {e}")
+            return {}
+
+        totals = {}
+        for player in players.values():
+            total, count = totals.get(player["team_id"], (0.0, 0))
+            values = [player[attr] for attr in STRENGTH_ATTRIBUTES if attr in player]
+            totals[player["team_id"]] = (total + sum(values), count + len(values))
+        return {team_id: total / count for team_id, (total, count) in totals.items() if count}
+
+    def _predefined_matchups(self) -> Dict[int, List[Tuple[str, str]]]:
+        """Matchups fixed in matchups.csv take precedence over planned days"""
+        if not os.path.exists(os.path.join(self.data_loader.data_dir, "matchups.csv")):
+            return {}
+        try:
+            return self.data_loader.load_matchups()
+        except (OSError, KeyError, ValueError):
+            return {}
+
+    def _signature(self, strengths: Dict[str, float], predefined: Dict[int, List[Tuple[str, str]]]) -> str:
+        """Hash of everything the season plan depends on"""
+        data = {
+            "divisions": {division: sorted(teams) for division, teams in sorted(self.division_teams.items())},
+            "strengths": {team_id: round(value, 3) for team_id, value in sorted(strengths.items())},
+            "predefined": {str(day): pairs for day, pairs in sorted(predefined.items())},
+            "settings": [self.matches_per_day, self.season_days, self.min_days_between, self.repeat_weight,
+                         self.strength_weight, self.venue_weight, self.balance_weight, self.rest_weight, self.seed,
+                         self.undercurrent_division, self.overlay_division,
+                         SCIPY_AVAILABLE or self.max_matching_block]
+        }
+        return hashlib.sha256(json.dumps(data, sort_keys=True, default=list).encode("utf-8")).hexdigest()[:16]
+
+    def get_schedule_table(self) -> ScheduleTable:
+        """Get the season schedule table, loading a saved one or planning the season"""
+        if self.schedule_table is None:
+            self.build_season()
+        return self.schedule_table
+
+    def build_season(self, force: bool = False) -> ScheduleTable:
+        """
+        Plan every match day of the season in one pass
+
+        Args:
+            force: Re-plan even if a saved table matches the current league
+
+        Returns:
+            ScheduleTable: The cached season schedule
+        """
+        self._load_division_teams()
+
+        strengths = self._team_strengths()
+        predefined = self._predefined_matchups()
+        signature = self._signature(strengths, predefined)
+
+        table = None if force else ScheduleTable.load(self.table_path, signature)
+
+        if table is not None:
+            self.logger.info(f"Loaded season schedule {signature} ({len(table)} days)")
+            self._commit_table(table, strengths)
+            self.schedule_table = table
+            return table
+
+        self._reset_indices()
+
+        rng = random.Random(self.seed)
+        table = ScheduleTable(signature)
+        for day_number in range(1, self.season_days + 1):
+            if (day_number - 1) % 7 >= 5:
+                continue  # Weekends are not match days
+            pairings = predefined.get(day_number)
+            if pairings is None:
+                pairings = self._plan_day(day_number, self._division_list(self.undercurrent_division),
+                                          self._division_list(self.overlay_division), strengths, rng)
+            table.set(day_number, pairings)
+            self._commit_day(day_number, pairings, strengths)
+
+        self.schedule_table = table
+        self.logger.info(f"Planned season schedule {signature}: {len(table)} days, "
+                         f"{self.rest_violations} rest violations (scipy={SCIPY_AVAILABLE})")
+
+        self._save_table(table)
+        return table
+
+    def _commit_table(self, table: ScheduleTable, strengths: Dict[str, float]) -> None:
+        """Rebuild the per-team indices from every day of a table"""
+        self._reset_indices()
+        for day_number, pairings in sorted(table.days.items()):
+            self._commit_day(day_number, pairings, strengths)
+
+    def _save_table(self, table: ScheduleTable) -> None:
+        """Write the table to the configured path, warning if it cannot be saved"""
+        try:
+            table.save(self.table_path)
+        except OSError as e:
+            self.logger.warning(f"Could not save season schedule: {e}")
+
+    def _division_list(self, division: str) -> List[str]:
+        """Teams of a division"""
+        return list(self.division_teams.get(division.lower(), []))
+
+    def _rest_order(self, teams: List[str], day_number: int, rng: random.Random) -> List[str]:
+        """
+        Order teams by how long they have rested (longest first), then fewest games
+
+        Only used to trim a division to the candidates the day's matching considers.
+
+        Args:
+            teams: List of team IDs
+            day_number: Day being planned
+            rng: Tie-break generator
+
+        Returns:
+            Ordered list of team IDs
+        """
+        teams = list(teams)
+        rng.shuffle(teams)
+        return sorted(teams, key=lambda t: (self.last_played.get(t, 0), self.games_played.get(t, 0)))
+
+    def _venue_preference(self, team_id: str) -> int:
+        """+1 if the team is due a home match, -1 if due away, 0 if indifferent"""
+        balance = self.home_balance.get(team_id, 0)
+        if balance:
+            return -1 if balance > 0 else 1
+        last = self.last_venue.get(team_id, 0)
+        return -last
+
+    def _plan_day(self, day_number: int, undercurrent: List[str], overlay: List[str],
+                  strengths: Dict[str, float], rng: random.Random) -> List[Tuple[str, str]]:
+        """
+        Choose the day's teams and pair them in one min-cost matching
+
+        Args:
+            day_number: Day to plan
+            undercurrent: Eligible undercurrent team IDs
+            overlay: Eligible overlay team IDs
+            strengths: Team strengths for strength-of-schedule balance
+            rng: Tie-break generator
+
+        Returns:
+            List of (home_team_id, away_team_id) tuples
+        """
+        count = min(self.matches_per_day, len(undercurrent), len(overlay))
+
+        # Without scipy, keep the matrix within one fallback block (or exactly the day's teams)
+        if SCIPY_AVAILABLE:
+            limit = max(len(undercurrent), len(overlay))
+        else:
+            limit = max(count, (self.max_matching_block + count) // 2)
+        home_side = self._rest_order(undercurrent, day_number, rng)[:limit]
+        away_side = self._rest_order(overlay, day_number, rng)[:limit]
+        rows, columns = len(home_side), len(away_side)
+
+        import numpy as np
+
+        # Repeat pairings
+        cost = np.zeros((rows, columns))
+        away_index = {team_id: j for j, team_id in enumerate(away_side)}
+        for i, team_u in enumerate(home_side):
+            for team_o, times in self.opponents.get(team_u, {}).items():
+                j = away_index.get(team_o)
+                if j is not None:
+                    cost[i, j] = self.repeat_weight * times
+
+        # Strength of schedule: distance of each side's average opponent strength from the league mean
+        if len(strengths) > 1:
+            league_mean = sum(strengths.values()) / len(strengths)
+            spread = max(strengths.values()) - min(strengths.values())
+            if spread:
+                def side_arrays(teams):
+                    strength = np.array([strengths.get(t, league_mean) for t in teams])
+                    faced = np.array([self.opponent_strength.get(t, 0.0) for t in teams])
+                    games = np.array([self.games_played.get(t, 0) for t in teams], dtype=float)
+                    return strength, faced, games
+
+                strength_u, faced_u, games_u = side_arrays(home_side)
+                strength_o, faced_o, games_o = side_arrays(away_side)
+                deviation_u = np.abs((faced_u[:, None] + strength_o[None, :]) / (games_u[:, None] + 1) - league_mean)
+                deviation_o = np.abs((faced_o[None, :] + strength_u[:, None]) / (games_o[None, :] + 1) - league_mean)
+                cost += self.strength_weight * (deviation_u + deviation_o) / spread
+
+        # Venue: both teams due the same venue
+        preference_u = np.array([self._venue_preference(t) for t in home_side])
+        preference_o = np.array([self._venue_preference(t) for t in away_side])
+        cost += self.venue_weight * ((preference_u[:, None] == preference_o[None, :]) & (preference_u[:, None] != 0))
+
+        # Selection: fielding a team costs its games beyond its division's fewest, plus any rest violation
+        def selection_costs(teams):
+            games = np.array([self.games_played.get(t, 0) for t in teams], dtype=float)
+            short_rest = np.array([t in self.last_played and day_number - self.last_played[t] < self.min_days_between
+                                   for t in teams], dtype=float)
+            return self.balance_weight * (games - games.min()) + self.rest_weight * short_rest
+
+        cost += selection_costs(home_side)[:, None] + selection_costs(away_side)[None, :]
+
+        # Teams left out are matched to free "sits out" slots: extra columns for undercurrent, extra rows for overlay
+        full = np.zeros((rows + columns - count,) * 2)
+        full[:rows, :columns] = cost
+        full[rows:, columns:] = UNASSIGNABLE
+
+        pairings = []
+        for row, column in self._assign(full):
+            if row < rows and column < columns:
+                pairings.append(self._orient(home_side[row], away_side[column], day_number))
+        return pairings
+
+    def _assign(self, cost) -> List[Tuple[int, int]]:
+        """
+        Solve the day's assignment problem
+
+        Without scipy, days larger than scheduling.max_matching_block are solved as
+        independent diagonal blocks (exact within a block) to keep the O(n^3) fallback fast.
+
+        Returns:
+            List of (row, column) pairs
+        """
+        count = len(cost)
+        block = count if SCIPY_AVAILABLE else max(1, self.max_matching_block)
+
+        pairs = []
+        for start in range(0, count, block):
+            end = min(start + block, count)
+            rows, columns = linear_sum_assignment(cost[start:end, start:end])
+            pairs.extend((start + row, start + column) for row, column in zip(rows, columns))
+        return pairs
+
+    def _orient(self, undercurrent_team: str, overlay_team: str, day_number: int) -> Tuple[str, str]:
+        """Decide which team is home (team_a) from venue preferences"""
+        preference_u = self._venue_preference(undercurrent_team)
+        preference_o = self._venue_preference(overlay_team)
+        if preference_u > preference_o:
+            return undercurrent_team, overlay_team
+        if preference_o > preference_u:
+            return overlay_team, undercurrent_team
+        # No preference either way: even days undercurrent is home, odd days overlay is home
+        if day_number % 2 == 0:
+            return undercurrent_team, overlay_team
+        return overlay_team, undercurrent_team
+
+    def _commit_day(self, day_number: int, pairings: List[Tuple[str, str]], strengths: Dict[str, float]) -> None:
+        """Fold a day's pairings into the last-played, venue, pairing and strength indices"""
+        undercurrent = set(self.division_teams.get(self.undercurrent_division, ()))
+        for home, away in pairings:
+            for team_id, opponent_id, venue in ((home, away, 1), (away, home, -1)):
+                last = self.last_played.get(team_id)
+                if last is not None and day_number - last < self.min_days_between:
+                    self.rest_violations += 1
+                self.last_played[team_id] = day_number
+                self.games_played[team_id] = self.games_played.get(team_id, 0) + 1
+                self.home_balance[team_id] = self.home_balance.get(team_id, 0) + venue
+                self.last_venue[team_id] = venue
+                self.opponent_strength[team_id] = self.opponent_strength.get(team_id, 0.0) + strengths.get(opponent_id, 0.0)
+
+            # Opponent counts keyed by the undercurrent team
+            team_u, team_o = (home, away) if home in undercurrent else (away, home)
+            faced = self.opponents.setdefault(team_u, {})
+            faced[team_o] = faced.get(team_o, 0) + 1
+
+            # Record in match history
+            self._record_match(home, away, day_number)
+
+    # ---- DAILY LOOKUP ----
+
     def schedule_matches(self, day_number: int, lineups: Dict[str, List[Dict[str, Any]]]) -> List[Tuple[str, str]]:
         """
-        Schedule matches for a specific day following division separation rules
-        
+        Get the matches for a specific day from the season schedule table
+
+        Days whose scheduled teams lack an eligible lineup are re-planned from the
+        eligible teams of each division.
+
         Args:
             day_number: Day number to schedule matches for
             lineups: Dict mapping team_id to list of character dictionaries
-            
+
         Returns:
             List of (team_a_id, team_b_id) tuples for scheduled matches
         """
-        self.logger.info(f"Scheduling matches for day {day_number}")
-        
-        # Make sure division teams are loaded
-        if self.division_teams is None:
-            self._load_division_teams()
-        
+        table = self.get_schedule_table()
+        matchups = table.get(day_number)
+
+        if matchups is not None:
+            eligible = set(self._get_eligible_teams(self.undercurrent_division, lineups)) | \
+                       set(self._get_eligible_teams(self.overlay_division, lineups))
+            if all(team_a in eligible and team_b in eligible for team_a, team_b in matchups):
+                self.logger.info(f"Using scheduled matches for day {day_number}")
+                return list(matchups)
+            self.logger.warning(f"Scheduled teams for day {day_number} lack eligible lineups, re-planning the day")
+
+        strengths = self._team_strengths()
+        matchups = self._replan_day(day_number, lineups, strengths)
+        table.set(day_number, matchups)
+        self._commit_table(table, strengths)
+        self._save_table(table)
+
+        self.logger.info(f"Scheduled {len(matchups)} matches for day {day_number}")
+
+        # Log the matchups
+        for i, (team_a, team_b) in enumerate(matchups):
+            self.logger.info(f"  Match {i+1}: {team_a} vs {team_b}")
+
+        return matchups
+
+    def _replan_day(self, day_number: int, lineups: Dict[str, List[Dict[str, Any]]],
+                    strengths: Dict[str, float]) -> List[Tuple[str, str]]:
+        """Plan one day from the teams with eligible lineups"""
         # Determine eligible teams with enough active players
         undercurrent_eligible = self._get_eligible_teams(self.undercurrent_division, lineups)
         overlay_eligible = self._get_eligible_teams(self.overlay_division, lineups)
-        
+
         # Check if we have enough teams
         if len(undercurrent_eligible) < self.matches_per_day:
             self.logger.warning(f"Not enough eligible teams in {self.undercurrent_division} division: {len(undercurrent_eligible)}/{self.matches_per_day}")
             undercurrent_eligible = self._get_eligible_teams(self.undercurrent_division, lineups, enforce_active_count=False)
-        
+
         if len(overlay_eligible) < self.matches_per_day:
             self.logger.warning(f"Not enough eligible teams in {self.overlay_division} division: {len(overlay_eligible)}/{self.matches_per_day}")
             overlay_eligible = self._get_eligible_teams(self.overlay_division, lineups, enforce_active_count=False)
-        
+
         # Final check
         if len(undercurrent_eligible) < self.matches_per_day or len(overlay_eligible) < self.matches_per_day:
             self.logger.error(f"Cannot schedule {self.matches_per_day} matches: Undercurrent={len(undercurrent_eligible)}, Overlay={len(overlay_eligible)}")
             raise ValueError(f"Not enough teams for {self.matches_per_day} matches")
-        
-        # Randomize teams within each division for fairness
-        random.shuffle(undercurrent_eligible)
-        random.shuffle(overlay_eligible)
-        
-        # Prioritize teams that haven't played recently
-        undercurrent_eligible = self._prioritize_teams(undercurrent_eligible, day_number)
-        overlay_eligible = self._prioritize_teams(overlay_eligible, day_number)
-        
-        # Determine home vs away based on day number
-        # Even days: undercurrent teams are home (team_a), odd days: overlay teams are home (team_a)
-        is_even_day = day_number % 2 == 0
-        
-        matchups = []
-        for i in range(self.matches_per_day):
-            if i < len(undercurrent_eligible) and i < len(overlay_eligible):
-                if is_even_day:
-                    # Even day: undercurrent is home (team_a)
-                    matchups.append((undercurrent_eligible[i], overlay_eligible[i]))
-                else:
-                    # Odd day: overlay is home (team_a)
-                    matchups.append((overlay_eligible[i], undercurrent_eligible[i]))
-                
-                # Record in match history
-                self._record_match(undercurrent_eligible[i], overlay_eligible[i], day_number)
-        
-        self.logger.info(f"Scheduled {len(matchups)} matches for day {day_number}")
-        
-        # Log the matchups
-        for i, (team_a, team_b) in enumerate(matchups):
-            self.logger.info(f"  Match {i+1}: {team_a} vs {team_b}")
-        
-        return matchups
-    
+
+        rng = random.Random(f"{self.seed}:{day_number}")
+        return self._plan_day(day_number, undercurrent_eligible, overlay_eligible, strengths, rng)
+
     def _get_eligible_teams(self, division: str, lineups: Dict[str, List[Dict[str, Any]]], enforce_active_count: bool = True) -> List[str]:
         """
         Get eligible teams from a division for scheduling
-        
+
         Args:
             division: Division name
             lineups: Dict mapping team_id to list of character dictionaries
             enforce_active_count: Whether to enforce the minimum active character count
-            
+
         Returns:
             List of eligible team IDs
         """
         division_teams = self.division_teams.get(division.lower(), [])
-        teams_per_match = self.config.get("simulation.teams_per_match")
-        
+        teams_per_match = self.config.get("simulation.teams_per_match", 8)
+
         eligible = []
         for team_id in division_teams:
             # Check if team has lineup data
             if team_id not in lineups:
                 continue
-            
+
             # Check for minimum active characters if enforcing
             if enforce_active_count:
                 active_chars = [c for c in lineups[team_id] if c.get("is_active", True)]
                 if len(active_chars) < teams_per_match:
                     continue
-            
+
             eligible.append(team_id)
-        
+
         return eligible
-    
-    def _prioritize_teams(self, teams: List[str], current_day: int) -> List[str]:
-        """
-        Prioritize teams that haven't played recently
-        
-        Args:
-            teams: List of team IDs
-            current_day: Current day number
-            
-        Returns:
-            Prioritized list of team IDs
-        """
-        # Calculate days since last match for each team
-        days_since_match = {}
-        for team_id in teams:
-            last_match_day = 0
-            for day in range(current_day - 1, 0, -1):
-                if team_id in self.match_history.get(day, []):
-                    last_match_day = day
-                    break
-            
-            days_since_match[team_id] = current_day - last_match_day
-        
-        # Sort teams by days since last match (descending)
-        return sorted(teams, key=lambda t: days_since_match[t], reverse=True)
-    
+
     def _record_match(self, team_a: str, team_b: str, day_number: int) -> None:
         """
         Record a match in the history
-        
+
         Args:
             team_a: First team ID
             team_b: Second team ID
@@ -228,15 +661,15 @@ class MatchScheduler(SystemBase):
         """
         if day_number not in self.match_history:
             self.match_history[day_number] = set()
-        
+
         self.match_history[day_number].add(team_a)
         self.match_history[day_number].add(team_b)
-    
+
     def get_match_history(self) -> Dict[int, Set[str]]:
         """
         Get the match history
-        
+
         Returns:
             Dict mapping day number to set of team IDs that played that day
         """
-        return self.match_history
\ No newline at end of file
+        return self.match_history
@@ -18,18 +18,25 @@ import random
 import datetime
 import logging
 import math
+import importlib
 import chess
-import chess.pgn
-import chess.engine
-import pandas as pd
 import traceback
-from typing import Dict, List, Any, Optional, Tuple, Union, Set
+import copy
+import tempfile
+from typing import Dict, List, Any, Optional, Tuple, Union, Set, Callable
 from collections import defaultdict
+from contextlib import contextmanager
 
 # System base imports
 from system_base import SystemBase
 from system_registry import SystemRegistry
 from config_manager import ConfigurationManager
+from tracing import configure_tracing, TRACE_MATCH, TRACE_ROUND, TRACE_MOVE, TRACE_CONVERGENCE
+from phase_timer import PhaseTimer, get_phase_timer, merge_phase_metrics
+from round_pipeline import EndOfRoundPipeline
+from board_state import BoardState
+from stat_modifiers import add_modifier, tick_modifiers, MUL, PRIORITY_HOME
+from match_replay import MatchRecording, ReplayMoveSource, recorded_matchups, scratch_config, load_snapshot
 
 class MetaLeagueSimulatorV5:
     """Main simulator class for META Fantasy League simulations v5.0"""
@@ -44,12 +51,35 @@ class MetaLeagueSimulatorV5:
         # Create configuration
         self.config = ConfigurationManager(config_file)
         
+        # Resolve typed settings up front so bad values fail before any match runs
+        self.settings = self.config.settings
+        
         # Set up logging
         self._setup_logging()
         
+        # Hot paths record into the trace ring buffer instead of formatting log lines
+        self.tracer = configure_tracing(self.config.get("tracing", {}))
+        
         # Create registry
         self.registry = SystemRegistry()
         
+        # Per-phase timings (reset per match, attached to each result's metrics)
+        self.phase_timer = get_phase_timer()
+        self.phase_timer.enabled = self.config.get("development.phase_timing", True)
+        
+        # Timing every system call costs a wrapper per call, so it is opt-in
+        if self.phase_timer.enabled and self.config.get("development.system_timing", False):
+            self.registry.enable_timing()
+        
+        # End-of-round stages are fused into one pipeline, built once the systems load
+        self._round_pipeline = None
+        
+        # Standings over the week/season being simulated, fed alongside the league engine
+        self._scoped_standings = {}
+        
+        # Scratch directory of a replay simulator (None for the live simulator; see replay_simulator)
+        self.scratch_dir = None
+        
         # Validate system integrity
         if not self._validate_system_integrity():
             raise RuntimeError("System validation failed. Fix errors before continuing.")
@@ -58,7 +88,7 @@ class MetaLeagueSimulatorV5:
         self._initialize_subsystems()
         
         # Apply combat calibration if enabled
-        if self.config.get("features.combat_calibration_enabled", True):
+        if self.settings.features.combat_calibration_enabled:
             self._apply_combat_calibration()
         
         self.logger.info(f"META Fantasy League Simulator v{self.VERSION} initialized successfully")
@@ -133,157 +163,266 @@ class MetaLeagueSimulatorV5:
         return validity
     
     def _initialize_subsystems(self):
-        """Initialize all simulation subsystems"""
+        """Register all simulation subsystems
+        
+        Systems are registered lazily: each module is imported and its system
+        constructed the first time it is requested from the registry. Systems
+        whose feature flag is off are not registered at all.
+        """
         self.logger.info("Initializing subsystems...")
         
-        # Initialize data loader (already done in validation)
-        data_loader = self.registry.get("data_loader")
+        features = self.settings.features
+        reporting = self.config.get("reporting", {})
+        
+        # Core match systems (constructor arguments after config are resolved from the registry)
+        self._register_lazy_system("trait_system", "enhanced_trait_loader", "EnhancedTraitSystem")
+        self._register_lazy_system("chess_system", "chess_system", "ChessSystem")
+        self._register_lazy_system("combat_system", "combat_system", "CombatSystem",
+                                   ["trait_system"])
+        self._register_lazy_system("convergence_system", "convergence_system", "ConvergenceSystem",
+                                   ["trait_system", "combat_system"])
+        self._register_lazy_system("pgn_tracker", "enhanced_pgn_tracker", "EnhancedPGNTracker")
+        self._register_lazy_system("stat_tracker", "enhanced_stats_system", "EnhancedStatTracker")
+        self._register_lazy_system("standings_engine", "standings_engine", "StandingsEngine")
+        self._register_lazy_system("match_scheduler", "match_scheduler", "MatchScheduler",
+                                   with_settings=True)
+        
+        # Optional gameplay systems
+        if features.stamina_enabled:
+            self._register_lazy_system("stamina_system", "stamina_system", "StaminaSystem")
+        if features.injury_enabled:
+            self._register_lazy_system("injury_system", "injury_system", "InjurySystem")
+        if features.xp_enabled:
+            self._register_lazy_system("xp_system", "xp_system", "XPSystem")
+        if features.synergy_enabled:
+            self._register_lazy_system("synergy_system", "synergy_system", "SynergySystem")
+        if features.morale_enabled:
+            self._register_lazy_system("morale_system", "morale_system", "MoraleSystem")
+        
+        # Reporting systems
+        report_flags = ("generate_match_reports", "generate_day_reports",
+                        "generate_week_reports", "generate_season_reports")
+        if any(reporting.get(flag, True) for flag in report_flags):
+            if reporting.get("use_report_store", True):
+                self._register_lazy_system("report_store", "report_store", "ReportStore")
+            else:
+                self._register_lazy_system("match_visualizer", "match_visualizer", "MatchVisualizer")
         
-        # Initialize trait system with enhanced version
-        from enhanced_trait_loader import EnhancedTraitSystem
-        trait_system = EnhancedTraitSystem(self.config)
-        self.registry.register("trait_system", trait_system)
-        
-        # Initialize chess system
-        from chess_system import ChessSystem
-        chess_system = ChessSystem(self.config)
-        self.registry.register("chess_system", chess_system)
-        
-        # Initialize combat system
-        from combat_system import CombatSystem
-        combat_system = CombatSystem(self.config, trait_system)
-        self.registry.register("combat_system", combat_system)
-        
-        # Initialize convergence system
-        from convergence_system import ConvergenceSystem
-        convergence_system = ConvergenceSystem(self.config, trait_system, combat_system)
-        self.registry.register("convergence_system", convergence_system)
-        
-        # Initialize stamina system - always enabled in v5.0
-        from stamina_system import StaminaSystem
-        stamina_system = StaminaSystem(self.config)
-        self.registry.register("stamina_system", stamina_system)
-        self.logger.info("Stamina system initialized")
-        
-        # Initialize injury system - always enabled in v5.0
-        from injury_system import InjurySystem
-        injury_system = InjurySystem(self.config)
-        self.registry.register("injury_system", injury_system)
-        self.logger.info("Injury system initialized")
-        
-        # Initialize PGN tracker with enhanced version
-        from enhanced_pgn_tracker import EnhancedPGNTracker
-        pgn_tracker = EnhancedPGNTracker(self.config)
-        self.registry.register("pgn_tracker", pgn_tracker)
-        self.logger.info(f"Enhanced PGN tracker initialized with per_board_pgn={self.config.get('features.per_board_pgn', True)}, aggregate_match_pgn={self.config.get('features.aggregate_match_pgn', True)}")
-        
-        # Initialize stat tracker with enhanced version
-        from enhanced_stats_system import EnhancedStatTracker
-        stat_tracker = EnhancedStatTracker(self.config)
-        self.registry.register("stat_tracker", stat_tracker)
-        
-        # Initialize match visualizer
-        from match_visualizer import MatchVisualizer
-        match_visualizer = MatchVisualizer(self.config)
-        self.registry.register("match_visualizer", match_visualizer)
-        
-        # Initialize XP system
-        from xp_system import XPSystem
-        xp_system = XPSystem(self.config)
-        self.registry.register("xp_system", xp_system)
-        self.logger.info("XP system initialized")
-        
-        # Initialize synergy system
-        from synergy_system import SynergySystem
-        synergy_system = SynergySystem(self.config)
-        self.registry.register("synergy_system", synergy_system)
-        self.logger.info("Synergy system initialized")
-        
-        # Initialize morale system
-        from morale_system import MoraleSystem
-        morale_system = MoraleSystem(self.config)
-        self.registry.register("morale_system", morale_system)
-        self.logger.info("Morale system initialized")
-        
-        # Activate all systems
+        if reporting.get("generate_charts", True):
+            self._register_lazy_system("chart_renderer", "chart_renderer", "ChartRenderer")
+        
+        # Request activation; lazy systems activate as they are constructed
         for system_name in self.registry.get_all_systems():
             self.registry.activate(system_name)
             
-        self.logger.info("All subsystems initialized and activated")
+        self.logger.info(f"{len(self.registry.get_all_systems())} subsystems registered")
     
-    def _apply_combat_calibration(self):
-        """Apply combat calibration settings from the configuration"""
-        self.logger.info("Applying combat calibration settings...")
+    def _register_lazy_system(self, name: str, module_name: str, class_name: str,
+                              system_args: Optional[List[str]] = None, with_settings: bool = False):
+        """Register a system to be imported and constructed on first use
+        
+        Args:
+            name: Registry name
+            module_name: Module defining the system class
+            class_name: System class name
+            system_args: Registry names of systems passed to the constructor after config
+            with_settings: Pass the typed settings as the settings keyword argument
+        """
+        system_args = system_args or []
         
-        # Default combat calibration settings if not in config
-        combat_defaults = {
-            "health_settings": {
-                "base_hp_multiplier": 1.0
-            },
-            "damage_settings": {
-                "base_damage_multiplier": 1.25
-            },
-            "stamina_settings": {
-                "stamina_decay_per_round_multiplier": 1.15,
-                "low_stamina_extra_damage_taken_percent": 20
-            },
-            "morale_settings": {
-                "morale_loss_per_ko_multiplier": 1.10,
-                "morale_collapse_enabled": True,
-                "morale_collapse_threshold_percent": 30
-            },
-            "convergence_settings": {
-                "convergence_damage_multiplier": 2.0
-            },
-            "injury_settings": {
-                "injury_enabled": True,
-                "injury_trigger_stamina_threshold_percent": 35
-            }
-        }
+        def factory():
+            module = importlib.import_module(module_name)
+            system_class = getattr(module, class_name)
+            kwargs = {"settings": self.settings} if with_settings else {}
+            system = system_class(self.config, *(self.registry.get(arg) for arg in system_args), **kwargs)
+            self.logger.info(f"{class_name} loaded")
+            return system
         
-        # Get calibration settings from config or use defaults
-        combat_settings = self.config.get("combat_calibration", combat_defaults)
+        self.registry.register_lazy(name, factory, system_args)
+    
+    def _apply_combat_calibration(self):
+        """Apply combat calibration settings from the typed settings"""
+        self.logger.info("Applying combat calibration settings...")
         
-        # Apply settings to respective systems
+        settings = self.settings
         
         # Apply to combat system
         combat_system = self.registry.get("combat_system")
         if combat_system:
-            combat_system.set_hp_multiplier(combat_settings["health_settings"]["base_hp_multiplier"])
-            combat_system.set_damage_multiplier(combat_settings["damage_settings"]["base_damage_multiplier"])
+            combat_system.set_hp_multiplier(settings.combat.base_hp_multiplier)
+            combat_system.set_damage_multiplier(settings.combat.base_damage_multiplier)
             
         # Apply to stamina system
         stamina_system = self.registry.get("stamina_system")
         if stamina_system:
-            stamina_system.set_decay_multiplier(combat_settings["stamina_settings"]["stamina_decay_per_round_multiplier"])
-            stamina_system.set_low_stamina_damage_percent(combat_settings["stamina_settings"]["low_stamina_extra_damage_taken_percent"])
+            stamina_system.set_decay_multiplier(settings.stamina.stamina_decay_per_round_multiplier)
+            stamina_system.set_low_stamina_damage_percent(settings.stamina.low_stamina_extra_damage_taken_percent)
             
         # Apply to morale system
         morale_system = self.registry.get("morale_system")
         if morale_system:
-            morale_system.set_ko_loss_multiplier(combat_settings["morale_settings"]["morale_loss_per_ko_multiplier"])
-            morale_system.set_collapse_enabled(combat_settings["morale_settings"]["morale_collapse_enabled"])
-            morale_system.set_collapse_threshold(combat_settings["morale_settings"]["morale_collapse_threshold_percent"])
+            morale_system.set_ko_loss_multiplier(settings.morale.morale_loss_per_ko_multiplier)
+            morale_system.set_collapse_enabled(settings.morale.morale_collapse_enabled)
+            morale_system.set_collapse_threshold(settings.morale.morale_collapse_threshold_percent)
             
         # Apply to convergence system
         convergence_system = self.registry.get("convergence_system")
         if convergence_system:
-            convergence_system.set_damage_multiplier(combat_settings["convergence_settings"]["convergence_damage_multiplier"])
+            convergence_system.set_damage_multiplier(settings.combat.convergence_damage_multiplier)
             
         # Apply to injury system
         injury_system = self.registry.get("injury_system")
         if injury_system:
-            injury_system.set_enabled(combat_settings["injury_settings"]["injury_enabled"])
-            injury_system.set_stamina_threshold(combat_settings["injury_settings"]["injury_trigger_stamina_threshold_percent"])
+            injury_system.set_enabled(settings.injury.injury_enabled)
+            injury_system.set_stamina_threshold(settings.injury.injury_trigger_stamina_threshold_percent)
             
         self.logger.info("Combat calibration settings applied successfully")
     
+    def reload_settings(self) -> None:
+        """Reload typed settings after configuration changes and re-apply calibration"""
+        self.settings = self.config.reload_settings()
+        self._round_pipeline = None
+        if self.settings.features.combat_calibration_enabled:
+            self._apply_combat_calibration()
+    
     def simulate_match(self, team_a: List[Dict[str, Any]], team_b: List[Dict[str, Any]], 
                       day_number: int = 1, match_number: int = 1, 
-                      show_details: bool = True) -> Dict[str, Any]:
-        """Simulate a match between two teams"""
+                      show_details: bool = True, featured: bool = False) -> Dict[str, Any]:
+        """Simulate a match between two teams
+        
+        Featured matches have their reports pre-rendered in the background.
+        Moves requested by match_steps() are answered by the chess system in turn.
+        """
+        timer = self.phase_timer
+        steps = self.match_steps(team_a, team_b, day_number, match_number, show_details, featured, timer)
+        chess_system = None
+        try:
+            request = next(steps)
+            while True:
+                board, char = request
+                chess_system = chess_system or self.registry.get("chess_system")
+                try:
+                    # Select the move, splitting engine wait from Python time
+                    if timer.enabled:
+                        start = time.perf_counter_ns()
+                        engine_wait = timer.total_ns("engine_wait")
+                        move = chess_system.select_move(board, char)
+                        engine_wait = timer.total_ns("engine_wait") - engine_wait
+                        timer.add("select_move.engine_wait", engine_wait)
+                        timer.add("select_move.python", time.perf_counter_ns() - start - engine_wait)
+                    else:
+                        move = chess_system.select_move(board, char)
+                except Exception as e:
+                    # Raised at the request so the round handles it like any move error
+                    request = steps.throw(e)
+                    continue
+                request = steps.send(move)
+        except StopIteration as done:
+            return done.value
+    
+    def replay_simulator(self, scratch_dir: Optional[str] = None,
+                         snapshot_dir: Optional[str] = None) -> "MetaLeagueSimulatorV5":
+        """A separate simulator for replays, writing only into a scratch directory
+        
+        It shares this simulator's configuration and input data, but its PGNs, reports,
+        charts, stats, schedule table, backups and persistent system data all live under
+        scratch_dir, so replays never touch the live season.
+        
+        Args:
+            scratch_dir: Directory for the replay's outputs (default: a new temporary directory)
+            snapshot_dir: Persistent data saved before the first replayed day; without it
+                the replay starts from fresh system state, as at the start of a season
+        """
+        scratch_dir = scratch_dir or tempfile.mkdtemp(prefix="meta_replay_")
+        os.makedirs(scratch_dir, exist_ok=True)
+        config = scratch_config(self.config.config_data, scratch_dir)
+        if snapshot_dir:
+            load_snapshot(snapshot_dir, config["paths"]["persistence_dir"])
+        
+        config_path = os.path.join(scratch_dir, "config.json")
+        with open(config_path, "w") as f:
+            json.dump(config, f, indent=2)
+        
+        simulator = type(self)(config_path)
+        simulator.scratch_dir = scratch_dir
+        self.logger.info(f"Replay simulator writing to {scratch_dir}")
+        return simulator
+    
+    def replay_match(self, team_a: List[Dict[str, Any]], team_b: List[Dict[str, Any]],
+                     recording: MatchRecording, day_number: int = 1, match_number: int = 1,
+                     show_details: bool = False, fallback: Optional[Callable] = None) -> Dict[str, Any]:
+        """Re-run a recorded match under the current rules without the chess engine
+        
+        The match is re-driven with the recorded seed, and its move requests are answered
+        from the recording; everything else is recomputed. Recordings without a seed
+        (interleaved runs) replay their moves under a fresh seed, so results can differ.
+        Called on the live simulator, the match runs on a new replay_simulator() with
+        copies of the teams.
+        
+        Args:
+            recording: Seed and per-character moves (see match_replay)
+            fallback: fn(board, character) for moves missing from the recording (default: pass)
+            
+        Returns:
+            dict: New match result, with the move source's counters under "replay"
+        """
+        if self.scratch_dir is None:
+            return self.replay_simulator().replay_match(copy.deepcopy(team_a), copy.deepcopy(team_b), recording,
+                                                        day_number, match_number, show_details, fallback)
+        
+        if recording.seed is None:
+            self.logger.warning(f"{recording.match_id} was recorded without a seed; its replay will not reproduce it")
+        
+        source = ReplayMoveSource(recording, fallback)
+        steps = self.match_steps(team_a, team_b, day_number, match_number, show_details,
+                                 seed=recording.seed)
+        try:
+            request = next(steps)
+            while True:
+                board, char = request
+                try:
+                    move = source(board, char)
+                except Exception as e:
+                    request = steps.throw(e)
+                    continue
+                request = steps.send(move)
+        except StopIteration as done:
+            result = done.value
+        
+        result["replay"] = source.get_stats()
+        if source.exhausted or source.diverged:
+            self.logger.info(f"Replay of {recording.match_id} left the recording: {result['replay']}")
+        return result
+    
+    def match_steps(self, team_a: List[Dict[str, Any]], team_b: List[Dict[str, Any]],
+                    day_number: int = 1, match_number: int = 1,
+                    show_details: bool = True, featured: bool = False,
+                    timer: Optional[PhaseTimer] = None, seed: Optional[int] = None,
+                    seeded: bool = True):
+        """Run a match as a generator of move requests
+        
+        Yields (board, character) whenever a move is needed and expects the selected
+        move (or None) to be sent back; the match result is the generator's return value.
+        This lets simulate_match() answer requests synchronously and match_orchestrator
+        interleave many matches over an async engine pool.
+        
+        Args:
+            timer: Phase timer for this match (defaults to the simulator's timer)
+            seed: RNG seed for the match (drawn from the current stream if None); the
+                result records it with the move lists so the match can be replayed
+            seeded: Seed the global random stream for the match. Interleaved matches share
+                the stream, so match_orchestrator passes False and no seed is recorded
+        """
         self.logger.info(f"Starting match simulation - Day {day_number}, Match {match_number}")
         
+        # Seed the match so a replay of its moves sees the same random stream
+        if not seeded:
+            seed = None
+        else:
+            if seed is None:
+                seed = random.getrandbits(32)
+            random.seed(seed)
+        
         # Validate teams
         if not team_a or not team_b:
             raise ValueError("Both teams must have characters")
@@ -330,6 +469,7 @@ class MetaLeagueSimulatorV5:
             "team_a_division": division_a,
             "team_b_division": division_b,
             "date": datetime.datetime.now().isoformat(),
+            "seed": seed,
             "round": 1,
             "trait_logs": [],
             "convergence_logs": [],
@@ -357,8 +497,10 @@ class MetaLeagueSimulatorV5:
         
         # Set up chess boards
         chess_system = self.registry.get("chess_system")
-        team_a_boards = [chess_system.create_board() for _ in range(len(team_a_active))]
-        team_b_boards = [chess_system.create_board() for _ in range(len(team_b_active))]
+        # BoardState caches legal moves, game-over status and material per position,
+        # so the round loop, result tallying and PGN export share one computation
+        team_a_boards = [BoardState.from_board(chess_system.create_board()) for _ in range(len(team_a_active))]
+        team_b_boards = [BoardState.from_board(chess_system.create_board()) for _ in range(len(team_b_active))]
         
         # Apply home advantage based on day number (even days: team_a is home, odd days: team_b is home)
         # Non-negotiable rule: Alternate Home/Away
@@ -379,7 +521,10 @@ class MetaLeagueSimulatorV5:
             synergy_system.apply_team_synergies(team_b_active, team_b_id)
         
         # Main simulation loop
-        max_rounds = self.config.get("simulation.max_rounds", 30)
+        simulation_settings = self.settings.simulation
+        max_rounds = simulation_settings.max_rounds
+        ko_threshold = simulation_settings.ko_threshold
+        team_hp_threshold = simulation_settings.team_hp_threshold
         match_complete = False
         round_number = 1
         
@@ -388,39 +533,52 @@ class MetaLeagueSimulatorV5:
         
         self.logger.info(f"Starting match: {team_a_name} vs {team_b_name}")
         
+        timer = timer if timer is not None else self.phase_timer
+        timer.reset()
+        
+        # System calls are timed on this match's timer (drivers interleaving matches re-point it)
+        self.registry.timer = timer
+        
+        tracer = self.tracer
+        if tracer.mask & TRACE_MATCH:
+            tracer.record(TRACE_MATCH, "match_start", match_context["match_id"], team_a_name, team_b_name, None,
+                          day_number, match_number)
+        
         while not match_complete and round_number <= max_rounds:
             if show_details and round_number % 5 == 1:
                 print(f"\n-- Round {round_number} --")
                 
-            self.logger.info(f"Round {round_number}")
+            if tracer.mask & TRACE_ROUND:
+                tracer.record(TRACE_ROUND, "round_start", None, None, None, None, round_number)
             match_context["round"] = round_number
             
             # Simulate chess moves for each character
-            self._simulate_chess_round(
-                team_a_active, team_a_boards, 
-                team_b_active, team_b_boards,
-                match_context
-            )
+            with timer.phase("chess_round"):
+                yield from self._simulate_chess_round(
+                    team_a_active, team_a_boards, 
+                    team_b_active, team_b_boards,
+                    match_context
+                )
             
             # Process convergences
-            self._process_convergences(
-                team_a_active, team_a_boards,
-                team_b_active, team_b_boards, 
-                match_context
-            )
+            with timer.phase("convergences"):
+                self._process_convergences(
+                    team_a_active, team_a_boards,
+                    team_b_active, team_b_boards, 
+                    match_context
+                )
             
             # Apply end of round effects
-            self._apply_end_of_round_effects(
-                team_a_active + team_b_active,
-                match_context
-            )
+            with timer.phase("end_of_round_effects"):
+                self._apply_end_of_round_effects(
+                    team_a_active + team_b_active,
+                    match_context
+                )
             
             # Check if match is complete
             team_a_ko_count = sum(1 for char in team_a_active if char.get("is_ko", False))
             team_b_ko_count = sum(1 for char in team_b_active if char.get("is_ko", False))
             
-            ko_threshold = self.config.get("simulation.ko_threshold", 4)
-            
             if team_a_ko_count >= ko_threshold or team_b_ko_count >= ko_threshold:
                 match_complete = True
                 self.logger.info(f"Match complete by KO threshold: A={team_a_ko_count}, B={team_b_ko_count}")
@@ -435,8 +593,6 @@ class MetaLeagueSimulatorV5:
             team_a_hp_pct = sum(char.get("HP", 0) for char in team_a_active) / (len(team_a_active) * 100) * 100
             team_b_hp_pct = sum(char.get("HP", 0) for char in team_b_active) / (len(team_b_active) * 100) * 100
             
-            team_hp_threshold = self.config.get("simulation.team_hp_threshold", 30)
-            
             if team_a_hp_pct < team_hp_threshold or team_b_hp_pct < team_hp_threshold:
                 match_complete = True
                 self.logger.info(f"Match complete by HP threshold: A={team_a_hp_pct:.1f}%, B={team_b_hp_pct:.1f}%")
@@ -615,11 +771,12 @@ class MetaLeagueSimulatorV5:
         pgn_tracker = self.registry.get("pgn_tracker")
         pgn_files, metadata_files = [], []
         if pgn_tracker:
-            pgn_files, metadata_files = pgn_tracker.record_match_games(
-                team_a_active, team_a_boards,
-                team_b_active, team_b_boards,
-                match_context
-            )
+            with timer.phase("pgn_recording"):
+                pgn_files, metadata_files = pgn_tracker.record_match_games(
+                    team_a_active, team_a_boards,
+                    team_b_active, team_b_boards,
+                    match_context
+                )
             self.logger.info(f"PGNs generated: {pgn_files}")
         
         # Record performance metrics
@@ -670,10 +827,20 @@ class MetaLeagueSimulatorV5:
                 "rStats": char.get("rStats", {})
             })
         
+        # Update stat leaderboards
+        standings_engine = self.registry.get("standings_engine")
+        if standings_engine:
+            standings_engine.record_character_results(character_results)
+        
         # Generate match report
-        match_visualizer = self.registry.get("match_visualizer")
+        report_store = None
+        match_visualizer = None
         report_files = []
-        if match_visualizer and self.config.get("reporting.generate_match_reports", True):
+        report_id = None
+        if self.config.get("reporting.generate_match_reports", True):
+            report_store = self.registry.get("report_store")
+            match_visualizer = None if report_store else self.registry.get("match_visualizer")
+        if report_store or match_visualizer:
             # Create result dictionary
             match_result_data = {
                 "match_id": match_context["match_id"],
@@ -703,20 +870,16 @@ class MetaLeagueSimulatorV5:
                 "metrics": match_metrics
             }
             
-            # Generate reports
-            report_files = match_visualizer.generate_match_reports(match_result_data)
-            self.logger.info(f"Match reports generated: {report_files}")
-        
-        # Generate visualizations if enabled
-        if self.config.get("reporting.generate_charts", True):
-            # Check if we have the enhanced stat tracker
-            if stat_tracker and hasattr(stat_tracker, "generate_visualization"):
-                # Generate team comparison chart
-                try:
-                    stat_tracker.generate_visualization("team_history", "WINS", team_a_id)
-                    stat_tracker.generate_visualization("team_history", "WINS", team_b_id)
-                except Exception as e:
-                    self.logger.error(f"Error generating team visualizations: {e}")
+            with timer.phase("report_generation.match"):
+                if report_store:
+                    # Store the structured result once; reports are rendered when opened
+                    featured = featured or match_context["match_id"] in self.config.get("reporting.featured_matches", [])
+                    report_id = report_store.store_match(match_result_data, featured=featured)
+                    self.logger.info(f"Match result stored for reporting: {report_id}")
+                else:
+                    # Generate reports
+                    report_files = match_visualizer.generate_match_reports(match_result_data)
+                    self.logger.info(f"Match reports generated: {report_files}")
         
         # Apply experience to characters
         xp_system = self.registry.get("xp_system")
@@ -733,10 +896,11 @@ class MetaLeagueSimulatorV5:
                 morale_system.update_morale(char, match_result == "loss", match_context)
         
         # Save persistent data
-        self._save_persistent_data()
+        with timer.phase("save_persistent_data"):
+            self._save_persistent_data()
         
-        # Return match results
-        return {
+        # Build match results
+        result = {
             "match_id": match_context["match_id"],
             "day": day_number,
             "match_number": match_number,
@@ -754,32 +918,66 @@ class MetaLeagueSimulatorV5:
             "pgn_files": pgn_files,
             "metadata_files": metadata_files,
             "report_files": report_files,
-            "metrics": match_metrics
+            "report_id": report_id,
+            "metrics": match_metrics,
+            "seed": seed,
+            "move_log": {
+                char.get("id", "unknown"): [move.uci() for move in board.move_stack]
+                for char, board in zip(team_a_active + team_b_active, team_a_boards + team_b_boards)
+            }
         }
+        
+        # Update league standings
+        if standings_engine:
+            standings_engine.record_match(result)
+            for scoped_standings in self._scoped_standings.values():
+                scoped_standings.record_match(result)
+        
+        # Queue visualizations if enabled (rendered out of process when the day is flushed)
+        if self.config.get("reporting.generate_charts", True):
+            chart_renderer = self.registry.get("chart_renderer")
+            if chart_renderer and standings_engine:
+                for team_id, team_name in ((team_a_id, team_a_name), (team_b_id, team_b_name)):
+                    chart_renderer.submit_team_history(
+                        team_id, "WINS", day_number,
+                        standings_engine.records[team_id]["wins"], team_name
+                    )
+            elif stat_tracker and hasattr(stat_tracker, "generate_visualization"):
+                # Generate team comparison chart
+                try:
+                    stat_tracker.generate_visualization("team_history", "WINS", team_a_id)
+                    stat_tracker.generate_visualization("team_history", "WINS", team_b_id)
+                except Exception as e:
+                    self.logger.error(f"Error generating team visualizations: {e}")
+        
+        # Attach this match's phase histograms (the result shares the metrics dict)
+        if timer.enabled:
+            match_metrics["phases"] = timer.snapshot()
+        if self.registry.timer is timer:
+            self.registry.timer = None
+        
+        return result
     
     def _apply_home_advantage(self, team: List[Dict[str, Any]]) -> None:
         """Apply home team advantage to a team"""
-        advantage_factor = self.config.get("simulation.home_advantage_factor", 0.1)
+        advantage_factor = self.settings.simulation.home_advantage_factor
         
         for char in team:
-            # Apply small boost to base stats
+            # Apply small percentage boost to base stats (a modifier, so it never compounds)
             for stat in ["aSTR", "aSPD", "aFS", "aLDR", "aDUR", "aRES", "aWIL"]:
                 if stat in char:
-                    # Store original value if not already stored
-                    orig_key = f"original_{stat}"
-                    if orig_key not in char:
-                        char[orig_key] = char[stat]
-                    
-                    # Apply percentage boost
-                    char[stat] = char[orig_key] * (1 + advantage_factor)
+                    add_modifier(char, "home_advantage", stat, 1 + advantage_factor, MUL, PRIORITY_HOME)
             
             # Set home flag
             char["is_home"] = True
     
     def _simulate_chess_round(self, team_a: List[Dict[str, Any]], team_a_boards: List[chess.Board],
                             team_b: List[Dict[str, Any]], team_b_boards: List[chess.Board],
-                            match_context: Dict[str, Any]) -> None:
-        """Simulate a round of chess moves for all characters"""
+                            match_context: Dict[str, Any]):
+        """Simulate a round of chess moves for all characters
+        
+        Generator: yields (board, character) for each move and receives the move back
+        """
         chess_system = self.registry.get("chess_system")
         combat_system = self.registry.get("combat_system")
         trait_system = self.registry.get("trait_system")
@@ -787,6 +985,8 @@ class MetaLeagueSimulatorV5:
         if not chess_system or not combat_system:
             raise ValueError("Chess system or Combat system not available")
         
+        tracer = self.tracer
+        
         # Process team A moves
         for i, (char, board) in enumerate(zip(team_a, team_a_boards)):
             # Skip knocked out characters
@@ -798,8 +998,8 @@ class MetaLeagueSimulatorV5:
                 if trait_system:
                     trait_system.check_pre_move_traits(char, board, match_context)
                 
-                # Select and make move
-                move = chess_system.select_move(board, char)
+                # Request a move from the driver and make it
+                move = yield board, char
                 if move:
                     # Calculate material before move
                     material_before = chess_system.calculate_material_value(board, chess.WHITE)
@@ -814,8 +1014,9 @@ class MetaLeagueSimulatorV5:
                     # Update character metrics based on material change
                     combat_system.update_character_metrics(char, material_change, match_context)
                     
-                    # Log the move
-                    self.logger.debug(f"Team A - {char['name']} moved {move.uci()}, material change: {material_change}")
+                    # Trace the move
+                    if tracer.mask & TRACE_MOVE:
+                        tracer.record(TRACE_MOVE, "move", char.get("id"), move.uci(), "A", None, material_change)
                     
                     # Check for post-move trait activations
                     if trait_system:
@@ -834,8 +1035,8 @@ class MetaLeagueSimulatorV5:
                 if trait_system:
                     trait_system.check_pre_move_traits(char, board, match_context)
                 
-                # Select and make move
-                move = chess_system.select_move(board, char)
+                # Request a move from the driver and make it
+                move = yield board, char
                 if move:
                     # Calculate material before move
                     material_before = chess_system.calculate_material_value(board, chess.WHITE)
@@ -850,8 +1051,9 @@ class MetaLeagueSimulatorV5:
                     # Update character metrics based on material change
                     combat_system.update_character_metrics(char, material_change, match_context)
                     
-                    # Log the move
-                    self.logger.debug(f"Team B - {char['name']} moved {move.uci()}, material change: {material_change}")
+                    # Trace the move
+                    if tracer.mask & TRACE_MOVE:
+                        tracer.record(TRACE_MOVE, "move", char.get("id"), move.uci(), "B", None, material_change)
                     
                     # Check for post-move trait activations
                     if trait_system:
@@ -868,7 +1070,7 @@ class MetaLeagueSimulatorV5:
         if not convergence_system:
             raise ValueError("Convergence system not available")
         
-        max_per_char = self.config.get("simulation.max_convergences_per_char", 3)
+        max_per_char = self.settings.simulation.max_convergences_per_char
         
         # Process convergences
         convergences = convergence_system.process_convergences(
@@ -878,34 +1080,62 @@ class MetaLeagueSimulatorV5:
             max_per_char
         )
         
-        # Log convergence count
-        self.logger.info(f"Processed {len(convergences)} convergences")
+        # Trace convergence count
+        if self.tracer.mask & TRACE_CONVERGENCE:
+            self.tracer.record(TRACE_CONVERGENCE, "round_convergences", None, None, None, None,
+                               len(convergences), match_context.get("round", 0))
     
     def _apply_end_of_round_effects(self, characters: List[Dict[str, Any]], 
                                    match_context: Dict[str, Any]) -> None:
         """Apply end of round effects to all characters"""
+        pipeline = self._round_pipeline
+        if pipeline is None:
+            pipeline = self._round_pipeline = self._build_round_pipeline()
+        pipeline.run(characters, match_context)
+    
+    def _build_round_pipeline(self) -> EndOfRoundPipeline:
+        """Fuse the combat, trait, stamina and morale end-of-round work into one pipeline
+        
+        Systems exposing end_of_round_stages() share a single pass over the characters;
+        the others keep their list-level call, in the same order as before.
+        """
         combat_system = self.registry.get("combat_system")
         trait_system = self.registry.get("trait_system")
-        stamina_system = self.registry.get("stamina_system")
-        morale_system = self.registry.get("morale_system")
         
         if not combat_system:
             raise ValueError("Combat system not available")
         
+        pipeline = EndOfRoundPipeline(self.registry.get("event_system"),
+                                      self.settings.simulation.vectorized_round_effects)
+        
         # Apply combat system effects
-        combat_system.apply_end_of_round_effects(characters, match_context)
+        pipeline.add_system("combat", combat_system)
         
         # Update trait cooldowns
         if trait_system:
-            trait_system.update_cooldowns(characters)
+            pipeline.add_stage("trait_cooldowns",
+                               batch=lambda characters, match_context, events: trait_system.update_cooldowns(characters))
         
-        # Apply stamina effects
-        if stamina_system:
-            stamina_system.apply_end_of_round_effects(characters, match_context)
+        # Apply stamina and morale effects
+        pipeline.add_system("stamina", self.registry.get("stamina_system"))
+        pipeline.add_system("morale", self.registry.get("morale_system"))
         
-        # Apply morale effects
-        if morale_system:
-            morale_system.apply_end_of_round_effects(characters, match_context)
+        # Expire timed stat modifiers (systems that already ticked this round are not counted twice)
+        pipeline.add_stage("stat_modifiers", per_character=self._expire_stat_modifiers, include_ko=True)
+        
+        self.logger.info(f"End-of-round pipeline: {[stage.name for stage in pipeline.stages]}")
+        return pipeline
+    
+    def _expire_stat_modifiers(self, character: Dict[str, Any], match_context: Dict[str, Any],
+                               events: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """Round-pipeline stage: count down a character's timed stat modifiers"""
+        for modifier in tick_modifiers(character, match_context.get("round")):
+            events.append(("stat_modifier_expired", {
+                "character_id": character.get("id"),
+                "source": modifier.source,
+                "stat": modifier.stat,
+                "match_context": match_context
+            }))
     
     def _save_persistent_data(self) -> None:
         """Save persistent data for all systems"""
@@ -928,12 +1158,98 @@ class MetaLeagueSimulatorV5:
     
     def simulate_day(self, day_number: int, show_details: bool = True) -> Dict[str, Any]:
         """Simulate a full day of matches"""
+        lineups, matchups = self._prepare_day(day_number)
+        
+        # Simulate each match
+        match_results = []
+        
+        for match_number, (team_a_id, team_b_id) in enumerate(matchups, 1):
+            self.logger.info(f"Starting match {match_number}: {team_a_id} vs {team_b_id}")
+            
+            # Get team lineups
+            team_a = lineups.get(team_a_id, [])
+            team_b = lineups.get(team_b_id, [])
+            
+            # Simulate the match
+            try:
+                result = self.simulate_match(team_a, team_b, day_number, match_number, show_details)
+                match_results.append(result)
+                self.logger.info(f"Match {match_number} completed: {result['winning_team']}")
+            except Exception as e:
+                self._handle_match_error(day_number, match_number, team_a_id, team_b_id, e)
+                raise
+        
+        return self._finish_day(day_number, match_results, lineups)
+    
+    def replay_day(self, day_number: int, recordings: Dict[str, MatchRecording],
+                   show_details: bool = False, fallback: Optional[Callable] = None,
+                   scratch_dir: Optional[str] = None, snapshot_dir: Optional[str] = None) -> Dict[str, Any]:
+        """Replay a day's recorded matches under the current rules
+        
+        The matchups are the recorded ones (the scheduler is only asked for days without
+        recordings). Called on the live simulator, the day runs on a new replay_simulator().
+        
+        Args:
+            recordings: Recordings by match ID (from match results or the PGN archive)
+            fallback: Move selector for matches or moves the recordings do not cover
+            scratch_dir, snapshot_dir: See replay_simulator()
+        """
+        if self.scratch_dir is None:
+            return self.replay_simulator(scratch_dir, snapshot_dir).replay_day(day_number, recordings,
+                                                                               show_details, fallback)
+        
+        lineups, matchups = self._prepare_day(day_number, recorded_matchups(recordings, day_number) or None)
+        
+        match_results = []
+        for match_number, (team_a_id, team_b_id) in enumerate(matchups, 1):
+            match_id = f"day{day_number}_match{match_number}_{team_a_id}_vs_{team_b_id}"
+            recording = recordings.get(match_id)
+            if recording is None:
+                self.logger.warning(f"No recording for {match_id}; replaying it without moves")
+                recording = MatchRecording(match_id)
+            
+            try:
+                result = self.replay_match(lineups.get(team_a_id, []), lineups.get(team_b_id, []), recording,
+                                           day_number, match_number, show_details, fallback)
+                match_results.append(result)
+                self.logger.info(f"Match {match_number} replayed: {result['winning_team']}")
+            except Exception as e:
+                self._handle_match_error(day_number, match_number, team_a_id, team_b_id, e)
+                raise
+        
+        return self._finish_day(day_number, match_results, lineups)
+    
+    def replay_days(self, start_day: int, end_day: int, recordings: Dict[str, MatchRecording],
+                    show_details: bool = False, fallback: Optional[Callable] = None,
+                    scratch_dir: Optional[str] = None, snapshot_dir: Optional[str] = None) -> Dict[int, Dict[str, Any]]:
+        """Replay every valid match day in [start_day, end_day] (e.g. a season after a rules fix)
+        
+        All days run on one replay simulator, so state carries from day to day as it did live.
+        snapshot_dir should hold the persistent data as it was before start_day.
+        """
+        simulator = self if self.scratch_dir is not None else self.replay_simulator(scratch_dir, snapshot_dir)
+        return {day_number: simulator.replay_day(day_number, recordings, show_details, fallback)
+                for day_number in range(start_day, end_day + 1) if simulator._is_valid_match_day(day_number)}
+    
+    def _prepare_day(self, day_number: int, matchups: Optional[List[Tuple[str, str]]] = None
+                     ) -> Tuple[Dict[str, List[Dict[str, Any]]], List[Tuple[str, str]]]:
+        """Load a day's lineups and matchups and advance injuries to the day
+        
+        Args:
+            matchups: Matchups already known (e.g. recorded); the scheduler is not asked
+            
+        Returns:
+            tuple: (lineups by team ID, list of (team_a_id, team_b_id) matchups)
+        """
         self.logger.info(f"Starting simulation for day {day_number}")
         
         # Check if this is a valid match day (Monday-Friday)
         if not self._is_valid_match_day(day_number):
             raise ValueError(f"Day {day_number} is not a valid match day (must be Mon-Fri)")
         
+        # Trace records and their string table cover one day (interleaved matches share them)
+        self.tracer.clear()
+        
         # Load data for this day
         data_loader = self.registry.get("data_loader")
         if not data_loader:
@@ -947,19 +1263,25 @@ class MetaLeagueSimulatorV5:
             self.logger.error(f"Error loading lineups for day {day_number}: {e}")
             raise
         
-        # Generate matchups
-        matches_per_day = 5  # Non-negotiable rule: 5 Matches per Day
-        try:
-            matchups = data_loader.get_matchups(day_number, lineups)
-            self.logger.info(f"Generated matchups for day {day_number}: {matchups}")
-        except Exception as e:
-            self.logger.error(f"Error generating matchups for day {day_number}: {e}")
-            raise
-        
-        # Check matchup count
-        if len(matchups) != matches_per_day:
-            self.logger.error(f"Invalid matchup count: {len(matchups)}, expected {matches_per_day}")
-            raise ValueError(f"Invalid matchup count: {len(matchups)}, expected {matches_per_day}")
+        # Look up the day in the season schedule (planned once, on first use)
+        # Non-negotiable rule: 5 Matches per Day (larger synthetic leagues override it)
+        if matchups is None:
+            matches_per_day = self.settings.simulation.matches_per_day
+            try:
+                scheduler = self.registry.get("match_scheduler")
+                if scheduler:
+                    matchups = scheduler.schedule_matches(day_number, lineups)
+                else:
+                    matchups = data_loader.get_matchups(day_number, lineups)
+                self.logger.info(f"Generated matchups for day {day_number}: {matchups}")
+            except Exception as e:
+                self.logger.error(f"Error generating matchups for day {day_number}: {e}")
+                raise
+            
+            # Check matchup count
+            if len(matchups) != matches_per_day:
+                self.logger.error(f"Invalid matchup count: {len(matchups)}, expected {matches_per_day}")
+                raise ValueError(f"Invalid matchup count: {len(matchups)}, expected {matches_per_day}")
         
         # Process injuries if enabled
         injury_system = self.registry.get("injury_system")
@@ -967,26 +1289,22 @@ class MetaLeagueSimulatorV5:
             injury_report = injury_system.process_day_change(day_number)
             self.logger.info(f"Processed injuries: {len(injury_report.get('recovered', []))} recovered, {len(injury_report.get('still_injured', []))} still injured")
         
-        # Simulate each match
-        match_results = []
-        
-        for match_number, (team_a_id, team_b_id) in enumerate(matchups, 1):
-            self.logger.info(f"Starting match {match_number}: {team_a_id} vs {team_b_id}")
-            
-            # Get team lineups
-            team_a = lineups.get(team_a_id, [])
-            team_b = lineups.get(team_b_id, [])
-            
-            # Simulate the match
-            try:
-                result = self.simulate_match(team_a, team_b, day_number, match_number, show_details)
-                match_results.append(result)
-                self.logger.info(f"Match {match_number} completed: {result['winning_team']}")
-            except Exception as e:
-                self.logger.error(f"Error simulating match {match_number}: {e}")
-                if self.config.get("development.dump_state_on_error", True):
-                    self._dump_error_state(day_number, match_number, team_a_id, team_b_id, e)
-                raise
+        return lineups, matchups
+    
+    def _handle_match_error(self, day_number: int, match_number: int, team_a_id: str, team_b_id: str,
+                            error: Exception) -> None:
+        """Log a failed match and dump the simulation state if configured"""
+        self.logger.error(f"Error simulating match {match_number}: {error}")
+        if self.config.get("development.dump_state_on_error", True):
+            self._dump_error_state(day_number, match_number, team_a_id, team_b_id, error)
+    
+    def _finish_day(self, day_number: int, match_results: List[Dict[str, Any]],
+                    lineups: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Flush charts, summarize and report a day once all its matches are played"""
+        # Hand the day's queued charts to the render worker
+        # Only flush if a match has queued charts (avoids constructing the renderer)
+        if self.registry.is_loaded("chart_renderer"):
+            self.registry.get("chart_renderer").flush()
         
         # Generate day summary
         day_results = self._generate_day_summary(day_number, match_results, lineups)
@@ -999,7 +1317,7 @@ class MetaLeagueSimulatorV5:
         # Generate day report if enabled
         report_file = None
         if self.config.get("reporting.generate_day_reports", True):
-            report_file = self._generate_day_report(day_number, day_results)
+            report_file = self._timed_report(day_results, "report_generation.day", lambda: self._generate_day_report(day_number, day_results))
         
         # Create backup if configured
         auto_backup_frequency = self.config.get("advanced.auto_backup_frequency", 5)
@@ -1012,6 +1330,15 @@ class MetaLeagueSimulatorV5:
         
         return day_results
     
+    def _timed_report(self, results: Dict[str, Any], phase_name: str, generate: Callable[[], Any]) -> Any:
+        """Run a report generator and fold its timing into the results' phase metrics"""
+        timer = PhaseTimer(self.phase_timer.enabled)
+        with timer.phase(phase_name):
+            report = generate()
+        if timer.enabled:
+            results["phase_metrics"] = merge_phase_metrics([results.get("phase_metrics"), timer.snapshot()])
+        return report
+    
     def _is_valid_match_day(self, day_number: int) -> bool:
         """Check if a day number is a valid match day (Mon-Fri)"""
         # First day is Monday (4/7/2025)
@@ -1063,6 +1390,10 @@ class MetaLeagueSimulatorV5:
         # Get calendar date for this day
         calendar_date = self._get_calendar_date(day_number)
         
+        # League-wide standings to date (maintained incrementally per match)
+        standings_engine = self.registry.get("standings_engine")
+        league_standings = standings_engine.get_standings() if standings_engine else []
+        
         # Create summary
         return {
             "day": day_number,
@@ -1070,7 +1401,9 @@ class MetaLeagueSimulatorV5:
             "weekday": self._get_weekday_name(day_number),
             "matches": match_results,
             "standings": team_standings,
-            "teams": team_data
+            "league_standings": league_standings,
+            "teams": team_data,
+            "phase_metrics": merge_phase_metrics([match.get("metrics", {}).get("phases") for match in match_results])
         }
     
     def _get_calendar_date(self, day_number: int) -> str:
@@ -1089,6 +1422,13 @@ class MetaLeagueSimulatorV5:
     
     def _generate_day_report(self, day_number: int, day_results: Dict[str, Any]) -> str:
         """Generate a report for the day's matches"""
+        report_store = self.registry.get("report_store")
+        if report_store:
+            # Stored for on-demand rendering; the returned ID is accepted by report_store.render()
+            report_id = report_store.store_summary("day", day_number, day_results)
+            self.logger.info(f"Day summary stored for reporting: {report_id}")
+            return report_id
+        
         match_visualizer = self.registry.get("match_visualizer")
         if not match_visualizer:
             self.logger.warning("Match visualizer not available, cannot generate day report")
@@ -1163,7 +1503,8 @@ class MetaLeagueSimulatorV5:
                 "error_message": str(error),
                 "traceback": traceback.format_exc(),
                 "simulator_version": self.VERSION,
-                "config": self.config.to_dict()
+                "config": self.config.to_dict(),
+                "trace": self.tracer.export_state(self.config.get("tracing.dump_records"))
             }
             
             # Write error data
@@ -1191,36 +1532,59 @@ class MetaLeagueSimulatorV5:
         # Simulate each day (Monday-Friday)
         day_results = []
         
-        for day_offset in range(5):  # Mon-Fri
-            day_number = starting_day + day_offset
-            
-            if show_details:
-                weekday = self._get_weekday_name(day_number)
-                print(f"\n--- Day {day_number} ({weekday}) ---\n")
-            
-            try:
-                result = self.simulate_day(day_number, show_details)
-                day_results.append(result)
-                self.logger.info(f"Day {day_number} completed")
-            except Exception as e:
-                self.logger.error(f"Error simulating day {day_number}: {e}")
-                # Continue with next day if possible
+        with self._standings_scope("week") as week_standings:
+            for day_offset in range(5):  # Mon-Fri
+                day_number = starting_day + day_offset
+                
+                if show_details:
+                    weekday = self._get_weekday_name(day_number)
+                    print(f"\n--- Day {day_number} ({weekday}) ---\n")
+                
+                try:
+                    result = self.simulate_day(day_number, show_details)
+                    day_results.append(result)
+                    self.logger.info(f"Day {day_number} completed")
+                except Exception as e:
+                    self.logger.error(f"Error simulating day {day_number}: {e}")
+                    # Continue with next day if possible
         
         # Generate week summary
-        week_results = self._generate_week_summary(week_number, day_results)
+        week_results = self._generate_week_summary(week_number, day_results, week_standings)
         
         # Generate week report if enabled
         report_file = None
         if self.config.get("reporting.generate_week_reports", True):
-            report_file = self._generate_week_report(week_number, week_results)
+            report_file = self._timed_report(week_results, "report_generation.week", lambda: self._generate_week_report(week_number, week_results))
         
         # Add report file to results
         week_results["report_file"] = report_file
         
         return week_results
     
-    def _generate_week_summary(self, week_number: int, day_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    @contextmanager
+    def _standings_scope(self, scope: str):
+        """Collect standings for the matches simulated inside the block only
+        
+        Yields a standings engine fed every match result recorded while the block runs,
+        or None when the standings engine is unavailable.
+        """
+        standings_engine = self.registry.get("standings_engine")
+        if not standings_engine:
+            yield None
+            return
+        
+        scoped_standings = self._scoped_standings[scope] = standings_engine.spawn()
+        try:
+            yield scoped_standings
+        finally:
+            del self._scoped_standings[scope]
+    
+    def _generate_week_summary(self, week_number: int, day_results: List[Dict[str, Any]],
+                               week_standings=None) -> Dict[str, Any]:
         """Generate a summary of the week's results"""
+        if week_standings is not None and week_standings.matches_recorded:
+            return self._generate_week_summary_from_engine(week_number, day_results, week_standings)
+        
         # Calculate overall standings
         team_standings = {}
         division_standings = {}
@@ -1305,11 +1669,35 @@ class MetaLeagueSimulatorV5:
             "date_range": date_range,
             "days_completed": len(day_results),
             "standings": sorted_standings,
-            "division_standings": sorted_division_standings
+            "division_standings": sorted_division_standings,
+            "phase_metrics": merge_phase_metrics([day.get("phase_metrics") for day in day_results])
+        }
+    
+    def _generate_week_summary_from_engine(self, week_number: int, day_results: List[Dict[str, Any]],
+                                           week_standings) -> Dict[str, Any]:
+        """Build the week summary from the week's own standings engine"""
+        first_day = day_results[0]["date"] if day_results else None
+        last_day = day_results[-1]["date"] if day_results else None
+        date_range = f"{first_day} to {last_day}" if first_day and last_day else "Unknown"
+        
+        return {
+            "week": week_number,
+            "days": [day.get("day") for day in day_results],
+            "date_range": date_range,
+            "days_completed": len(day_results),
+            "standings": week_standings.get_standings(),
+            "division_standings": week_standings.get_division_standings(),
+            "phase_metrics": merge_phase_metrics([day.get("phase_metrics") for day in day_results])
         }
     
     def _generate_week_report(self, week_number: int, week_results: Dict[str, Any]) -> str:
         """Generate a report for the week's matches"""
+        report_store = self.registry.get("report_store")
+        if report_store:
+            report_id = report_store.store_summary("week", week_number, week_results)
+            self.logger.info(f"Week summary stored for reporting: {report_id}")
+            return report_id
+        
         match_visualizer = self.registry.get("match_visualizer")
         if not match_visualizer:
             self.logger.warning("Match visualizer not available, cannot generate week report")
@@ -1328,7 +1716,7 @@ class MetaLeagueSimulatorV5:
         self.logger.info("Starting season simulation")
         
         # Season length is configurable (default 10 weeks)
-        weeks_per_season = self.config.get("simulation.weeks_per_season", 10)
+        weeks_per_season = self.settings.simulation.weeks_per_season
         starting_day = 1
         
         if show_details:
@@ -1337,34 +1725,40 @@ class MetaLeagueSimulatorV5:
         # Simulate each week
         week_results = []
         
-        for week_number in range(1, weeks_per_season + 1):
-            if show_details:
-                print(f"\n==== WEEK {week_number} ====\n")
-                
-            try:
-                day_number = starting_day + (week_number - 1) * 7
-                result = self.simulate_week(day_number, show_details)
-                week_results.append(result)
-                self.logger.info(f"Week {week_number} completed")
-            except Exception as e:
-                self.logger.error(f"Error simulating week {week_number}: {e}")
-                # Continue with next week if possible
+        with self._standings_scope("season") as season_standings:
+            for week_number in range(1, weeks_per_season + 1):
+                if show_details:
+                    print(f"\n==== WEEK {week_number} ====\n")
+                    
+                try:
+                    day_number = starting_day + (week_number - 1) * 7
+                    result = self.simulate_week(day_number, show_details)
+                    week_results.append(result)
+                    self.logger.info(f"Week {week_number} completed")
+                except Exception as e:
+                    self.logger.error(f"Error simulating week {week_number}: {e}")
+                    # Continue with next week if possible
         
         # Generate season summary
-        season_results = self._generate_season_summary(week_results)
+        season_results = self._generate_season_summary(week_results, season_standings)
         
         # Generate season report if enabled
         report_file = None
         if self.config.get("reporting.generate_season_reports", True):
-            report_file = self._generate_season_report(season_results)
+            report_file = self._timed_report(season_results, "report_generation.season", lambda: self._generate_season_report(season_results))
         
         # Add report file to results
         season_results["report_file"] = report_file
         
         return season_results
     
-    def _generate_season_summary(self, week_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _generate_season_summary(self, week_results: List[Dict[str, Any]],
+                                 season_standings=None) -> Dict[str, Any]:
         """Generate a summary of the season's results"""
+        # Use the standings of the season's own matches, maintained as they were played
+        if season_standings is not None and season_standings.matches_recorded:
+            return self._generate_season_summary_from_engine(season_standings, week_results)
+        
         # Calculate overall standings
         team_standings = {}
         division_standings = {}
@@ -1498,11 +1892,58 @@ class MetaLeagueSimulatorV5:
             "standings": sorted_standings,
             "division_standings": sorted_division_standings,
             "division_champions": division_champions,
-            "overall_champion": overall_champion
+            "overall_champion": overall_champion,
+            "phase_metrics": merge_phase_metrics([week.get("phase_metrics") for week in week_results])
+        }
+    
+    def _generate_season_summary_from_engine(self, standings_engine, week_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the season summary from the standings engine without re-aggregating results"""
+        sorted_standings = standings_engine.get_standings()
+        sorted_division_standings = standings_engine.get_division_standings()
+        champions = standings_engine.get_champions()
+        
+        champion_fields = ["wins", "losses", "draws", "points", "win_pct"]
+        
+        division_champions = {}
+        for division, (champion_id, champion_stats) in champions["division_champions"].items():
+            division_champions[division] = {"team_id": champion_id, "name": champion_stats["name"]}
+            division_champions[division].update({field: champion_stats[field] for field in champion_fields})
+        
+        overall_champion = None
+        if champions["overall_champion"]:
+            champion_id, champion_stats = champions["overall_champion"]
+            overall_champion = {
+                "team_id": champion_id,
+                "name": champion_stats["name"],
+                "division": champion_stats.get("division") or "Unknown"
+            }
+            overall_champion.update({field: champion_stats[field] for field in champion_fields})
+        
+        # Determine date range of season
+        first_week = week_results[0] if week_results else {}
+        last_week = week_results[-1] if week_results else {}
+        first_day = first_week.get("date_range", "").split(" to ")[0] if first_week else None
+        last_day = last_week.get("date_range", "").split(" to ")[-1] if last_week else None
+        date_range = f"{first_day} to {last_day}" if first_day and last_day else "Unknown"
+        
+        return {
+            "weeks_completed": len(week_results),
+            "date_range": date_range,
+            "standings": sorted_standings,
+            "division_standings": sorted_division_standings,
+            "division_champions": division_champions,
+            "overall_champion": overall_champion,
+            "phase_metrics": merge_phase_metrics([week.get("phase_metrics") for week in week_results])
         }
     
     def _generate_season_report(self, season_results: Dict[str, Any]) -> str:
         """Generate a report for the season's results"""
+        report_store = self.registry.get("report_store")
+        if report_store:
+            report_id = report_store.store_summary("season", "season", season_results)
+            self.logger.info(f"Season summary stored for reporting: {report_id}")
+            return report_id
+        
         match_visualizer = self.registry.get("match_visualizer")
         if not match_visualizer:
             self.logger.warning("Match visualizer not available, cannot generate season report")
@@ -0,0 +1,196 @@
+"""
+Phase Timing for META League Simulator v5.0
+Per-phase latency histograms for match phases and registry system calls
+"""
+
+import time
+import functools
+from typing import Dict, List, Any, Optional, Callable
+
+# Histogram buckets are powers of two in microseconds: bucket i holds durations < 2**i us
+NUM_BUCKETS = 32
+
+
+class PhaseHistogram:
+    """Log2 latency histogram for one phase"""
+
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * NUM_BUCKETS
+
+    def add(self, ns: int) -> None:
+        """Record one duration in nanoseconds"""
+        if not self.count or ns < self.min_ns:
+            self.min_ns = ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        self.count += 1
+        self.total_ns += ns
+        self.buckets[min((ns // 1000).bit_length(), NUM_BUCKETS - 1)] += 1
+
+    def merge(self, other: "PhaseHistogram") -> None:
+        """Fold another histogram into this one"""
+        if not other.count:
+            return
+        if not self.count or other.min_ns < self.min_ns:
+            self.min_ns = other.min_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        self.count += other.count
+        self.total_ns += other.total_ns
+        for i, n in enumerate(other.buckets):
+            self.buckets[i] += n
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound in ms of the bucket containing the given fraction of samples"""
+        if not self.count:
+            return 0.0
+        threshold = fraction * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= threshold:
+                return min((1 << i) / 1000.0, self.max_ns / 1e6)
+        return self.max_ns / 1e6
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly view; from_dict() restores it for roll-ups"""
+        return {
+            "count": self.count,
+            "total_ms": self.total_ns / 1e6,
+            "mean_ms": self.total_ns / self.count / 1e6 if self.count else 0.0,
+            "min_ms": self.min_ns / 1e6,
+            "max_ms": self.max_ns / 1e6,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "buckets_us": {str(1 << i): n for i, n in enumerate(self.buckets) if n}
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PhaseHistogram":
+        """Rebuild a histogram from to_dict() output"""
+        histogram = cls()
+        histogram.count = data.get("count", 0)
+        histogram.total_ns = int(round(data.get("total_ms", 0.0) * 1e6))
+        histogram.min_ns = int(round(data.get("min_ms", 0.0) * 1e6))
+        histogram.max_ns = int(round(data.get("max_ms", 0.0) * 1e6))
+        for bound, n in data.get("buckets_us", {}).items():
+            histogram.buckets[int(bound).bit_length() - 1] += n
+        return histogram
+
+
+class _Phase:
+    """Context manager timing one phase"""
+
+    __slots__ = ("_timer", "_name", "_start")
+
+    def __init__(self, timer: "PhaseTimer", name: str):
+        self._timer = timer
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._timer.add(self._name, time.perf_counter_ns() - self._start)
+        return False
+
+
+class _NullPhase:
+    """Context manager used when timing is disabled"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class PhaseTimer:
+    """
+    Collects per-phase histograms
+    Phases are timed with `with timer.phase(name):` or by wrapping callables; nested
+    phases each record their own inclusive time
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._histograms: Dict[str, PhaseHistogram] = {}
+
+    def phase(self, name: str):
+        """Context manager timing the enclosed block as `name`"""
+        if not self.enabled:
+            return _NULL_PHASE
+        return _Phase(self, name)
+
+    def add(self, name: str, ns: int) -> None:
+        """Record a duration for a phase"""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = PhaseHistogram()
+        histogram.add(ns)
+
+    def total_ns(self, name: str) -> int:
+        """Accumulated time of a phase since the last reset"""
+        histogram = self._histograms.get(name)
+        return histogram.total_ns if histogram else 0
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        """Wrap a callable so every call is recorded as phase `name`"""
+        perf_counter_ns = time.perf_counter_ns
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add(name, perf_counter_ns() - start)
+
+        timed.__wrapped_phase__ = name
+        return timed
+
+    def reset(self) -> None:
+        """Drop all collected timings"""
+        self._histograms = {}
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Histograms collected since the last reset, by phase name"""
+        return {name: histogram.to_dict() for name, histogram in sorted(self._histograms.items())}
+
+
+def merge_phase_metrics(snapshots: List[Optional[Dict[str, Dict[str, Any]]]]) -> Dict[str, Dict[str, Any]]:
+    """Roll up several PhaseTimer snapshots (match -> day -> week -> season)
+
+    Args:
+        snapshots: Snapshots to merge; None entries are skipped
+
+    Returns:
+        dict: Merged snapshot in the same format
+    """
+    merged: Dict[str, PhaseHistogram] = {}
+    for snapshot in snapshots:
+        for name, data in (snapshot or {}).items():
+            histogram = merged.get(name)
+            if histogram is None:
+                histogram = merged[name] = PhaseHistogram()
+            histogram.merge(PhaseHistogram.from_dict(data))
+    return {name: histogram.to_dict() for name, histogram in sorted(merged.items())}
+
+
+_phase_timer = PhaseTimer()
+
+
+def get_phase_timer() -> PhaseTimer:
+    """Get the process-wide phase timer (chess systems record engine waits on it)"""
+    return _phase_timer
@@ -0,0 +1,307 @@
+"""
+Profiler Capture for META League Simulator v5.0
+Runs a simulator workload under cProfile or a statistical stack sampler and writes
+per-match profiles, merged profiles (per workload and per day), collapsed stacks and optional
+tracemalloc snapshots
+"""
+
+import os
+import sys
+import json
+import time
+import pstats
+import hashlib
+import cProfile
+import datetime
+import threading
+import tracemalloc
+from collections import Counter
+from typing import Dict, List, Any, Optional
+
+PROFILE_MODES = ["cprofile", "sample"]
+
+DEFAULT_SAMPLE_INTERVAL = 0.005
+TRACEMALLOC_FRAMES = 25
+
+
+def config_hash(config) -> str:
+    """Short hash of the active configuration (ConfigManager or plain dict)"""
+    data = getattr(config, "config_data", config)
+    encoded = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:12]
+
+
+def _frame_label(code) -> str:
+    """Flame graph frame label: function (file:line)"""
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _pstats_label(func) -> str:
+    """Flame graph frame label for a pstats function key"""
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def collapse_pstats(stats: pstats.Stats) -> Counter:
+    """Approximate collapsed stacks from a cProfile call graph
+
+    cProfile keeps only caller -> callee edges, so each function's own time is
+    attributed to the chain of its heaviest callers.
+
+    Returns:
+        Counter: "root;...;leaf" -> microseconds of own time
+    """
+    raw = stats.stats
+    stacks = Counter()
+
+    for func, (_, _, tottime, _, callers) in raw.items():
+        if tottime <= 0:
+            continue
+        chain = [func]
+        seen = {func}
+        current = callers
+        while current:
+            # Heaviest caller by cumulative time through this edge
+            parent = max(current, key=lambda caller: current[caller][3])
+            if parent in seen:
+                break
+            chain.append(parent)
+            seen.add(parent)
+            current = raw.get(parent, (0, 0, 0, 0, {}))[4]
+        stack = ";".join(_pstats_label(f) for f in reversed(chain))
+        stacks[stack] += int(tottime * 1e6)
+
+    return stacks
+
+
+def write_collapsed(stacks: Counter, path: str) -> str:
+    """Write collapsed stacks in flamegraph.pl / speedscope format"""
+    with open(path, "w") as f:
+        for stack, count in sorted(stacks.items()):
+            if count > 0:
+                f.write(f"{stack} {count}\n")
+    return path
+
+
+class StackSampler:
+    """Samples one thread's Python stack at a fixed interval into collapsed stacks"""
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL, thread_id: Optional[int] = None):
+        self.interval = interval
+        self.thread_id = thread_id or threading.get_ident()
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        """Start sampling in a daemon thread"""
+        self.stacks = Counter()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        """Stop sampling and return the collected stacks (sample counts)"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        return self.stacks
+
+    def _run(self) -> None:
+        """Sampling loop"""
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            if labels:
+                self.stacks[";".join(reversed(labels))] += 1
+
+
+class ProfileSession:
+    """
+    Profiles every simulate_match call of a simulator
+    Each match gets its own profile file tagged with the match id and config hash;
+    finish() writes the merged profile, collapsed stacks and a manifest, optionally with
+    one merged profile per matchday
+    """
+
+    def __init__(self, simulator, output_dir: str, mode: str = "cprofile",
+                 memory: bool = False, sample_interval: float = DEFAULT_SAMPLE_INTERVAL):
+        """Create a session
+
+        Args:
+            simulator: Simulator exposing simulate_match and config
+            output_dir: Directory for profile artifacts
+            mode: "cprofile" (deterministic) or "sample" (statistical stack sampler)
+            memory: Also take a tracemalloc snapshot after every match
+            sample_interval: Seconds between samples in sample mode
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode: {mode} (expected one of {PROFILE_MODES})")
+
+        self.simulator = simulator
+        self.output_dir = output_dir
+        self.mode = mode
+        self.memory = memory
+        self.sample_interval = sample_interval
+        self.config_hash = config_hash(simulator.config)
+
+        self.entries: List[Dict[str, Any]] = []
+        self._merged_stats: Optional[pstats.Stats] = None
+        self._merged_stacks = Counter()
+        self._day_stats: Dict[int, pstats.Stats] = {}
+        self._day_stacks: Dict[int, Counter] = {}
+        self._last_snapshot = None
+        self._original_simulate_match = None
+
+        os.makedirs(output_dir, exist_ok=True)
+
+    def _artifact(self, tag: str, extension: str) -> str:
+        """Path of an artifact tagged with the config hash"""
+        safe_tag = "".join(c if c.isalnum() or c in "-_." else "_" for c in tag)
+        return os.path.join(self.output_dir, f"{safe_tag}.{self.config_hash}.{extension}")
+
+    def install(self) -> "ProfileSession":
+        """Start profiling simulate_match calls"""
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+
+        self._original_simulate_match = self.simulator.simulate_match
+        self.simulator.simulate_match = self._profiled_simulate_match
+        return self
+
+    def uninstall(self) -> None:
+        """Restore the unprofiled simulate_match"""
+        if self._original_simulate_match is not None:
+            self.simulator.simulate_match = self._original_simulate_match
+            self._original_simulate_match = None
+        if self.memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def _profiled_simulate_match(self, *args, **kwargs):
+        """simulate_match wrapper profiling one match"""
+        profiler = None
+        sampler = None
+        if self.mode == "cprofile":
+            profiler = cProfile.Profile()
+            profiler.enable()
+        else:
+            sampler = StackSampler(self.sample_interval)
+            sampler.start()
+
+        start = time.perf_counter()
+        result = None
+        try:
+            result = self._original_simulate_match(*args, **kwargs)
+            return result
+        finally:
+            wall_time = time.perf_counter() - start
+            if profiler:
+                profiler.disable()
+            stacks = sampler.stop() if sampler else None
+            match_id = (result or {}).get("match_id") or f"match{len(self.entries) + 1}_failed"
+            day_number = kwargs.get("day_number", args[2] if len(args) > 2 else 1)
+            self._record_match(match_id, day_number, wall_time, profiler, stacks)
+
+    def _record_match(self, match_id: str, day_number: int, wall_time: float,
+                      profiler: Optional[cProfile.Profile], stacks: Optional[Counter]) -> None:
+        """Write one match's artifacts and fold them into the merged and per-day profiles"""
+        entry = {"match_id": match_id, "day": day_number, "config_hash": self.config_hash,
+                 "wall_time_s": round(wall_time, 4)}
+
+        if profiler:
+            path = self._artifact(match_id, "pstats")
+            profiler.dump_stats(path)
+            entry["pstats"] = path
+            if self._merged_stats is None:
+                self._merged_stats = pstats.Stats(path)
+            else:
+                self._merged_stats.add(path)
+            if day_number not in self._day_stats:
+                self._day_stats[day_number] = pstats.Stats(path)
+            else:
+                self._day_stats[day_number].add(path)
+        if stacks is not None:
+            entry["collapsed"] = write_collapsed(stacks, self._artifact(match_id, "collapsed.txt"))
+            self._merged_stacks.update(stacks)
+            self._day_stacks.setdefault(day_number, Counter()).update(stacks)
+
+        if self.memory:
+            snapshot = tracemalloc.take_snapshot()
+            path = self._artifact(match_id, "tracemalloc")
+            snapshot.dump(path)
+            entry["tracemalloc"] = path
+            entry["traced_memory_bytes"] = tracemalloc.get_traced_memory()[0]
+            self._write_memory_top(match_id, snapshot)
+            self._last_snapshot = snapshot
+
+        self.entries.append(entry)
+
+    def _write_memory_top(self, match_id: str, snapshot) -> None:
+        """Write the top allocation sites (and growth since the previous match)"""
+        with open(self._artifact(match_id, "memory.txt"), "w") as f:
+            f.write(f"# {match_id} config={self.config_hash}\n")
+            f.write("# Top allocation sites\n")
+            for stat in snapshot.statistics("lineno")[:25]:
+                f.write(f"{stat}\n")
+            if self._last_snapshot is not None:
+                f.write("\n# Growth since previous match\n")
+                for stat in snapshot.compare_to(self._last_snapshot, "lineno")[:25]:
+                    f.write(f"{stat}\n")
+
+    def _write_profile(self, tag: str, stats: Optional[pstats.Stats], stacks: Counter) -> Dict[str, str]:
+        """Write one merged profile and its collapsed stacks"""
+        artifacts = {}
+        if stats is not None:
+            path = self._artifact(tag, "pstats")
+            stats.dump_stats(path)
+            artifacts["pstats"] = path
+            artifacts["collapsed"] = write_collapsed(collapse_pstats(stats), self._artifact(tag, "collapsed.txt"))
+        elif stacks:
+            artifacts["collapsed"] = write_collapsed(stacks, self._artifact(tag, "collapsed.txt"))
+        return artifacts
+
+    def finish(self, label: str, per_day: bool = False) -> Dict[str, Any]:
+        """Write the merged profile, collapsed stacks and manifest for the workload
+
+        Args:
+            label: Workload tag, e.g. "day3" or "days1-5"
+            per_day: Also write one merged profile per matchday (tagged "<label>_day<n>")
+
+        Returns:
+            dict: Manifest of written artifacts
+        """
+        self.uninstall()
+
+        manifest = {
+            "workload": label,
+            "mode": self.mode,
+            "config_hash": self.config_hash,
+            "created": datetime.datetime.now().isoformat(),
+            "matches": self.entries
+        }
+
+        manifest.update(self._write_profile(label, self._merged_stats, self._merged_stacks))
+        if per_day:
+            manifest["days"] = [
+                {"day": day, **self._write_profile(f"{label}_day{day}", self._day_stats.get(day),
+                                                   self._day_stacks.get(day, Counter()))}
+                for day in sorted({entry["day"] for entry in self.entries})
+            ]
+
+        manifest_path = self._artifact(label, "manifest.json")
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+        manifest["manifest"] = manifest_path
+
+        return manifest
+
+    def print_summary(self, limit: int = 20) -> None:
+        """Print the heaviest functions of the merged cProfile run"""
+        if self._merged_stats is not None:
+            self._merged_stats.sort_stats("cumulative").print_stats(limit)
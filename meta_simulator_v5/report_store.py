@@ -0,0 +1,589 @@
+"""
+Report Store for META League Simulator v5.0
+Keeps structured match and summary results in compact form and renders text reports on demand
+"""
+
+import os
+import json
+import zlib
+import random
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from string import Template
+from typing import Dict, List, Any, Optional
+from system_base import SystemBase
+
+# Result fields holding lists of uniform dicts; stored column-wise
+COLUMNAR_FIELDS = ["character_results", "convergence_logs", "trait_logs", "stamina_logs", "morale_logs"]
+
+MATCH_REPORT_TYPES = ["summary", "narrative", "visualization", "health_bars"]
+
+#############################################################################
+#                           TEMPLATES                                       #
+#############################################################################
+
+DEFAULT_TEMPLATES = {
+    "summary": """
+=== MATCH SUMMARY ===
+$team_a_name vs $team_b_name
+
+RESULT: $team_a_name $team_a_wins - $team_b_wins $team_b_name
+WINNER: $winning_team
+
+KEY STATISTICS:
+- Rounds Played: $rounds_played
+- Convergences: $convergence_count
+- Trait Activations: $trait_activations
+
+TOP PERFORMERS:
+- Damage Dealer: $top_damage_name ($top_damage_team)
+- Knockouts: $top_ko_name ($top_ko_team)
+
+TEAM SUMMARIES:
+$team_a_name: $team_a_standing/$team_a_count characters active
+$team_b_name: $team_b_standing/$team_b_count characters active
+$ko_section""",
+
+    "narrative": """
+=== MATCH NARRATIVE REPORT ===
+$team_a_name vs $team_b_name
+Final Score: $team_a_wins-$team_b_wins
+
+$opening
+$body
+
+$closing
+""",
+
+    "visualization": """
+==========================================
+            MATCH VISUALIZATION
+==========================================
+
+$team_a_name ($team_a_wins wins)
+$team_a_health_bar $team_a_health%
+$team_a_roster
+vs.
+
+$team_b_name ($team_b_wins wins)
+$team_b_health_bar $team_b_health%
+$team_b_roster
+==========================================
+$convergence_section""",
+
+    "health_bars": """
+$team_a_name  $team_a_health_bar $team_a_health%
+$team_b_name  $team_b_health_bar $team_b_health%
+""",
+
+    "day": """
+=== DAY $day REPORT ($weekday $date) ===
+
+MATCHES:
+$match_lines
+STANDINGS:
+$standing_lines""",
+
+    "week": """
+=== WEEK $week REPORT ($date_range) ===
+Days completed: $days_completed
+
+STANDINGS:
+$standing_lines""",
+
+    "season": """
+=== SEASON REPORT ($date_range) ===
+Weeks completed: $weeks_completed
+Overall champion: $champion_line
+
+DIVISION CHAMPIONS:
+$division_lines
+STANDINGS:
+$standing_lines"""
+}
+
+NARRATIVE_PHRASES = {
+    "close_opening": [
+        "In a thrilling contest that came down to the wire, $winner narrowly defeated their rivals.",
+        "The arena fell silent as $winner secured a hard-fought victory in the closing moments.",
+        "Neither team gave an inch in a back-and-forth battle that $winner ultimately won."
+    ],
+    "decisive_opening": [
+        "$winner dominated from the opening bell, securing a decisive victory.",
+        "It was a showcase of tactical superiority as $winner overwhelmed their opponents.",
+        "The outcome was never in doubt as $winner controlled every aspect of the match."
+    ],
+    "close_closing": [
+        "As the dust settled, $winner emerged victorious, but both teams earned respect for their performance.",
+        "The match will be remembered as one of the season's most competitive, with $winner barely edging out the win."
+    ],
+    "decisive_closing": [
+        "The dominant performance from $winner sends a message to all other teams in the league.",
+        "The coaching staff of $winner deserves credit for a perfectly executed game plan."
+    ]
+}
+
+ROLE_PHRASES = {
+    "FL": "leading the team with tactical brilliance.",
+    "VG": "breaking through enemy lines with devastating efficiency.",
+    "EN": "enforcing dominance with raw power and determination.",
+    "SV": "controlling reality with unmatched strategic awareness."
+}
+
+
+class TemplateCache:
+    """Compiles each report template once; file overrides are read from the templates directory"""
+
+    def __init__(self, template_dir: Optional[str] = None):
+        """Initialize the template cache"""
+        self.template_dir = template_dir
+        self._compiled = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Template:
+        """Get the compiled template for a report type"""
+        template = self._compiled.get(name)
+        if template is not None:
+            return template
+
+        with self._lock:
+            if name not in self._compiled:
+                self._compiled[name] = Template(self._load_source(name))
+            return self._compiled[name]
+
+    def _load_source(self, name: str) -> str:
+        """Load template text, preferring <template_dir>/<name>.txt"""
+        if self.template_dir:
+            path = os.path.join(self.template_dir, f"{name}.txt")
+            if os.path.exists(path):
+                with open(path, 'r') as f:
+                    return f.read()
+        if name in DEFAULT_TEMPLATES:
+            return DEFAULT_TEMPLATES[name]
+        raise KeyError(f"Unknown report template: {name}")
+
+    def clear(self) -> None:
+        """Drop compiled templates (e.g. after editing template files)"""
+        with self._lock:
+            self._compiled.clear()
+
+
+#############################################################################
+#                         COMPACT STORAGE                                   #
+#############################################################################
+
+def _to_columns(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert a list of dicts to a column list plus value rows"""
+    columns = []
+    for record in records:
+        for key in record:
+            if key not in columns:
+                columns.append(key)
+    return {"columns": columns, "rows": [[record.get(col) for col in columns] for record in records]}
+
+
+def _from_columns(table: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Inverse of _to_columns (keys that were absent come back as None)"""
+    columns = table["columns"]
+    return [dict(zip(columns, row)) for row in table["rows"]]
+
+
+def pack_result(result: Dict[str, Any]) -> bytes:
+    """Pack a result dict into compressed, column-wise JSON"""
+    compact = {}
+    for key, value in result.items():
+        if key in COLUMNAR_FIELDS and isinstance(value, list):
+            if value:
+                compact[key] = {"__columns__": _to_columns(value)}
+        elif value not in (None, [], {}):
+            compact[key] = value
+    return zlib.compress(json.dumps(compact, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+def unpack_result(blob: bytes) -> Dict[str, Any]:
+    """Unpack a blob produced by pack_result"""
+    compact = json.loads(zlib.decompress(blob).decode("utf-8"))
+    for key in COLUMNAR_FIELDS:
+        value = compact.get(key)
+        compact[key] = _from_columns(value["__columns__"]) if isinstance(value, dict) else []
+    return compact
+
+
+def health_bar(percentage: float, width: int = 20) -> str:
+    """Text health bar: '#' above 60%, '!' above 30%, '*' otherwise"""
+    percentage = max(0, min(100, percentage))
+    filled = int(width * percentage / 100)
+    fill_char = '#' if percentage > 60 else ('!' if percentage > 30 else '*')
+    return f"[{fill_char * filled}{' ' * (width - filled)}]"
+
+
+#############################################################################
+#                            REPORT STORE                                   #
+#############################################################################
+
+class ReportStore(SystemBase):
+    """
+    Stores each match result once and renders reports only when they are requested
+    Featured matches can be pre-rendered in the background
+    """
+
+    def __init__(self, config):
+        """Initialize the report store"""
+        super().__init__("report_store", None)
+        self.config = config
+
+        self.reports_dir = config.get("paths.reports_dir", "results/reports")
+        self.store_dir = os.path.join(self.reports_dir, "store")
+        self.persist = config.get("reporting.persist_compact_results", True)
+        self.cache_size = config.get("reporting.rendered_cache_size", 64)
+
+        self.templates = TemplateCache(config.get("paths.report_templates_dir"))
+
+        # Packed results keyed by (kind, key); kind is "match", "day", "week" or "season"
+        self._blobs = {}
+        self._featured = set()
+
+        # Small LRU of rendered text
+        self._rendered = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._prerender_pool = None
+        self._prerender_futures = []
+
+        self.logger.info("Report store initialized")
+
+    def _activate_implementation(self) -> bool:
+        """Implementation-specific activation logic"""
+        self.logger.info("Activating Report Store")
+        if self.persist:
+            os.makedirs(self.store_dir, exist_ok=True)
+        return True
+
+    def _deactivate_implementation(self) -> bool:
+        """Wait for background pre-renders"""
+        self.wait_for_prerender()
+        if self._prerender_pool is not None:
+            self._prerender_pool.shutdown(wait=True)
+            self._prerender_pool = None
+        return True
+
+    # ---- STORAGE ----
+
+    def _store(self, kind: str, key: Any, data: Dict[str, Any]) -> str:
+        """Pack and store a result; returns the report ID"""
+        blob = pack_result(data)
+        report_id = f"{kind}:{key}"
+
+        with self._lock:
+            self._blobs[(kind, str(key))] = blob
+            # A re-stored result invalidates anything rendered from the old one
+            for cache_key in [k for k in self._rendered if k[0] == report_id]:
+                del self._rendered[cache_key]
+
+        if self.persist:
+            os.makedirs(self.store_dir, exist_ok=True)
+            with open(self._blob_path(kind, key), 'wb') as f:
+                f.write(blob)
+
+        return report_id
+
+    def _blob_path(self, kind: str, key: Any) -> str:
+        """Get the on-disk path for a packed result"""
+        safe_key = str(key).replace(os.sep, "_")
+        return os.path.join(self.store_dir, f"{kind}_{safe_key}.json.z")
+
+    def store_match(self, result: Dict[str, Any], featured: bool = False) -> str:
+        """Store a match result
+
+        Args:
+            result: Full match result data (including character_results and logs)
+            featured: Pre-render every match report type in the background
+
+        Returns:
+            str: Report ID to pass to render()
+        """
+        report_id = self._store("match", result["match_id"], result)
+        if featured:
+            self._featured.add(result["match_id"])
+            self.prerender(report_id)
+        return report_id
+
+    def store_summary(self, kind: str, key: Any, summary: Dict[str, Any]) -> str:
+        """Store a day, week or season summary"""
+        if kind not in ("day", "week", "season"):
+            raise ValueError(f"Unknown summary kind: {kind}")
+        return self._store(kind, key, summary)
+
+    def load(self, report_id: str) -> Dict[str, Any]:
+        """Get the structured result behind a report ID"""
+        kind, key = report_id.split(":", 1)
+        blob = self._blobs.get((kind, key))
+        if blob is None:
+            path = self._blob_path(kind, key)
+            if not os.path.exists(path):
+                raise KeyError(f"No stored result for {report_id}")
+            with open(path, 'rb') as f:
+                blob = f.read()
+            self._blobs[(kind, key)] = blob
+        return unpack_result(blob)
+
+    def is_featured(self, match_id: str) -> bool:
+        """Check whether a match was flagged as featured"""
+        return match_id in self._featured
+
+    # ---- RENDERING ----
+
+    def render(self, report_id: str, report_type: Optional[str] = None) -> str:
+        """Render a report, reusing the cached text when available
+
+        Args:
+            report_id: ID returned by store_match or store_summary
+            report_type: Match report type (summary, narrative, visualization, health_bars);
+                         summaries use their own kind
+
+        Returns:
+            str: Rendered report text
+        """
+        kind = report_id.split(":", 1)[0]
+        report_type = report_type or ("summary" if kind == "match" else kind)
+        cache_key = (report_id, report_type)
+
+        with self._lock:
+            text = self._rendered.get(cache_key)
+            if text is not None:
+                self._rendered.move_to_end(cache_key)
+                return text
+
+        data = self.load(report_id)
+        context_builder = getattr(self, f"_context_{report_type}", None)
+        if context_builder is None:
+            raise ValueError(f"Unknown report type: {report_type}")
+        text = self.templates.get(report_type).safe_substitute(context_builder(data))
+
+        with self._lock:
+            self._rendered[cache_key] = text
+            while len(self._rendered) > self.cache_size:
+                self._rendered.popitem(last=False)
+        return text
+
+    def save(self, report_id: str, report_type: Optional[str] = None, output_dir: Optional[str] = None) -> str:
+        """Render a report and write it to disk"""
+        output_dir = output_dir or self.reports_dir
+        os.makedirs(output_dir, exist_ok=True)
+        kind, key = report_id.split(":", 1)
+        report_type = report_type or ("summary" if kind == "match" else kind)
+        path = os.path.join(output_dir, f"{kind}_{key}_{report_type}.txt".replace(os.sep, "_"))
+        with open(path, 'w') as f:
+            f.write(self.render(report_id, report_type))
+        return path
+
+    def prerender(self, report_id: str, report_types: Optional[List[str]] = None) -> None:
+        """Render reports in a background thread so they are ready when opened"""
+        if self._prerender_pool is None:
+            self._prerender_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report_prerender")
+        for report_type in report_types or MATCH_REPORT_TYPES:
+            self._prerender_futures.append(self._prerender_pool.submit(self.render, report_id, report_type))
+
+    def wait_for_prerender(self) -> None:
+        """Block until queued pre-renders finish"""
+        for future in self._prerender_futures:
+            try:
+                future.result()
+            except Exception as e:
+                self.logger.error(f"Error pre-rendering report: {e}")
+        self._prerender_futures = []
+
+    # ---- CONTEXT BUILDERS ----
+
+    @staticmethod
+    def _team_name(data: Dict[str, Any], team: str) -> str:
+        return data.get("team_a_name", "Team A") if team == "A" else data.get("team_b_name", "Team B")
+
+    @staticmethod
+    def _team_health(chars: List[Dict[str, Any]]) -> float:
+        if not chars:
+            return 0.0
+        return sum(c.get("HP", c.get("final_hp", 0)) for c in chars) / (len(chars) * 100) * 100
+
+    def _base_context(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Fields shared by every match report"""
+        chars = data.get("character_results", [])
+        team_a = [c for c in chars if c.get("team") == "A" and c.get("was_active", True)]
+        team_b = [c for c in chars if c.get("team") == "B" and c.get("was_active", True)]
+        team_a_health = self._team_health(team_a)
+        team_b_health = self._team_health(team_b)
+        return {
+            "team_a_name": data.get("team_a_name", "Team A"),
+            "team_b_name": data.get("team_b_name", "Team B"),
+            "team_a_wins": data.get("team_a_wins", 0),
+            "team_b_wins": data.get("team_b_wins", 0),
+            "winning_team": data.get("winning_team", "Draw"),
+            "rounds_played": data.get("rounds_played", 0),
+            "team_a": team_a,
+            "team_b": team_b,
+            "team_a_health": f"{team_a_health:.1f}",
+            "team_b_health": f"{team_b_health:.1f}",
+            "team_a_health_bar": health_bar(team_a_health),
+            "team_b_health_bar": health_bar(team_b_health)
+        }
+
+    def _context_summary(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        context = self._base_context(data)
+        chars = data.get("character_results", [])
+
+        def damage(c):
+            rstats = c.get("rStats") or {}
+            return rstats.get("rDD", 0) + rstats.get("rDDo", 0) + rstats.get("rDDi", 0)
+
+        def kos(c):
+            return (c.get("rStats") or {}).get("rOTD", 0)
+
+        top_damage = max(chars, key=damage, default=None)
+        top_ko = max(chars, key=kos, default=None)
+        ko_chars = [c for c in context["team_a"] + context["team_b"] if c.get("is_ko")]
+
+        ko_section = ""
+        if ko_chars:
+            ko_section = "\nKNOCKOUTS:\n" + "".join(
+                f"- {c.get('character_name', 'Unknown')} ({self._team_name(data, c.get('team'))}): Knocked Out\n"
+                for c in ko_chars
+            )
+
+        context.update({
+            "convergence_count": data.get("convergence_count", len(data.get("convergence_logs", []))),
+            "trait_activations": data.get("trait_activations", len(data.get("trait_logs", []))),
+            "top_damage_name": top_damage.get("character_name", "Unknown") if top_damage and damage(top_damage) else "None",
+            "top_damage_team": self._team_name(data, top_damage.get("team")) if top_damage and damage(top_damage) else "-",
+            "top_ko_name": top_ko.get("character_name", "Unknown") if top_ko and kos(top_ko) else "None",
+            "top_ko_team": self._team_name(data, top_ko.get("team")) if top_ko and kos(top_ko) else "-",
+            "team_a_count": len(context["team_a"]),
+            "team_b_count": len(context["team_b"]),
+            "team_a_standing": sum(1 for c in context["team_a"] if not c.get("is_ko")),
+            "team_b_standing": sum(1 for c in context["team_b"] if not c.get("is_ko")),
+            "ko_section": ko_section
+        })
+        return context
+
+    def _context_narrative(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        context = self._base_context(data)
+        # Seed from the match ID so re-rendering gives the same story
+        rng = random.Random(data.get("match_id", ""))
+        winner = context["winning_team"]
+
+        match_type = "close" if abs(context["team_a_wins"] - context["team_b_wins"]) <= 2 else "decisive"
+        opening = Template(rng.choice(NARRATIVE_PHRASES[f"{match_type}_opening"])).substitute(winner=winner)
+        closing = Template(rng.choice(NARRATIVE_PHRASES[f"{match_type}_closing"])).substitute(winner=winner)
+
+        performers = []
+        for c in context["team_a"] + context["team_b"]:
+            rstats = c.get("rStats") or {}
+            score = (rstats.get("rDD", 0) / 100 + rstats.get("rOTD", 0) * 5 + rstats.get("rULT", 0) * 3
+                     + rstats.get("rHLG", 0) / 50 + rstats.get("rMBi", 0) * 2)
+            if score > 0:
+                performers.append((score, c))
+        performers.sort(key=lambda item: item[0], reverse=True)
+
+        body = ""
+        if performers:
+            mvp = performers[0][1]
+            body += (f"\n{mvp.get('character_name', 'Unknown')} was the standout performer for "
+                     f"{self._team_name(data, mvp.get('team'))}, "
+                     f"{ROLE_PHRASES.get(mvp.get('role'), 'showcasing exceptional skill throughout the match.')}")
+            if len(performers) > 1:
+                second = performers[1][1]
+                body += (f"\n\n{second.get('character_name', 'Unknown')} of {self._team_name(data, second.get('team'))} "
+                         f"also made a significant impact, "
+                         f"{'despite being knocked out in the later stages.' if second.get('is_ko') else 'remaining a threat until the final moments.'}")
+
+        convergences = data.get("convergence_logs", [])
+        if convergences:
+            notable = rng.choice(convergences)
+            if notable.get("winner") and notable.get("loser"):
+                body += (f"\n\nA pivotal moment came when {notable['winner']} triumphed over {notable['loser']}"
+                         f" in a convergence at {notable.get('square', '?')}.")
+
+        context.update({"opening": opening, "body": body, "closing": closing})
+        return context
+
+    def _roster_lines(self, chars: List[Dict[str, Any]]) -> str:
+        lines = []
+        for c in chars:
+            status = "KO" if c.get("is_ko") else "OK"
+            hp = c.get("HP", c.get("final_hp", 0)) or 0
+            stamina = c.get("stamina", c.get("final_stamina", 0)) or 0
+            lines.append(f"  {c.get('character_name', 'Unknown')} ({c.get('role', '?')}): {status} | HP: {hp:.1f} | STAM: {stamina:.1f}\n")
+        return "".join(lines)
+
+    def _context_visualization(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        context = self._base_context(data)
+
+        convergence_section = ""
+        convergences = data.get("convergence_logs", [])
+        if convergences:
+            significant = sorted(convergences, key=lambda x: abs((x.get("a_roll") or 0) - (x.get("b_roll") or 0)), reverse=True)[:5]
+            convergence_section = "\nNOTABLE CONVERGENCE POINTS:\n" + "".join(
+                f"  {conv.get('square', '?')}: {conv.get('winner', '?')} defeated {conv.get('loser', '?')}"
+                f" (Damage: {conv.get('reduced_damage') or 0:.1f})\n"
+                for conv in significant
+            )
+
+        context.update({
+            "team_a_roster": self._roster_lines(context["team_a"]),
+            "team_b_roster": self._roster_lines(context["team_b"]),
+            "convergence_section": convergence_section
+        })
+        return context
+
+    def _context_health_bars(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return self._base_context(data)
+
+    @staticmethod
+    def _standing_lines(standings) -> str:
+        if isinstance(standings, dict):
+            standings = list(standings.items())
+        lines = []
+        for position, (team_id, record) in enumerate(standings, 1):
+            lines.append(f"{position:>3}. {record.get('name', team_id)}: "
+                         f"{record.get('wins', 0)}-{record.get('losses', 0)}-{record.get('draws', 0)}"
+                         f" ({record.get('points', 0)} pts)\n")
+        return "".join(lines)
+
+    def _context_day(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        match_lines = "".join(
+            f"  {m.get('team_a_name')} {m.get('team_a_wins', 0)} - {m.get('team_b_wins', 0)} {m.get('team_b_name')}"
+            f" (Winner: {m.get('winning_team')})\n"
+            for m in data.get("matches", [])
+        )
+        standings = data.get("league_standings") or data.get("standings", {})
+        return {
+            "day": data.get("day"),
+            "weekday": data.get("weekday", ""),
+            "date": data.get("date", ""),
+            "match_lines": match_lines,
+            "standing_lines": self._standing_lines(standings)
+        }
+
+    def _context_week(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "week": data.get("week"),
+            "date_range": data.get("date_range", "Unknown"),
+            "days_completed": data.get("days_completed", 0),
+            "standing_lines": self._standing_lines(data.get("standings", []))
+        }
+
+    def _context_season(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        champion = data.get("overall_champion")
+        champion_line = (f"{champion.get('name')} ({champion.get('wins', 0)}-{champion.get('losses', 0)}-"
+                         f"{champion.get('draws', 0)})") if champion else "None"
+        division_lines = "".join(
+            f"  {division}: {info.get('name')} ({info.get('points', 0)} pts)\n"
+            for division, info in (data.get("division_champions") or {}).items()
+        )
+        return {
+            "date_range": data.get("date_range", "Unknown"),
+            "weeks_completed": data.get("weeks_completed", 0),
+            "champion_line": champion_line,
+            "division_lines": division_lines,
+            "standing_lines": self._standing_lines(data.get("standings", []))
+        }
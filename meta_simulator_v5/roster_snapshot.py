@@ -0,0 +1,311 @@
+"""
+Roster Snapshot for META League Simulator v5.0
+Compiles teams, players, traits, trait assignments, divisions and lineups into one
+versioned binary artifact that worker processes can load without re-parsing CSVs
+"""
+
+import os
+import re
+import sys
+import glob
+import json
+import pickle
+import hashlib
+import logging
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional
+
+from character_overlay import CharacterOverlay
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_MAGIC = b"METAROSTER\n"
+
+# Files compiled into the snapshot; lineups_day*.csv are added by pattern
+SOURCE_FILES = ["teams.csv", "players.csv", "traits.csv", "divisions.csv", "player_traits.csv", "matchups.csv"]
+LINEUP_PATTERN = "lineups_day*.csv"
+
+LINEUP_SIZE = 8
+
+
+def source_paths(data_dir: str) -> List[str]:
+    """List the existing source files for a data directory in a stable order"""
+    paths = [os.path.join(data_dir, name) for name in SOURCE_FILES]
+    paths.extend(sorted(glob.glob(os.path.join(data_dir, LINEUP_PATTERN))))
+    return [path for path in paths if os.path.exists(path)]
+
+
+def hash_sources(data_dir: str) -> str:
+    """SHA-256 over the names and contents of all source files"""
+    digest = hashlib.sha256()
+    for path in source_paths(data_dir):
+        digest.update(os.path.basename(path).encode("utf-8"))
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class RosterSnapshot:
+    """
+    Immutable compiled roster
+    Players and traits are addressed by integer index; lineups store player indices
+    """
+
+    def __init__(self, payload: Dict[str, Any], source_hash: str):
+        """Wrap a compiled payload (use build() or load() to create one)"""
+        self.source_hash = source_hash
+        self.version = payload["version"]
+
+        self.teams = payload["teams"]
+        self.divisions = payload["divisions"]
+        self.matchups = payload["matchups"]
+        self.errors = payload["errors"]
+
+        self.player_ids = payload["player_ids"]
+        self.players = payload["players"]
+        self.player_traits = payload["player_traits"]
+
+        self.trait_ids = payload["trait_ids"]
+        self.lineups = payload["lineups"]
+
+        self.player_index = {player_id: i for i, player_id in enumerate(self.player_ids)}
+        self.trait_index = {trait_id: i for i, trait_id in enumerate(self.trait_ids)}
+
+        # Trait definitions are shared read-only; each player gets a plain dict copy for its own state
+        self.traits = [MappingProxyType(trait) for trait in payload["traits"]]
+        # Player records likewise; per-match state lives in a CharacterOverlay delta
+        self.player_records = [MappingProxyType(player) for player in self.players]
+
+    @property
+    def valid(self) -> bool:
+        """True if the integrity checks passed when the snapshot was built"""
+        return not self.errors
+
+    # ---- BUILD ----
+
+    @classmethod
+    def build(cls, data_loader, source_hash: Optional[str] = None) -> "RosterSnapshot":
+        """Compile a snapshot from the data loader's CSV parsers and run the integrity checks once
+
+        Args:
+            data_loader: DataLoader reading the CSV sources
+            source_hash: Precomputed hash of the sources
+
+        Returns:
+            RosterSnapshot: Compiled snapshot
+        """
+        data_dir = data_loader.data_dir
+        source_hash = source_hash or hash_sources(data_dir)
+
+        teams = data_loader.load_teams()
+        players = data_loader.load_players()
+        traits = data_loader.load_traits()
+        divisions = data_loader.load_divisions()
+        player_traits = data_loader.load_player_traits()
+
+        matchups = {}
+        if os.path.exists(os.path.join(data_dir, "matchups.csv")):
+            matchups = data_loader.load_matchups()
+
+        # Intern repeated strings so every record shares one object per team, role and division
+        intern = sys.intern
+        interned_teams = {}
+        for team_id, team in teams.items():
+            interned_teams[intern(team_id)] = dict(team, division=intern(team["division"]))
+
+        player_ids = list(players)
+        trait_ids = list(traits)
+        trait_index = {trait_id: i for i, trait_id in enumerate(trait_ids)}
+
+        compiled_players = []
+        compiled_player_traits = []
+        for player_id in player_ids:
+            player = dict(players[player_id])
+            for key in ("team_id", "role", "division"):
+                player[key] = intern(player[key])
+            player["traits"] = []
+            compiled_players.append(player)
+            compiled_player_traits.append(tuple(
+                trait_index[trait_id] for trait_id in player_traits.get(player_id, []) if trait_id in trait_index
+            ))
+
+        compiled_traits = []
+        for trait_id in trait_ids:
+            trait = dict(traits[trait_id])
+            trait["type"] = intern(trait["type"])
+            compiled_traits.append(trait)
+
+        player_index = {player_id: i for i, player_id in enumerate(player_ids)}
+        lineups = {}
+        for path in sorted(glob.glob(os.path.join(data_dir, LINEUP_PATTERN))):
+            match = re.search(r"lineups_day(\d+)\.csv$", path)
+            if match:
+                day_lineup = data_loader.read_lineup_file(path)
+                lineups[int(match.group(1))] = {
+                    intern(team_id): tuple(player_index[pid] for pid in team_player_ids if pid in player_index)
+                    for team_id, team_player_ids in day_lineup.items()
+                }
+
+        payload = {
+            "version": SNAPSHOT_VERSION,
+            "teams": interned_teams,
+            "divisions": divisions,
+            "matchups": matchups,
+            "player_ids": player_ids,
+            "players": compiled_players,
+            "player_traits": compiled_player_traits,
+            "trait_ids": trait_ids,
+            "traits": compiled_traits,
+            "lineups": lineups,
+            "errors": []
+        }
+        payload["errors"] = cls._check_assignments(players, traits, player_traits) + cls._check_integrity(payload)
+
+        return cls(payload, source_hash)
+
+    @staticmethod
+    def _check_assignments(players: Dict[str, Any], traits: Dict[str, Any],
+                           player_traits: Dict[str, List[str]]) -> List[str]:
+        """Check trait assignments before they are reduced to indices"""
+        errors = []
+        for player_id, trait_ids in player_traits.items():
+            if player_id not in players:
+                errors.append(f"Traits assigned to non-existent player: {player_id}")
+            for trait_id in trait_ids:
+                if trait_id not in traits:
+                    errors.append(f"Player {player_id} has invalid trait: {trait_id}")
+        return errors
+
+    @staticmethod
+    def _check_integrity(payload: Dict[str, Any]) -> List[str]:
+        """Cross-check the compiled tables; returns a list of problems"""
+        errors = []
+        teams = payload["teams"]
+        divisions = payload["divisions"]
+
+        for team_id, team in teams.items():
+            if team["division"] not in divisions:
+                errors.append(f"Team {team_id} has invalid division: {team['division']}")
+
+        for player in payload["players"]:
+            if player["team_id"] not in teams:
+                errors.append(f"Player {player['id']} assigned to non-existent team: {player['team_id']}")
+
+        day1 = payload["lineups"].get(1)
+        if day1 is None:
+            errors.append("No lineup data found for day 1")
+        else:
+            for team_id, lineup in day1.items():
+                if team_id not in teams:
+                    errors.append(f"Lineup contains non-existent team: {team_id}")
+                if len(lineup) != LINEUP_SIZE:
+                    errors.append(f"Team {team_id} does not have exactly {LINEUP_SIZE} players in lineup")
+
+        return errors
+
+    # ---- PERSISTENCE ----
+
+    def _payload(self) -> Dict[str, Any]:
+        """Rebuild the picklable payload"""
+        return {
+            "version": self.version,
+            "teams": self.teams,
+            "divisions": self.divisions,
+            "matchups": self.matchups,
+            "player_ids": self.player_ids,
+            "players": self.players,
+            "player_traits": self.player_traits,
+            "trait_ids": self.trait_ids,
+            "traits": [dict(trait) for trait in self.traits],
+            "lineups": self.lineups,
+            "errors": self.errors
+        }
+
+    def save(self, path: str) -> str:
+        """Write the snapshot: magic line, JSON header line, then the pickled payload"""
+        body = pickle.dumps(self._payload(), protocol=pickle.HIGHEST_PROTOCOL)
+        header = {
+            "version": self.version,
+            "source_hash": self.source_hash,
+            "payload_sha256": hashlib.sha256(body).hexdigest()
+        }
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            f.write(body)
+        os.replace(tmp_path, path)
+        return path
+
+    @staticmethod
+    def read_header(path: str) -> Optional[Dict[str, Any]]:
+        """Read only the header of a snapshot file, or None if it is not a snapshot"""
+        try:
+            with open(path, "rb") as f:
+                if f.readline() != SNAPSHOT_MAGIC:
+                    return None
+                return json.loads(f.readline())
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def load(cls, path: str, source_hash: Optional[str] = None,
+             verify_payload: bool = True) -> Optional["RosterSnapshot"]:
+        """Load a snapshot file
+
+        Args:
+            path: Snapshot path
+            source_hash: Expected source hash; stale snapshots are rejected
+            verify_payload: Check the payload checksum (workers handed a verified path can skip it)
+
+        Returns:
+            RosterSnapshot or None if the file is missing, stale, corrupt or from another version
+        """
+        logger = logging.getLogger("DATA_LOADER")
+        try:
+            with open(path, "rb") as f:
+                if f.readline() != SNAPSHOT_MAGIC:
+                    return None
+                header = json.loads(f.readline())
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+
+        if header.get("version") != SNAPSHOT_VERSION:
+            logger.info(f"Ignoring roster snapshot with version {header.get('version')}")
+            return None
+        if source_hash is not None and header.get("source_hash") != source_hash:
+            logger.info("Roster snapshot is stale")
+            return None
+        if verify_payload and hashlib.sha256(body).hexdigest() != header.get("payload_sha256"):
+            logger.warning(f"Roster snapshot checksum mismatch: {path}")
+            return None
+
+        return cls(pickle.loads(body), header["source_hash"])
+
+    # ---- LINEUPS ----
+
+    def resolve_lineup_day(self, day_number: int) -> Optional[int]:
+        """Pick the lineup day to use: the day itself, else the latest earlier day, else day 1"""
+        if day_number in self.lineups:
+            return day_number
+        earlier = [day for day in self.lineups if day < day_number]
+        if earlier:
+            return max(earlier)
+        return 1 if 1 in self.lineups else None
+
+    def make_player(self, index: int) -> CharacterOverlay:
+        """Create a match-ready player overlay; the record is shared, the small trait dicts are copied"""
+        record = self.player_records[index]
+        return CharacterOverlay(record, {
+            "HP": record["base_HP"],
+            "traits": [dict(self.traits[t], current_cooldown=0) for t in self.player_traits[index]]
+        })
+
+    def get_lineups(self, day: int) -> Dict[str, List[CharacterOverlay]]:
+        """Build the lineups compiled for a lineup day"""
+        return {
+            team_id: [self.make_player(index) for index in player_indices]
+            for team_id, player_indices in self.lineups[day].items()
+        }
@@ -0,0 +1,142 @@
+"""
+Round Pipeline for META League Simulator v5.0
+Fuses the end-of-round work of several systems into as few passes as possible
+
+Systems contribute stages. A per-character stage is called as
+stage(character, match_context, events) and consecutive per-character stages are
+fused into a single loop over the characters. A batch stage takes the whole list,
+stage(characters, match_context, events), and is used for systems that only offer
+a list-level method or for columnar (vectorized) implementations. Stages append
+(event_name, data) tuples to `events`; the pipeline emits them together after the pass.
+"""
+
+import logging
+from typing import Dict, List, Any, Optional, Tuple, Callable
+
+Event = Tuple[str, Dict[str, Any]]
+
+
+class RoundStage:
+    """One system's contribution to the end-of-round pass"""
+
+    __slots__ = ("name", "per_character", "batch", "columnar", "include_ko")
+
+    def __init__(self, name: str, per_character: Optional[Callable] = None, batch: Optional[Callable] = None,
+                 columnar: Optional[Callable] = None, include_ko: bool = False):
+        """Create a stage
+
+        Args:
+            name: Stage name (for logging and introspection)
+            per_character: fn(character, match_context, events)
+            batch: fn(characters, match_context, events) for list-level systems
+            columnar: Vectorized fn(characters, match_context, events) used when the pipeline is vectorized
+            include_ko: Whether per_character also runs for KO'd or inactive characters
+        """
+        if per_character is None and batch is None and columnar is None:
+            raise ValueError(f"Stage {name} needs a per-character, batch or columnar implementation")
+        self.name = name
+        self.per_character = per_character
+        self.batch = batch
+        self.columnar = columnar
+        self.include_ko = include_ko
+
+
+class EndOfRoundPipeline:
+    """
+    Ordered end-of-round stages compiled into fused segments
+
+    Stages run in registration order. Each run of consecutive per-character stages
+    becomes one loop over the characters; batch and columnar stages run on their own.
+    """
+
+    def __init__(self, event_sink: Any = None, vectorized: bool = False):
+        """Create an empty pipeline
+
+        Args:
+            event_sink: Event system receiving the round's events (emit_batch() or emit())
+            vectorized: Prefer stages' columnar implementations when they have one
+        """
+        self.logger = logging.getLogger("META_SIMULATOR.RoundPipeline")
+        self.event_sink = event_sink
+        self.vectorized = vectorized
+        self.stages: List[RoundStage] = []
+        self._segments: Optional[List[Tuple[str, Any]]] = None
+
+    def add_stage(self, name: str, per_character: Optional[Callable] = None, batch: Optional[Callable] = None,
+                  columnar: Optional[Callable] = None, include_ko: bool = False) -> RoundStage:
+        """Append a stage (see RoundStage)"""
+        stage = RoundStage(name, per_character, batch, columnar, include_ko)
+        self.stages.append(stage)
+        self._segments = None
+        return stage
+
+    def add_system(self, name: str, system: Any, method: str = "apply_end_of_round_effects") -> None:
+        """Append a system's stages
+
+        Systems exposing end_of_round_stages() contribute those (a list of RoundStage
+        keyword dicts); others are called through `method(characters, match_context)`.
+        """
+        if system is None:
+            return
+        if hasattr(system, "end_of_round_stages"):
+            for stage in system.end_of_round_stages():
+                stage = dict(stage)
+                self.add_stage(f"{name}.{stage.pop('name')}", **stage)
+        elif hasattr(system, method):
+            list_method = getattr(system, method)
+            self.add_stage(name, batch=lambda characters, match_context, events: list_method(characters, match_context))
+        else:
+            self.logger.warning(f"System {name} has no end-of-round stages or {method}()")
+
+    def _compile(self) -> List[Tuple[str, Any]]:
+        """Group the stages into fused per-character segments and single batch segments"""
+        segments = []
+        for stage in self.stages:
+            if self.vectorized and stage.columnar is not None:
+                segments.append(("batch", stage.columnar))
+            elif stage.per_character is not None:
+                if segments and segments[-1][0] == "fused":
+                    segments[-1][1].append(stage)
+                else:
+                    segments.append(("fused", [stage]))
+            else:
+                segments.append(("batch", stage.batch or stage.columnar))
+        return segments
+
+    def run(self, characters: List[Dict[str, Any]], match_context: Dict[str, Any]) -> List[Event]:
+        """Run every stage over the characters and emit the collected events
+
+        Returns:
+            list: (event_name, data) events produced this round
+        """
+        segments = self._segments
+        if segments is None:
+            segments = self._segments = self._compile()
+
+        events: List[Event] = []
+        for kind, segment in segments:
+            if kind == "batch":
+                segment(characters, match_context, events)
+                continue
+
+            live_stages = [stage.per_character for stage in segment]
+            all_stages = [stage.per_character for stage in segment if stage.include_ko]
+            for character in characters:
+                stages = all_stages if character.get("is_ko", False) or not character.get("is_active", True) else live_stages
+                for stage in stages:
+                    stage(character, match_context, events)
+
+        if events:
+            self.emit(events)
+        return events
+
+    def emit(self, events: List[Event]) -> None:
+        """Hand a round's events to the event sink in one call when it supports batches"""
+        sink = self.event_sink
+        if sink is None:
+            return
+        if hasattr(sink, "emit_batch"):
+            sink.emit_batch(events)
+        else:
+            for event_name, data in events:
+                sink.emit(event_name, data)
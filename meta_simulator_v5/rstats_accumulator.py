@@ -0,0 +1,249 @@
+# rstats_accumulator.py
+# Array-backed rStats store: one row per character, one column per stat code.
+# Trimmed copy of the root rstats_accumulator without the canonical default layout;
+# each tracker passes its own stat list.
+
+import csv
+from typing import Dict, List, Optional
+
+import numpy as np
+
+DIVISIONS = ("o", "i", "b")
+DIVISION_INDEX: Dict[str, int] = {division: k for k, division in enumerate(DIVISIONS)}
+
+META_FIELDS = ["unit_id", "name", "division", "role", "team_id"]
+
+
+def _build_code_map(columns: List[str], domains: Dict[str, str]) -> Dict[str, int]:
+    """
+    Maps every accepted spelling of a stat code to its column.
+    Both 'rDD' and 'DD' resolve to the same column so callers never strip or re-add prefixes.
+    """
+    code_map = {}
+    for col, code in enumerate(columns):
+        code_map[code] = col
+        if code in domains and code.startswith("r"):
+            code_map.setdefault(code[1:], col)
+    return code_map
+
+
+def _column_mask(code: str, domains: Dict[str, str], fixed: bool) -> List[bool]:
+    """
+    Allowed divisions of one column, in DIVISIONS order.
+    Coded stats follow their domain; other layout columns are valid for every division,
+    and columns opened on first write are valid for none.
+    """
+    domain = domains.get(code)
+    if domain is None:
+        return [fixed] * len(DIVISIONS)
+    return [domain == "b" or domain == division or division == "b" for division in DIVISIONS]
+
+
+def _build_division_masks(columns: List[str], domains: Dict[str, str]) -> np.ndarray:
+    """
+    Returns a (3, n_columns) bool matrix; row k is the allowed-column mask for DIVISIONS[k].
+    """
+    masks = np.ones((len(DIVISIONS), len(columns)), dtype=bool)
+    for col, code in enumerate(columns):
+        masks[:, col] = _column_mask(code, domains, True)
+    return masks
+
+
+class RStatsAccumulator:
+    """
+    Accumulates rStats for many characters in a single float matrix.
+    Writes are a dict lookup plus one array store; validation and export work on the whole matrix.
+
+    With open_columns, a code outside the layout gets a new column on first write instead of
+    raising KeyError.
+    """
+
+    def __init__(self, columns: List[str], domains: Optional[Dict[str, str]] = None,
+                 capacity: int = 64, open_columns: bool = False, default_division: str = "b"):
+        self.columns: List[str] = list(columns)
+        self._domains = dict(domains or {})
+        self._code_map = _build_code_map(self.columns, self._domains)
+        self._masks = _build_division_masks(self.columns, self._domains)
+        self.open_columns = open_columns
+        self.default_division = default_division
+        self._data = np.zeros((max(capacity, 1), len(self.columns)), dtype=np.float64)
+        self._division = np.full(self._data.shape[0], DIVISION_INDEX["b"], dtype=np.int8)
+        self._rows: Dict[str, int] = {}
+        self._meta: List[Dict[str, str]] = []
+
+    # ---- LAYOUT ----
+
+    def column(self, code: str) -> int:
+        """
+        Column of a stat code. Raises KeyError for codes outside the layout unless columns are open.
+        """
+        col = self._code_map.get(code)
+        if col is None:
+            if not self.open_columns:
+                raise KeyError(code)
+            col = self._add_column(code)
+        return col
+
+    def _add_column(self, code: str) -> int:
+        col = len(self.columns)
+        self.columns.append(code)
+        self._code_map[code] = col
+        self._data = np.concatenate([self._data, np.zeros((self._data.shape[0], 1))], axis=1)
+        mask = np.array(_column_mask(code, self._domains, False), dtype=bool).reshape(-1, 1)
+        self._masks = np.concatenate([self._masks, mask], axis=1)
+        return col
+
+    # ---- ROWS ----
+
+    def register(self, character: dict) -> int:
+        """
+        Registers a character (idempotent) and returns its row index.
+        """
+        char_id = character.get("id", "unknown")
+        row = self._rows.get(char_id)
+        if row is not None:
+            return row
+
+        row = len(self._meta)
+        if row == self._data.shape[0]:
+            self._grow()
+
+        division = character.get("division", self.default_division)
+        self._division[row] = DIVISION_INDEX.get(division, DIVISION_INDEX["b"])
+        self._rows[char_id] = row
+        self._meta.append({
+            "unit_id": char_id,
+            "name": character.get("name", "Unknown"),
+            "division": division,
+            "role": character.get("role", ""),
+            "team_id": character.get("team_id", ""),
+        })
+        return row
+
+    def _grow(self) -> None:
+        size = self._data.shape[0]
+        self._data = np.concatenate([self._data, np.zeros_like(self._data)])
+        self._division = np.concatenate([self._division, np.full(size, DIVISION_INDEX["b"], dtype=np.int8)])
+
+    def row_of(self, char_id: str) -> Optional[int]:
+        return self._rows.get(char_id)
+
+    def meta(self, row: int) -> Dict[str, str]:
+        return self._meta[row]
+
+    def __len__(self) -> int:
+        return len(self._meta)
+
+    def __contains__(self, char_id: str) -> bool:
+        return char_id in self._rows
+
+    # ---- WRITES ----
+
+    def apply_at(self, row: int, col: int, value: float, operation: str = "add") -> float:
+        """
+        Applies an 'add', 'set' or 'max' write to a resolved cell and returns the new value.
+        """
+        data = self._data
+        if operation == "add":
+            data[row, col] += value
+        elif operation == "set":
+            data[row, col] = value
+        elif operation == "max":
+            if value > data[row, col]:
+                data[row, col] = value
+        else:
+            raise ValueError(f"Unknown operation: {operation}")
+        return float(data[row, col])
+
+    def update(self, char_id: str, code: str, value: float = 1, operation: str = "add") -> float:
+        """
+        Updates one stat and returns its new value.
+        Raises KeyError for unregistered characters or codes outside a closed layout.
+        """
+        return self.apply_at(self._rows[char_id], self.column(code), value, operation)
+
+    def reset(self) -> None:
+        self._data[:len(self._meta)] = 0
+
+    # ---- READS ----
+
+    def get(self, char_id: str, code: str, default: float = 0) -> float:
+        row = self._rows.get(char_id)
+        col = self._code_map.get(code)
+        if row is None or col is None:
+            return default
+        return float(self._data[row, col])
+
+    def matrix(self) -> np.ndarray:
+        """
+        Read-only view of the populated rows.
+        """
+        view = self._data[:len(self._meta)]
+        view.flags.writeable = False
+        return view
+
+    def as_dict(self, char_id: str, include_zero: bool = False) -> Dict[str, float]:
+        values = self._data[self._rows[char_id]]
+        if include_zero:
+            return dict(zip(self.columns, values.tolist()))
+        cols = np.flatnonzero(values)
+        return {self.columns[c]: float(values[c]) for c in cols}
+
+    def column_totals(self) -> Dict[str, float]:
+        totals = self._data[:len(self._meta)].sum(axis=0)
+        return dict(zip(self.columns, totals.tolist()))
+
+    # ---- VALIDATION ----
+
+    def invalid_entries(self) -> Dict[str, List[str]]:
+        """
+        Returns {char_id: [codes]} for non-zero stats not allowed for the character's division.
+        """
+        n = len(self._meta)
+        bad = (self._data[:n] != 0) & ~self._masks[self._division[:n]]
+        report = {}
+        for row in np.flatnonzero(bad.any(axis=1)):
+            report[self._meta[row]["unit_id"]] = [self.columns[c] for c in np.flatnonzero(bad[row])]
+        return report
+
+    def validate(self) -> int:
+        """
+        Zeroes every stat not allowed for its row's division. Returns the number of cleared entries.
+        """
+        n = len(self._meta)
+        allowed = self._masks[self._division[:n]]
+        cleared = int(np.count_nonzero(self._data[:n][~allowed]))
+        self._data[:n][~allowed] = 0
+        return cleared
+
+    # ---- EXPORT ----
+
+    def export_csv(self, path: str, meta_fields: Optional[List[str]] = None,
+                   skip_zero_columns: bool = False, sort_columns: bool = False) -> str:
+        """
+        Writes one row per character; skip_zero_columns leaves out stats nobody has recorded.
+        """
+        n = len(self._meta)
+        data = self._data[:n]
+        cols = np.flatnonzero(data.any(axis=0)) if skip_zero_columns else np.arange(len(self.columns))
+        if sort_columns:
+            cols = sorted(cols, key=self.columns.__getitem__)
+        fields = META_FIELDS if meta_fields is None else meta_fields
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(fields + [self.columns[c] for c in cols])
+            values = data[:, cols].tolist()
+            writer.writerows([m.get(field, "") for field in fields] + row for m, row in zip(self._meta, values))
+        return path
+
+    def to_flat_dict(self, include_zero: bool = False) -> Dict[str, Dict]:
+        """
+        {char_id: {meta..., code: value}}, the shape trackers used for their per-unit dicts.
+        """
+        out = {}
+        for meta, values in zip(self._meta, self._data[:len(self._meta)].tolist()):
+            stats = dict(zip(self.columns, values))
+            if not include_zero:
+                stats = {code: value for code, value in stats.items() if value}
+            out[meta["unit_id"]] = {**meta, **stats}
+        return out
@@ -0,0 +1,199 @@
+"""
+Typed Settings for META League Simulator v5.0
+Resolves, validates and freezes the hot-path configuration once per run
+"""
+
+import logging
+from dataclasses import dataclass, fields
+from typing import Dict, List, Any, Tuple, Type
+
+
+class SettingsError(ValueError):
+    """Raised when configuration values fail validation"""
+
+    def __init__(self, errors: List[str]):
+        self.errors = errors
+        super().__init__("Invalid configuration:\n" + "\n".join(f"- {error}" for error in errors))
+
+
+@dataclass(frozen=True, slots=True)
+class SimulationSettings:
+    """Match flow settings (config section: simulation)"""
+    max_rounds: int = 30
+    ko_threshold: int = 4
+    team_hp_threshold: float = 30.0
+    max_convergences_per_char: int = 3
+    home_advantage_factor: float = 0.1
+    weeks_per_season: int = 10
+    teams_per_match: int = 8
+    matches_per_day: int = 5
+    vectorized_round_effects: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class CombatSettings:
+    """Damage and HP calibration (config sections: combat_calibration.health/damage/convergence_settings)"""
+    base_hp_multiplier: float = 1.0
+    base_damage_multiplier: float = 1.25
+    convergence_damage_multiplier: float = 2.0
+
+
+@dataclass(frozen=True, slots=True)
+class StaminaSettings:
+    """Stamina calibration (config section: combat_calibration.stamina_settings)"""
+    stamina_decay_per_round_multiplier: float = 1.15
+    low_stamina_extra_damage_taken_percent: float = 20.0
+
+
+@dataclass(frozen=True, slots=True)
+class MoraleSettings:
+    """Morale calibration (config section: combat_calibration.morale_settings)"""
+    morale_loss_per_ko_multiplier: float = 1.10
+    morale_collapse_enabled: bool = True
+    morale_collapse_threshold_percent: float = 30.0
+
+
+@dataclass(frozen=True, slots=True)
+class InjurySettings:
+    """Injury calibration (config section: combat_calibration.injury_settings)"""
+    injury_enabled: bool = True
+    injury_trigger_stamina_threshold_percent: float = 35.0
+
+
+@dataclass(frozen=True, slots=True)
+class FeatureFlags:
+    """Feature toggles (config section: features)"""
+    per_board_pgn: bool = True
+    aggregate_match_pgn: bool = True
+    stamina_enabled: bool = True
+    injury_enabled: bool = True
+    xp_enabled: bool = True
+    synergy_enabled: bool = True
+    morale_enabled: bool = True
+    combat_calibration_enabled: bool = True
+    use_stockfish: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """All typed settings for a run"""
+    simulation: SimulationSettings
+    combat: CombatSettings
+    stamina: StaminaSettings
+    morale: MoraleSettings
+    injury: InjurySettings
+    features: FeatureFlags
+
+
+# Where each settings group lives in the config: list of (section path, field names taken from it)
+SECTION_SOURCES: Dict[str, List[Tuple[str, Tuple[str, ...]]]] = {
+    "simulation": [("simulation", ())],
+    "combat": [
+        ("combat_calibration.health_settings", ("base_hp_multiplier",)),
+        ("combat_calibration.damage_settings", ("base_damage_multiplier",)),
+        ("combat_calibration.convergence_settings", ("convergence_damage_multiplier",))
+    ],
+    "stamina": [("combat_calibration.stamina_settings", ())],
+    "morale": [("combat_calibration.morale_settings", ())],
+    "injury": [("combat_calibration.injury_settings", ())],
+    "features": [("features", ())]
+}
+
+SETTINGS_TYPES: Dict[str, Type] = {
+    "simulation": SimulationSettings,
+    "combat": CombatSettings,
+    "stamina": StaminaSettings,
+    "morale": MoraleSettings,
+    "injury": InjurySettings,
+    "features": FeatureFlags
+}
+
+# Allowed ranges (inclusive); None means unbounded on that side
+RANGES: Dict[str, Tuple[Any, Any]] = {
+    "max_rounds": (1, None),
+    "ko_threshold": (1, 8),
+    "team_hp_threshold": (0, 100),
+    "max_convergences_per_char": (0, None),
+    "home_advantage_factor": (0, 1),
+    "weeks_per_season": (1, None),
+    "teams_per_match": (1, None),
+    "matches_per_day": (1, None),
+    "base_hp_multiplier": (0.01, None),
+    "base_damage_multiplier": (0.01, None),
+    "convergence_damage_multiplier": (0, None),
+    "stamina_decay_per_round_multiplier": (0, None),
+    "low_stamina_extra_damage_taken_percent": (0, 100),
+    "morale_loss_per_ko_multiplier": (0, None),
+    "morale_collapse_threshold_percent": (0, 100),
+    "injury_trigger_stamina_threshold_percent": (0, 100)
+}
+
+
+def _coerce(name: str, key: str, value: Any, target: type, errors: List[str]) -> Any:
+    """Convert a raw config value to the field type, recording a readable error on failure"""
+    if target is bool:
+        if isinstance(value, bool):
+            return value
+        errors.append(f"{name} must be true or false, got {value!r}")
+        return None
+
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        errors.append(f"{name} must be a number, got {value!r}")
+        return None
+    if target is int and value != int(value):
+        errors.append(f"{name} must be a whole number, got {value!r}")
+        return None
+
+    value = target(value)
+    low, high = RANGES.get(key, (None, None))
+    if (low is not None and value < low) or (high is not None and value > high):
+        errors.append(f"{name} must be within [{low}, {'inf' if high is None else high}], got {value!r}")
+        return None
+    return value
+
+
+def _build_group(config, group: str, errors: List[str]):
+    """Resolve one settings group from its config sections"""
+    settings_type = SETTINGS_TYPES[group]
+    types = {f.name: f.type for f in fields(settings_type)}
+    logger = logging.getLogger("CONFIG_MANAGER")
+
+    values = {}
+    for section, names in SECTION_SOURCES[group]:
+        raw = config.get(section, {}) or {}
+        if not isinstance(raw, dict):
+            errors.append(f"{section} must be a mapping")
+            continue
+        for key, value in raw.items():
+            if names and key not in names:
+                continue
+            if key not in types:
+                if not names:
+                    logger.debug(f"Config key {section}.{key} is not a typed setting")
+                continue
+            coerced = _coerce(f"{section}.{key}", key, value, types[key], errors)
+            if coerced is not None:
+                values[key] = coerced
+
+    return settings_type(**values)
+
+
+def resolve_settings(config) -> Settings:
+    """Resolve and validate typed settings from a ConfigManager (or any object with get(path, default))
+
+    Raises:
+        SettingsError: If any value has the wrong type or is out of range
+    """
+    errors = []
+    groups = {group: _build_group(config, group, errors) for group in SETTINGS_TYPES}
+    if errors:
+        raise SettingsError(errors)
+    return Settings(**groups)
+
+
+def settings_to_dict(settings: Settings) -> Dict[str, Dict[str, Any]]:
+    """Plain-dict view of the settings, for logs and backups"""
+    return {
+        group.name: {f.name: getattr(getattr(settings, group.name), f.name) for f in fields(getattr(settings, group.name))}
+        for group in fields(settings)
+    }
@@ -19,6 +19,9 @@ from config_utils import load_config
 # Import the integration patch
 from final_integration import apply_final_integration_patches
 
+from profiler import ProfileSession, PROFILE_MODES
+from match_orchestrator import run_range_concurrent
+
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Load configuration from file or use defaults
@@ -99,7 +102,9 @@ def run_day_simulation(simulator, day_number: int, quiet: bool = False) -> None:
         print(f"Error simulating day {day_number}: {e}")
         sys.exit(1)
 
-def run_range_simulation(simulator, start_day: int, end_day: int, quiet: bool = False) -> None:
+def run_range_simulation(simulator, start_day: int, end_day: int, quiet: bool = False,
+                         concurrent: Optional[int] = None, engine_pool_size: Optional[int] = None,
+                         engine_path: Optional[str] = None) -> None:
     """
     Run simulation for a range of days
     
@@ -108,10 +113,18 @@ def run_range_simulation(simulator, start_day: int, end_day: int, quiet: bool =
         start_day: Starting day number
         end_day: Ending day number
         quiet: Whether to suppress detailed output
+        concurrent: Interleave up to this many matches on one event loop over an engine pool
+        engine_pool_size: Engine processes in the pool (with concurrent)
+        engine_path: UCI engine executable for the pool (with concurrent)
     """
     print(f"\nSimulating days {start_day} through {end_day}...")
     try:
-        result = simulator.run_simulation(start_day, end_day, not quiet)
+        if concurrent:
+            result = run_range_concurrent(simulator, start_day, end_day, not quiet,
+                                          engine_path, engine_pool_size, concurrent)
+            print(f"Engine pool: {result['engine_pool']}")
+        else:
+            result = simulator.run_simulation(start_day, end_day, not quiet)
         print(f"Range simulation completed successfully")
         
         # Print summary
@@ -121,7 +134,8 @@ def run_range_simulation(simulator, start_day: int, end_day: int, quiet: bool =
                 matches_played = day_stats.get("matches_played", 0)
                 print(f"  Day {day}: {matches_played} matches played")
         
-        print(f"\nFinal results saved to: {result.get('final_stats', ['Unknown'])[0]}")
+        if "final_stats" in result:
+            print(f"\nFinal results saved to: {result['final_stats'][0]}")
     
     except Exception as e:
         print(f"Error in range simulation: {e}")
@@ -192,8 +206,24 @@ def main():
     parser.add_argument("--match", help="Simulate a specific match (format: team_a_id,team_b_id)")
     parser.add_argument("--match-day", type=int, default=1, help="Day number for match simulation")
     parser.add_argument("--quiet", action="store_true", help="Suppress detailed output")
+    parser.add_argument("--concurrent", type=int, metavar="N",
+                        help="With --range, interleave up to N matches over a shared engine pool")
+    parser.add_argument("--engine-pool", type=int, metavar="K",
+                        help="Engine processes in the pool (default: config concurrency.engine_pool_size)")
+    parser.add_argument("--engine-path", help="UCI engine for the pool (default: config concurrency.engine_path)")
+    parser.add_argument("--profile", nargs="?", const="cprofile", choices=PROFILE_MODES,
+                        help="Profile the workload (cprofile or sample; default cprofile)")
+    parser.add_argument("--profile-dir", default=os.path.join("results", "profiles"),
+                        help="Output directory for profile artifacts")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="Take a tracemalloc snapshot after each match (with --profile)")
+    parser.add_argument("--sample-interval", type=float, default=0.005,
+                        help="Seconds between stack samples in sample mode")
     
     args = parser.parse_args()
+    if args.profile and args.concurrent:
+        # Interleaved matches run through the orchestrator, which the profile session does not hook
+        parser.error("--profile cannot be combined with --concurrent")
     
     # Load configuration
     config = load_config(args.config)
@@ -210,24 +240,49 @@ def main():
     print("Applying integration patches...")
     simulator = apply_final_integration_patches(simulator)
     
-    # Determine what to simulate
-    if args.match:
-        # Simulate a specific match
-        team_a_id, team_b_id = args.match.split(',')
-        run_match_simulation(simulator, team_a_id, team_b_id, args.match_day, args.quiet)
-        
-    elif args.range:
-        # Simulate a range of days
-        start, end = map(int, args.range.split('-'))
-        run_range_simulation(simulator, start, end, args.quiet)
-        
-    elif args.day:
-        # Simulate a specific day
-        run_day_simulation(simulator, args.day, args.quiet)
-        
-    else:
-        # Default: simulate day 1
-        run_day_simulation(simulator, 1, args.quiet)
+    # Profile every match of the chosen workload if requested
+    profile_session = None
+    if args.profile:
+        profile_session = ProfileSession(simulator, args.profile_dir, args.profile,
+                                         args.profile_memory, args.sample_interval).install()
+        print(f"Profiling enabled ({args.profile}), writing to {args.profile_dir}")
+    
+    # Determine what to simulate; a failed run still writes the profiles of the matches it played
+    workload = "aborted"
+    try:
+        if args.match:
+            # Simulate a specific match
+            team_a_id, team_b_id = args.match.split(',')
+            workload = f"match_{team_a_id}_vs_{team_b_id}_day{args.match_day}"
+            run_match_simulation(simulator, team_a_id, team_b_id, args.match_day, args.quiet)
+            
+        elif args.range:
+            # Simulate a range of days
+            start, end = map(int, args.range.split('-'))
+            workload = f"days{start}-{end}"
+            run_range_simulation(simulator, start, end, args.quiet,
+                                 args.concurrent, args.engine_pool, args.engine_path)
+            
+        elif args.day:
+            # Simulate a specific day
+            workload = f"day{args.day}"
+            run_day_simulation(simulator, args.day, args.quiet)
+            
+        else:
+            # Default: simulate day 1
+            workload = "day1"
+            run_day_simulation(simulator, 1, args.quiet)
+    
+    finally:
+        if profile_session:
+            # Ranges also get one merged profile per day
+            manifest = profile_session.finish(workload, per_day=bool(args.range))
+            print(f"\nProfiled {len(manifest['matches'])} matches (config {manifest['config_hash']})")
+            print(f"Profile manifest: {manifest['manifest']}")
+            for day in manifest.get("days", []):
+                print(f"  Day {day['day']}: {day.get('pstats') or day.get('collapsed')}")
+            if not args.quiet:
+                profile_session.print_summary()
     
     print("\nSimulation completed successfully")
 
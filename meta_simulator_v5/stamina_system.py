@@ -8,9 +8,16 @@ import json
 import datetime
 import logging
 import math
+from collections.abc import Mapping
 from typing import Dict, List, Any, Optional, Tuple, Union
 from system_base import SystemBase
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 class StaminaSystem(SystemBase):
     """System for tracking and managing character stamina with persistence"""
     
@@ -200,16 +207,8 @@ class StaminaSystem(SystemBase):
         
         # Calculate decay amount
         if decay_amount is None:
-            # Calculate from base rates and multipliers
-            decay_amount = self.stamina_decay_per_round * self.stamina_decay_per_round_multiplier
-            
-            # Apply trait modifiers if character has relevant traits
-            if "traits" in character:
-                for trait in character.get("traits", []):
-                    if isinstance(trait, dict) and trait.get("type") == "stamina":
-                        if trait.get("effect_type") == "decay_reduction":
-                            reduction = trait.get("effect_value", 0)
-                            decay_amount *= (1.0 - reduction)
+            # Calculate from base rates, multipliers and trait modifiers
+            decay_amount = self._round_decay(character)
         
         # Apply decay (ensure it doesn't go below 0)
         self.update_stamina(
@@ -219,6 +218,15 @@ class StaminaSystem(SystemBase):
             match_context
         )
     
+    def _round_decay(self, character: Dict[str, Any]) -> float:
+        """Per-round stamina decay for a character after trait reductions"""
+        decay_amount = self.stamina_decay_per_round * self.stamina_decay_per_round_multiplier
+        for trait in character.get("traits", []):
+            if isinstance(trait, Mapping) and trait.get("type") == "stamina":
+                if trait.get("effect_type") == "decay_reduction":
+                    decay_amount *= (1.0 - trait.get("effect_value", 0))
+        return decay_amount
+    
     def apply_action_cost(self, character: Dict[str, Any], 
                          action_type: str, success: bool,
                          match_context: Dict[str, Any]) -> None:
@@ -283,34 +291,100 @@ class StaminaSystem(SystemBase):
             if character.get("is_ko", False) or not character.get("is_active", True):
                 continue
             
-            # Apply stamina decay first
-            self.apply_stamina_decay(character, match_context=match_context)
-            
-            # Apply attribute-based regeneration
-            dur_value = character.get("aDUR", 5)
-            will_value = character.get("aWIL", 5)
-            
-            # Calculate regen amount
-            base_regen = self.stamina_regen_rate
-            
-            # Durability bonus
-            if dur_value > 5:
-                dur_bonus = (dur_value - 5) * 0.2  # 0.2 per point above 5
-                base_regen += dur_bonus
-            
-            # Willpower bonus
-            if will_value > 5:
-                will_bonus = (will_value - 5) * 0.1  # 0.1 per point above 5
-                base_regen += will_bonus
-            
-            # Apply regeneration if needed
-            if base_regen > 0 and character["stamina"] < self.base_stamina:
-                self.update_stamina(
-                    character,
-                    base_regen,
-                    "End of round recovery",
-                    match_context
-                )
+            self._end_of_round_character(character, match_context)
+    
+    def end_of_round_stages(self) -> List[Dict[str, Any]]:
+        """Stages for the fused end-of-round pipeline (round_pipeline)"""
+        return [{
+            "name": "recovery",
+            "per_character": self._end_of_round_character,
+            "columnar": self._end_of_round_columnar
+        }]
+    
+    def _round_regen(self, character: Dict[str, Any]) -> float:
+        """Attribute-based end of round regeneration for a character"""
+        dur_value = character.get("aDUR", 5)
+        will_value = character.get("aWIL", 5)
+        
+        # Calculate regen amount
+        base_regen = self.stamina_regen_rate
+        
+        # Durability bonus
+        if dur_value > 5:
+            base_regen += (dur_value - 5) * 0.2  # 0.2 per point above 5
+        
+        # Willpower bonus
+        if will_value > 5:
+            base_regen += (will_value - 5) * 0.1  # 0.1 per point above 5
+        
+        return base_regen
+    
+    def _end_of_round_character(self, character: Dict[str, Any], match_context: Dict[str, Any],
+                                events: Optional[List] = None) -> None:
+        """Decay then regenerate one active character's stamina"""
+        was_low = character.get("is_stamina_low", False)
+        
+        # Apply stamina decay first
+        self.apply_stamina_decay(character, match_context=match_context)
+        
+        # Apply regeneration if needed
+        base_regen = self._round_regen(character)
+        if base_regen > 0 and character["stamina"] < self.base_stamina:
+            self.update_stamina(
+                character,
+                base_regen,
+                "End of round recovery",
+                match_context
+            )
+        
+        if events is not None and character["is_stamina_low"] and not was_low:
+            events.append(("stamina_low", {"character": character, "stamina": character["stamina"],
+                                           "match_context": match_context}))
+    
+    def _end_of_round_columnar(self, characters: List[Dict[str, Any]], match_context: Dict[str, Any],
+                               events: List) -> None:
+        """Vectorized end of round decay, regeneration and threshold checks
+        
+        Produces the same stamina values, stamina logs and events as _end_of_round_character()
+        """
+        live = [character for character in characters
+                if not character.get("is_ko", False) and character.get("is_active", True)]
+        if not live:
+            return
+        if not NUMPY_AVAILABLE:
+            for character in live:
+                self._end_of_round_character(character, match_context, events)
+            return
+        
+        for character in live:
+            if "stamina" not in character:
+                self.initialize_character_stamina(character)
+        
+        decay = np.array([self._round_decay(character) for character in live])
+        regen = np.array([self._round_regen(character) for character in live])
+        before = np.array([character["stamina"] for character in live], dtype=float)
+        was_low = np.array([character.get("is_stamina_low", False) for character in live])
+        
+        # Same clamping order as two update_stamina() calls
+        decayed = np.clip(before - decay, 0, self.base_stamina)
+        regenerates = (regen > 0) & (decayed < self.base_stamina)
+        after = np.where(regenerates, np.clip(decayed + regen, 0, self.base_stamina), decayed)
+        is_low = after <= self.low_stamina_threshold
+        
+        for i, character in enumerate(live):
+            char_id = character.get("id", "unknown")
+            new_stamina = float(after[i])
+            character["stamina"] = new_stamina
+            character["is_stamina_low"] = bool(is_low[i])
+            self.active_stamina[char_id] = new_stamina
+            self._log_stamina_change(character, float(before[i]), float(decayed[i]), -float(decay[i]),
+                                     "Stamina decay per round", match_context)
+            if regenerates[i]:
+                self._log_stamina_change(character, float(decayed[i]), new_stamina, float(regen[i]),
+                                         "End of round recovery", match_context)
+            if is_low[i] and not was_low[i]:
+                events.append(("stamina_low", {"character": character, "stamina": new_stamina,
+                                               "match_context": match_context}))
     
     def calculate_stamina_damage_modifier(self, character: Dict[str, Any]) -> float:
         """Calculate damage modifier based on stamina level"""
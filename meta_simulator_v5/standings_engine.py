@@ -0,0 +1,325 @@
+"""
+Standings Engine for META League Simulator v5.0
+Incrementally maintained league table, division tables and per-stat leaderboards
+"""
+
+import bisect
+from typing import Dict, List, Any, Optional, Tuple, Hashable
+from system_base import SystemBase
+from rstats_accumulator import RStatsAccumulator
+
+# sortedcontainers gives O(log n) insert/remove/index; fall back to bisect on a plain list
+try:
+    from sortedcontainers import SortedList
+    SORTED_CONTAINERS_AVAILABLE = True
+except ImportError:
+    SORTED_CONTAINERS_AVAILABLE = False
+
+    class SortedList:
+        """Minimal bisect-backed stand-in for sortedcontainers.SortedList"""
+
+        def __init__(self):
+            self._items = []
+
+        def add(self, item):
+            bisect.insort(self._items, item)
+
+        def remove(self, item):
+            idx = bisect.bisect_left(self._items, item)
+            if idx == len(self._items) or self._items[idx] != item:
+                raise ValueError(f"{item!r} not in list")
+            del self._items[idx]
+
+        def index(self, item):
+            idx = bisect.bisect_left(self._items, item)
+            if idx == len(self._items) or self._items[idx] != item:
+                raise ValueError(f"{item!r} not in list")
+            return idx
+
+        def __getitem__(self, index):
+            return self._items[index]
+
+        def __len__(self):
+            return len(self._items)
+
+        def __iter__(self):
+            return iter(self._items)
+
+
+class Leaderboard:
+    """Ordered board of keys by a sortable score; best score ranks first"""
+
+    def __init__(self):
+        """Initialize an empty leaderboard"""
+        self._order = SortedList()
+        self._entries = {}
+
+    def update(self, key: Hashable, sort_key: Tuple) -> None:
+        """Insert or reposition a key
+
+        Args:
+            key: Entry identifier (team or character ID)
+            sort_key: Ascending sort tuple; negate fields that should rank high-first
+        """
+        old = self._entries.get(key)
+        if old is not None:
+            if old == sort_key:
+                return
+            self._order.remove((old, key))
+        self._entries[key] = sort_key
+        self._order.add((sort_key, key))
+
+    def discard(self, key: Hashable) -> None:
+        """Remove a key if present"""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._order.remove((old, key))
+
+    def top(self, n: int) -> List[Hashable]:
+        """Get the first n keys in rank order"""
+        return [key for _, key in self._order[:n]]
+
+    def rank(self, key: Hashable) -> Optional[int]:
+        """Get the 1-based rank of a key, or None if absent"""
+        sort_key = self._entries.get(key)
+        if sort_key is None:
+            return None
+        return self._order.index((sort_key, key)) + 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+
+class StandingsEngine(SystemBase):
+    """
+    League standings updated one match at a time
+    Answers top-N and rank-of queries without re-sorting the league
+    """
+
+    def __init__(self, config):
+        """Initialize the standings engine"""
+        super().__init__("standings_engine", None)
+        self.config = config
+
+        # Points per result (v5 summaries use 3 for a win, 1 for a draw)
+        self.points_per_win = config.get("standings.points_per_win", 3)
+        self.points_per_draw = config.get("standings.points_per_draw", 1)
+
+        # Team records keyed by team ID
+        self.records = {}
+
+        # League table and one table per division
+        self.league_table = Leaderboard()
+        self.division_tables = {}
+
+        # Per-stat character leaderboards and the values they are ranked on
+        self.stat_boards = {}
+        self.character_totals = RStatsAccumulator([], open_columns=True)
+        self.character_info = {}
+
+        self.matches_recorded = 0
+
+        self.logger.info(f"Standings engine initialized (sortedcontainers={SORTED_CONTAINERS_AVAILABLE})")
+
+    def spawn(self) -> "StandingsEngine":
+        """Create an empty engine with the same scoring, for standings over a subset of matches
+        (one week or one season) fed alongside this one"""
+        return type(self)(self.config)
+
+    def _activate_implementation(self) -> bool:
+        """Implementation-specific activation logic"""
+        self.logger.info("Activating Standings Engine")
+        return True
+
+    def _get_record(self, team_id: str, team_name: Optional[str] = None,
+                    division: Optional[str] = None) -> Dict[str, Any]:
+        """Get or create a team record"""
+        record = self.records.get(team_id)
+        if record is None:
+            record = {
+                "team_id": team_id,
+                "name": team_name or team_id,
+                "division": division,
+                "wins": 0,
+                "losses": 0,
+                "draws": 0,
+                "total_games": 0,
+                "points": 0,
+                "win_pct": 0.0,
+                "board_diff": 0.0,
+                "streak": 0
+            }
+            self.records[team_id] = record
+        else:
+            if team_name:
+                record["name"] = team_name
+            if division and record["division"] is None:
+                record["division"] = division
+        return record
+
+    @staticmethod
+    def _sort_key(record: Dict[str, Any]) -> Tuple:
+        """Tie-breakers: points, wins, fewest losses, board differential, team ID"""
+        return (-record["points"], -record["wins"], record["losses"], -record["board_diff"], record["team_id"])
+
+    def _apply_result(self, team_id: str, outcome: str, board_diff: float) -> None:
+        """Apply a single team's result and reposition it in its tables"""
+        record = self.records[team_id]
+
+        if outcome == "win":
+            record["wins"] += 1
+            record["points"] += self.points_per_win
+            record["streak"] = record["streak"] + 1 if record["streak"] > 0 else 1
+        elif outcome == "loss":
+            record["losses"] += 1
+            record["streak"] = record["streak"] - 1 if record["streak"] < 0 else -1
+        else:
+            record["draws"] += 1
+            record["points"] += self.points_per_draw
+            record["streak"] = 0
+
+        record["total_games"] += 1
+        record["win_pct"] = record["wins"] / record["total_games"]
+        record["board_diff"] += board_diff
+
+        sort_key = self._sort_key(record)
+        self.league_table.update(team_id, sort_key)
+
+        division = record["division"]
+        if division:
+            if division not in self.division_tables:
+                self.division_tables[division] = Leaderboard()
+            self.division_tables[division].update(team_id, sort_key)
+
+    def record_match(self, result: Dict[str, Any]) -> None:
+        """Record a match result returned by MetaLeagueSimulatorV5.simulate_match
+
+        Args:
+            result: Match result with team IDs, divisions, board wins and team A's result
+        """
+        team_a_id = result["team_a_id"]
+        team_b_id = result["team_b_id"]
+
+        self._get_record(team_a_id, result.get("team_a_name"), result.get("team_a_division"))
+        self._get_record(team_b_id, result.get("team_b_name"), result.get("team_b_division"))
+
+        outcome_a = result.get("result", "draw")
+        outcome_b = {"win": "loss", "loss": "win"}.get(outcome_a, "draw")
+        diff = result.get("team_a_wins", 0) - result.get("team_b_wins", 0)
+
+        self._apply_result(team_a_id, outcome_a, diff)
+        self._apply_result(team_b_id, outcome_b, -diff)
+
+        self.matches_recorded += 1
+
+    def record_character_results(self, character_results: List[Dict[str, Any]]) -> None:
+        """Add per-character rStats from a match to the stat leaderboards
+
+        Args:
+            character_results: Character result entries as built in simulate_match
+        """
+        for entry in character_results:
+            char_id = entry.get("character_id", "unknown")
+            self.character_info[char_id] = {
+                "name": entry.get("character_name", "Unknown"),
+                "team_id": entry.get("team_id", "unknown"),
+                "role": entry.get("role", "Unknown")
+            }
+
+            totals = self.character_totals
+            row = totals.register({"id": char_id, "name": entry.get("character_name", "Unknown"),
+                                   "role": entry.get("role", "Unknown"), "team_id": entry.get("team_id", "unknown")})
+            for stat_name, value in entry.get("rStats", {}).items():
+                if not value:
+                    continue
+                total = totals.apply_at(row, totals.column(stat_name), value)
+
+                board = self.stat_boards.get(stat_name)
+                if board is None:
+                    board = self.stat_boards[stat_name] = Leaderboard()
+                board.update(char_id, (-total, char_id))
+
+    # ---- QUERIES ----
+
+    def get_standings(self, limit: Optional[int] = None,
+                      division: Optional[str] = None) -> List[Tuple[str, Dict[str, Any]]]:
+        """Get (team_id, record) pairs in rank order
+
+        Args:
+            limit: Maximum number of teams to return (all if None)
+            division: Restrict to one division table
+
+        Returns:
+            List of (team_id, record) tuples, same shape as the v5 summary standings
+        """
+        table = self.division_tables.get(division) if division else self.league_table
+        if table is None:
+            return []
+        team_ids = table.top(limit if limit is not None else len(table))
+        return [(team_id, dict(self.records[team_id])) for team_id in team_ids]
+
+    def get_division_standings(self, limit: Optional[int] = None) -> Dict[str, List[Tuple[str, Dict[str, Any]]]]:
+        """Get ranked standings for every division"""
+        return {division: self.get_standings(limit, division) for division in self.division_tables}
+
+    def get_team_rank(self, team_id: str, division: bool = False) -> Optional[int]:
+        """Get a team's 1-based rank in the league (or in its division)"""
+        if division:
+            record = self.records.get(team_id)
+            table = self.division_tables.get(record["division"]) if record else None
+            return table.rank(team_id) if table else None
+        return self.league_table.rank(team_id)
+
+    def get_top_performers(self, stat_name: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """Get top characters for a stat, same shape as StatTracker.get_top_performers"""
+        if not stat_name.startswith('r'):
+            stat_name = 'r' + stat_name
+
+        board = self.stat_boards.get(stat_name)
+        if board is None:
+            return []
+
+        performers = []
+        for char_id in board.top(limit):
+            info = self.character_info.get(char_id, {})
+            performers.append({
+                "id": char_id,
+                "name": info.get("name", "Unknown"),
+                "value": self.character_totals.get(char_id, stat_name),
+                "team_id": info.get("team_id", "unknown"),
+                "role": info.get("role", "Unknown")
+            })
+        return performers
+
+    def get_character_rank(self, char_id: str, stat_name: str) -> Optional[int]:
+        """Get a character's 1-based rank on a stat leaderboard"""
+        if not stat_name.startswith('r'):
+            stat_name = 'r' + stat_name
+        board = self.stat_boards.get(stat_name)
+        return board.rank(char_id) if board else None
+
+    def get_champions(self) -> Dict[str, Any]:
+        """Get the overall leader and each division leader"""
+        overall = self.get_standings(1)
+        return {
+            "overall_champion": overall[0] if overall else None,
+            "division_champions": {
+                division: standings[0]
+                for division, standings in self.get_division_standings(1).items()
+                if standings
+            }
+        }
+
+    def export_state(self) -> Dict[str, Any]:
+        """Export standings state for backups"""
+        return {
+            "matches_recorded": self.matches_recorded,
+            "records": self.records,
+            "character_totals": {
+                char_id: self.character_totals.as_dict(char_id) for char_id in self.character_info
+            },
+            "character_info": self.character_info
+        }
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark for META League Simulator v5.0
+Measures module import time with `python -X importtime` and enforces a startup budget
+"""
+
+import os
+import sys
+import argparse
+import subprocess
+from typing import Dict, List, Any, Optional, Tuple
+
+# Modules a single-match run or worker process imports before simulating
+DEFAULT_MODULES = [
+    "meta_simulator_5",
+    "system_registry",
+    "config_manager",
+    "standings_engine",
+    "report_store",
+    "chart_renderer"
+]
+
+# Heavy dependencies that must not be imported at module load
+DEFERRED_MODULES = ["pandas", "matplotlib", "chess.engine"]
+
+DEFAULT_BUDGET_MS = 500.0
+
+
+def measure_imports(module: str, cwd: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Import a module in a fresh interpreter and parse the -X importtime report
+
+    Args:
+        module: Module to import
+        cwd: Working directory for the interpreter (defaults to this directory)
+
+    Returns:
+        List of entries with module name, self_us, cumulative_us and depth
+    """
+    cwd = cwd or os.path.dirname(os.path.abspath(__file__))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr.strip().splitlines()[-1]}")
+
+    entries = []
+    for line in proc.stderr.splitlines():
+        # Format: "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        entries.append({
+            "module": name.strip(),
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+            "depth": (len(name) - len(name.lstrip())) // 2
+        })
+    return entries
+
+
+def summarize(module: str, entries: List[Dict[str, Any]], top: int = 10) -> Dict[str, Any]:
+    """Summarize an import-time report
+
+    Returns:
+        dict: Total time in ms, the slowest top-level imports and any deferred modules loaded
+    """
+    target = next((e for e in reversed(entries) if e["module"] == module), None)
+    total_us = target["cumulative_us"] if target else sum(e["self_us"] for e in entries)
+
+    loaded = {e["module"] for e in entries}
+    top_level = [e for e in entries if e["depth"] <= 1 and e["module"] != module]
+    top_level.sort(key=lambda e: e["cumulative_us"], reverse=True)
+
+    return {
+        "module": module,
+        "total_ms": total_us / 1000.0,
+        "slowest": [(e["module"], e["cumulative_us"] / 1000.0) for e in top_level[:top]],
+        "deferred_loaded": [name for name in DEFERRED_MODULES if name in loaded]
+    }
+
+
+def check_startup(modules: List[str], budget_ms: float, top: int = 10) -> Tuple[bool, List[Dict[str, Any]]]:
+    """Measure each module against the budget
+
+    Returns:
+        tuple: (all modules passed, per-module summaries)
+    """
+    summaries = []
+    passed = True
+    for module in modules:
+        summary = summarize(module, measure_imports(module), top)
+        summary["passed"] = summary["total_ms"] <= budget_ms and not summary["deferred_loaded"]
+        passed = passed and summary["passed"]
+        summaries.append(summary)
+    return passed, summaries
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="META Simulator v5.0 startup benchmark")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES, help="Modules to import")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="Maximum cumulative import time per module")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to show")
+    args = parser.parse_args()
+
+    passed, summaries = check_startup(args.modules, args.budget_ms, args.top)
+
+    for summary in summaries:
+        status = "OK" if summary["passed"] else "FAIL"
+        print(f"[{status}] {summary['module']}: {summary['total_ms']:.1f} ms (budget {args.budget_ms:.0f} ms)")
+        for name, ms in summary["slowest"]:
+            print(f"    {ms:8.1f} ms  {name}")
+        if summary["deferred_loaded"]:
+            print(f"    heavy modules imported at load: {', '.join(summary['deferred_loaded'])}")
+
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
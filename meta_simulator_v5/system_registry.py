@@ -3,8 +3,11 @@ META Fantasy League Simulator - System Registry
 Central registry for all simulator systems with dependency tracking
 """
 
+import functools
+import inspect
 import logging
-from typing import Dict, List, Any, Optional, Type
+import time
+from typing import Dict, List, Any, Optional, Type, Callable
 from collections import defaultdict
 
 # Import base system class
@@ -18,6 +21,16 @@ class SystemRegistry:
         self._systems = {}
         self._dependencies = defaultdict(list)
         self._activation_status = {}
+        
+        # Lazily registered systems: name -> factory, built on first get()
+        self._factories = {}
+        self._activate_on_load = set()
+        
+        # System call timing (off unless enable_timing() is called); calls are recorded on
+        # the timer of the match currently running, set by the simulator as it runs a match
+        self._timing = False
+        self.timer = None
+        
         self.logger = logging.getLogger("system.registry")
     
     def register(self, name: str, system: SystemBase, dependencies: Optional[List[str]] = None) -> SystemBase:
@@ -45,10 +58,102 @@ class SystemRegistry:
         system.dependencies = deps
         system.registry = self
         
+        if self._timing:
+            self._instrument(name, system)
+        
         self.logger.info(f"Registered system: {name} with dependencies: {deps}")
         
         return system
     
+    def register_lazy(self, name: str, factory: Callable[[], SystemBase],
+                      dependencies: Optional[List[str]] = None) -> None:
+        """Register a system that is only constructed when first requested
+        
+        Args:
+            name: System name
+            factory: Zero-argument callable returning the system instance
+            dependencies: List of dependency system names
+        """
+        self._factories[name] = factory
+        self._dependencies[name] = dependencies or []
+        self._activation_status[name] = False
+        
+        self.logger.info(f"Registered lazy system: {name} with dependencies: {self._dependencies[name]}")
+    
+    def enable_timing(self) -> None:
+        """Time every public method call of registered systems
+        
+        Calls made while a timer is set (self.timer) are recorded on it as
+        "system.<name>.<method>"; calls made with no timer set are not timed. Systems
+        registered (or lazily constructed) later are instrumented as they are registered.
+        """
+        self._timing = True
+        for name, system in self._systems.items():
+            self._instrument(name, system)
+    
+    def _instrument(self, name: str, system: SystemBase) -> None:
+        """Shadow a system's public methods with timed wrappers on the instance"""
+        for attr, member in inspect.getmembers(type(system), inspect.isfunction):
+            if attr.startswith("_"):
+                continue
+            bound = getattr(system, attr)
+            if hasattr(bound, "__wrapped_phase__"):
+                continue
+            setattr(system, attr, self._timed(f"system.{name}.{attr}", bound))
+    
+    def _timed(self, phase_name: str, method: Callable) -> Callable:
+        """Wrap a bound method so each call is recorded on the current timer"""
+        perf_counter_ns = time.perf_counter_ns
+        registry = self
+        
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            timer = registry.timer
+            if timer is None or not timer.enabled:
+                return method(*args, **kwargs)
+            start = perf_counter_ns()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                timer.add(phase_name, perf_counter_ns() - start)
+        
+        timed.__wrapped_phase__ = phase_name
+        return timed
+    
+    def _load(self, name: str) -> SystemBase:
+        """Construct a lazily registered system, activating it if activation was requested
+        
+        Raises:
+            RuntimeError: If the factory fails (the original error is chained)
+        """
+        factory = self._factories.pop(name)
+        
+        try:
+            system = factory()
+        except Exception as e:
+            # Keep the registration: a broken system fails loudly on every get(), never as a missing one
+            self._factories[name] = factory
+            raise RuntimeError(f"Failed to load system {name}: {e}") from e
+        
+        self.register(name, system, self._dependencies[name])
+        
+        if name in self._activate_on_load:
+            self._activate_on_load.discard(name)
+            self.activate(name)
+        
+        return system
+    
+    def is_loaded(self, name: str) -> bool:
+        """Check if a system has been constructed
+        
+        Args:
+            name: System name
+            
+        Returns:
+            bool: True if the system exists and is not pending lazy construction
+        """
+        return name in self._systems
+    
     def activate(self, name: str) -> bool:
         """Activate a system and its dependencies
         
@@ -58,6 +163,11 @@ class SystemRegistry:
         Returns:
             bool: Activation success
         """
+        # Lazy systems are activated when they are constructed
+        if name in self._factories:
+            self._activate_on_load.add(name)
+            return True
+        
         if name not in self._systems:
             self.logger.error(f"Cannot activate unknown system: {name}")
             return False
@@ -97,6 +207,10 @@ class SystemRegistry:
         Returns:
             bool: Deactivation success
         """
+        if name in self._factories:
+            self._activate_on_load.discard(name)
+            return True
+        
         if name not in self._systems:
             self.logger.error(f"Cannot deactivate unknown system: {name}")
             return False
@@ -140,8 +254,14 @@ class SystemRegistry:
             
         Returns:
             SystemBase: System instance or None if not found
+            
+        Raises:
+            RuntimeError: If a lazily registered system fails to construct
         """
-        return self._systems.get(name)
+        system = self._systems.get(name)
+        if system is None and name in self._factories:
+            system = self._load(name)
+        return system
     
     def is_active(self, name: str) -> bool:
         """Check if a system is active
@@ -163,15 +283,24 @@ class SystemRegistry:
         return {
             name: {
                 "active": status,
+                "loaded": name in self._systems,
                 "dependencies": self._dependencies[name]
             }
             for name, status in self._activation_status.items()
         }
     
     def get_systems(self) -> Dict[str, SystemBase]:
-        """Get all registered systems
+        """Get all constructed systems
+        
+        Returns:
+            dict: All registered systems that have been constructed
+        """
+        return self._systems.copy()
+    
+    def get_all_systems(self) -> List[str]:
+        """Get the names of all registered systems, including ones not yet constructed
         
         Returns:
-            dict: All registered systems
+            list: System names in registration order
         """
-        return self._systems.copy()
\ No newline at end of file
+        return list(self._activation_status)
\ No newline at end of file
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The simulator uses flat imports, as when run from meta_simulator_v5/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,133 @@
+import asyncio
+
+import chess
+import chess.engine
+import pytest
+
+from engine_pool import EnginePool
+
+
+class Transport:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class DeadProtocol:
+    async def play(self, board, limit):
+        raise chess.engine.EngineTerminatedError("engine process died")
+
+
+def test_engine_that_cannot_be_replaced_leaves_the_pool():
+    async def scenario():
+        pool = EnginePool("engine", size=1, restart_timeout=0.01)
+        launches = []
+
+        async def launch():
+            launches.append(None)
+            if len(launches) > 1:
+                await asyncio.sleep(1)  # The replacement never finishes starting
+            return Transport(), DeadProtocol()
+
+        pool._launch = launch
+        await pool.start()
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.play(chess.Board(), chess.engine.Limit(depth=1))
+        return pool
+
+    pool = asyncio.run(scenario())
+
+    assert pool._engines == []
+    with pytest.raises(RuntimeError):
+        asyncio.run(pool.play(chess.Board(), chess.engine.Limit(depth=1)))
+
+
+def test_waiters_fail_when_the_last_engine_is_dropped():
+    async def scenario():
+        pool = EnginePool("engine", size=1, restart_timeout=0.01)
+        started = asyncio.Event()
+
+        class SlowDeadProtocol:
+            async def play(self, board, limit):
+                started.set()
+                await asyncio.sleep(0.01)
+                raise chess.engine.EngineTerminatedError("engine process died")
+
+        launches = []
+
+        async def launch():
+            launches.append(None)
+            if len(launches) > 1:
+                await asyncio.sleep(1)
+            return Transport(), SlowDeadProtocol()
+
+        pool._launch = launch
+        await pool.start()
+        first = asyncio.ensure_future(pool.play(chess.Board(), chess.engine.Limit(depth=1)))
+        await started.wait()
+        waiters = [pool.play(chess.Board(), chess.engine.Limit(depth=1)) for _ in range(3)]
+        return await asyncio.wait_for(asyncio.gather(first, *waiters, return_exceptions=True), 1)
+
+    results = asyncio.run(scenario())
+
+    assert isinstance(results[0], asyncio.TimeoutError)
+    assert all(isinstance(result, RuntimeError) for result in results[1:])
+
+
+class StuckProtocol:
+    async def play(self, board, limit):
+        await asyncio.sleep(1)
+
+    async def quit(self):
+        raise chess.engine.EngineError("quit failed")
+
+
+def test_close_fails_waiters_and_closes_transports():
+    transports = []
+
+    async def scenario():
+        pool = EnginePool("engine", size=1)
+
+        async def launch():
+            transports.append(Transport())
+            return transports[-1], StuckProtocol()
+
+        pool._launch = launch
+        await pool.start()
+        # Take the only engine, then queue a search behind it
+        pool._idle.get_nowait()
+        waiter = asyncio.ensure_future(pool.play(chess.Board(), chess.engine.Limit(depth=1)))
+        await asyncio.sleep(0)
+        await pool.close()
+        return await asyncio.wait_for(asyncio.gather(waiter, return_exceptions=True), 1)
+
+    results = asyncio.run(scenario())
+
+    assert isinstance(results[0], RuntimeError)
+    assert [transport.closed for transport in transports] == [True]
+
+
+def test_orchestrator_searches_at_the_chess_system_limit():
+    from match_orchestrator import MatchOrchestrator
+
+    limit = chess.engine.Limit(depth=3)
+    played = []
+
+    class ChessSystem:
+        def search_limit(self, character):
+            return limit
+
+    class Pool:
+        async def play(self, board, search, timer=None):
+            played.append(search)
+
+    class Simulator:
+        config = {}
+        registry = type("Registry", (), {"get": lambda self, name: ChessSystem()})()
+
+    orchestrator = MatchOrchestrator(Simulator(), Pool(), max_concurrent=1)
+    asyncio.run(orchestrator.select_move(chess.Board(), {"aFS": 9}, None))
+
+    assert played == [limit]
@@ -0,0 +1,52 @@
+import csv
+
+import pytest
+
+from data_loader import DataLoader
+from stamina_system import StaminaSystem
+
+STAMINA_TRAIT = {"id": "second_wind", "name": "Second Wind", "type": "stamina", "triggers": "round_end",
+                 "formula_key": "", "formula_expr": "", "bound_nbid": "", "stamina_cost": 0, "cooldown": 0,
+                 "description": "", "current_cooldown": 0,
+                 "effect_type": "decay_reduction", "effect_value": 0.5}
+
+ATTRIBUTES = ["aSTR", "aSPD", "aFS", "aLDR", "aDUR", "aRES", "aWIL"]
+
+
+def write_csv(path, fields, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    write_csv(tmp_path / "teams.csv", ["team_id", "team_name", "division", "coach_name", "home_court_advantage"],
+              [{"team_id": "t1", "team_name": "One", "division": "Undercurrent", "coach_name": "c",
+                "home_court_advantage": 0.1}])
+    write_csv(tmp_path / "divisions.csv", ["division_id", "division_name", "bonus_type", "bonus_value"],
+              [{"division_id": "d1", "division_name": "Undercurrent", "bonus_type": "none", "bonus_value": 0}])
+    write_csv(tmp_path / "players.csv", ["player_id", "name", "team_id", "role", "division", "base_HP"] + ATTRIBUTES,
+              [dict({"player_id": f"p{i}", "name": f"P{i}", "team_id": "t1", "role": "FL", "division": "u",
+                     "base_HP": 100}, **{attr: 5 for attr in ATTRIBUTES}) for i in range(8)])
+    write_csv(tmp_path / "player_traits.csv", ["player_id", "trait_ids"], [{"player_id": "p0", "trait_ids": "second_wind"}])
+    write_csv(tmp_path / "lineups_day1.csv", ["team_id", "player_ids"],
+              [{"team_id": "t1", "player_ids": ",".join(f"p{i}" for i in range(8))}])
+    return tmp_path
+
+
+def load_lineup(data_dir, use_snapshot):
+    loader = DataLoader({"paths.data_dir": str(data_dir), "data.use_roster_snapshot": use_snapshot})
+    loader._traits_cache = {"second_wind": STAMINA_TRAIT}
+    return loader.load_lineups(1)["t1"]
+
+
+@pytest.mark.parametrize("use_snapshot", [False, True])
+def test_loaded_stamina_traits_reduce_round_decay(data_dir, tmp_path, use_snapshot):
+    stamina = StaminaSystem({"paths.persistence_dir": str(tmp_path / "persistence")})
+    lineup = load_lineup(data_dir, use_snapshot)
+
+    assert [type(trait) for trait in lineup[0]["traits"]] == [dict]
+    full_decay = stamina._round_decay(lineup[1])
+    assert stamina._round_decay(lineup[0]) == pytest.approx(full_decay * 0.5)
@@ -0,0 +1,78 @@
+import itertools
+
+import numpy as np
+import pytest
+
+import match_scheduler
+from match_scheduler import MatchScheduler
+
+
+class League:
+    def __init__(self, data_dir, teams_per_division=10):
+        self.data_dir = str(data_dir)
+        self.teams = {}
+        for division, prefix in (("undercurrent", "u"), ("overlay", "o")):
+            for i in range(teams_per_division):
+                self.teams["{}{}".format(prefix, i)] = {"division": division}
+
+    def load_teams(self):
+        return self.teams
+
+    def load_players(self):
+        return {}
+
+
+@pytest.fixture
+def scheduler(tmp_path):
+    config = {"simulation.matches_per_day": 5, "simulation.weeks_per_season": 10,
+              "scheduling.table_path": str(tmp_path / "schedule_table.json")}
+    return MatchScheduler(config, League(tmp_path))
+
+
+def pairings_of(table):
+    return [tuple(sorted(pair)) for day in table.days.values() for pair in day]
+
+
+def test_season_covers_every_cross_division_pairing(scheduler):
+    table = scheduler.build_season(force=True)
+
+    pairings = pairings_of(table)
+    assert len(table) == 50
+    assert set(pairings) == {tuple(sorted(pair)) for pair in itertools.product(
+        ["u{}".format(i) for i in range(10)], ["o{}".format(i) for i in range(10)])}
+    assert set(scheduler.games_played.values()) == {25}
+    assert scheduler.rest_violations == 0
+
+
+def test_replanned_day_is_committed_and_saved(scheduler):
+    table = scheduler.build_season(force=True)
+    benched = table.get(1)[0][0]
+    lineups = {team_id: [{"is_active": True}] * 8 for team_id in scheduler.data_loader.teams if team_id != benched}
+
+    matchups = scheduler.schedule_matches(1, lineups)
+
+    assert benched not in itertools.chain.from_iterable(matchups)
+    assert benched not in scheduler.match_history[1]
+    assert sum(scheduler.games_played.values()) == 2 * len(pairings_of(table))
+    saved = match_scheduler.ScheduleTable.load(scheduler.table_path, table.signature)
+    assert saved.get(1) == matchups
+
+
+def test_fallback_assignment_rejects_rectangular_costs():
+    if match_scheduler.SCIPY_AVAILABLE:
+        pytest.skip("scipy solver in use")
+    with pytest.raises(ValueError):
+        match_scheduler.linear_sum_assignment(np.zeros((2, 3)))
+
+
+def test_scheduler_reads_typed_settings(tmp_path):
+    from config_manager import ConfigManager
+
+    config = ConfigManager()
+    config.set("simulation.matches_per_day", 7)
+    config.set("simulation.weeks_per_season", 2)
+    config.set("scheduling.table_path", str(tmp_path / "schedule_table.json"))
+    scheduler = MatchScheduler(config, League(tmp_path))
+
+    assert (scheduler.matches_per_day, scheduler.season_days) == (7, 14)
+    assert config.settings.simulation.vectorized_round_effects is False
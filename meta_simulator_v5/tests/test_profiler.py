@@ -0,0 +1,59 @@
+import os
+
+import pytest
+
+from profiler import ProfileSession
+
+
+class FakeSimulator:
+    config = {"simulation": {"rounds": 3}}
+
+    def simulate_match(self, team_a, team_b, day_number=1, match_number=1, show_details=True):
+        if team_a == "fail":
+            raise RuntimeError("match failed")
+        return {"match_id": f"day{day_number}_match{match_number}"}
+
+
+@pytest.mark.parametrize("mode", ["cprofile", "sample"])
+def test_range_writes_one_merged_profile_per_day(tmp_path, mode):
+    simulator = FakeSimulator()
+    session = ProfileSession(simulator, str(tmp_path), mode).install()
+    simulator.simulate_match([], [], 1, 1)
+    simulator.simulate_match([], [], 1, 2)
+    simulator.simulate_match([], [], day_number=2)
+
+    manifest = session.finish("days1-2", per_day=True)
+
+    assert [entry["day"] for entry in manifest["matches"]] == [1, 1, 2]
+    assert [day["day"] for day in manifest["days"]] == [1, 2]
+    artifact = "pstats" if mode == "cprofile" else "collapsed"
+    for day in manifest["days"]:
+        if artifact in day:
+            assert os.path.basename(day[artifact]).startswith(f"days1-2_day{day['day']}.")
+            assert os.path.exists(day[artifact])
+    if mode == "cprofile":
+        assert all("pstats" in day for day in manifest["days"])
+
+
+def test_single_workload_writes_no_per_day_profiles(tmp_path):
+    simulator = FakeSimulator()
+    session = ProfileSession(simulator, str(tmp_path)).install()
+    simulator.simulate_match([], [], 3)
+
+    manifest = session.finish("day3")
+
+    assert "days" not in manifest
+    assert os.path.exists(manifest["pstats"])
+    assert simulator.simulate_match.__name__ == "simulate_match"
+
+
+def test_failed_match_is_still_recorded(tmp_path):
+    simulator = FakeSimulator()
+    session = ProfileSession(simulator, str(tmp_path)).install()
+    with pytest.raises(RuntimeError):
+        simulator.simulate_match("fail", [], 4)
+
+    manifest = session.finish("day4", per_day=True)
+
+    assert manifest["matches"][0]["match_id"] == "match1_failed"
+    assert manifest["days"][0]["day"] == 4
@@ -0,0 +1,119 @@
+import asyncio
+import logging
+
+from match_orchestrator import MatchOrchestrator
+from match_replay import MatchRecording, SCRATCH_PATH_KEYS, load_snapshot, recorded_matchups, scratch_config
+from meta_simulator_5 import MetaLeagueSimulatorV5
+from phase_timer import PhaseTimer
+from tracing import Tracer
+
+
+class Scheduler:
+    def __init__(self):
+        self.calls = 0
+
+    def schedule_matches(self, day_number, lineups):
+        self.calls += 1
+        return [("t9", "t8")]
+
+
+class Loader:
+    def load_lineups(self, day_number):
+        return {"t1": [], "t2": [], "t3": [], "t4": []}
+
+
+class Registry:
+    def __init__(self, **systems):
+        self.systems = systems
+
+    def get(self, name):
+        return self.systems.get(name)
+
+
+def make_simulator(monkeypatch, scratch_dir=None):
+    simulator = object.__new__(MetaLeagueSimulatorV5)
+    simulator.scratch_dir = scratch_dir
+    simulator.logger = logging.getLogger("test")
+    simulator.tracer = Tracer(capacity=8)
+    simulator.config = {"simulation.matches_per_day": 1}
+    simulator.registry = Registry(data_loader=Loader(), match_scheduler=Scheduler())
+    simulator.played = []
+
+    def match_steps(team_a, team_b, day_number, match_number, show_details, seed=None):
+        simulator.played.append((day_number, match_number, seed))
+        return {"winning_team": "t1"}
+        yield
+
+    monkeypatch.setattr(simulator, "match_steps", match_steps)
+    monkeypatch.setattr(simulator, "_finish_day", lambda day_number, results, lineups: {"matches": results})
+    return simulator
+
+
+RECORDINGS = {
+    "day1_match2_t3_vs_t4": MatchRecording("day1_match2_t3_vs_t4", 8),
+    "day1_match1_t1_vs_t2": MatchRecording("day1_match1_t1_vs_t2", 7),
+    "day2_match1_t1_vs_t3": MatchRecording("day2_match1_t1_vs_t3", 9)
+}
+
+
+def test_recorded_matchups_are_in_match_order():
+    assert recorded_matchups(RECORDINGS, 1) == [("t1", "t2"), ("t3", "t4")]
+    assert recorded_matchups(RECORDINGS, 3) == []
+
+
+def test_scratch_config_moves_every_output(tmp_path):
+    config = scratch_config({"paths": {"data_dir": "data", "pgn_dir": "results/pgn"}}, str(tmp_path))
+
+    assert config["paths"]["data_dir"] == "data"
+    for key in SCRATCH_PATH_KEYS:
+        assert config["paths"][key].startswith(str(tmp_path))
+    assert config["scheduling"]["table_path"].startswith(str(tmp_path))
+
+
+def test_snapshot_is_copied_into_scratch_persistence(tmp_path):
+    snapshot = tmp_path / "snapshot"
+    snapshot.mkdir()
+    (snapshot / "stamina_data.json").write_text("{}")
+
+    load_snapshot(str(snapshot), str(tmp_path / "scratch" / "persistence"))
+
+    assert (tmp_path / "scratch" / "persistence" / "stamina_data.json").exists()
+
+
+def test_live_simulator_replays_on_a_scratch_simulator(monkeypatch, tmp_path):
+    live = make_simulator(monkeypatch)
+    scratch = make_simulator(monkeypatch, str(tmp_path))
+    requested = []
+
+    def replay_simulator(scratch_dir=None, snapshot_dir=None):
+        requested.append((scratch_dir, snapshot_dir))
+        return scratch
+
+    monkeypatch.setattr(live, "replay_simulator", replay_simulator)
+
+    days = live.replay_days(1, 2, RECORDINGS, snapshot_dir="snapshot")
+
+    assert requested == [(None, "snapshot")]
+    assert live.played == []
+    assert scratch.played == [(1, 1, 7), (1, 2, 8), (2, 1, 9)]
+    assert [len(day["matches"]) for day in days.values()] == [2, 1]
+    assert scratch.registry.get("match_scheduler").calls == 0
+
+
+def test_interleaved_matches_are_not_seeded():
+    calls = []
+
+    class Simulator:
+        phase_timer = PhaseTimer(False)
+        config = {}
+        registry = Registry()
+
+        def match_steps(self, *args, **kwargs):
+            calls.append(kwargs)
+            return {"winning_team": "t1"}
+            yield
+
+    orchestrator = MatchOrchestrator(Simulator(), engine_pool=None, max_concurrent=1)
+    asyncio.run(orchestrator.simulate_match([], []))
+
+    assert calls == [{"seeded": False}]
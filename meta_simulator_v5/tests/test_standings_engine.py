@@ -0,0 +1,60 @@
+from standings_engine import StandingsEngine
+
+
+class Config(dict):
+    def get(self, key, default=None):
+        return super().get(key, default)
+
+
+def test_character_totals_accumulate_and_rank():
+    engine = StandingsEngine(Config())
+    engine.record_character_results([
+        {"character_id": "c1", "team_id": "t1", "rStats": {"rDD": 5, "rOTD": 0}},
+        {"character_id": "c2", "team_id": "t2", "rStats": {"rDD": 7}},
+    ])
+    engine.record_character_results([{"character_id": "c1", "team_id": "t1", "rStats": {"rDD": 4}}])
+
+    top = engine.get_top_performers("DD")
+    assert [(p["id"], p["value"]) for p in top] == [("c1", 9.0), ("c2", 7.0)]
+    assert engine.get_top_performers("OTD") == []
+    assert engine.export_state()["character_totals"] == {"c1": {"rDD": 9.0}, "c2": {"rDD": 7.0}}
+
+
+def _match(team_a, team_b, result):
+    return {"team_a_id": team_a, "team_b_id": team_b, "team_a_division": "north",
+            "team_b_division": "north", "team_a_wins": 5 if result == "win" else 3,
+            "team_b_wins": 3 if result == "win" else 5, "result": result}
+
+
+class Registry:
+    def __init__(self, engine):
+        self.engine = engine
+
+    def get(self, name):
+        return self.engine if name == "standings_engine" else None
+
+
+def test_season_summary_covers_only_the_seasons_matches():
+    import logging
+    from meta_simulator_5 import MetaLeagueSimulatorV5
+
+    engine = StandingsEngine(Config())
+    engine.record_match(_match("t1", "t2", "win"))  # played before the season
+
+    simulator = object.__new__(MetaLeagueSimulatorV5)
+    simulator.registry = Registry(engine)
+    simulator.logger = logging.getLogger("test")
+    simulator._scoped_standings = {}
+
+    with simulator._standings_scope("season") as season:
+        with simulator._standings_scope("week") as week:
+            for scoped in simulator._scoped_standings.values():
+                scoped.record_match(_match("t2", "t1", "win"))
+    assert simulator._scoped_standings == {}
+
+    week_summary = simulator._generate_week_summary(1, [], week)
+    season_summary = simulator._generate_season_summary([week_summary], season)
+
+    for summary in (week_summary, season_summary):
+        assert [(team_id, record["wins"]) for team_id, record in summary["standings"]] == [("t2", 1), ("t1", 0)]
+    assert engine.records["t1"]["wins"] == 1
@@ -0,0 +1,9 @@
+from startup_benchmark import DEFAULT_MODULES, DEFAULT_BUDGET_MS, check_startup
+
+
+def test_startup_within_budget_without_heavy_imports():
+    passed, summaries = check_startup(DEFAULT_MODULES, DEFAULT_BUDGET_MS)
+
+    failures = {summary["module"]: (round(summary["total_ms"], 1), summary["deferred_loaded"])
+                for summary in summaries if not summary["passed"]}
+    assert passed, f"startup budget exceeded or heavy modules loaded: {failures}"
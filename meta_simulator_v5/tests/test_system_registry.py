@@ -0,0 +1,79 @@
+import pytest
+
+from system_base import SystemBase
+from system_registry import SystemRegistry
+
+
+class Dummy(SystemBase):
+    config = {}
+
+    def __init__(self):
+        super().__init__("dummy", None)
+
+    def activate(self):
+        self.active = True
+        return True
+
+
+def test_lazy_system_is_built_on_first_get():
+    registry = SystemRegistry()
+    built = []
+    registry.register_lazy("dummy", lambda: built.append(1) or Dummy())
+
+    assert not registry.is_loaded("dummy")
+    system = registry.get("dummy")
+
+    assert registry.get("dummy") is system
+    assert built == [1]
+
+
+def test_failed_factory_raises_with_the_system_name():
+    registry = SystemRegistry()
+
+    def factory():
+        raise ImportError("no module named broken")
+
+    registry.register_lazy("broken", factory)
+    registry.activate("broken")
+
+    with pytest.raises(RuntimeError, match="broken") as error:
+        registry.get("broken")
+    assert isinstance(error.value.__cause__, ImportError)
+
+    # Still registered, so it keeps failing instead of turning into a missing system
+    with pytest.raises(RuntimeError):
+        registry.get("broken")
+
+
+class Worker(SystemBase):
+    def __init__(self):
+        super().__init__("worker", None)
+
+    def work(self):
+        return 42
+
+
+def test_system_calls_are_not_timed_by_default():
+    registry = SystemRegistry()
+    worker = registry.register("worker", Worker())
+
+    assert "work" not in vars(worker)
+
+
+def test_system_calls_are_timed_on_the_current_timer():
+    from phase_timer import PhaseTimer
+
+    registry = SystemRegistry()
+    registry.enable_timing()
+    worker = registry.register("worker", Worker())
+    first, second = PhaseTimer(), PhaseTimer()
+
+    assert worker.work() == 42  # no match running: not recorded anywhere
+    registry.timer = first
+    worker.work()
+    registry.timer = second
+    worker.work()
+    worker.work()
+
+    assert first.snapshot()["system.worker.work"]["count"] == 1
+    assert second.snapshot()["system.worker.work"]["count"] == 2
@@ -0,0 +1,18 @@
+import tracing
+from tracing import TRACE_MOVE, Tracer
+
+
+def test_full_string_table_is_counted_and_reset_by_clear(monkeypatch):
+    monkeypatch.setattr(tracing, "MAX_STRINGS", 4)
+    tracer = Tracer(capacity=8)
+
+    tracer.record(TRACE_MOVE, "move", "c1", "e2e4")
+    tracer.record(TRACE_MOVE, "move", "c2", "d2d4")
+
+    assert tracer.dump()[-1]["args"] == ["c2"]
+    assert tracer.export_state()["strings_dropped"] == 1
+
+    tracer.clear()
+    tracer.record(TRACE_MOVE, "move", "c2", "d2d4")
+    assert tracer.dump()[-1]["args"] == ["c2", "d2d4"]
+    assert tracer.strings_dropped == 0
@@ -0,0 +1,230 @@
+"""
+Structured Tracing for META League Simulator v5.0
+Fixed-size binary ring buffer of hot-path records, filtered by per-category masks
+and sampling rates before anything is formatted
+
+Usage in a hot path:
+    tracer = get_tracer()
+    if tracer.mask & TRACE_DAMAGE:
+        tracer.record(TRACE_DAMAGE, "damage", attacker_id, target_id, method, board_id, amount, final)
+"""
+
+import time
+import struct
+import logging
+from typing import Dict, List, Any, Optional
+
+# Categories (bit flags)
+TRACE_MATCH = 1 << 0
+TRACE_ROUND = 1 << 1
+TRACE_MOVE = 1 << 2
+TRACE_DAMAGE = 1 << 3
+TRACE_TRAIT = 1 << 4
+TRACE_CONVERGENCE = 1 << 5
+
+CATEGORIES = {
+    "match": TRACE_MATCH,
+    "round": TRACE_ROUND,
+    "move": TRACE_MOVE,
+    "damage": TRACE_DAMAGE,
+    "trait": TRACE_TRAIT,
+    "convergence": TRACE_CONVERGENCE
+}
+CATEGORY_NAMES = {bit: name for name, bit in CATEGORIES.items()}
+TRACE_ALL = sum(CATEGORIES.values())
+
+# Record layout: ns since tracer start, category, event, four string refs, two values
+RECORD = struct.Struct("<qHHiiiidd")
+
+DEFAULT_CAPACITY = 16384
+MAX_STRINGS = 65535
+
+# String slot value for "no string"
+NO_STRING = -1
+
+
+class Tracer:
+    """
+    Ring buffer of fixed-size binary trace records
+    Strings (event names, character/trait ids, moves) are stored once in a string
+    table and referenced by index, so recording never formats text
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, mask: int = TRACE_ALL,
+                 sample_rates: Optional[Dict[int, float]] = None):
+        """Create a tracer
+
+        Args:
+            capacity: Number of records kept (older records are overwritten)
+            mask: Enabled categories; callers test `tracer.mask & CATEGORY` before recording
+            sample_rates: Fraction of records kept per category (default 1.0)
+        """
+        self.configure(capacity, mask, sample_rates)
+
+    def configure(self, capacity: int = DEFAULT_CAPACITY, mask: int = TRACE_ALL,
+                  sample_rates: Optional[Dict[int, float]] = None) -> None:
+        """Reset the buffer with new settings (systems holding this tracer see the change)"""
+        self.capacity = max(1, int(capacity))
+        self._buffer = bytearray(RECORD.size * self.capacity)
+        self._count = 0
+        self._start_ns = time.perf_counter_ns()
+
+        self._reset_strings()
+
+        self.mask = mask
+        self._sample_every: Dict[int, int] = {}
+        self._sample_counts: Dict[int, int] = {}
+        for category, rate in (sample_rates or {}).items():
+            self.set_sample_rate(category, rate)
+
+    def _reset_strings(self) -> None:
+        self._strings: List[str] = []
+        self._string_index: Dict[str, int] = {}
+        # References left empty because the string table was full
+        self.strings_dropped = 0
+
+    def set_sample_rate(self, category: int, rate: float) -> None:
+        """Keep roughly `rate` of the records in a category (every Nth record; 0 disables it)"""
+        if rate <= 0:
+            self.mask &= ~category
+            self._sample_every.pop(category, None)
+            return
+        every = max(1, round(1.0 / min(rate, 1.0)))
+        if every == 1:
+            self._sample_every.pop(category, None)
+        else:
+            self._sample_every[category] = every
+            self._sample_counts[category] = 0
+
+    def _ref(self, value: Any) -> int:
+        """Index of a string in the string table, adding it on first use"""
+        if value is None:
+            return NO_STRING
+        if not isinstance(value, str):
+            value = str(value)
+        index = self._string_index.get(value)
+        if index is None:
+            if len(self._strings) >= MAX_STRINGS:
+                if not self.strings_dropped:
+                    logging.getLogger("META_SIMULATOR").warning(
+                        f"Trace string table full ({MAX_STRINGS}); new strings are recorded as empty until cleared")
+                self.strings_dropped += 1
+                return NO_STRING
+            index = len(self._strings)
+            self._strings.append(value)
+            self._string_index[value] = index
+        return index
+
+    def record(self, category: int, event: str, s0: Any = None, s1: Any = None,
+               s2: Any = None, s3: Any = None, v0: float = 0.0, v1: float = 0.0) -> None:
+        """Write one record; the caller has already checked the category mask"""
+        every = self._sample_every.get(category)
+        if every is not None:
+            count = self._sample_counts[category] + 1
+            self._sample_counts[category] = count
+            if count % every:
+                return
+
+        ref = self._ref
+        RECORD.pack_into(
+            self._buffer, (self._count % self.capacity) * RECORD.size,
+            time.perf_counter_ns() - self._start_ns, category, ref(event),
+            ref(s0), ref(s1), ref(s2), ref(s3), v0, v1
+        )
+        self._count += 1
+
+    def __len__(self) -> int:
+        """Number of records currently held"""
+        return min(self._count, self.capacity)
+
+    @property
+    def dropped(self) -> int:
+        """Records overwritten since the tracer was created or cleared"""
+        return max(0, self._count - self.capacity)
+
+    def clear(self) -> None:
+        """Forget all records and the string table they referenced"""
+        self._count = 0
+        self._reset_strings()
+
+    def dump(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Decode the buffered records, oldest first
+
+        Args:
+            limit: Only decode the most recent `limit` records
+
+        Returns:
+            List of record dicts
+        """
+        held = len(self)
+        if limit is not None:
+            held = min(held, limit)
+
+        strings = self._strings
+
+        def lookup(index):
+            return strings[index] if index != NO_STRING else None
+
+        records = []
+        for position in range(self._count - held, self._count):
+            ts, category, event, s0, s1, s2, s3, v0, v1 = RECORD.unpack_from(
+                self._buffer, (position % self.capacity) * RECORD.size)
+            records.append({
+                "t_ms": ts / 1e6,
+                "category": CATEGORY_NAMES.get(category, category),
+                "event": lookup(event),
+                "args": [lookup(s) for s in (s0, s1, s2, s3) if s != NO_STRING],
+                "values": [v0, v1]
+            })
+        return records
+
+    def export_state(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Summary plus decoded records, for error dumps"""
+        return {
+            "capacity": self.capacity,
+            "recorded": self._count,
+            "dropped": self.dropped,
+            "strings": len(self._strings),
+            "strings_dropped": self.strings_dropped,
+            "enabled": [name for name, bit in CATEGORIES.items() if self.mask & bit],
+            "records": self.dump(limit)
+        }
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer"""
+    return _tracer
+
+
+def configure_tracing(settings: Optional[Dict[str, Any]] = None) -> Tracer:
+    """Configure the process-wide tracer from a `tracing` config section
+
+    Config keys:
+        enabled: Master switch (default true)
+        categories: Category names to record (default all)
+        buffer_size: Ring buffer capacity in records
+        sample_rates: {category name: fraction of records kept}
+    """
+    settings = settings or {}
+    logger = logging.getLogger("META_SIMULATOR")
+
+    mask = 0
+    if settings.get("enabled", True):
+        for name in settings.get("categories", list(CATEGORIES)):
+            if name in CATEGORIES:
+                mask |= CATEGORIES[name]
+            else:
+                logger.warning(f"Unknown trace category: {name}")
+
+    sample_rates = {}
+    for name, rate in settings.get("sample_rates", {}).items():
+        if name in CATEGORIES:
+            sample_rates[CATEGORIES[name]] = float(rate)
+        else:
+            logger.warning(f"Unknown trace category in sample_rates: {name}")
+
+    _tracer.configure(settings.get("buffer_size", DEFAULT_CAPACITY), mask, sample_rates)
+    return _tracer
@@ -5,10 +5,11 @@ from typing import Dict
 from rstat_validator import validate_rstats
 
 
-def log_rstats(unit: dict, convergence: dict, material_loss: int) -> Dict[str, int]:
+def log_rstats(unit: dict, convergence: dict, material_loss: int, accumulator=None) -> Dict[str, int]:
     """
     Determines rStat outputs based on convergence result and material loss.
     Returns a dict of rStat name → value, validated against role division.
+    When an RStatsAccumulator is given, the validated stats are also added to the unit's row.
     """
     raw_rstats = {}
     outcome = convergence.get("outcome", "none")
@@ -29,7 +30,11 @@ def log_rstats(unit: dict, convergence: dict, material_loss: int) -> Dict[str, i
     if material_loss >= 12:
         raw_rstats["rMBi"] = 1
 
-    return validate_rstats(unit, raw_rstats)
+    rstats = validate_rstats(unit, raw_rstats)
+    if accumulator is not None:
+        accumulator.register(unit)
+        accumulator.update_many(unit.get("id", "unknown"), rstats)
+    return rstats
 
 
 # Example usage
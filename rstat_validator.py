@@ -25,15 +25,18 @@ def get_allowed_rstats(role_division: str) -> set:
 def validate_rstats(unit: dict, rstats: Dict[str, int]) -> Dict[str, int]:
     """
     Filters rStats to only include valid, canonical codes for the unit's division.
+    Uses the accumulator's per-division code table, so each stat is one dict lookup.
     """
+    from rstats_accumulator import CANONICAL_CODES  # imports this module for CANONICAL_RSTATS
+
     division = unit.get("division", "b")  # assume fallback to 'both'
-    allowed = get_allowed_rstats(division)
+    codes = CANONICAL_CODES.get(division, CANONICAL_CODES["b"])
 
     validated = {}
     for stat, val in rstats.items():
-        stat_clean = stat.replace("r", "", 1) if stat.startswith("r") else stat
-        if stat_clean in allowed:
-            validated[f"r{stat_clean}"] = val
+        code = codes.get(stat)
+        if code is not None:
+            validated[code] = val
     return validated
 
 
@@ -0,0 +1,405 @@
+# rstats_accumulator.py
+# Array-backed rStats store: one row per character, one column per canonical stat code
+
+import csv
+import json
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from meta_integrity_engine import REQUIRED_RSTATS
+from rstat_validator import CANONICAL_RSTATS
+from rstats_constants import CHARACTER_STATS, EVENT_TO_STAT_MAP
+
+# Column layout: canonical rStats first, then the long-form character stats
+STAT_COLUMNS: List[str] = list(REQUIRED_RSTATS) + list(CHARACTER_STATS)
+
+DIVISIONS = ("o", "i", "b")
+
+
+def _build_code_map(columns: List[str], domains: Dict[str, str]) -> Dict[str, int]:
+    """
+    Maps every accepted spelling of a stat code to its column.
+    Both 'rDD' and 'DD' resolve to the same column so callers never strip or re-add prefixes.
+    """
+    code_map = {}
+    for col, code in enumerate(columns):
+        code_map[code] = col
+        if code in domains and code.startswith("r"):
+            code_map.setdefault(code[1:], col)
+    return code_map
+
+
+def _column_mask(code: str, domains: Dict[str, str], fixed: bool) -> List[bool]:
+    """
+    Allowed divisions of one column, in DIVISIONS order.
+    Coded stats follow their domain; other layout columns (long-form stats) are valid for every
+    division, and columns opened on first write are valid for none.
+    """
+    domain = domains.get(code)
+    if domain is None:
+        return [fixed] * len(DIVISIONS)
+    return [domain == "b" or domain == division or division == "b" for division in DIVISIONS]
+
+
+def _build_division_masks(columns: List[str], domains: Dict[str, str]) -> np.ndarray:
+    """
+    Returns a (3, n_columns) bool matrix; row k is the allowed-column mask for DIVISIONS[k].
+    """
+    masks = np.ones((len(DIVISIONS), len(columns)), dtype=bool)
+    for col, code in enumerate(columns):
+        masks[:, col] = _column_mask(code, domains, True)
+    return masks
+
+
+# Canonical rStats are stored with the 'r' prefix, e.g. "rDD": "b"
+STAT_DOMAINS: Dict[str, str] = {code: CANONICAL_RSTATS.get(code[1:], "b") for code in REQUIRED_RSTATS}
+
+CODE_TO_COLUMN: Dict[str, int] = _build_code_map(STAT_COLUMNS, STAT_DOMAINS)
+EVENT_TO_COLUMN: Dict[str, int] = {event: CODE_TO_COLUMN[stat] for event, stat in EVENT_TO_STAT_MAP.items()}
+DIVISION_INDEX: Dict[str, int] = {division: k for k, division in enumerate(DIVISIONS)}
+DIVISION_MASKS: np.ndarray = _build_division_masks(STAT_COLUMNS, STAT_DOMAINS)
+
+# Accepted spelling -> stored code, per division, for canonical rStats only (see rstat_validator)
+CANONICAL_CODES: Dict[str, Dict[str, str]] = {
+    division: {spelling: STAT_COLUMNS[col] for spelling, col in CODE_TO_COLUMN.items()
+               if STAT_COLUMNS[col] in STAT_DOMAINS and STAT_DOMAINS[STAT_COLUMNS[col]] in ("b", division)}
+    for division in DIVISIONS
+}
+
+META_FIELDS = ["unit_id", "name", "division", "role", "team_id"]
+
+
+class RStatsAccumulator:
+    """
+    Accumulates rStats for many characters in a single float matrix.
+    Writes are a dict lookup plus one array store; validation and export work on the whole matrix.
+
+    The default layout is the canonical rStats plus the long-form character stats. Trackers with
+    their own stat lists pass columns and domains; with open_columns, a code outside the layout
+    gets a new column on first write instead of raising KeyError.
+    """
+
+    def __init__(self, capacity: int = 64, columns: Optional[List[str]] = None,
+                 domains: Optional[Dict[str, str]] = None, open_columns: bool = False):
+        if columns is None:
+            columns, domains = STAT_COLUMNS, STAT_DOMAINS
+        self.columns: List[str] = list(columns)
+        self._domains = dict(domains or {})
+        self._code_map = _build_code_map(self.columns, self._domains)
+        self._masks = _build_division_masks(self.columns, self._domains)
+        self.open_columns = open_columns
+        self._data = np.zeros((max(capacity, 1), len(self.columns)), dtype=np.float64)
+        self._division = np.full(self._data.shape[0], DIVISION_INDEX["b"], dtype=np.int8)
+        self._rows: Dict[str, int] = {}
+        self._meta: List[Dict[str, str]] = []
+
+    # ---- LAYOUT ----
+
+    def column(self, code: str) -> int:
+        """
+        Column of a stat code. Raises KeyError for codes outside the layout unless columns are open.
+        """
+        col = self._code_map.get(code)
+        if col is None:
+            if not self.open_columns:
+                raise KeyError(code)
+            col = self._add_column(code)
+        return col
+
+    def _add_column(self, code: str) -> int:
+        col = len(self.columns)
+        self.columns.append(code)
+        self._code_map[code] = col
+        self._data = np.concatenate([self._data, np.zeros((self._data.shape[0], 1))], axis=1)
+        mask = np.array(_column_mask(code, self._domains, False), dtype=bool).reshape(-1, 1)
+        self._masks = np.concatenate([self._masks, mask], axis=1)
+        return col
+
+    # ---- ROWS ----
+
+    def register(self, character: dict) -> int:
+        """
+        Registers a character (idempotent) and returns its row index.
+        """
+        char_id = character.get("id", "unknown")
+        row = self._rows.get(char_id)
+        if row is not None:
+            return row
+
+        row = len(self._meta)
+        if row == self._data.shape[0]:
+            self._grow()
+
+        division = character.get("division", "b")
+        self._division[row] = DIVISION_INDEX.get(division, DIVISION_INDEX["b"])
+        self._rows[char_id] = row
+        self._meta.append({
+            "unit_id": char_id,
+            "name": character.get("name", "Unknown"),
+            "division": division,
+            "role": character.get("role", ""),
+            "team_id": character.get("team_id", ""),
+        })
+
+        # Seed from any rStats the character already carries
+        for code, value in character.get("rStats", {}).items():
+            col = self._code_map.get(code)
+            if col is not None:
+                self._data[row, col] = value
+        return row
+
+    def _grow(self) -> None:
+        size = self._data.shape[0]
+        self._data = np.concatenate([self._data, np.zeros_like(self._data)])
+        self._division = np.concatenate([self._division, np.full(size, DIVISION_INDEX["b"], dtype=np.int8)])
+
+    def row_of(self, char_id: str) -> Optional[int]:
+        return self._rows.get(char_id)
+
+    def __len__(self) -> int:
+        return len(self._meta)
+
+    def __contains__(self, char_id: str) -> bool:
+        return char_id in self._rows
+
+    # ---- WRITES ----
+
+    def add_at(self, row: int, col: int, value: float = 1) -> None:
+        """
+        Hot-path increment when the caller has already resolved row and column.
+        """
+        self._data[row, col] += value
+
+    def apply_at(self, row: int, col: int, value: float, operation: str = "add") -> float:
+        """
+        Applies an 'add', 'set' or 'max' write to a resolved cell and returns the new value.
+        """
+        data = self._data
+        if operation == "add":
+            data[row, col] += value
+        elif operation == "set":
+            data[row, col] = value
+        elif operation == "max":
+            if value > data[row, col]:
+                data[row, col] = value
+        else:
+            raise ValueError(f"Unknown operation: {operation}")
+        return float(data[row, col])
+
+    def update(self, char_id: str, code: str, value: float = 1, operation: str = "add") -> None:
+        """
+        Updates one stat. Accepts 'rDD', 'DD' or a long-form code such as 'DAMAGE_DEALT'.
+        Raises KeyError for unregistered characters or codes outside the layout.
+        """
+        self.apply_at(self._rows[char_id], self.column(code), value, operation)
+
+    def update_many(self, char_id: str, stats: Dict[str, float], operation: str = "add") -> int:
+        """
+        Applies every stat of a dict to one row; codes outside a closed layout are skipped.
+        Returns the number of stats written.
+        """
+        row = self._rows[char_id]
+        written = 0
+        for code, value in stats.items():
+            col = self._code_map.get(code)
+            if col is None:
+                if not self.open_columns:
+                    continue
+                col = self._add_column(code)
+            self.apply_at(row, col, value, operation)
+            written += 1
+        return written
+
+    def record_event(self, char_id: str, event_type: str, value: float = 1) -> bool:
+        """
+        Applies an EVENT_TO_STAT_MAP event. Returns False for unmapped events.
+        """
+        stat = EVENT_TO_STAT_MAP.get(event_type)
+        col = self._code_map.get(stat) if stat is not None else None
+        if col is None:
+            return False
+        self._data[self._rows[char_id], col] += value
+        return True
+
+    def add_batch(self, rows: np.ndarray, cols: np.ndarray, values: np.ndarray) -> None:
+        """
+        Scatter-adds many (row, col, value) triples at once; repeated pairs accumulate.
+        """
+        np.add.at(self._data, (rows, cols), values)
+
+    def reset(self) -> None:
+        self._data[:len(self._meta)] = 0
+
+    # ---- READS ----
+
+    def get(self, char_id: str, code: str, default: float = 0) -> float:
+        row = self._rows.get(char_id)
+        col = self._code_map.get(code)
+        if row is None or col is None:
+            return default
+        return float(self._data[row, col])
+
+    def matrix(self) -> np.ndarray:
+        """
+        Read-only view of the populated rows.
+        """
+        view = self._data[:len(self._meta)]
+        view.flags.writeable = False
+        return view
+
+    def column_totals(self) -> Dict[str, float]:
+        totals = self._data[:len(self._meta)].sum(axis=0)
+        return dict(zip(self.columns, totals.tolist()))
+
+    def as_dict(self, char_id: str, include_zero: bool = False) -> Dict[str, float]:
+        """
+        Plain dict of a character's stats, for callers that expect character["rStats"].
+        """
+        values = self._data[self._rows[char_id]]
+        if include_zero:
+            return dict(zip(self.columns, values.tolist()))
+        cols = np.flatnonzero(values)
+        return {self.columns[c]: float(values[c]) for c in cols}
+
+    def view(self, char_id: str) -> "RStatsView":
+        """
+        Live mapping over a character's row; writes go straight to the matrix.
+        """
+        return RStatsView(self, self._rows[char_id])
+
+    # ---- VALIDATION ----
+
+    def _allowed(self) -> np.ndarray:
+        return self._masks[self._division[:len(self._meta)]]
+
+    def invalid_entries(self) -> Dict[str, List[str]]:
+        """
+        Returns {char_id: [codes]} for non-zero stats not allowed for the character's division.
+        """
+        n = len(self._meta)
+        bad = (self._data[:n] != 0) & ~self._allowed()
+        report = {}
+        for row in np.flatnonzero(bad.any(axis=1)):
+            report[self._meta[row]["unit_id"]] = [self.columns[c] for c in np.flatnonzero(bad[row])]
+        return report
+
+    def validate(self, char_id: Optional[str] = None) -> int:
+        """
+        Zeroes every stat not allowed for its row's division (one character's row when given).
+        Returns the number of cleared entries.
+        """
+        if char_id is not None:
+            row = self._rows[char_id]
+            allowed = self._masks[self._division[row]]
+            cleared = int(np.count_nonzero(self._data[row][~allowed]))
+            self._data[row][~allowed] = 0
+            return cleared
+        n = len(self._meta)
+        allowed = self._allowed()
+        cleared = int(np.count_nonzero(self._data[:n][~allowed]))
+        self._data[:n][~allowed] = 0
+        return cleared
+
+    # ---- EXPORT ----
+
+    def export_csv(self, path: str, include_meta: bool = True, skip_zero_columns: bool = False) -> str:
+        """
+        Writes one row per character; skip_zero_columns leaves out stats nobody has recorded.
+        """
+        n = len(self._meta)
+        data = self._data[:n]
+        cols = np.flatnonzero(data.any(axis=0)) if skip_zero_columns else np.arange(len(self.columns))
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            fields = META_FIELDS if include_meta else ["unit_id"]
+            writer.writerow(fields + [self.columns[c] for c in cols])
+            meta_cols = [[m[field] for field in fields] for m in self._meta]
+            writer.writerows(meta + values for meta, values in zip(meta_cols, data[:, cols].tolist()))
+        return path
+
+    def to_json_dict(self, include_zero: bool = False) -> Dict[str, Dict]:
+        n = len(self._meta)
+        rows = self._data[:n].tolist()
+        out = {}
+        for meta, values in zip(self._meta, rows):
+            stats = dict(zip(self.columns, values))
+            if not include_zero:
+                stats = {code: value for code, value in stats.items() if value}
+            out[meta["unit_id"]] = {**meta, "rStats": stats}
+        return out
+
+    def export_json(self, path: str, include_zero: bool = False) -> str:
+        with open(path, "w") as f:
+            json.dump(self.to_json_dict(include_zero), f, indent=2)
+        return path
+
+
+class RStatsView(MutableMapping):
+    """
+    Dict-like window onto one accumulator row, so legacy code can keep doing
+    character["rStats"]["rDD"] += n. Like a defaultdict, a code in the layout that was
+    never written reads as 0.0 (through [] and get alike); iteration, len and `in` cover
+    non-zero stats only.
+    """
+
+    __slots__ = ("_acc", "_row")
+
+    def __init__(self, accumulator: RStatsAccumulator, row: int):
+        self._acc = accumulator
+        self._row = row
+
+    def __getitem__(self, code: str) -> float:
+        return float(self._acc._data[self._row, self._acc._code_map[code]])
+
+    def __contains__(self, code) -> bool:
+        col = self._acc._code_map.get(code)
+        return col is not None and self._acc._data[self._row, col] != 0
+
+    def get(self, code: str, default=None):
+        col = self._acc._code_map.get(code)
+        if col is None:
+            return default
+        return float(self._acc._data[self._row, col])
+
+    def __setitem__(self, code: str, value: float) -> None:
+        self._acc._data[self._row, self._acc.column(code)] = value
+
+    def __delitem__(self, code: str) -> None:
+        self._acc._data[self._row, self._acc._code_map[code]] = 0
+
+    def __iter__(self) -> Iterator[str]:
+        values = self._acc._data[self._row]
+        columns = self._acc.columns
+        return (columns[c] for c in np.flatnonzero(values))
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._acc._data[self._row]))
+
+    def canonical(self) -> Dict[str, float]:
+        """
+        Every canonical rStat of the row, zeros included (the layout lists them first).
+        """
+        n = len(REQUIRED_RSTATS)
+        return dict(zip(self._acc.columns[:n], self._acc._data[self._row, :n].tolist()))
+
+    def __repr__(self) -> str:
+        return f"RStatsView({dict(self)})"
+
+
+# Example usage
+if __name__ == "__main__":
+    acc = RStatsAccumulator()
+    acc.register({"id": "U01", "name": "Ops Unit", "division": "o"})
+    acc.register({"id": "U02", "name": "Intel Unit", "division": "i"})
+
+    acc.update("U01", "DD", 12)
+    acc.update("U01", "rBRXo", 1)
+    acc.update("U02", "rBRXo", 1)  # illegal for intel
+    acc.record_event("U02", "damage_taken", 7)
+
+    print("Invalid before validation:", acc.invalid_entries())
+    print("Cleared:", acc.validate())
+    print("U01:", acc.as_dict("U01"))
+    print("U02:", dict(acc.view("U02")))
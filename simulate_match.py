@@ -4,7 +4,7 @@
 from life_state_scaffold import inject_life_meter, is_unit_dead
 from checkMeta_core_engine import evaluate_post_match
 from material_loss_engine import calculate_material_loss
-from convergence_trait_engine import evaluate_convergence
+from convergence_trait_engine import evaluate_convergences
 from rstat_logger import log_rstats
 
 SAMPLE_PGN = """
@@ -20,24 +20,27 @@ SAMPLE_PGN = """
 """
 
 
-def simulate_match(match: dict, pgn_text: str = SAMPLE_PGN) -> dict:
+def simulate_match(match: dict, pgn_text: str = SAMPLE_PGN, accumulator=None, rng=None) -> dict:
     """
     Simulates a match:
     - Injects full life status
     - Calculates material loss
     - Triggers convergence and trait effects
     - Applies post-match consequences
-    - Logs result stats (rStats)
+    - Logs result stats (rStats), into the RStatsAccumulator when one is given
+    Convergence rolls use `rng` (a numpy Generator, e.g. seeded with the match seed),
+    else the dice engine's shared generator.
     """
     white = inject_life_meter(match["white"])
     black = inject_life_meter(match["black"])
 
     material_loss = calculate_material_loss(pgn_text)
-    white_convergence = evaluate_convergence(white, material_loss["white_loss"])
-    black_convergence = evaluate_convergence(black, material_loss["black_loss"])
+    white_convergence, black_convergence = evaluate_convergences(
+        [white, black], [material_loss["white_loss"], material_loss["black_loss"]], rng
+    )
 
-    white_rstats = log_rstats(white, white_convergence, material_loss["white_loss"])
-    black_rstats = log_rstats(black, black_convergence, material_loss["black_loss"])
+    white_rstats = log_rstats(white, white_convergence, material_loss["white_loss"], accumulator)
+    black_rstats = log_rstats(black, black_convergence, material_loss["black_loss"], accumulator)
 
     white = evaluate_post_match(white)
     black = evaluate_post_match(black)
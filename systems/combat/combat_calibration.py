@@ -15,6 +15,8 @@ from typing import Dict, List, Any, Optional, Tuple, Union, Set
 from collections import defaultdict
 
 from system_base import SystemBase
+from tracing import get_tracer, TRACE_DAMAGE
+from stat_modifiers import add_modifier, tick_modifiers, ADD, PRIORITY_COMBAT
 
 class CombatCalibrationSystem(SystemBase):
     """
@@ -40,6 +42,7 @@ class CombatCalibrationSystem(SystemBase):
         # Cache for commonly used systems and configurations
         self._event_system = None
         self._trait_system = None
+        self._tracer = get_tracer()
         
         # Load combat calibration settings
         self._load_calibration_settings()
@@ -254,13 +257,8 @@ class CombatCalibrationSystem(SystemBase):
             board_id = match_context.get("board_id", "unknown")
             round_num = match_context.get("round", 0)
             
-            self.logger.info("{} deals {:.1f} base damage to {} via {} on board {}".format(
-                attacker.get("name", attacker_id),
-                amount,
-                target.get("name", target_id),
-                method,
-                board_id
-            ))
+            tracer = self._tracer
+            trace = tracer.mask & TRACE_DAMAGE
             
             # Apply damage multiplier
             modified_amount = amount * self._damage_multiplier
@@ -273,14 +271,18 @@ class CombatCalibrationSystem(SystemBase):
                 is_critical = True
                 critical_reason = "random"
                 modified_amount *= self._critical_hit_multiplier
-                self.logger.debug("Critical hit! Damage increased to {:.1f}".format(modified_amount))
+                if trace:
+                    tracer.record(TRACE_DAMAGE, "damage_modifier", attacker_id, target_id, "critical", board_id,
+                                  self._critical_hit_multiplier)
             
             # Apply trait effects to damage
             trait_system = self._get_trait_system()
             if trait_system:
                 trait_multiplier = trait_system.get_damage_multiplier(attacker, target, method)
                 if trait_multiplier != 1.0:
-                    self.logger.debug("Trait effect: damage multiplier {:.2f}".format(trait_multiplier))
+                    if trace:
+                        tracer.record(TRACE_DAMAGE, "damage_modifier", attacker_id, target_id, "trait", board_id,
+                                      trait_multiplier)
                     
                     if trait_multiplier >= 2.0 and not is_critical:
                         is_critical = True
@@ -291,17 +293,24 @@ class CombatCalibrationSystem(SystemBase):
             # Apply low stamina penalty
             if target.get("stamina", 100) < self._low_stamina_threshold:
                 stamina_multiplier = 1.0 + (self._low_stamina_damage_percent / 100.0)
-                self.logger.debug("Low stamina: damage increased by {:.0f}%".format(self._low_stamina_damage_percent))
+                if trace:
+                    tracer.record(TRACE_DAMAGE, "damage_modifier", attacker_id, target_id, "low_stamina", board_id,
+                                  stamina_multiplier)
                 modified_amount *= stamina_multiplier
             
             # Apply convergence multiplier if method is convergence
             if method == "convergence":
                 modified_amount *= self._convergence_damage_multiplier
-                self.logger.debug("Convergence damage: multiplier {:.2f}".format(self._convergence_damage_multiplier))
+                if trace:
+                    tracer.record(TRACE_DAMAGE, "damage_modifier", attacker_id, target_id, "convergence", board_id,
+                                  self._convergence_damage_multiplier)
             
             # Apply final damage
             final_amount = round(modified_amount, 1)
             
+            if trace:
+                tracer.record(TRACE_DAMAGE, "damage", attacker_id, target_id, method, board_id, amount, final_amount)
+            
             # Update target HP
             old_hp = target.get("HP", 100)
             new_hp = max(0, old_hp - final_amount)
@@ -313,10 +322,8 @@ class CombatCalibrationSystem(SystemBase):
             
             if is_ko and not was_ko:
                 target["is_ko"] = True
-                self.logger.info("{} knocked out by {}".format(
-                    target.get("name", target_id),
-                    attacker.get("name", attacker_id)
-                ))
+                if trace:
+                    tracer.record(TRACE_DAMAGE, "knockout", target_id, attacker_id, method, board_id, round_num)
                 
                 # Emit knockout event
                 self._emit_event("knockout", {
@@ -417,19 +424,11 @@ class CombatCalibrationSystem(SystemBase):
                 board_id
             ))
             
-            # Store original value if not already stored
             if modifier_type in character:
-                orig_key = f"original_{modifier_type}"
-                if orig_key not in character:
-                    character[orig_key] = character[modifier_type]
-                
-                # Apply modifier
+                # Apply modifier (repeat modifiers accumulate and refresh the duration)
                 old_value = character[modifier_type]
-                new_value = old_value + value
-                character[modifier_type] = new_value
-                
-                # Store modifier duration
-                character[f"{modifier_type}_modifier_duration"] = duration
+                new_value = add_modifier(character, "combat", modifier_type, value, ADD, PRIORITY_COMBAT,
+                                         duration, stack=True)
                 
                 # Update modifier statistics
                 self.modifier_statistics["total_modifiers"] += 1
@@ -583,37 +582,15 @@ class CombatCalibrationSystem(SystemBase):
                         character["rStats"]["ROUNDS_SURVIVED"] = 0
                     character["rStats"]["ROUNDS_SURVIVED"] += 1
                     
-                    # Process modifiers - decrement duration and remove if expired
-                    modifiers_to_remove = []
-                    
-                    for key in character:
-                        if key.endswith("_modifier_duration"):
-                            stat_name = key[:-17]  # Remove "_modifier_duration"
-                            duration = character[key]
-                            
-                            # Decrement duration
-                            character[key] = duration - 1
-                            
-                            # If expired, add to removal list
-                            if character[key] <= 0:
-                                modifiers_to_remove.append((stat_name, key))
-                    
-                    # Remove expired modifiers
-                    for stat_name, key in modifiers_to_remove:
-                        # Restore original value if available
-                        orig_key = f"original_{stat_name}"
-                        if orig_key in character:
-                            character[stat_name] = character[orig_key]
-                            
+                    # Process modifiers - count down the stack and restore expired stats
+                    for modifier in tick_modifiers(character, round_num):
+                        if modifier.source == "combat":
                             # Emit modifier_expired event
                             self._emit_event("combat_modifier_expired", {
                                 "character": character,
-                                "modifier_type": stat_name,
+                                "modifier_type": modifier.stat,
                                 "match_context": match_context
                             })
-                        
-                        # Remove duration tracker
-                        del character[key]
                     
                     # Emit round_survived event
                     self._emit_event("round_survived", {
@@ -17,6 +17,7 @@ from typing import Dict, List, Any, Optional, Tuple, Union, Set
 from collections import defaultdict
 
 from system_base import SystemBase
+from board_state import material_difference
 
 class MotifDetectionSystem(SystemBase):
     """
@@ -440,16 +441,8 @@ class MotifDetectionSystem(SystemBase):
                 back_rank_white = [chess.A1, chess.B1, chess.C1, chess.D1, chess.E1, chess.F1, chess.G1, chess.H1]
                 back_rank_black = [chess.A8, chess.B8, chess.C8, chess.D8, chess.E8, chess.F8, chess.G8, chess.H8]
                 
-                # Find king square
-                for square in chess.SQUARES:
-                    piece = board.piece_at(square)
-                    if piece and piece.piece_type == chess.KING:
-                        if piece.color == chess.WHITE and board.turn == chess.BLACK:
-                            king_square = square
-                            break
-                        elif piece.color == chess.BLACK and board.turn == chess.WHITE:
-                            king_square = square
-                            break
+                # Find king square (from the king bitboard rather than a square scan)
+                king_square = board.king(not board.turn)
                 
                 # Check if king is on back rank
                 is_back_rank_mate = False
@@ -485,24 +478,22 @@ class MotifDetectionSystem(SystemBase):
                     player_color = chess.WHITE if color_str.lower() == "white" else chess.BLACK
                 
                 # Check for knight forks as a simple example
-                for square in chess.SQUARES:
-                    piece = board.piece_at(square)
-                    if piece and piece.piece_type == chess.KNIGHT and piece.color == player_color:
-                        # Get all attacks from this knight
-                        attacked_squares = []
-                        for target in chess.SQUARES:
-                            if chess.square_distance(square, target) == 2:  # Knight's move
-                                # Check if square is valid attack
-                                if (target > square - 17 and 
-                                    abs(chess.square_file(square) - chess.square_file(target)) <= 2):
-                                    attacked_pieces = 0
-                                    target_piece = board.piece_at(target)
-                                    if target_piece and target_piece.color != player_color:
-                                        attacked_pieces += 1
-                                    
-                                    if attacked_pieces >= 2:
-                                        has_fork = True
-                                        break
+                for square in board.pieces(chess.KNIGHT, player_color):
+                    # Get all attacks from this knight
+                    attacked_squares = []
+                    for target in chess.SQUARES:
+                        if chess.square_distance(square, target) == 2:  # Knight's move
+                            # Check if square is valid attack
+                            if (target > square - 17 and 
+                                abs(chess.square_file(square) - chess.square_file(target)) <= 2):
+                                attacked_pieces = 0
+                                target_piece = board.piece_at(target)
+                                if target_piece and target_piece.color != player_color:
+                                    attacked_pieces += 1
+                                
+                                if attacked_pieces >= 2:
+                                    has_fork = True
+                                    break
                 
                 if has_fork:
                     pattern = position_patterns["fork"]
@@ -595,21 +586,8 @@ class MotifDetectionSystem(SystemBase):
                     # Process the move
                     analysis_board.push(move)
                     
-                    # Calculate material balance
-                    white_material = 0
-                    black_material = 0
-                    
-                    for square in chess.SQUARES:
-                        piece = analysis_board.piece_at(square)
-                        if piece:
-                            value = piece_values.get(piece.piece_type, 0)
-                            if piece.color == chess.WHITE:
-                                white_material += value
-                            else:
-                                black_material += value
-                    
                     # Calculate material balance from white's perspective
-                    material_balance = white_material - black_material
+                    material_balance = material_difference(analysis_board)
                     
                     # Check for sacrifice - material loss followed by material gain
                     if moving_piece and captured_piece:
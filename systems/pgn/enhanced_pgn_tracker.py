@@ -11,6 +11,7 @@ import chess.pgn
 import logging
 from typing import Dict, List, Any, Optional, Tuple, Union
 from system_base import SystemBase
+from board_state import BoardState, material_difference
 
 class EnhancedPGNTracker(SystemBase):
     """Enhanced system for recording chess games in PGN format with detailed metadata"""
@@ -272,6 +273,9 @@ class EnhancedPGNTracker(SystemBase):
         game.headers["WhiteDivision"] = character.get("division", "Unknown")
         game.headers["MatchID"] = match_context["match_id"]
         game.headers["GameID"] = game_id
+        if match_context.get("seed") is not None:
+            # Lets match_replay re-drive the match from the archive
+            game.headers["Seed"] = str(match_context["seed"])
         
         # Add character metadata
         game.headers["CharacterID"] = character.get("id", "Unknown")
@@ -332,17 +336,16 @@ class EnhancedPGNTracker(SystemBase):
         # Track material changes for annotations
         prev_material = 0
         
-        for move_idx, move in enumerate(board.move_stack):
+        # Replay the game once, evaluating each position as it is reached
+        pos_board = BoardState(board.root().fen(), chess960=board.chess960)
+        
+        for move in board.move_stack:
             # Add the move to the game tree
             node = node.add_variation(move)
-            
-            # Create a new board to evaluate this position
-            pos_board = chess.Board()
-            for m in board.move_stack[:move_idx + 1]:
-                pos_board.push(m)
+            pos_board.push(move)
             
             # Calculate material difference
-            material = self._calculate_material_difference(pos_board)
+            material = pos_board.material_difference()
             material_change = material - prev_material
             prev_material = material
             
@@ -451,23 +454,25 @@ class EnhancedPGNTracker(SystemBase):
     
     def _calculate_material_difference(self, board: chess.Board) -> int:
         """Calculate material difference from White's perspective"""
-        piece_values = {
-            chess.PAWN: 1,
-            chess.KNIGHT: 3,
-            chess.BISHOP: 3,
-            chess.ROOK: 5,
-            chess.QUEEN: 9,
-            chess.KING: 0  # King isn't counted in material difference
+        return material_difference(board)
+
+    def _collect_board_metrics(self, board: chess.Board) -> Dict[str, Any]:
+        """Collect end-of-game board metrics for the PGN headers and metadata
+
+        The queries hit the BoardState caches when the match boards are BoardStates,
+        so tallying a board here after the simulator has already checked it costs nothing.
+        """
+        board = BoardState.from_board(board)
+        metrics = {
+            "MovesCount": len(board.move_stack),
+            "MaterialDiff": board.material_difference(),
+            "WhiteMaterial": board.material(chess.WHITE),
+            "BlackMaterial": board.material(chess.BLACK),
+            "InCheck": board.is_check(),
+            "LegalMoves": len(board.legal_move_list())
         }
-        
-        white_material = 0
-        black_material = 0
-        
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece:
-                value = piece_values.get(piece.piece_type, 0)
-                if piece.color == chess.WHITE:
-                    white_material += value
-                else:
-                    bl
\ No newline at end of file
+        outcome = board.outcome()
+        if outcome is not None:
+            metrics["Termination"] = outcome.termination.name.lower()
+            metrics["BoardResult"] = outcome.result()
+        return metrics
@@ -0,0 +1,9 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Root modules use flat imports, as when run from the repository root; the
+# systems/ layer imports system_base, tracing and friends from the v5 tree
+sys.path.insert(0, ROOT)
+sys.path.insert(1, os.path.join(ROOT, "meta_simulator_v5"))
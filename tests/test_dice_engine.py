@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+import dice_engine
+
+
+@pytest.fixture(autouse=True)
+def fresh_generator():
+    yield
+    dice_engine._rng = None
+
+
+def test_seed_dice_reproduces_batches():
+    dice_engine.seed_dice(7)
+    first = dice_engine.roll_dice_batch(20, 16).tolist()
+    dice_engine.seed_dice(7)
+    assert dice_engine.roll_dice_batch(20, 16).tolist() == first
+
+
+def test_batches_share_one_generator():
+    generator = dice_engine._generator(None)
+    dice_engine.roll_d20_batch(np.zeros(4))
+    assert dice_engine._generator(None) is generator
+
+
+def test_caller_generator_takes_precedence():
+    first = dice_engine.roll_d20_batch(np.zeros(8), rng=np.random.default_rng(3))["natural"].tolist()
+    assert dice_engine.roll_d20_batch(np.zeros(8), rng=np.random.default_rng(3))["natural"].tolist() == first
@@ -0,0 +1,63 @@
+import pytest
+
+from systems.convergence.process_convergences_revised import ConvergenceSystem
+
+
+class Convergences(ConvergenceSystem):
+    config = {}
+
+
+@pytest.fixture
+def system(monkeypatch):
+    system = Convergences({})
+    system.activate()
+    monkeypatch.setattr(system, "_emit_event", lambda *args, **kwargs: None)
+    monkeypatch.setattr(system, "_calculate_convergence_chance", lambda char: 1.0)
+    return system
+
+
+def make_team(prefix, size=3):
+    return [{"id": "{}{}".format(prefix, i), "name": "{}{}".format(prefix, i)} for i in range(size)]
+
+
+def test_triggered_character_attempts_a_convergence(system, monkeypatch):
+    attempts = []
+
+    def attempt(char, idx, team, boards, team_id, counts, max_per_char, context):
+        attempts.append(char["id"])
+        return {"initiator": char["id"]}
+
+    monkeypatch.setattr(system, "_attempt_convergence", attempt)
+    team_a, team_b = make_team("a"), make_team("b")
+
+    results = system.process_convergences(team_a, [None] * 3, team_b, [None] * 3, {"match_id": "m1"})
+
+    assert attempts == ["a0", "a1", "a2", "b0", "b1", "b2"]
+    assert len(results) == 6
+
+
+def test_knocked_out_characters_do_not_attempt(system, monkeypatch):
+    attempts = []
+    monkeypatch.setattr(system, "_attempt_convergence",
+                        lambda char, *args: attempts.append(char["id"]))
+    team_a = make_team("a")
+    team_a[1]["is_ko"] = True
+
+    system.process_convergences(team_a, [None] * 3, [], [], {"match_id": "m1"})
+
+    assert attempts == ["a0", "a2"]
+
+
+def test_match_seed_reproduces_trigger_batches(system):
+    chances = [0.5] * 32
+    first = system._roll_triggers(chances, {"match_id": "m1", "seed": 42})
+    replay = Convergences({})
+    assert replay._roll_triggers(chances, {"match_id": "m1", "seed": 42}) == first
+
+
+def test_trigger_batches_share_one_generator_per_match(system):
+    context = {"match_id": "m1", "seed": 42}
+    system._roll_triggers([0.5] * 4, context)
+    system._roll_triggers([0.5] * 4, context)
+
+    assert list(system._match_rngs) == ["m1"]
@@ -0,0 +1,76 @@
+import pytest
+
+from rstat_logger import log_rstats
+from rstats_accumulator import RStatsAccumulator
+
+
+def test_view_reads_unwritten_codes_as_zero():
+    acc = RStatsAccumulator()
+    acc.register({"id": "U01", "division": "o"})
+    stats = acc.view("U01")
+
+    assert stats["rDD"] == 0.0
+    assert "rDD" not in stats
+    stats["rDD"] += 5
+    stats["DD"] += 2
+    assert stats["rDD"] == 7.0
+    assert dict(stats) == {"rDD": 7.0}
+
+
+def test_view_rejects_unknown_codes():
+    acc = RStatsAccumulator()
+    acc.register({"id": "U01", "division": "o"})
+    with pytest.raises(KeyError):
+        acc.view("U01")["rXPBoost"]
+
+
+def test_log_rstats_accumulates_validated_stats():
+    acc = RStatsAccumulator()
+    unit = {"id": "U02", "division": "i"}
+
+    first = log_rstats(unit, {"outcome": "critical_success"}, 13, acc)
+    log_rstats(unit, {"outcome": "success"}, 4, acc)
+
+    assert first == {"rDD": 13, "rULT": 1, "rDSRi": 1, "rMBi": 1}
+    assert acc.as_dict("U02") == {"rDD": 17.0, "rULT": 1.0, "rDSRi": 2.0, "rMBi": 1.0}
+    assert acc.invalid_entries() == {}
+
+
+def test_view_get_matches_getitem():
+    acc = RStatsAccumulator()
+    acc.register({"id": "U01", "division": "o"})
+    stats = acc.view("U01")
+
+    assert stats.get("rDD") == stats["rDD"] == 0.0
+    assert stats.get("rXPBoost") is None
+
+
+def test_validate_rstats_keeps_division_rules():
+    from rstat_validator import validate_rstats
+
+    attempted = {"rMBi": 1, "BRXo": 2, "DD": 3, "rXPBoost": 999}
+    assert validate_rstats({"division": "i"}, attempted) == {"rMBi": 1, "rDD": 3}
+    assert validate_rstats({"division": "o"}, attempted) == {"rBRXo": 2, "rDD": 3}
+    assert validate_rstats({}, attempted) == {"rDD": 3}
+
+
+def test_fill_missing_rstats_reads_views():
+    from matchday_report_generator import CANONICAL_RSTATS, fill_missing_rstats
+
+    acc = RStatsAccumulator()
+    acc.register({"id": "U01", "division": "o"})
+    acc.update("U01", "DD", 4)
+    filled = fill_missing_rstats(acc.view("U01"))
+
+    assert list(filled) == CANONICAL_RSTATS
+    assert filled["rDD"] == 4.0 and filled["rMBi"] == 0.0
+
+
+def test_open_columns_are_added_and_flagged_invalid():
+    acc = RStatsAccumulator(columns=["rDD", "rMBi"], domains={"rDD": "b", "rMBi": "i"}, open_columns=True)
+    acc.register({"id": "U01", "division": "i"})
+    acc.update("U01", "rCustom", 2)
+    acc.update("U01", "MBi", 1)
+
+    assert acc.as_dict("U01") == {"rMBi": 1.0, "rCustom": 2.0}
+    assert acc.invalid_entries() == {"U01": ["rCustom"]}
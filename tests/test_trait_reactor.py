@@ -0,0 +1,127 @@
+import pytest
+
+from systems.trait.trait_reactor import TraitReactorSystem
+from tracing import get_tracer, TRACE_TRAIT
+
+SPEED_TRAIT = {"name": "Quickstep", "type": "active", "triggers": "round_start",
+               "formula_key": "speed_boost", "formula_expr": "+2", "cooldown": 3}
+REVENGE_TRAIT = {"name": "Vengeance", "type": "active", "triggers": "ally_ko",
+                 "formula_key": "revenge_boost", "formula_expr": "+50%", "cooldown": 2}
+
+
+class EventRecorder:
+    def __init__(self):
+        self.events = []
+
+    def emit(self, name, data):
+        self.events.append((name, data))
+
+    def register_handler(self, name, handler):
+        pass
+
+
+class Registry:
+    def __init__(self, **systems):
+        self.systems = systems
+
+    def get(self, name):
+        return self.systems.get(name)
+
+
+class Catalog:
+    def get_trait_catalog(self):
+        return {"quickstep": SPEED_TRAIT, "vengeance": REVENGE_TRAIT}
+
+
+class Reactor(TraitReactorSystem):
+    config = {}
+
+
+@pytest.fixture
+def events():
+    return EventRecorder()
+
+
+@pytest.fixture
+def reactor(events):
+    reactor = Reactor({}, Registry(event_system=events, trait_system=Catalog()))
+    reactor.activate()
+    return reactor
+
+
+def make_character(char_id, team_id, **stats):
+    character = {"id": char_id, "team_id": team_id, "traits": {}, "stamina": 100, "aSPD": 5.0}
+    character.update(stats)
+    return character
+
+
+def test_activation_is_traced(reactor, monkeypatch):
+    tracer = get_tracer()
+    monkeypatch.setattr(tracer, "mask", tracer.mask | TRACE_TRAIT)
+    tracer.clear()
+
+    reactor._activate_trait(make_character("c1", "t1"), "quickstep", SPEED_TRAIT, {})
+
+    records = [record for record in tracer.dump() if record["event"] == "trait_activated"]
+    assert records and records[-1]["args"] == ["c1", "quickstep", "active"]
+    assert records[-1]["values"][1] == 3
+
+
+def test_cooldown_expires_after_its_rounds(reactor, events):
+    character = make_character("c1", "t1")
+    assert reactor._activate_trait(character, "quickstep", SPEED_TRAIT, {})
+
+    assert reactor._is_trait_on_cooldown(character, "quickstep")
+    assert reactor.get_trait_cooldowns() == {"c1": {"quickstep": 3}}
+
+    for remaining in (2, 1):
+        reactor.update_cooldowns([character])
+        assert reactor.get_trait_cooldowns() == {"c1": {"quickstep": remaining}}
+
+    reactor.update_cooldowns([character])
+    assert not reactor._is_trait_on_cooldown(character, "quickstep")
+    assert reactor.export_state()["trait_cooldowns"] == {}
+    expired = [data for name, data in events.events if name == "trait_cooldown_expired"]
+    assert [(data["character"]["id"], data["trait_id"], data["trait_name"]) for data in expired] == \
+        [("c1", "quickstep", "Quickstep")]
+
+
+def test_cooldowns_only_tick_for_the_teams_given(reactor):
+    home = make_character("c1", "t1")
+    away = make_character("c2", "t2")
+    reactor._activate_trait(home, "quickstep", SPEED_TRAIT, {})
+    reactor._activate_trait(away, "quickstep", SPEED_TRAIT, {})
+
+    reactor.update_cooldowns([home])
+    reactor.update_cooldowns([home])
+
+    assert reactor.get_trait_cooldowns() == {"c1": {"quickstep": 1}, "c2": {"quickstep": 3}}
+
+
+def test_reactivation_replaces_the_pending_cooldown(reactor):
+    character = make_character("c1", "t1")
+    reactor._activate_trait(character, "quickstep", SPEED_TRAIT, {})
+    reactor.update_cooldowns([character])
+    reactor._activate_trait(character, "quickstep", SPEED_TRAIT, {})
+
+    assert reactor.get_trait_cooldowns() == {"c1": {"quickstep": 3}}
+
+
+def test_trait_boosts_are_modifiers_that_do_not_compound(reactor):
+    character = make_character("c1", "t1", aSTR=8.0)
+    for _ in range(3):
+        reactor._apply_trait_effect(character, "quickstep", SPEED_TRAIT, {})
+        reactor._apply_trait_effect(character, "vengeance", REVENGE_TRAIT, {})
+
+    assert character["aSPD"] == pytest.approx(10.5)    # (5 + 2) * 1.5
+    assert character["aSTR"] == pytest.approx(12.0)
+    assert character["modifier_stack"].bases == {"aSPD": 5.0, "aSTR": 8.0}
+
+
+def test_stat_sharing_replaces_the_earlier_share(reactor):
+    leader = make_character("c1", "t1", aSTR=10.0)
+    ally = make_character("c2", "t1", aSTR=4.0)
+    reactor._apply_stat_sharing(leader, [ally], 0.2)
+    reactor._apply_stat_sharing(leader, [ally], 0.2)
+
+    assert ally["aSTR"] == pytest.approx(6.0)
@@ -10,9 +10,17 @@ import datetime
 import logging
 import chess
 from typing import List, Dict, Any, Tuple, Optional
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 from system_base import SystemBase
+from tracing import get_tracer, TRACE_CONVERGENCE
+from stat_modifiers import add_modifier, ADD, PRIORITY_CONVERGENCE
 
 class ConvergenceSystem(SystemBase):
     """
@@ -39,6 +47,7 @@ class ConvergenceSystem(SystemBase):
         # Cache for commonly used systems and configurations
         self._event_system = None
         self._registry = None
+        self._tracer = get_tracer()
         self._base_convergence_chance = self.config.get("simulation.convergence_base_chance", 0.15)
         self._ldr_factor = self.config.get("simulation.convergence_ldr_factor", 0.005)
         self._esp_factor = self.config.get("simulation.convergence_esp_factor", 0.01)
@@ -47,6 +56,7 @@ class ConvergenceSystem(SystemBase):
         # Initialize state
         self.active = False
         self.convergence_history = []
+        self._match_rngs = OrderedDict()  # match_id -> trigger generator, a few live matches at most
         
         self.logger.info("Convergence system initialized with damage_multiplier={:.2f}".format(self._damage_multiplier))
     
@@ -124,8 +134,6 @@ class ConvergenceSystem(SystemBase):
             return []
         
         try:
-            self.logger.info("Processing convergences for round {}".format(match_context.get('round', 0)))
-            
             # Emit process_start event
             self._emit_event("process_convergences_start", {
                 "match_id": match_context.get("match_id", "unknown"),
@@ -171,9 +179,9 @@ class ConvergenceSystem(SystemBase):
                 "team_b_count": len(team_b_convergences)
             })
             
-            self.logger.info("Processed {} convergences (Team A: {}, Team B: {})".format(
-                len(all_convergences), len(team_a_convergences), len(team_b_convergences)
-            ))
+            if self._tracer.mask & TRACE_CONVERGENCE:
+                self._tracer.record(TRACE_CONVERGENCE, "convergences_processed", None, None, None, None,
+                                    len(team_a_convergences), len(team_b_convergences))
             
             # Return all convergences processed
             return all_convergences
@@ -203,6 +211,8 @@ class ConvergenceSystem(SystemBase):
         """
         team_convergences = []
         
+        # Chances for every eligible character first, then one trigger draw for the whole team
+        candidates = []
         for i, (char, board) in enumerate(zip(team, team_boards)):
             try:
                 # Skip knocked out or inactive characters
@@ -210,7 +220,7 @@ class ConvergenceSystem(SystemBase):
                     continue
                 
                 # Skip if already at max convergences
-                if convergence_counts.get(char.get("id")) >= max_per_char:
+                if convergence_counts[char.get("id")] >= max_per_char:
                     continue
                 
                 # Check for pre-convergence traits
@@ -218,31 +228,70 @@ class ConvergenceSystem(SystemBase):
                     self.trait_system.check_pre_convergence_traits(char, board, match_context)
                 
                 # Calculate convergence chance
-                convergence_chance = self._calculate_convergence_chance(char)
+                candidates.append((i, self._calculate_convergence_chance(char)))
+            
+            except Exception as e:
+                self._report_character_error(char, team_id, e)
+        
+        # Roll for convergence
+        triggers = self._roll_triggers([chance for _, chance in candidates], match_context)
+        
+        for (i, _), triggered in zip(candidates, triggers):
+            if not triggered:
+                continue
+            char = team[i]
+            try:
+                # An earlier convergence this round may have used up the allowance
+                if convergence_counts[char.get("id")] >= max_per_char:
+                    continue
                 
-                # Roll for convergence
-                if random.random() <= convergence_chance:
-                    # Attempt to find a convergence target
-                    convergence_result = self._attempt_convergence(
-                        char, i, team, team_boards, team_id, convergence_counts, max_per_char, match_context
-                    )
-                    
-                    if convergence_result:
-                        team_convergences.append(convergence_result)
+                # Attempt to find a convergence target
+                convergence_result = self._attempt_convergence(
+                    char, i, team, team_boards, team_id, convergence_counts, max_per_char, match_context
+                )
+                
+                if convergence_result:
+                    team_convergences.append(convergence_result)
             
             except Exception as e:
-                self.logger.error("Error processing convergence for character {}: {}".format(
-                    char.get("id", "unknown"), e
-                ))
-                # Emit error event
-                self._emit_error_event("process_team_convergences", str(e), {
-                    "character_id": char.get("id", "unknown"),
-                    "character_name": char.get("name", "Unknown"),
-                    "team": team_id
-                })
+                self._report_character_error(char, team_id, e)
         
         return team_convergences
     
+    def _report_character_error(self, char: Dict[str, Any], team_id: str, error: Exception) -> None:
+        """Log and emit an error raised while processing one character's convergence"""
+        self.logger.error("Error processing convergence for character {}: {}".format(
+            char.get("id", "unknown"), error
+        ))
+        # Emit error event
+        self._emit_error_event("process_team_convergences", str(error), {
+            "character_id": char.get("id", "unknown"),
+            "character_name": char.get("name", "Unknown"),
+            "team": team_id
+        })
+    
+    def _roll_triggers(self, chances: List[float], match_context: Dict[str, Any]) -> List[bool]:
+        """Convergence triggers for a list of chances, drawn in one batch when numpy is available"""
+        if not chances:
+            return []
+        if NUMPY_AVAILABLE:
+            rng = self._match_rng(match_context)
+            return (rng.random(len(chances)) <= np.asarray(chances)).tolist()
+        return [random.random() <= chance for chance in chances]
+    
+    def _match_rng(self, match_context: Dict[str, Any]):
+        """The match's trigger generator, created once from the match seed on first use"""
+        match_id = match_context.get("match_id", "unknown")
+        rng = self._match_rngs.get(match_id)
+        if rng is None:
+            seed = match_context.get("seed")
+            rng = np.random.default_rng(seed if seed is not None else random.getrandbits(64))
+            self._match_rngs[match_id] = rng
+            # Interleaved matches keep a handful alive; finished ones fall off the end
+            while len(self._match_rngs) > 16:
+                self._match_rngs.popitem(last=False)
+        return rng
+    
     def _calculate_convergence_chance(self, char: Dict[str, Any]) -> float:
         """Calculate the chance of a character initiating a convergence"""
         try:
@@ -312,7 +361,7 @@ class ConvergenceSystem(SystemBase):
                     continue
                 
                 # Cannot converge with characters already at max
-                if convergence_counts.get(target.get("id")) >= max_per_char:
+                if convergence_counts[target.get("id")] >= max_per_char:
                     continue
                 
                 # Check for compatibility
@@ -346,11 +395,10 @@ class ConvergenceSystem(SystemBase):
                 "timestamp": datetime.datetime.now().isoformat()
             }
             
-            self.logger.info("Convergence: {} -> {}, effect: {}".format(
-                initiator.get("name", "Unknown"),
-                target_char.get("name", "Unknown"),
-                convergence_effect
-            ))
+            if self._tracer.mask & TRACE_CONVERGENCE:
+                self._tracer.record(TRACE_CONVERGENCE, "convergence", convergence_record["initiator_id"],
+                                    convergence_record["target_id"], convergence_effect.get("type"), team_id,
+                                    convergence_effect.get("value", 0), convergence_record["round"])
             
             # Emit convergence events
             self._emit_convergence_events(initiator, target_char, convergence_effect, match_context)
@@ -516,33 +564,21 @@ class ConvergenceSystem(SystemBase):
                 new_hp = min(100, target_hp + effect_value)
                 target["HP"] = new_hp
                 
-                self.logger.debug("Applied healing effect: {} -> {}, +{} HP".format(
-                    initiator.get("name", "Unknown"),
-                    target.get("name", "Unknown"),
-                    effect_value
-                ))
+                if self._tracer.mask & TRACE_CONVERGENCE:
+                    self._tracer.record(TRACE_CONVERGENCE, "convergence_effect", initiator.get("id"),
+                                        target.get("id"), "HP", None, effect_value, new_hp)
                 
             elif effect_type == "stat_buff":
                 # Apply stat buffs to target
                 for stat, value in stat_buffs.items():
                     if stat in target:
-                        # Store original value if not already stored
-                        orig_key = f"original_{stat}"
-                        if orig_key not in target:
-                            target[orig_key] = target[stat]
-                        
-                        # Apply buff
-                        target[stat] += value
-                        
-                        # Store buff duration
-                        target[f"{stat}_buff_duration"] = effect_duration
+                        # Apply buff; it expires with the round pipeline's modifier tick
+                        add_modifier(target, f"convergence:{initiator.get('id', 'unknown')}", stat, value,
+                                     ADD, PRIORITY_CONVERGENCE, effect_duration)
                         
-                        self.logger.debug("Applied stat buff: {} -> {}, +{} {}".format(
-                            initiator.get("name", "Unknown"),
-                            target.get("name", "Unknown"),
-                            value,
-                            stat
-                        ))
+                        if self._tracer.mask & TRACE_CONVERGENCE:
+                            self._tracer.record(TRACE_CONVERGENCE, "convergence_effect", initiator.get("id"),
+                                                target.get("id"), stat, None, value, effect_duration)
                 
             elif effect_type == "stamina_regen":
                 # Add stamina to target
@@ -550,11 +586,9 @@ class ConvergenceSystem(SystemBase):
                 new_stamina = min(100, target_stamina + effect_value)
                 target["stamina"] = new_stamina
                 
-                self.logger.debug("Applied stamina regen: {} -> {}, +{} stamina".format(
-                    initiator.get("name", "Unknown"),
-                    target.get("name", "Unknown"),
-                    effect_value
-                ))
+                if self._tracer.mask & TRACE_CONVERGENCE:
+                    self._tracer.record(TRACE_CONVERGENCE, "convergence_effect", initiator.get("id"),
+                                        target.get("id"), "stamina", None, effect_value, new_stamina)
             
             # Additional effects can be added here
             
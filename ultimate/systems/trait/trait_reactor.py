@@ -13,7 +13,10 @@ import random
 from typing import Dict, List, Any, Optional, Set, Tuple
 from collections import defaultdict
 
-from core.system_base import SystemBase
+from system_base import SystemBase
+from tracing import get_tracer, TRACE_TRAIT
+from expiry_scheduler import ExpiryScheduler
+from stat_modifiers import add_modifier, ADD, MUL, PRIORITY_TRAIT
 
 class TraitReactorSystem(SystemBase):
     """
@@ -42,6 +45,7 @@ class TraitReactorSystem(SystemBase):
         # Cache for commonly used systems
         self._event_system = None
         self._trait_catalog = None
+        self._tracer = get_tracer()
         
         # Load trait configuration
         self._load_trait_configuration()
@@ -52,7 +56,10 @@ class TraitReactorSystem(SystemBase):
         # Initialize state
         self.active = False
         self.trait_activations = defaultdict(int)
+        # character_id -> {trait_id: team key of the round clock holding its expiry}
         self.trait_cooldowns = defaultdict(dict)
+        # One round clock per team: update_cooldowns only ticks the teams it is given
+        self._cooldown_clocks: Dict[Any, ExpiryScheduler] = {}
         
         self.logger.info("Trait reactor system initialized with {} trait triggers".format(
             len(self._trait_triggers)))
@@ -781,7 +788,7 @@ class TraitReactorSystem(SystemBase):
                             try:
                                 # Get trait catalog data
                                 trait_catalog = self._get_trait_catalog()
-                    trait_info = trait_catalog.get(trait_id, {})
+                                trait_info = trait_catalog.get(trait_id, {})
                                 
                                 # Check if trait triggers on last_survivor
                                 if trait_info.get("triggers") == "last_survivor":
@@ -1134,11 +1141,8 @@ class TraitReactorSystem(SystemBase):
         if not character_id:
             return True  # Treat as on cooldown if no character ID
         
-        # Check if trait has cooldown tracking
-        character_cooldowns = self.trait_cooldowns.get(character_id, {})
-        cooldown_remaining = character_cooldowns.get(trait_id, 0)
-        
-        return cooldown_remaining > 0
+        # Cooldowns are removed when they expire, so any tracked entry is still running
+        return trait_id in self.trait_cooldowns.get(character_id, ())
     
     def _has_enough_stamina(self, character: Dict[str, Any], trait_info: Dict[str, Any]) -> bool:
         """
@@ -1262,9 +1266,12 @@ class TraitReactorSystem(SystemBase):
             # Apply cooldown
             cooldown = self._calculate_trait_cooldown(character, trait_info)
             if cooldown > 0:
-                if character_id not in self.trait_cooldowns:
-                    self.trait_cooldowns[character_id] = {}
-                self.trait_cooldowns[character_id][trait_id] = cooldown
+                team_key = character.get("team_id")
+                clock = self._cooldown_clocks.get(team_key)
+                if clock is None:
+                    clock = self._cooldown_clocks[team_key] = ExpiryScheduler()
+                clock.schedule((character_id, trait_id), cooldown, character)
+                self.trait_cooldowns[character_id][trait_id] = team_key
             
             # Track activation
             self.trait_activations[trait_id] += 1
@@ -1305,8 +1312,9 @@ class TraitReactorSystem(SystemBase):
                 "match_context": event_data.get("match_context", {})
             })
             
-            self.logger.info("Trait {} activated for character {}".format(
-                trait_name, character.get("name", character_id)))
+            if self._tracer.mask & TRACE_TRAIT:
+                self._tracer.record(TRACE_TRAIT, "trait_activated", character_id, trait_id,
+                                    trait_type, None, stamina_cost, cooldown)
             
             return True
             
@@ -1483,13 +1491,8 @@ class TraitReactorSystem(SystemBase):
                     # Apply to all base stats
                     for stat in ["aSTR", "aSPD", "aFS", "aLDR", "aDUR", "aRES", "aWIL"]:
                         if stat in character:
-                            # Store original value if not already stored
-                            orig_key = f"original_{stat}"
-                            if orig_key not in character:
-                                character[orig_key] = character[stat]
-                            
-                            # Apply boost
-                            character[stat] = character[orig_key] * (1 + boost)
+                            # Apply boost (a trait modifier on the stack; reapplying replaces it)
+                            add_modifier(character, f"trait:{trait_id}", stat, 1 + boost, MUL, PRIORITY_TRAIT)
             
             elif formula_key == "critical_chance":
                 # Increase critical hit chance
@@ -1545,13 +1548,8 @@ class TraitReactorSystem(SystemBase):
                                 # Apply boost to all stats
                                 for stat in ["aSTR", "aSPD", "aFS", "aLDR", "aDUR", "aRES", "aWIL"]:
                                     if stat in teammate:
-                                        # Store original value if not already stored
-                                        orig_key = f"original_{stat}"
-                                        if orig_key not in teammate:
-                                            teammate[orig_key] = teammate[stat]
-                                        
                                         # Apply boost
-                                        teammate[stat] = teammate[orig_key] * (1 + boost)
+                                        add_modifier(teammate, f"trait:{trait_id}", stat, 1 + boost, MUL, PRIORITY_TRAIT)
             
             elif formula_key == "counter_damage":
                 # Set up counter damage effect
@@ -1585,24 +1583,14 @@ class TraitReactorSystem(SystemBase):
                     # Percentage boost
                     boost = float(formula_expr.rstrip("%").lstrip("+")) / 100.0
                     if "aSPD" in character:
-                        # Store original value if not already stored
-                        orig_key = "original_aSPD"
-                        if orig_key not in character:
-                            character[orig_key] = character["aSPD"]
-                        
                         # Apply boost
-                        character["aSPD"] = character[orig_key] * (1 + boost)
+                        add_modifier(character, f"trait:{trait_id}", "aSPD", 1 + boost, MUL, PRIORITY_TRAIT)
                 else:
                     # Flat boost
                     boost = float(formula_expr.lstrip("+"))
                     if "aSPD" in character:
-                        # Store original value if not already stored
-                        orig_key = "original_aSPD"
-                        if orig_key not in character:
-                            character[orig_key] = character["aSPD"]
-                        
                         # Apply boost
-                        character["aSPD"] = character[orig_key] + boost
+                        add_modifier(character, f"trait:{trait_id}", "aSPD", boost, ADD, PRIORITY_TRAIT)
             
             elif formula_key == "team_defense":
                 # Increase team defense
@@ -1639,13 +1627,8 @@ class TraitReactorSystem(SystemBase):
                                     
                                 # Apply defense boost
                                 if "aDUR" in teammate:
-                                    # Store original value if not already stored
-                                    orig_key = "original_aDUR"
-                                    if orig_key not in teammate:
-                                        teammate[orig_key] = teammate["aDUR"]
-                                    
                                     # Apply boost
-                                    teammate["aDUR"] = teammate[orig_key] * (1 + boost)
+                                    add_modifier(teammate, f"trait:{trait_id}", "aDUR", 1 + boost, MUL, PRIORITY_TRAIT)
             
             elif formula_key == "damage_avoid":
                 # Set up damage avoidance
@@ -1835,13 +1818,8 @@ class TraitReactorSystem(SystemBase):
                     # Apply to all stats
                     for stat in ["aSTR", "aSPD", "aFS", "aLDR", "aDUR", "aRES", "aWIL"]:
                         if stat in character:
-                            # Store original value if not already stored
-                            orig_key = f"original_{stat}"
-                            if orig_key not in character:
-                                character[orig_key] = character[stat]
-                            
                             # Apply boost
-                            character[stat] = character[orig_key] * (1 + boost)
+                            add_modifier(character, f"trait:{trait_id}", stat, 1 + boost, MUL, PRIORITY_TRAIT)
             
             elif formula_key == "damage_negate":
                 # Set damage negation
@@ -1919,13 +1897,8 @@ class TraitReactorSystem(SystemBase):
                     # Apply to all stats
                     for stat in ["aSTR", "aSPD", "aFS", "aLDR", "aDUR", "aRES", "aWIL"]:
                         if stat in character:
-                            # Store original value if not already stored
-                            orig_key = f"original_{stat}"
-                            if orig_key not in character:
-                                character[orig_key] = character[stat]
-                            
                             # Apply significant boost
-                            character[stat] = character[orig_key] * (1 + boost)
+                            add_modifier(character, f"trait:{trait_id}", stat, 1 + boost, MUL, PRIORITY_TRAIT)
             
             elif formula_key == "perfect_move":
                 # Set perfect move chance
@@ -2321,7 +2294,7 @@ class TraitReactorSystem(SystemBase):
                 return False
                 
             # Parse share percentage
-share_percent = float(formula_expr.rstrip("%")) / 100.0
+            share_percent = float(formula_expr.rstrip("%")) / 100.0
             
             # Get board positions
             board_position = event_data.get("board_position")
@@ -2448,14 +2421,10 @@ share_percent = float(formula_expr.rstrip("%")) / 100.0
             # Calculate shared value
             shared_value = highest_value * share_percent
             
-            # Store original value if not already stored
-            orig_key = f"original_{highest_stat}"
-            if highest_stat in ally and orig_key not in ally:
-                ally[orig_key] = ally[highest_stat]
-            
-            # Apply boost
+            # Apply boost (replaces this character's earlier share)
             if highest_stat in ally:
-                ally[highest_stat] += shared_value
+                add_modifier(ally, f"stat_share:{character.get('id', 'unknown')}", highest_stat,
+                             shared_value, ADD, PRIORITY_TRAIT)
     
     def _update_move_pattern(self, character: Dict[str, Any], trait_id: str,
                             trait_info: Dict[str, Any], event_data: Dict[str, Any]) -> bool:
@@ -2563,6 +2532,9 @@ share_percent = float(formula_expr.rstrip("%")) / 100.0
         """
         Update trait cooldowns for all characters
         
+        Advances the round clock of each team in `characters` by one round; only
+        cooldowns that expire on this round are visited.
+        
         Args:
             characters: List of character dictionaries
         """
@@ -2570,62 +2542,61 @@ share_percent = float(formula_expr.rstrip("%")) / 100.0
             return
             
         try:
-            for character in characters:
-                character_id = character.get("id")
-                if not character_id:
+            for team_key in {character.get("team_id") for character in characters}:
+                clock = self._cooldown_clocks.get(team_key)
+                if clock is None:
                     continue
-                    
-                # Skip if not in cooldown tracking
-                if character_id not in self.trait_cooldowns:
-                    continue
-                    
-                # Update each trait cooldown
-                cooldowns = self.trait_cooldowns[character_id]
-                traits_off_cooldown = []
                 
-                for trait_id, cooldown in cooldowns.items():
-                    # Reduce cooldown
-                    new_cooldown = max(0, cooldown - 1)
-                    cooldowns[trait_id] = new_cooldown
-                    
-                    # Check if cooldown expired
-                    if new_cooldown == 0:
-                        traits_off_cooldown.append(trait_id)
-                        
-                        # Get trait info
-                        trait_catalog = self._get_trait_catalog()
-                        trait_info = trait_catalog.get(trait_id, {})
-                        trait_name = trait_info.get("name", trait_id)
-                        
-                        # Emit trait_cooldown_expired event
-                        self._emit_event("trait_cooldown_expired", {
-                            "character": character,
-                            "trait_id": trait_id,
-                            "trait_name": trait_name
-                        })
-                        
-                        self.logger.debug("Trait {} cooldown expired for character {}".format(
-                            trait_name, character.get("name", character_id)))
+                for (character_id, trait_id), character in clock.advance():
+                    self._expire_cooldown(character, character_id, trait_id)
                 
-                # Remove expired cooldowns
-                for trait_id in traits_off_cooldown:
-                    del cooldowns[trait_id]
-                    
-                # Remove character if no cooldowns left
-                if not cooldowns:
-                    del self.trait_cooldowns[character_id]
+                # Drop idle clocks so they do not accumulate across matches
+                if not clock:
+                    del self._cooldown_clocks[team_key]
                     
         except Exception as e:
             self.logger.error("Error updating trait cooldowns: {}".format(e))
             self._emit_error_event("update_cooldowns", str(e))
     
+    def _expire_cooldown(self, character: Dict[str, Any], character_id: str, trait_id: str) -> None:
+        """Take a trait off cooldown and announce it"""
+        cooldowns = self.trait_cooldowns.get(character_id)
+        if cooldowns is not None:
+            cooldowns.pop(trait_id, None)
+            if not cooldowns:
+                del self.trait_cooldowns[character_id]
+        
+        # Get trait info
+        trait_catalog = self._get_trait_catalog()
+        trait_info = trait_catalog.get(trait_id, {})
+        trait_name = trait_info.get("name", trait_id)
+        
+        # Emit trait_cooldown_expired event
+        self._emit_event("trait_cooldown_expired", {
+            "character": character,
+            "trait_id": trait_id,
+            "trait_name": trait_name
+        })
+        
+        if self._tracer.mask & TRACE_TRAIT:
+            self._tracer.record(TRACE_TRAIT, "trait_cooldown_expired", character_id, trait_id)
+    
+    def _remaining_cooldowns(self, character_id: str) -> Dict[str, int]:
+        """Rounds left on each of a character's cooldowns"""
+        remaining = {}
+        for trait_id, team_key in self.trait_cooldowns.get(character_id, {}).items():
+            clock = self._cooldown_clocks.get(team_key)
+            if clock is not None:
+                remaining[trait_id] = clock.remaining((character_id, trait_id))
+        return remaining
+    
     def get_trait_activations(self) -> Dict[str, int]:
         """Get trait activation counts"""
         return dict(self.trait_activations)
     
     def get_trait_cooldowns(self) -> Dict[str, Dict[str, int]]:
         """Get trait cooldown states"""
-        return {char_id: dict(cooldowns) for char_id, cooldowns in self.trait_cooldowns.items()}
+        return {char_id: self._remaining_cooldowns(char_id) for char_id in self.trait_cooldowns}
     
     def _emit_event(self, event_name: str, data: Dict[str, Any]) -> None:
         """Emit an event with the given name and data"""
@@ -2680,6 +2651,6 @@ share_percent = float(formula_expr.rstrip("%")) / 100.0
         """Export state for backup"""
         return {
             "trait_activations": dict(self.trait_activations),
-            "trait_cooldowns": {char_id: dict(cooldowns) for char_id, cooldowns in self.trait_cooldowns.items()},
+            "trait_cooldowns": self.get_trait_cooldowns(),
             "active": self.active
         }
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""
+META Fantasy League Simulator - Expiry Scheduler
+Heap of deadlines on an integer tick clock (rounds or days)
+
+Systems schedule a key to expire a number of ticks from now and advance the clock
+once per round or day; only the keys that are due come back, so the cost of a tick
+is proportional to the expiries rather than to everything being tracked.
+"""
+
+import heapq
+import itertools
+from typing import Dict, List, Any, Optional, Tuple, Hashable, Callable, Iterator
+
+
+class ExpiryScheduler:
+    """
+    Schedules keyed expiries on a tick clock
+
+    Keys are any hashable except None. Rescheduling a key replaces its deadline;
+    cancelled or replaced entries stay in the heap until they surface and are dropped then.
+    """
+
+    __slots__ = ("now", "on_expire", "_heap", "_entries", "_sequence")
+
+    def __init__(self, on_expire: Optional[Callable[[Hashable, Any], None]] = None, now: int = 0):
+        """Create a scheduler
+
+        Args:
+            on_expire: Called as on_expire(key, payload) for each expiry, in deadline order
+            now: Starting tick
+        """
+        self.now = now
+        self.on_expire = on_expire
+        self._heap: List[list] = []
+        self._entries: Dict[Hashable, list] = {}
+        self._sequence = itertools.count()
+
+    def schedule(self, key: Hashable, delay: int, payload: Any = None) -> int:
+        """Expire `key` `delay` ticks from now (at least one), replacing any earlier deadline
+
+        Returns:
+            int: Deadline tick
+        """
+        previous = self._entries.get(key)
+        if previous is not None:
+            previous[2] = None
+        deadline = self.now + max(1, delay)
+        entry = [deadline, next(self._sequence), key, payload]
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+        return deadline
+
+    def cancel(self, key: Hashable) -> bool:
+        """Drop a pending expiry
+
+        Returns:
+            bool: Whether the key was pending
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        entry[2] = None
+        return True
+
+    def remaining(self, key: Hashable) -> int:
+        """Ticks until `key` expires (0 if it is not pending)"""
+        entry = self._entries.get(key)
+        return entry[0] - self.now if entry is not None else 0
+
+    def advance(self, ticks: int = 1) -> List[Tuple[Hashable, Any]]:
+        """Move the clock forward and collect everything that is now due
+
+        Returns:
+            list: (key, payload) of each expiry in deadline order
+        """
+        self.now += ticks
+        heap = self._heap
+        expired = []
+        while heap and heap[0][0] <= self.now:
+            _, _, key, payload = heapq.heappop(heap)
+            if key is None:
+                continue
+            del self._entries[key]
+            expired.append((key, payload))
+        if self.on_expire is not None:
+            for key, payload in expired:
+                self.on_expire(key, payload)
+        return expired
+
+    def clear(self) -> List[Tuple[Hashable, Any]]:
+        """Drop every pending expiry without calling on_expire
+
+        Returns:
+            list: (key, payload) of each dropped entry
+        """
+        dropped = [(key, entry[3]) for key, entry in self._entries.items()]
+        self._entries = {}
+        self._heap = []
+        return dropped
+
+    def pending(self) -> Dict[Hashable, int]:
+        """Remaining ticks of every pending key"""
+        return {key: entry[0] - self.now for key, entry in self._entries.items()}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._entries)
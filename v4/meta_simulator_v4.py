@@ -29,12 +29,13 @@ import io
 import math
 import logging
 import chess
-import chess.pgn
-import chess.engine
-import pandas as pd
+import numpy as np
 from typing import Dict, List, Any, Optional, Tuple, Union
 from collections import defaultdict
 
+from expiry_scheduler import ExpiryScheduler
+from rstats_accumulator import RStatsAccumulator
+
 #############################################################################
 #                           LOGGER SETUP                                    #
 #############################################################################
@@ -386,15 +387,13 @@ class SystemValidator:
             logger.warning("Stockfish not found but enabled in config")
             return False
         
-        # Try to initialize Stockfish (optional, can be removed if causes issues)
-        try:
-            engine = chess.engine.SimpleEngine.popen_uci(stockfish_path)
-            engine.quit()  # Just testing, close it right away
-            logger.info("Stockfish validation passed")
-            return True
-        except Exception as e:
-            logger.error(f"Stockfish initialization failed: {e}")
+        # Check the binary is executable rather than spawning the engine
+        if not os.access(stockfish_path, os.X_OK):
+            logger.error(f"Stockfish is not executable: {stockfish_path}")
             return False
+        
+        logger.info("Stockfish validation passed")
+        return True
     
     @staticmethod
     def validate_division_data() -> bool:
@@ -403,6 +402,8 @@ class SystemValidator:
         Returns:
             bool: True if division data is valid
         """
+        import pandas as pd
+        
         try:
             # Check if divisions file exists and is readable
             if not os.path.exists(CONFIG.paths["divisions_file"]):
@@ -470,6 +471,8 @@ class DataLoader:
         Returns:
             dict: Mapping of team IDs to team names
         """
+        import pandas as pd
+        
         team_ids_file = CONFIG.paths["team_ids_file"]
         
         if not os.path.exists(team_ids_file):
@@ -526,6 +529,8 @@ class DataLoader:
         Returns:
             dict: Mapping of team IDs to divisions
         """
+        import pandas as pd
+        
         divisions_file = CONFIG.paths["divisions_file"]
         
         if not os.path.exists(divisions_file):
@@ -585,6 +590,8 @@ class DataLoader:
         Returns:
             dict: Dictionary of team lineups by team ID
         """
+        from lineup_cache import get_lineup_cache, build_teams
+        
         lineups_file = CONFIG.paths["lineups_file"]
         
         if not os.path.exists(lineups_file):
@@ -596,183 +603,22 @@ class DataLoader:
             day_sheet = CONFIG.get_excel_date_format(day_number)
             logger.info(f"Loading lineups for day {day_number} (sheet: {day_sheet})")
             
-            # Load Excel file
-            xls = pd.ExcelFile(lineups_file)
-            available_sheets = xls.sheet_names
-            logger.debug(f"Available sheets in Excel file: {available_sheets}")
-            
-            # Try to find a matching sheet
-            day_sheet_clean = day_sheet.replace('/', '')
-            matching_sheets = [s for s in available_sheets if day_sheet_clean in s.replace('/', '').replace('-', '')]
-            selected_sheet = None
-            
-            if day_sheet in available_sheets:
-                selected_sheet = day_sheet
-                logger.info(f"Found exact match for sheet: {day_sheet}")
-            elif matching_sheets:
-                selected_sheet = matching_sheets[0]
-                logger.info(f"Found partial match for sheet: {selected_sheet}")
-            else:
-                # Fall back to first sheet
-                selected_sheet = available_sheets[0]
-                logger.warning(f"No matching sheet found. Using first sheet: {selected_sheet}")
-            
-            # Load the selected sheet
-            df = pd.read_excel(lineups_file, sheet_name=selected_sheet)
-            logger.debug(f"Columns in sheet: {df.columns.tolist()}")
-            
-            # Map column names based on what's available
-            column_mapping = {
-                'team_id': ['Team', 'team_id', 'team', 'team id', 'teamid', 'tid'],
-                'name': ['Nexus Being', 'name', 'character', 'character name', 'char_name', 'character_name'],
-                'role': ['Position', 'PositionFull', 'role', 'position', 'char_role', 'character_role'],
-                'active': ['Active', 'is_active', 'active', 'playing', 'is_playing']
-            }
-            
-            # Create new columns with required names based on available columns
-            required_columns = ['team_id', 'name', 'role', 'active']
-            
-            for required_col, possible_cols in column_mapping.items():
-                found = False
-                for col in possible_cols:
-                    if col in df.columns:
-                        logger.debug(f"Mapping '{col}' to '{required_col}'")
-                        df[required_col] = df[col]
-                        found = True
-                        break
-                
-                if not found:
-                    logger.warning(f"Could not find any column to map to '{required_col}'")
-                    
-                    # Set defaults for missing columns
-                    if required_col == 'active':
-                        df[required_col] = True  # Default to active if not specified
-                    elif required_col == 'role':
-                        df[required_col] = 'FL'  # Default to Field Leader if not specified
-            
-            # Organize by teams
-            teams = {}
-            valid_rows = 0
-            
-            for _, row in df.iterrows():
-                # Skip completely empty rows
-                if pd.isna(row.get('team_id', None)) and pd.isna(row.get('name', None)):
-                    continue
-                
-                team_id = str(row.get('team_id', '')).strip()
-                
-                # Skip rows with empty team_id
-                if not team_id or pd.isna(team_id):
-                    continue
-                
-                # Clean team_id format if needed (some Excel exports add '.0')
-                if team_id.endswith('.0'):
-                    team_id = team_id[:-2]
-                
-                # Normalize team ID
-                team_id = DataLoader.normalize_team_id(team_id)
-                
-                if team_id not in teams:
-                    teams[team_id] = []
-                
-                # Get character name
-                char_name = str(row.get('name', f"Character {len(teams[team_id])}")).strip()
-                if not char_name or pd.isna(char_name):
-                    char_name = f"Character {len(teams[team_id])}"
-                
-                # Get role
-                role = str(row.get('role', 'FL')).strip()
-                if not role or pd.isna(role):
-                    role = 'FL'
-                
-                # Get active status
-                is_active = True
-                if 'active' in row:
-                    active_val = row.get('active')
-                    if not pd.isna(active_val):
-                        # Convert various values to boolean
-                        if isinstance(active_val, bool):
-                            is_active = active_val
-                        elif isinstance(active_val, (int, float)):
-                            is_active = active_val > 0
-                        elif isinstance(active_val, str):
-                            is_active = active_val.lower() in ('true', 'yes', 'y', '1', 'active', 'playing')
-                
-                # Get team name (from Team column or construct from team_id)
-                team_name = None
-                if 'Team' in df.columns and not pd.isna(row.get('Team')):
-                    team_name = f"Team {row.get('Team')}"
-                else:
-                    team_name = f"Team {team_id[1:]}"  # Remove 't' prefix for name
-                
-                # Create character dictionary
-                role_standardized = DataLoader.map_position_to_role(role)
-                division = DataLoader.get_division_from_role(role_standardized)
-                
-                character = {
-                    'id': f"{team_id}_{len(teams[team_id])}",
-                    'name': char_name,
-                    'team_id': team_id,
-                    'team_name': team_name,
-                    'role': role_standardized,
-                    'division': division,
-                    'is_active': is_active,
-                    'HP': 100,
-                    'stamina': 100,
-                    'life': 100,
-                    'morale': 50,
-                    'traits': [],
-                    'rStats': {},
-                    'xp_total': 0
-                }
-                
-                # Add stats - use default values since these usually aren't in the Excel
-                for stat in ['STR', 'SPD', 'FS', 'LDR', 'DUR', 'RES', 'WIL', 'OP', 'AM', 'SBY']:
-                    character[f"a{stat}"] = 5
-                
-                # Try to get Rank as a value for stats
-                if 'Rank' in df.columns and not pd.isna(row.get('Rank')):
-                    try:
-                        rank = int(row.get('Rank'))
-                        # Scale rank to stats (assuming rank is 1-10)
-                        stat_value = min(10, max(1, rank))
-                        # Apply to key stats
-                        character["aSTR"] = stat_value
-                        character["aSPD"] = stat_value
-                        character["aOP"] = stat_value
-                    except:
-                        pass
-                
-                # Add traits based on Primary Type
-                if 'Primary Type' in df.columns and not pd.isna(row.get('Primary Type')):
-                    primary_type = str(row.get('Primary Type')).lower()
-                    
-                    # Map primary types to traits
-                    type_to_trait = {
-                        'tech': ['genius', 'armor'],
-                        'energy': ['genius', 'tactical'],
-                        'cosmic': ['shield', 'healing'],
-                        'mutant': ['agile', 'stretchy'],
-                        'bio': ['agile', 'spider-sense'],
-                        'mystic': ['tactical', 'healing'],
-                        'skill': ['tactical', 'spider-sense']
-                    }
-                    
-                    # Assign traits based on primary type
-                    for type_key, traits in type_to_trait.items():
-                        if type_key in primary_type:
-                            character['traits'] = traits
-                            break
-                    
-                    # Default traits if no match
-                    if not character['traits']:
-                        character['traits'] = ['genius', 'tactical']
-                else:
-                    # Default traits if no primary type
-                    character['traits'] = ['genius', 'tactical']
-                
-                teams[team_id].append(character)
-                valid_rows += 1
+            # The workbook is compiled once per change; day loads read the compiled sheet
+            selected_sheet, sheet = get_lineup_cache(lineups_file).get_sheet(day_sheet)
+            if selected_sheet != day_sheet:
+                logger.info(f"Using sheet {selected_sheet} for {day_sheet}")
+            for column in sheet["missing"]:
+                logger.warning(f"Could not find any column to map to '{column}'")
+            
+            teams = build_teams(
+                sheet,
+                DataLoader.map_position_to_role,
+                DataLoader.get_division_from_role,
+                normalize_team_id=DataLoader.normalize_team_id,
+                active_source="active",
+                required=("team_id",)
+            )
+            valid_rows = sum(len(chars) for chars in teams.values())
             
             logger.info(f"Loaded {valid_rows} characters across {len(teams)} teams")
             
@@ -964,16 +810,13 @@ class ChessSystem:
         self.stockfish_path = stockfish_path
         self.stockfish_available = False
         
-        # Try to activate Stockfish
+        # Stockfish is only spawned when a move is requested
         if stockfish_path and os.path.exists(stockfish_path):
-            try:
-                import chess.engine
-                engine = chess.engine.SimpleEngine.popen_uci(stockfish_path)
-                engine.quit()  # Just testing, close it right away
+            if os.access(stockfish_path, os.X_OK):
                 self.stockfish_available = True
-                logger.info(f"Stockfish activated at {stockfish_path}")
-            except Exception as e:
-                logger.warning(f"Stockfish initialization failed: {e}")
+                logger.info(f"Stockfish available at {stockfish_path}")
+            else:
+                logger.warning(f"Stockfish is not executable: {stockfish_path}")
     
     def create_board(self) -> chess.Board:
         """Create a new chess board
@@ -997,21 +840,12 @@ class ChessSystem:
             # Fall back to random move selection
             return self._select_move_random(board)
         
+        import chess.engine
+        
         try:
-            # Determine analysis depth based on character attributes
-            base_depth = min(max(2, character.get("aFS", 5) // 2), 10)
-            
-            # Adjust depth based on stamina (lower stamina = lower depth)
-            stamina_factor = max(0.5, character.get("stamina", 100) / 100)
-            adjusted_depth = max(1, int(base_depth * stamina_factor))
-            
             # Initialize Stockfish engine
             with chess.engine.SimpleEngine.popen_uci(self.stockfish_path) as engine:
-                # Set thinking time based on character's Focus/Speed
-                thinking_ms = character.get("aFS", 5) * 50
-                
-                # Set limit object
-                limit = chess.engine.Limit(depth=adjusted_depth, time=thinking_ms/1000.0)
+                limit = self.search_limit(character)
                 
                 # Get trait-influenced decision quality
                 decision_quality = self._calculate_decision_quality(character)
@@ -1053,6 +887,29 @@ class ChessSystem:
         # Final fallback
         return self._select_move_random(board)
     
+    def search_limit(self, character: Dict[str, Any]):
+        """Engine search limit for a character's move (also used by pooled engines)
+        
+        Args:
+            character: Character making the move
+            
+        Returns:
+            chess.engine.Limit: Depth from Focus/Speed cut by stamina, think time from Focus/Speed
+        """
+        import chess.engine
+        
+        # Determine analysis depth based on character attributes
+        base_depth = min(max(2, character.get("aFS", 5) // 2), 10)
+        
+        # Adjust depth based on stamina (lower stamina = lower depth)
+        stamina_factor = max(0.5, character.get("stamina", 100) / 100)
+        adjusted_depth = max(1, int(base_depth * stamina_factor))
+        
+        # Set thinking time based on character's Focus/Speed
+        thinking_ms = character.get("aFS", 5) * 50
+        
+        return chess.engine.Limit(depth=adjusted_depth, time=thinking_ms/1000.0)
+    
     def _select_move_random(self, board: chess.Board) -> Optional[chess.Move]:
         """Select a random legal move as fallback
         
@@ -1510,6 +1367,7 @@ class ConvergenceSystem:
         possible_convergences = []
         
         # Check for non-pawn pieces occupying the same square across different boards
+        candidates = []
         for a_idx, (a_char, a_board) in enumerate(zip(first_team, first_boards)):
             # Skip if character is KO'd or dead
             if a_char.get("is_ko", False) or a_char.get("is_dead", False):
@@ -1518,7 +1376,8 @@ class ConvergenceSystem:
             # Skip if character has reached max convergences
             if char_convergence_counts[a_char["id"]] >= max_per_char:
                 continue
-                
+            
+            a_pieces = a_board.occupied & ~a_board.pawns
             for b_idx, (b_char, b_board) in enumerate(zip(second_team, second_boards)):
                 # Skip if character is KO'd or dead
                 if b_char.get("is_ko", False) or b_char.get("is_dead", False):
@@ -1528,67 +1387,66 @@ class ConvergenceSystem:
                 if char_convergence_counts[b_char["id"]] >= max_per_char:
                     continue
                 
-                # Find overlapping positions with non-pawn pieces
-                for square in chess.SQUARES:
-                    a_piece = a_board.piece_at(square)
-                    b_piece = b_board.piece_at(square)
-                    
-                    if (a_piece and b_piece and 
-                        a_piece.piece_type != chess.PAWN and 
-                        b_piece.piece_type != chess.PAWN):
-                        
-                        # Calculate combat rolls
-                        a_roll = self._calculate_combat_roll(a_char, b_char)
-                        b_roll = self._calculate_combat_roll(b_char, a_char)
-                        
-                        # Apply trait effects for convergence
-                        if self.trait_system:
-                            # Create context for trait activation
-                            a_context = {"opponent": b_char, "square": square, "roll": a_roll}
-                            a_effects = self.trait_system.apply_trait_effect(a_char, "convergence", a_context)
-                            
-                            for effect in a_effects:
-                                if effect.get("effect") == "combat_bonus":
-                                    a_roll += effect.get("value", 0)
-                                    context["trait_logs"].append({
-                                        "round": context.get("round", 1),
-                                        "character": a_char["name"],
-                                        "trait": effect.get("trait_name", "Unknown Trait"),
-                                        "effect": f"Added {effect.get('value', 0)} to combat roll"
-                                    })
-                            
-                            # Same for B character
-                            b_context = {"opponent": a_char, "square": square, "roll": b_roll}
-                            b_effects = self.trait_system.apply_trait_effect(b_char, "convergence", b_context)
-                            
-                            for effect in b_effects:
-                                if effect.get("effect") == "combat_bonus":
-                                    b_roll += effect.get("value", 0)
-                                    context["trait_logs"].append({
-                                        "round": context.get("round", 1),
-                                        "character": b_char["name"],
-                                        "trait": effect.get("trait_name", "Unknown Trait"),
-                                        "effect": f"Added {effect.get('value', 0)} to combat roll"
-                                    })
-                        
-                        # Calculate priority (higher difference = more important convergence)
-                        priority = abs(a_roll - b_roll)
-                        
-                        # Map original team indices
-                        original_a_idx = a_idx if first_id == "A" else b_idx
-                        original_b_idx = b_idx if first_id == "A" else a_idx
-                        
-                        # Store as possible convergence
-                        possible_convergences.append({
-                            "a_char": a_char,
-                            "b_char": b_char,
-                            "a_idx": original_a_idx,
-                            "b_idx": original_b_idx,
-                            "a_roll": a_roll,
-                            "b_roll": b_roll,
-                            "square": square,
-                            "priority": priority
+                # Overlapping non-pawn pieces, one bitboard intersection per board pair
+                for square in chess.scan_forward(a_pieces & b_board.occupied & ~b_board.pawns):
+                    candidates.append((a_idx, a_char, b_idx, b_char, square))
+        
+        # Calculate combat rolls for every candidate in one draw
+        attackers = [candidate[1] for candidate in candidates] + [candidate[3] for candidate in candidates]
+        rolls = self._calculate_combat_rolls(attackers, context.get("rng"))
+        
+        for n, (a_idx, a_char, b_idx, b_char, square) in enumerate(candidates):
+            a_roll = rolls[n]
+            b_roll = rolls[len(candidates) + n]
+            
+            # Apply trait effects for convergence
+            if self.trait_system:
+                # Create context for trait activation
+                a_context = {"opponent": b_char, "square": square, "roll": a_roll}
+                a_effects = self.trait_system.apply_trait_effect(a_char, "convergence", a_context)
+                
+                for effect in a_effects:
+                    if effect.get("effect") == "combat_bonus":
+                        a_roll += effect.get("value", 0)
+                        context["trait_logs"].append({
+                            "round": context.get("round", 1),
+                            "character": a_char["name"],
+                            "trait": effect.get("trait_name", "Unknown Trait"),
+                            "effect": f"Added {effect.get('value', 0)} to combat roll"
+                        })
+                
+                # Same for B character
+                b_context = {"opponent": a_char, "square": square, "roll": b_roll}
+                b_effects = self.trait_system.apply_trait_effect(b_char, "convergence", b_context)
+                
+                for effect in b_effects:
+                    if effect.get("effect") == "combat_bonus":
+                        b_roll += effect.get("value", 0)
+                        context["trait_logs"].append({
+                            "round": context.get("round", 1),
+                            "character": b_char["name"],
+                            "trait": effect.get("trait_name", "Unknown Trait"),
+                            "effect": f"Added {effect.get('value', 0)} to combat roll"
                         })
+            
+            # Calculate priority (higher difference = more important convergence)
+            priority = abs(a_roll - b_roll)
+            
+            # Map original team indices
+            original_a_idx = a_idx if first_id == "A" else b_idx
+            original_b_idx = b_idx if first_id == "A" else a_idx
+            
+            # Store as possible convergence
+            possible_convergences.append({
+                "a_char": a_char,
+                "b_char": b_char,
+                "a_idx": original_a_idx,
+                "b_idx": original_b_idx,
+                "a_roll": a_roll,
+                "b_roll": b_roll,
+                "square": square,
+                "priority": priority
+            })
         
         # Sort by priority (highest first) and take only max_convergences
         possible_convergences.sort(key=lambda x: x["priority"], reverse=True)
@@ -1717,43 +1575,37 @@ class ConvergenceSystem:
         else:
             return team_b, team_b_boards, team_b_id, team_a, team_a_boards, team_a_id
     
-    def _calculate_combat_roll(self, attacker: Dict[str, Any], defender: Dict[str, Any]) -> int:
-        """Calculate combat roll for convergence resolution
+    def _calculate_combat_rolls(self, attackers: List[Dict[str, Any]], rng=None) -> List[int]:
+        """Calculate combat rolls for convergence resolution: one d100 draw for every attacker of the round
         
         Args:
-            attacker: Attacking character
-            defender: Defending character
+            attackers: Rolling characters (one roll each)
+            rng: The match's numpy Generator (a fresh one is seeded from Python's random if omitted)
             
         Returns:
-            int: Combat roll value
+            List: Combat roll values, in order
         """
-        # Base roll (1-100)
-        roll = random.randint(1, 100)
-        
-        # Add stat bonuses
-        str_val = attacker.get("aSTR", 5)
-        fs_val = attacker.get("aFS", 5)
+        if not attackers:
+            return []
         
-        roll += str_val + fs_val
+        if rng is None:
+            rng = np.random.default_rng(random.getrandbits(64))
         
-        # Scale by Power Potential
-        op_factor = attacker.get("aOP", 5) / 5.0
-        roll = int(roll * op_factor)
+        # Base rolls (1-100) plus stat bonuses
+        roll = rng.integers(1, 101, size=len(attackers)).astype(float)
+        roll += np.array([attacker.get("aSTR", 5) + attacker.get("aFS", 5) for attacker in attackers], dtype=float)
         
-        # Apply morale factor
-        morale = attacker.get("morale", 50) / 50.0
-        roll = int(roll * morale)
+        # Scale by Power Potential, then morale (truncating like int())
+        op_factor = np.array([attacker.get("aOP", 5) / 5.0 for attacker in attackers])
+        roll = np.trunc(roll * op_factor)
+        morale = np.array([attacker.get("morale", 50) / 50.0 for attacker in attackers])
+        roll = np.trunc(roll * morale)
         
         # Apply role bonuses
-        role = attacker.get("role", "")
-        if role == "FL":  # Field Leader
-            roll += 10  # +10 to rolls
-        elif role == "VG":  # Vanguard
-            roll += 5   # +5 to rolls
-        elif role == "SV":  # Sovereign
-            roll += 15  # +15 to rolls
+        role_bonus = {"FL": 10, "VG": 5, "SV": 15}
+        roll += np.array([role_bonus.get(attacker.get("role", ""), 0) for attacker in attackers])
         
-        return roll
+        return roll.astype(int).tolist()
     
     def _apply_damage(self, character: Dict[str, Any], damage: float, source: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """Apply damage to character from convergence
@@ -1854,6 +1706,9 @@ class TraitSystem:
         
         # Track trait activations
         self.activation_counts = {}
+        
+        # One round clock per team: update_cooldowns only ticks the teams it is given
+        self._cooldown_clocks: Dict[Any, ExpiryScheduler] = {}
     
     def _load_traits(self, trait_file: str) -> Dict[str, Dict[str, Any]]:
         """Load trait definitions from CSV file
@@ -2040,6 +1895,7 @@ class TraitSystem:
                     if "trait_cooldowns" not in character:
                         character["trait_cooldowns"] = {}
                     character["trait_cooldowns"][trait_id] = cooldown
+                    self._schedule_cooldown(character, trait_id, cooldown)
                 
                 # Add to activated traits
                 activated_traits.append({
@@ -2133,11 +1989,135 @@ class TraitSystem:
             })
         
         return effects
+    
+    def _map_effect_type(self, effect_type: str) -> str:
+        """Map trait effect types to standardized effects
+        
+        Args:
+            effect_type: Original effect type
+            
+        Returns:
+            str: Standardized effect type
+        """
+        # Map of formula keys to standardized effects
+        effect_map = {
+            "bonus_roll": "combat_bonus",
+            "damage_reduction": "damage_reduction",
+            "heal": "healing",
+            "defense_bonus": "defense_bonus",
+            "evasion": "evasion_bonus",
+            "reroll": "reroll_dice",
+            "trait_bonus": "trait_bonus"
+        }
+        
+        return effect_map.get(effect_type, effect_type)
+    
+    def _schedule_cooldown(self, character: Dict[str, Any], trait_id: str, cooldown: int) -> None:
+        """Put a trait's expiry on the round clock of the character's team"""
+        team_key = character.get("team_id")
+        clock = self._cooldown_clocks.get(team_key)
+        if clock is None:
+            clock = self._cooldown_clocks[team_key] = ExpiryScheduler()
+        clock.schedule((character.get("id"), trait_id), cooldown, character)
+    
+    def update_cooldowns(self, characters: List[Dict[str, Any]]) -> None:
+        """Update trait cooldowns at end of round
+        
+        Advances the round clock of each team in `characters` by one round and
+        removes only the cooldowns that expire on it. A trait_cooldowns entry keeps
+        the cooldown it was set to until then; get_cooldown_remaining() reads the
+        rounds left from the clock.
+        
+        Args:
+            characters: List of characters to update
+        """
+        for team_key in {character.get("team_id") for character in characters}:
+            clock = self._cooldown_clocks.get(team_key)
+            if clock is None:
+                continue
+            
+            for (_, trait_id), character in clock.advance():
+                character.get("trait_cooldowns", {}).pop(trait_id, None)
+            
+            # Drop idle clocks so they do not accumulate across matches
+            if not clock:
+                del self._cooldown_clocks[team_key]
+    
+    def get_cooldown_remaining(self, character: Dict[str, Any], trait_id: str) -> int:
+        """Rounds left before a trait comes off cooldown (0 if it is not on cooldown)
+        
+        Args:
+            character: Character whose trait to check
+            trait_id: Trait to check
+        """
+        clock = self._cooldown_clocks.get(character.get("team_id"))
+        return clock.remaining((character.get("id"), trait_id)) if clock is not None else 0
+    
+    def end_match(self, characters: List[Dict[str, Any]]) -> None:
+        """Drop the round clocks of the teams in `characters` and their pending cooldowns
+        
+        Clocks hold the character dicts they expire, so they must not outlive the match.
+        
+        Args:
+            characters: Characters of both teams in the match
+        """
+        for team_key in {character.get("team_id") for character in characters}:
+            clock = self._cooldown_clocks.pop(team_key, None)
+            if clock is None:
+                continue
+            for (_, trait_id), character in clock.clear():
+                character.get("trait_cooldowns", {}).pop(trait_id, None)
+    
+    def assign_traits_to_character(self, character: Dict[str, Any], division: str, role: str) -> List[str]:
+        """Assign appropriate traits to a character based on division and role
+        
+        Args:
+            character: Character to assign traits to
+            division: Character's division ('o' or 'i')
+            role: Character's role
+            
+        Returns:
+            list: Assigned traits
+        """
+        # Define trait sets by division and role
+        operations_traits = {
+            "FL": ["tactical", "shield", "armor"],
+            "VG": ["agile", "shield", "stretchy"],
+            "EN": ["armor", "agile", "tactical"]
+        }
+        
+        intelligence_traits = {
+            "RG": ["genius", "agile", "spider-sense"],
+            "GO": ["spider-sense", "agile", "stretchy"],
+            "PO": ["genius", "spider-sense", "tactical"],
+            "SV": ["genius", "tactical", "shield"]
+        }
+        
+        # Get appropriate trait pool
+        if division == "o":
+            trait_pool = operations_traits.get(role, ["tactical", "armor"])
+        else:
+            trait_pool = intelligence_traits.get(role, ["genius", "spider-sense"])
+        
+        # Add healing trait based on DUR
+        if character.get("aDUR", 5) >= 7:
+            trait_pool.append("healing")
+        
+        # Select 2-3 traits based on character stats
+        num_traits = min(3, max(2, (character.get("aOP", 5) + character.get("aAM", 5)) // 4))
+        
+        # Select random traits from pool
+        selected_traits = random.sample(trait_pool, min(num_traits, len(trait_pool)))
+        
+        # Set traits on character
+        character["traits"] = selected_traits
+        
+        return selected_traits
+
 
 #############################################################################
 #                            PGN TRACKER                                    #
 #############################################################################
-
 class PGNTracker:
     """System for recording chess games in PGN format with character metadata"""
     
@@ -2189,6 +2169,8 @@ class PGNTracker:
         if not self.current_match:
             raise ValueError("No active match. Call start_match() first.")
         
+        import chess.pgn  # loads chess.engine, kept off the simulator's import path
+        
         # Create a new game
         game = chess.pgn.Game()
         
@@ -2351,14 +2333,25 @@ class StatTracker:
     
     def __init__(self):
         """Initialize the stat tracker"""
-        # Dictionary to store all unit stats
-        self.unit_stats = defaultdict(lambda: defaultdict(int))
-        
         # Dictionary to store team stats
         self.team_stats = defaultdict(lambda: defaultdict(int))
         
         # Define canonical rStats
         self.canonical_rstats = self._get_canonical_rstats()
+        
+        # Unit stats live in one matrix; non-canonical stats (WIN, LOSS, ...) get columns on first write
+        self.unit_stats = RStatsAccumulator(
+            [f"r{base}" for base in self.canonical_rstats],
+            {f"r{base}": stat_def["domain"] for base, stat_def in self.canonical_rstats.items()},
+            open_columns=True,
+            default_division="o"
+        )
+        
+        # Stat name as passed to update_stat -> (stored name, column)
+        self._stat_keys = {}
+        
+        # Division -> {spelling: stored name} for the canonical stats allowed in it
+        self._allowed_rstats = {}
     
     def _get_canonical_rstats(self) -> Dict[str, Dict[str, str]]:
         """Get the canonical rStat definitions
@@ -2490,12 +2483,7 @@ class StatTracker:
         Args:
             character: Character to register
         """
-        char_id = character.get("id", "unknown")
-        self.unit_stats[char_id]["unit_id"] = char_id
-        self.unit_stats[char_id]["name"] = character.get("name", "Unknown")
-        self.unit_stats[char_id]["division"] = character.get("division", "o")
-        self.unit_stats[char_id]["role"] = character.get("role", "")
-        self.unit_stats[char_id]["team_id"] = character.get("team_id", "")
+        self.unit_stats.register(character)
         
         # Initialize rStats if needed
         if "rStats" not in character:
@@ -2513,31 +2501,34 @@ class StatTracker:
         Returns:
             dict: Updated rStats
         """
-        # Get character ID
-        char_id = character.get("id", "unknown")
-        
-        # Strip 'r' prefix if present
-        base_stat = stat_name[1:] if stat_name.startswith('r') else stat_name
-        
-        # Add 'r' prefix for storage
-        full_stat_name = f"r{base_stat}"
+        # Resolve the stored name and column once per distinct stat name
+        key = self._stat_keys.get(stat_name)
+        if key is None:
+            base_stat = stat_name[1:] if stat_name.startswith('r') else stat_name
+            full_stat_name = f"r{base_stat}"
+            key = self._stat_keys[stat_name] = (full_stat_name, self.unit_stats.column(full_stat_name))
+        full_stat_name, col = key
         
         # Ensure rStats exists
-        if "rStats" not in character:
-            character["rStats"] = {}
+        rstats = character.get("rStats")
+        if rstats is None:
+            rstats = character["rStats"] = {}
         
         # Update based on operation type
         if operation == "add":
-            character["rStats"][full_stat_name] = character["rStats"].get(full_stat_name, 0) + value
+            rstats[full_stat_name] = rstats.get(full_stat_name, 0) + value
         elif operation == "set":
-            character["rStats"][full_stat_name] = value
+            rstats[full_stat_name] = value
         elif operation == "max":
-            character["rStats"][full_stat_name] = max(character["rStats"].get(full_stat_name, 0), value)
+            rstats[full_stat_name] = max(rstats.get(full_stat_name, 0), value)
         
-        # Also update in tracking dictionary
-        self.unit_stats[char_id][full_stat_name] = character["rStats"][full_stat_name]
+        # Also update in tracking matrix
+        row = self.unit_stats.row_of(character.get("id", "unknown"))
+        if row is None:
+            row = self.unit_stats.register(character)
+        self.unit_stats.apply_at(row, col, rstats[full_stat_name], "set")
         
-        return character["rStats"]
+        return rstats
     
     def update_team_stat(self, team_id: str, stat_name: str, value: int = 1, operation: str = "add") -> None:
         """Update a team-level stat
@@ -2660,24 +2651,20 @@ class StatTracker:
         if "rStats" not in character:
             character["rStats"] = {}
         
-        # Get current rStats
-        rstats = character["rStats"]
+        # Stats allowed for this division, by every accepted spelling
+        allowed = self._allowed_rstats.get(division)
+        if allowed is None:
+            allowed = self._allowed_rstats[division] = {}
+            for base_stat, stat_def in self.canonical_rstats.items():
+                if stat_def["domain"] == "b" or stat_def["domain"] == division:
+                    allowed[base_stat] = allowed[f"r{base_stat}"] = f"r{base_stat}"
         
-        # Check each stat against canonical definitions
+        # Keep canonical stats valid for this division, stored with the 'r' prefix
         validated = {}
-        
-        for stat_name, stat_value in rstats.items():
-            # Strip 'r' prefix if present
-            base_stat = stat_name[1:] if stat_name.startswith('r') else stat_name
-            
-            # Check if stat is in canonical list
-            if base_stat in self.canonical_rstats:
-                stat_def = self.canonical_rstats[base_stat]
-                
-                # Check if stat is valid for this division
-                if stat_def["domain"] == "b" or stat_def["domain"] == division:
-                    # Add 'r' prefix for storage
-                    validated[f"r{base_stat}"] = stat_value
+        for stat_name, stat_value in character["rStats"].items():
+            full_stat_name = allowed.get(stat_name)
+            if full_stat_name is not None:
+                validated[full_stat_name] = stat_value
         
         # Update character's rStats
         character["rStats"] = validated
@@ -2706,26 +2693,7 @@ class StatTracker:
         # Export character stats
         char_path = f"{output_path}_characters.csv"
         
-        with open(char_path, "w", newline="") as f:
-            # Get all possible fields
-            meta_fields = ["unit_id", "name", "division", "role", "team_id"]
-            stat_fields = []
-            
-            for unit_stats in self.unit_stats.values():
-                for key in unit_stats.keys():
-                    if key.startswith('r') and key not in stat_fields and key not in meta_fields:
-                        stat_fields.append(key)
-            
-            # Sort stat fields
-            stat_fields.sort()
-            
-            # Create CSV writer
-            writer = csv.DictWriter(f, fieldnames=meta_fields + stat_fields)
-            writer.writeheader()
-            
-            # Write character stats
-            for unit_id, stats in self.unit_stats.items():
-                writer.writerow(stats)
+        self.unit_stats.export_csv(char_path, skip_zero_columns=True, sort_columns=True)
         
         # Export team stats
         team_path = f"{output_path}_teams.csv"
@@ -2784,7 +2752,7 @@ class StatTracker:
         char_path = f"{output_path}_characters.json"
         
         with open(char_path, "w") as f:
-            json.dump(dict(self.unit_stats), f, indent=2)
+            json.dump(self.unit_stats.to_flat_dict(), f, indent=2)
         
         # Export team stats
         team_path = f"{output_path}_teams.json"
@@ -3300,7 +3268,9 @@ class MetaLeagueSimulator:
             "trait_logs": [],
             "damage_contributors": {},
             "team_a": team_a_active,
-            "team_b": team_b_active
+            "team_b": team_b_active,
+            # One generator for the match's combat rolls, seeded from Python's random so random.seed() fixes them
+            "rng": np.random.default_rng(random.getrandbits(64))
         }
         
         if show_details:
@@ -3420,6 +3390,9 @@ class MetaLeagueSimulator:
                     logger.info(f"Match ended in round {round_num}")
                 break
         
+        # Round clocks end with the match
+        self.trait_system.end_match(team_a_active + team_b_active)
+        
         # Calculate match results
         match_result = self._calculate_match_result(team_a_active, team_b_active, match_context)
         
@@ -3892,87 +3865,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-    
-    def _map_effect_type(self, effect_type: str) -> str:
-        """Map trait effect types to standardized effects
-        
-        Args:
-            effect_type: Original effect type
-            
-        Returns:
-            str: Standardized effect type
-        """
-        # Map of formula keys to standardized effects
-        effect_map = {
-            "bonus_roll": "combat_bonus",
-            "damage_reduction": "damage_reduction",
-            "heal": "healing",
-            "defense_bonus": "defense_bonus",
-            "evasion": "evasion_bonus",
-            "reroll": "reroll_dice",
-            "trait_bonus": "trait_bonus"
-        }
-        
-        return effect_map.get(effect_type, effect_type)
-    
-    def update_cooldowns(self, characters: List[Dict[str, Any]]) -> None:
-        """Update trait cooldowns at end of round
-        
-        Args:
-            characters: List of characters to update
-        """
-        for character in characters:
-            if "trait_cooldowns" in character:
-                # Reduce all cooldowns by 1
-                for trait_id in list(character["trait_cooldowns"].keys()):
-                    character["trait_cooldowns"][trait_id] -= 1
-                    
-                    # Remove expired cooldowns
-                    if character["trait_cooldowns"][trait_id] <= 0:
-                        del character["trait_cooldowns"][trait_id]
-    
-    def assign_traits_to_character(self, character: Dict[str, Any], division: str, role: str) -> List[str]:
-        """Assign appropriate traits to a character based on division and role
-        
-        Args:
-            character: Character to assign traits to
-            division: Character's division ('o' or 'i')
-            role: Character's role
-            
-        Returns:
-            list: Assigned traits
-        """
-        # Define trait sets by division and role
-        operations_traits = {
-            "FL": ["tactical", "shield", "armor"],
-            "VG": ["agile", "shield", "stretchy"],
-            "EN": ["armor", "agile", "tactical"]
-        }
-        
-        intelligence_traits = {
-            "RG": ["genius", "agile", "spider-sense"],
-            "GO": ["spider-sense", "agile", "stretchy"],
-            "PO": ["genius", "spider-sense", "tactical"],
-            "SV": ["genius", "tactical", "shield"]
-        }
-        
-        # Get appropriate trait pool
-        if division == "o":
-            trait_pool = operations_traits.get(role, ["tactical", "armor"])
-        else:
-            trait_pool = intelligence_traits.get(role, ["genius", "spider-sense"])
-        
-        # Add healing trait based on DUR
-        if character.get("aDUR", 5) >= 7:
-            trait_pool.append("healing")
-        
-        # Select 2-3 traits based on character stats
-        num_traits = min(3, max(2, (character.get("aOP", 5) + character.get("aAM", 5)) // 4))
-        
-        # Select random traits from pool
-        selected_traits = random.sample(trait_pool, min(num_traits, len(trait_pool)))
-        
-        # Set traits on character
-        character["traits"] = selected_traits
-        
-        return selected_traits
\ No newline at end of file
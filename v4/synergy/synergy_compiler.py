@@ -0,0 +1,223 @@
+"""
+META Fantasy League Simulator - Synergy Compiler
+Compiles synergy requirements into integer predicates over a per-team summary
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple, Callable
+
+logger = logging.getLogger("SynergyCompiler")
+
+DIVISIONS = ("o", "i")
+
+
+class TeamSummary:
+    """
+    Everything the compiled predicates read about a team
+
+    role_ge maps a count threshold to the bitmask of roles present at least that many
+    times; trait_masks holds one trait bitset per character; leader_max and
+    leader_traits describe the characters in leader roles. The summary doubles as
+    the cache key, so lineups with the same composition share their detection result.
+    """
+
+    __slots__ = ("role_ge", "division_counts", "trait_masks", "leader_max", "leader_traits", "key")
+
+    def __init__(self, role_ge: Dict[int, int], division_counts: Tuple[int, ...], trait_masks: Tuple[int, ...],
+                 leader_max: Dict[Tuple[str, str], Any], leader_traits: Dict[str, Optional[int]]):
+        self.role_ge = role_ge
+        self.division_counts = division_counts
+        self.trait_masks = trait_masks
+        self.leader_max = leader_max
+        self.leader_traits = leader_traits
+        self.key = (tuple(sorted(role_ge.items())), division_counts, tuple(sorted(trait_masks)),
+                    tuple(sorted(leader_max.items())), tuple(sorted(leader_traits.items(), key=lambda item: item[0])))
+
+
+class SynergyCompiler:
+    """
+    Turns a synergy catalog into bitmask and count predicates
+
+    Roles and traits named by any requirement get a bit each. A team is reduced to a
+    TeamSummary in one pass, after which every compiled synergy is a few integer
+    comparisons. Synergy types the compiler does not know are reported in
+    `uncompiled` for the caller to check the slow way.
+    """
+
+    def __init__(self, synergies: Dict[str, Dict[str, Any]], cache_size: int = 1024):
+        """Compile a catalog
+
+        Args:
+            synergies: Synergy definitions by ID
+            cache_size: Summaries whose detection results are remembered
+        """
+        self.role_bits: Dict[str, int] = {}
+        self.trait_bits: Dict[str, int] = {}
+        self.role_thresholds = set()
+        self.leader_stats = set()      # (role, stat) pairs read by leader_aura rules
+        self.leader_roles = set()      # roles read by leader_trait rules
+        self.predicates: List[Tuple[str, Callable[[TeamSummary], bool]]] = []
+        self.trait_requirements: Dict[str, int] = {}   # trait_combo masks, for effect targeting
+        self.uncompiled: List[str] = []
+
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[tuple, List[str]]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        for synergy_id, synergy in synergies.items():
+            predicate = self._compile(synergy_id, synergy)
+            if predicate is None:
+                self.uncompiled.append(synergy_id)
+            else:
+                self.predicates.append((synergy_id, predicate))
+
+        logger.info(f"Compiled {len(self.predicates)} synergies over {len(self.role_bits)} roles and "
+                    f"{len(self.trait_bits)} traits ({len(self.uncompiled)} left uncompiled)")
+
+    # ---- COMPILATION ----
+
+    def _role_mask(self, roles: List[str]) -> int:
+        mask = 0
+        for role in roles:
+            mask |= 1 << self.role_bits.setdefault(role, len(self.role_bits))
+        return mask
+
+    def _trait_mask(self, traits: List[str]) -> int:
+        mask = 0
+        for trait in traits:
+            mask |= 1 << self.trait_bits.setdefault(trait, len(self.trait_bits))
+        return mask
+
+    def _compile(self, synergy_id: str, synergy: Dict[str, Any]) -> Optional[Callable[[TeamSummary], bool]]:
+        """Predicate for one synergy (None for unknown types)"""
+        req = synergy.get("requirements", {})
+        synergy_type = synergy.get("type")
+
+        if synergy_type == "role_combo":
+            # Every required role present at least `count` times
+            required = self._role_mask(req["roles"])
+            threshold = req.get("count", 1)
+            self.role_thresholds.add(threshold)
+            return lambda summary: summary.role_ge[threshold] & required == required
+
+        if synergy_type == "trait_combo":
+            # At least `character_count` characters holding every required trait
+            required = self.trait_requirements[synergy_id] = self._trait_mask(req["traits"])
+            needed = req.get("character_count", 1)
+            return lambda summary: sum(1 for mask in summary.trait_masks if mask & required == required) >= needed
+
+        if synergy_type == "division_balance":
+            operations_min = req.get("operations_min", 0)
+            intelligence_min = req.get("intelligence_min", 0)
+            return lambda summary: (summary.division_counts[0] >= operations_min and
+                                    summary.division_counts[1] >= intelligence_min)
+
+        if synergy_type == "division_focus":
+            if "operations_min" in req:
+                operations_min = req["operations_min"]
+                return lambda summary: summary.division_counts[0] >= operations_min
+            if "intelligence_min" in req:
+                intelligence_min = req["intelligence_min"]
+                return lambda summary: summary.division_counts[1] >= intelligence_min
+            return lambda summary: False
+
+        if synergy_type == "leader_aura":
+            # Some character in the role reaches the stat minimum
+            key = (req.get("role"), req.get("stat"))
+            min_value = req.get("min_value", 0)
+            self.leader_stats.add(key)
+            return lambda summary: summary.leader_max[key] is not None and summary.leader_max[key] >= min_value
+
+        if synergy_type == "leader_trait":
+            # The first character in the role holds every required trait
+            role = req.get("role")
+            if "traits" not in req:
+                return lambda summary: False
+            required = self._trait_mask(req["traits"])
+            self.leader_roles.add(role)
+            return lambda summary: summary.leader_traits[role] is not None and \
+                summary.leader_traits[role] & required == required
+
+        return None
+
+    # ---- TEAM SUMMARY ----
+
+    def character_traits(self, character: Dict[str, Any]) -> int:
+        """Bitset of the catalog traits a character holds (named traits only)"""
+        bits = self.trait_bits
+        mask = 0
+        for trait in character.get("traits", []):
+            if isinstance(trait, str) and trait in bits:
+                mask |= 1 << bits[trait]
+        return mask
+
+    def summarize(self, team: List[Dict[str, Any]]) -> TeamSummary:
+        """Reduce a team to the counts, bitsets and leader stats the predicates read"""
+        role_counts: Dict[str, int] = {}
+        division_counts = [0] * len(DIVISIONS)
+        trait_masks = []
+        leader_max: Dict[Tuple[str, str], Any] = {key: None for key in self.leader_stats}
+        leader_traits: Dict[str, Optional[int]] = {role: None for role in self.leader_roles}
+
+        for char in team:
+            role = char.get("role")
+            mask = self.character_traits(char)
+            trait_masks.append(mask)
+
+            if role in self.role_bits:
+                role_counts[role] = role_counts.get(role, 0) + 1
+
+            division = char.get("division")
+            if division in DIVISIONS:
+                division_counts[DIVISIONS.index(division)] += 1
+
+            for key in self.leader_stats:
+                if key[0] == role:
+                    value = char.get(key[1], 0)
+                    if leader_max[key] is None or value > leader_max[key]:
+                        leader_max[key] = value
+
+            if role in leader_traits and leader_traits[role] is None:
+                leader_traits[role] = mask
+
+        role_ge = {}
+        for threshold in self.role_thresholds:
+            role_mask = 0
+            for role, count in role_counts.items():
+                if count >= threshold:
+                    role_mask |= 1 << self.role_bits[role]
+            role_ge[threshold] = role_mask
+
+        return TeamSummary(role_ge, tuple(division_counts), tuple(trait_masks), leader_max, leader_traits)
+
+    # ---- DETECTION ----
+
+    def detect(self, team: List[Dict[str, Any]]) -> List[str]:
+        """IDs of the compiled synergies a team satisfies, in catalog order (cached by summary)"""
+        summary = self.summarize(team)
+        cached = self._cache.get(summary.key)
+        if cached is not None:
+            self._cache.move_to_end(summary.key)
+            self.cache_hits += 1
+            return cached
+
+        self.cache_misses += 1
+        active = [synergy_id for synergy_id, predicate in self.predicates if predicate(summary)]
+        self._cache[summary.key] = active
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return active
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Catalog size, bit widths and cache counters"""
+        return {
+            "compiled": len(self.predicates),
+            "uncompiled": len(self.uncompiled),
+            "roles": len(self.role_bits),
+            "traits": len(self.trait_bits),
+            "cache_entries": len(self._cache),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses
+        }
@@ -11,6 +11,8 @@ import logging
 from typing import Dict, List, Any, Optional, Set, Tuple
 from collections import defaultdict
 
+from synergy_compiler import SynergyCompiler
+
 logger = logging.getLogger("SynergyEngine")
 
 class SynergyEngine:
@@ -29,6 +31,9 @@ class SynergyEngine:
         # Dictionary of defined synergies
         self.synergies = self._load_synergies()
         
+        # Requirements compiled to bitmask predicates (results cached by lineup)
+        self.compiler = SynergyCompiler(self.synergies)
+        
         # Track synergy activations
         self.activation_counts = defaultdict(int)
         
@@ -269,10 +274,13 @@ class SynergyEngine:
             list: Active synergies and their effects
         """
         active_synergies = []
+        compiled_active = set(self.compiler.detect(team))
+        uncompiled = self.compiler.uncompiled
         
-        # Check each synergy definition
+        # Check each synergy definition (unknown types the slow way)
         for synergy_id, synergy in self.synergies.items():
-            if self._check_synergy_requirements(team, synergy):
+            if synergy_id in compiled_active or (
+                    synergy_id in uncompiled and self._check_synergy_requirements(team, synergy)):
                 # Add to active synergies
                 active_synergies.append({
                     "id": synergy_id,
@@ -398,9 +406,9 @@ class SynergyEngine:
                     # Apply to characters that triggered the synergy
                     if "trait_combo" in synergy["type"]:
                         # For trait combos, apply to characters with all required traits
-                        required_traits = self.synergies[synergy["id"]]["requirements"]["traits"]
+                        required = self.compiler.trait_requirements[synergy["id"]]
                         for char in team:
-                            if all(trait in char.get("traits", []) for trait in required_traits):
+                            if self.compiler.character_traits(char) & required == required:
                                 self._apply_effect_to_character(char, effect, synergy["name"])
                 
                 elif target_type == "team":
@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+V4_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The simulator uses flat imports, as when run from v4/ (traits/ and synergy/ alongside)
+sys.path[:0] = [V4_ROOT, os.path.join(V4_ROOT, "traits"), os.path.join(V4_ROOT, "synergy")]
+
+
+@pytest.fixture(scope="session")
+def v4(tmp_path_factory):
+    """The simulator module, imported from a scratch directory (it creates logs/ and results/ on import)"""
+    previous = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("v4"))
+    try:
+        import meta_simulator_v4
+        yield meta_simulator_v4
+    finally:
+        os.chdir(previous)
@@ -0,0 +1,22 @@
+import numpy as np
+
+
+ATTACKERS = [{"aSTR": 6, "aFS": 4, "aOP": 5, "morale": 50, "role": role} for role in ("FL", "VG", "SV", "RG")]
+
+
+def test_match_generator_reproduces_combat_rolls(v4):
+    system = v4.ConvergenceSystem()
+
+    first = system._calculate_combat_rolls(ATTACKERS, np.random.default_rng(42))
+
+    assert system._calculate_combat_rolls(ATTACKERS, np.random.default_rng(42)) == first
+    assert all(11 <= roll - bonus <= 110 for roll, bonus in zip(first, (10, 5, 15, 0)))
+
+
+def test_rounds_continue_the_match_generator(v4):
+    system = v4.ConvergenceSystem()
+    rng = np.random.default_rng(42)
+
+    first = system._calculate_combat_rolls(ATTACKERS, rng)
+
+    assert system._calculate_combat_rolls(ATTACKERS, rng) != first
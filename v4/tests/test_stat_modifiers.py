@@ -0,0 +1,52 @@
+from stat_modifiers import ADD, MUL, add_modifier, base_stat, remove_modifiers, set_base_stat
+
+
+def test_base_change_survives_later_modifier_changes():
+    character = {"id": "c1", "aSTR": 6}
+    add_modifier(character, "home_advantage", "aSTR", 1.5, MUL)
+    assert character["aSTR"] == 9
+
+    assert set_base_stat(character, "aSTR", 7) == 10.5
+    remove_modifiers(character, "home_advantage")
+
+    assert character["aSTR"] == 7
+    assert base_stat(character, "aSTR") == 7
+
+
+def test_base_change_without_a_stack_writes_the_attribute():
+    character = {"id": "c1", "aSTR": 6}
+    assert set_base_stat(character, "aSTR", 7) == 7
+    assert character["aSTR"] == 7
+    assert "modifier_stack" not in character
+
+
+def test_level_up_grows_the_base_not_the_modified_value(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    from xp_progression_system import XPProgressionSystem
+
+    progression = XPProgressionSystem()
+    progression.default_growth = {"aSTR": 1.0}
+    character = {"id": "c1", "aSTR": 6}
+    add_modifier(character, "home_advantage", "aSTR", 2, ADD)
+
+    assert progression._apply_level_up_stats(character) == {"aSTR": 1}
+    assert character["aSTR"] == 9
+    remove_modifiers(character, "home_advantage")
+    assert character["aSTR"] == 7
+
+
+def test_synergy_attribute_bonuses_are_recorded_not_applied():
+    from synergy_engine import SynergyEngine
+
+    engine = SynergyEngine.__new__(SynergyEngine)
+    character = {"id": "c1", "aSTR": 6}
+    engine._apply_effect_to_character(character, {"stat": "aSTR", "bonus": 2}, "Vanguard")
+
+    assert character["aSTR"] == 6
+    assert character["synergy_bonuses"] == {"aSTR": 2}
+    assert "modifier_stack" not in character
+
+
+def test_base_stat_falls_back_to_the_attribute():
+    assert base_stat({"aSTR": 6}, "aSTR") == 6
+    assert base_stat({}, "aSTR", 5) == 5
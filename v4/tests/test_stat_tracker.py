@@ -0,0 +1,37 @@
+import csv
+
+
+def test_update_stat_mirrors_match_rstats_into_the_matrix(v4):
+    tracker = v4.StatTracker()
+    char = {"id": "c1", "name": "Ana", "division": "i", "team_id": "t1"}
+    tracker.register_character(char)
+
+    tracker.update_stat(char, "DD", 4)
+    tracker.update_stat(char, "rDD", 3)
+    tracker.update_stat(char, "WIN", 1)
+
+    assert char["rStats"] == {"rDD": 7, "rWIN": 1}
+    assert tracker.unit_stats.as_dict("c1") == {"rDD": 7.0, "rWIN": 1.0}
+
+
+def test_validate_rstats_filters_by_division(v4):
+    tracker = v4.StatTracker()
+    char = {"id": "c1", "division": "i", "rStats": {"rMBi": 1, "CVo": 2, "DD": 3, "rXPBoost": 9}}
+
+    assert tracker.validate_rstats(char) == {"rMBi": 1, "rDD": 3}
+    assert char["rStats"] == {"rMBi": 1, "rDD": 3}
+
+
+def test_export_stats_to_csv_writes_recorded_columns(v4, tmp_path):
+    tracker = v4.StatTracker()
+    char = {"id": "c1", "name": "Ana", "division": "o", "team_id": "t1"}
+    tracker.register_character(char)
+    tracker.update_stat(char, "OTD", 2)
+    tracker.update_stat(char, "DD", 5)
+
+    char_path, _, _ = tracker.export_stats_to_csv(str(tmp_path / "rstats"))
+    with open(char_path, newline="") as f:
+        rows = list(csv.DictReader(f))
+
+    assert list(rows[0]) == ["unit_id", "name", "division", "role", "team_id", "rDD", "rOTD"]
+    assert rows[0]["unit_id"] == "c1" and float(rows[0]["rDD"]) == 5.0
@@ -0,0 +1,63 @@
+import pytest
+
+
+@pytest.fixture(params=["TraitSystem", "EnhancedTraitSystem"])
+def trait_system(request, v4):
+    if request.param == "TraitSystem":
+        return v4.TraitSystem()
+    from enhanced_trait_system import EnhancedTraitSystem
+    return EnhancedTraitSystem()
+
+
+def activate(trait_system, character, trait_id, cooldown, monkeypatch):
+    trait_system.traits[trait_id] = {"name": trait_id, "triggers": ["combat"], "cooldown": cooldown,
+                                     "stamina_cost": 0, "formula_key": "bonus_roll", "value": 1}
+    character["traits"] = [trait_id]
+    monkeypatch.setattr("random.random", lambda: 0.0)
+    assert [trait["trait_id"] for trait in trait_system.check_trait_activation(character, "combat")] == [trait_id]
+
+
+def test_cooldown_blocks_activation_until_it_expires(trait_system, monkeypatch):
+    character = {"id": "c1", "team_id": "t1"}
+    activate(trait_system, character, "surge", 2, monkeypatch)
+
+    assert trait_system.check_trait_activation(character, "combat") == []
+    trait_system.update_cooldowns([character])
+    assert "surge" in character["trait_cooldowns"]
+    trait_system.update_cooldowns([character])
+    assert character["trait_cooldowns"] == {}
+    assert len(trait_system.check_trait_activation(character, "combat")) == 1
+
+
+def test_cooldowns_only_tick_for_the_teams_given(trait_system, monkeypatch):
+    home = {"id": "c1", "team_id": "t1"}
+    away = {"id": "c2", "team_id": "t2"}
+    activate(trait_system, home, "surge", 1, monkeypatch)
+    activate(trait_system, away, "surge", 1, monkeypatch)
+
+    trait_system.update_cooldowns([home])
+
+    assert home["trait_cooldowns"] == {}
+    assert away["trait_cooldowns"] == {"surge": 1}
+
+
+def test_remaining_rounds_come_from_the_clock(trait_system, monkeypatch):
+    character = {"id": "c1", "team_id": "t1"}
+    activate(trait_system, character, "surge", 3, monkeypatch)
+
+    trait_system.update_cooldowns([character])
+
+    assert character["trait_cooldowns"] == {"surge": 3}
+    assert trait_system.get_cooldown_remaining(character, "surge") == 2
+    assert trait_system.get_cooldown_remaining(character, "other") == 0
+
+
+def test_end_match_drops_clocks_and_pending_cooldowns(trait_system, monkeypatch):
+    character = {"id": "c1", "team_id": "t1"}
+    activate(trait_system, character, "surge", 3, monkeypatch)
+
+    trait_system.end_match([character])
+
+    assert trait_system._cooldown_clocks == {}
+    assert character["trait_cooldowns"] == {}
+    assert trait_system.get_cooldown_remaining(character, "surge") == 0
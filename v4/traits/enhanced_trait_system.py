@@ -8,6 +8,7 @@ import logging
 from typing import Dict, List, Any, Optional, Set
 import random
 from enhanced_trait_loader import TraitLoader
+from expiry_scheduler import ExpiryScheduler
 
 logger = logging.getLogger("TraitSystem")
 
@@ -36,6 +37,9 @@ class EnhancedTraitSystem:
         # Track trait activations
         self.activation_counts = {}
         
+        # One round clock per team: update_cooldowns only ticks the teams it is given
+        self._cooldown_clocks: Dict[Any, ExpiryScheduler] = {}
+        
         # Map trait effects
         self.trait_effect_map = self._create_trait_effect_mapping()
         self.trait_type_handlers = self._create_trait_type_handlers()
@@ -156,6 +160,7 @@ class EnhancedTraitSystem:
                     if "trait_cooldowns" not in character:
                         character["trait_cooldowns"] = {}
                     character["trait_cooldowns"][trait_id] = cooldown
+                    self._schedule_cooldown(character, trait_id, cooldown)
                 
                 # Add to activated traits
                 activated_traits.append({
@@ -221,21 +226,61 @@ class EnhancedTraitSystem:
         # Limit to reasonable range (20-90%)
         return max(0.2, min(final_chance, 0.9))
     
+    def _schedule_cooldown(self, character: Dict[str, Any], trait_id: str, cooldown: int) -> None:
+        """Put a trait's expiry on the round clock of the character's team"""
+        team_key = character.get("team_id")
+        clock = self._cooldown_clocks.get(team_key)
+        if clock is None:
+            clock = self._cooldown_clocks[team_key] = ExpiryScheduler()
+        clock.schedule((character.get("id"), trait_id), cooldown, character)
+    
     def update_cooldowns(self, characters: List[Dict[str, Any]]) -> None:
         """Update trait cooldowns at end of round
         
+        Advances the round clock of each team in `characters` by one round and
+        removes only the cooldowns that expire on it. A trait_cooldowns entry keeps
+        the cooldown it was set to until then; get_cooldown_remaining() reads the
+        rounds left from the clock.
+        
         Args:
             characters: List of characters to update
         """
-        for character in characters:
-            if "trait_cooldowns" in character:
-                # Reduce all cooldowns by 1
-                for trait_id in list(character["trait_cooldowns"].keys()):
-                    character["trait_cooldowns"][trait_id] -= 1
-                    
-                    # Remove expired cooldowns
-                    if character["trait_cooldowns"][trait_id] <= 0:
-                        del character["trait_cooldowns"][trait_id]
+        for team_key in {character.get("team_id") for character in characters}:
+            clock = self._cooldown_clocks.get(team_key)
+            if clock is None:
+                continue
+            
+            for (_, trait_id), character in clock.advance():
+                character.get("trait_cooldowns", {}).pop(trait_id, None)
+            
+            # Drop idle clocks so they do not accumulate across matches
+            if not clock:
+                del self._cooldown_clocks[team_key]
+    
+    def get_cooldown_remaining(self, character: Dict[str, Any], trait_id: str) -> int:
+        """Rounds left before a trait comes off cooldown (0 if it is not on cooldown)
+        
+        Args:
+            character: Character whose trait to check
+            trait_id: Trait to check
+        """
+        clock = self._cooldown_clocks.get(character.get("team_id"))
+        return clock.remaining((character.get("id"), trait_id)) if clock is not None else 0
+    
+    def end_match(self, characters: List[Dict[str, Any]]) -> None:
+        """Drop the round clocks of the teams in `characters` and their pending cooldowns
+        
+        Clocks hold the character dicts they expire, so they must not outlive the match.
+        
+        Args:
+            characters: Characters of both teams in the match
+        """
+        for team_key in {character.get("team_id") for character in characters}:
+            clock = self._cooldown_clocks.pop(team_key, None)
+            if clock is None:
+                continue
+            for (_, trait_id), character in clock.clear():
+                character.get("trait_cooldowns", {}).pop(trait_id, None)
     
     def apply_trait_effect(self, character: Dict[str, Any], trigger: str, context: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Apply trait effects for a given trigger
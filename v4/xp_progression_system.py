@@ -11,6 +11,8 @@ import math
 from typing import Dict, List, Any, Optional, Tuple
 from collections import defaultdict
 
+from stat_modifiers import base_stat, set_base_stat
+
 logger = logging.getLogger("XPProgressionSystem")
 
 class XPProgressionSystem:
@@ -287,12 +289,12 @@ class XPProgressionSystem:
         for attr, rate in growth_rates.items():
             # Chance-based increases
             if random.random() < rate:
-                # Get current value
-                current = character.get(attr, 5)
+                # Get current (unmodified) value
+                current = base_stat(character, attr, 5)
                 
                 # Increase stat (cap at 10)
                 if current < 10:
-                    character[attr] = current + 1
+                    set_base_stat(character, attr, current + 1)
                     increases[attr] = 1
         
         return increases
@@ -378,7 +380,7 @@ class XPProgressionSystem:
         # Add all attributes
         for key, value in character.items():
             if key.startswith('a') and len(key) > 1 and isinstance(value, (int, float)):
-                progression_data["attributes"][key] = value
+                progression_data["attributes"][key] = base_stat(character, key, value)
         
         # Save to file
         with open(char_file, 'w') as f:
@@ -439,7 +441,7 @@ class XPProgressionSystem:
         
         # Apply attributes
         for attr, value in progression_data.get("attributes", {}).items():
-            character[attr] = value
+            set_base_stat(character, attr, value)
         
         # Load history
         self.progression_history[char_id] = progression_data.get("history", [])
@@ -577,7 +579,7 @@ Attributes:
         # Calculate potential
         potential = {}
         for attr, rate in growth_rates.items():
-            current = character.get(attr, 5)
+            current = base_stat(character, attr, 5)
             max_value = 10
             
             # Calculate remaining growth